@@ -14,7 +14,8 @@ This script:
 Based on analysis of 3,556 deck files with 84,827 spell references.
 
 Usage:
-    python database_creator.py [--output-dir PATH] [--skip-validation]
+    python database_creator.py [--output-dir PATH] [--skip-validation] [--no-bulk-load]
+                               [stage metrics options]
 
 Requirements:
     - Deck XML files in MobDecks directory
@@ -42,6 +43,8 @@ try:
     from DatabaseCreator import DatabaseCreator, create_deck_database
     from WADProcessor import WADProcessor, process_deck_directory
     from DecksDTOFactory import DecksDTOFactory
+    from utils.bulk_load import add_bulk_load_argument
+    from utils.stage_metrics import add_metrics_arguments, apply_metrics_arguments
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure you're running this script from the correct directory")
@@ -162,7 +165,8 @@ def create_database_with_progress(db_path: Path, args) -> bool:
     
     try:
         # Create database creator
-        creator = DatabaseCreator(db_path)
+        creator = DatabaseCreator(db_path, bulk_load=not args.no_bulk_load)
+        apply_metrics_arguments(args, creator.metrics)
         
         # Process decks and create database
         success = creator.create_full_database()
@@ -258,6 +262,10 @@ Examples:
         help='Name for the output database file'
     )
     
+    add_bulk_load_argument(parser)
+    
+    add_metrics_arguments(parser)
+    
     args = parser.parse_args()
     
     # Print header
@@ -139,29 +139,41 @@ class DecksDTOFactory:
             self.conversion_stats['failed_conversions'] += 1
             return None
     
-    def convert_from_xml_file(self, xml_file_path: Path) -> Optional[DeckTemplateDTO]:
-        """Convert a deck XML file directly to DTO.
+    def load_xml_file(self, xml_file_path: Path) -> Optional[dict]:
+        """Read the deck JSON data of an XML file.
         
         Args:
             xml_file_path: Path to the XML file containing deck data
             
         Returns:
-            DeckTemplateDTO instance or None if conversion fails
+            Parsed deck data or None if the file cannot be read
         """
         try:
             with open(xml_file_path, 'r', encoding='utf-8') as f:
                 content = f.read().strip()
             
             # Parse JSON from XML file
-            xml_data = json.loads(content)
-            
-            return self.convert_from_xml_data(xml_data, xml_file_path.name)
+            return json.loads(content)
             
         except Exception as e:
             print(f"Error reading XML file {xml_file_path}: {e}")
             self.conversion_stats['failed_conversions'] += 1
             return None
     
+    def convert_from_xml_file(self, xml_file_path: Path) -> Optional[DeckTemplateDTO]:
+        """Convert a deck XML file directly to DTO.
+        
+        Args:
+            xml_file_path: Path to the XML file containing deck data
+            
+        Returns:
+            DeckTemplateDTO instance or None if conversion fails
+        """
+        xml_data = self.load_xml_file(xml_file_path)
+        if xml_data is None:
+            return None
+        return self.convert_from_xml_data(xml_data, xml_file_path.name)
+    
     def batch_convert_directory(self, directory_path: Path) -> List[DeckTemplateDTO]:
         """Convert all XML files in a directory to DTOs.
         
@@ -44,20 +44,30 @@ except ImportError:
         SpellSchool, DeckType, CommonSpells
     )
 
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.bulk_load import BulkLoader
+from utils.stage_metrics import StageMetrics
+
 
 class DatabaseCreator:
     """Main class for creating and populating deck databases."""
     
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, bulk_load: bool = True):
         """Initialize database creator.
         
         Args:
             db_path: Path where to create/update the database
+            bulk_load: Defer indexes and relax durability when creating a new database
         """
         self.db_path = db_path
+        self.bulk_load = bulk_load
         self.schema = DatabaseSchema(db_path)
         self.factory = create_factory()
         
+        # Stage timings of this run (written to processing_stage_metrics)
+        self.metrics = StageMetrics()
+        
         # Processing statistics
         self.stats = {
             'total_files_processed': 0,
@@ -85,10 +95,10 @@ class DatabaseCreator:
         
         return deck_path, reports_path
     
-    def setup_database(self) -> sqlite3.Connection:
+    def setup_database(self, defer_indexes: bool = False) -> sqlite3.Connection:
         """Setup database with schema and return connection."""
         print(f"Setting up database: {self.db_path}")
-        return self.schema.setup_database()
+        return self.schema.setup_database(defer_indexes)
     
     def insert_deck_dto(self, connection: sqlite3.Connection, dto: DeckTemplateDTO) -> bool:
         """Insert a single deck DTO into the database.
@@ -233,28 +243,119 @@ class DatabaseCreator:
         Returns:
             List of successfully converted DTOs
         """
+        xml_files = self._list_deck_files(deck_directory)
+        metrics = self.metrics
+        
+        # Use factory to convert all files (the inserts later reopen each deck's metrics frame)
+        dtos = []
+        for i, xml_file in enumerate(xml_files):
+            if i % 500 == 0:
+                print(f"Progress: {i}/{len(xml_files)} files processed")
+            
+            metrics.begin_file(xml_file.name)
+            dto = self._convert_deck_file(xml_file)
+            if dto:
+                dtos.append(dto)
+            metrics.end_file()
+        
+        print(f"Conversion complete: {len(dtos)} successful, {len(xml_files) - len(dtos)} failed")
+        self._update_conversion_stats()
+        
+        print(f"Conversion complete: {len(dtos)} successful DTOs")
+        return dtos
+    
+    def stream_deck_files(self, deck_directory: Path) -> bool:
+        """Convert deck XML files and insert each deck before reading the next.
+        
+        Only the current deck's DTO is alive at any point, so peak memory
+        does not grow with the number of deck files.
+        
+        Args:
+            deck_directory: Directory containing deck XML files
+            
+        Returns:
+            True if population successful
+        """
+        xml_files = self._list_deck_files(deck_directory)
+        metrics = self.metrics
+        
+        print(f"Streaming {len(xml_files)} deck files into the database...")
+        connection, bulk_loader = self._open_database()
+        
+        try:
+            connection.execute("BEGIN TRANSACTION")
+            
+            successful_inserts = 0
+            for i, xml_file in enumerate(xml_files):
+                if i % 500 == 0:
+                    print(f"Progress: {i}/{len(xml_files)} files processed")
+                
+                metrics.begin_file(xml_file.name)
+                dto = self._convert_deck_file(xml_file)
+                if dto:
+                    with metrics.stage("insert"):
+                        if self.insert_deck_dto(connection, dto):
+                            successful_inserts += 1
+                metrics.end_file()
+                
+                self._relieve_memory_pressure(connection, bulk_loader)
+            
+            self._update_conversion_stats()
+            if not self.stats['successful_conversions']:
+                print("No DTOs were successfully created")
+                connection.rollback()
+                return False
+            
+            self._finish_database(connection, bulk_loader)
+            
+            print(f"Database population complete: {successful_inserts}/{len(xml_files)} decks inserted")
+            return True
+            
+        except Exception as e:
+            print(f"Database population failed: {e}")
+            connection.rollback()
+            return False
+            
+        finally:
+            connection.close()
+            self.stats['end_time'] = datetime.now()
+    
+    def _list_deck_files(self, deck_directory: Path) -> List[Path]:
+        """List the deck XML files of a directory and start the run statistics."""
         if not deck_directory.exists():
             raise FileNotFoundError(f"Deck directory not found: {deck_directory}")
         
-        xml_files = list(deck_directory.glob("*.xml"))
+        metrics = self.metrics
+        with metrics.stage("list"):
+            xml_files = list(deck_directory.glob("*.xml"))
+        metrics.file_size_lookup = lambda filename: (deck_directory / filename).stat().st_size
         if not xml_files:
             raise ValueError(f"No XML files found in {deck_directory}")
         
         print(f"Processing {len(xml_files)} deck files from {deck_directory}")
         self.stats['total_files_processed'] = len(xml_files)
         self.stats['start_time'] = datetime.now()
-        
-        # Use factory to convert all files
-        dtos = self.factory.batch_convert_directory(deck_directory)
-        
-        # Update our statistics
+        return xml_files
+    
+    def _convert_deck_file(self, xml_file: Path) -> Optional[DeckTemplateDTO]:
+        """Load and convert one deck file inside the current metrics frame."""
+        metrics = self.metrics
+        with metrics.stage("deserialize"):
+            xml_data = self.factory.load_xml_file(xml_file)
+        if xml_data is None:
+            return None
+        with metrics.stage("dto"):
+            dto = self.factory.convert_from_xml_data(xml_data, xml_file.name)
+        if dto:
+            metrics.set_file_content(dto)
+        return dto
+    
+    def _update_conversion_stats(self):
+        """Copy the factory's conversion counts into our statistics."""
         factory_stats = self.factory.get_conversion_stats()
         self.stats['successful_conversions'] = factory_stats['successful_conversions']
         self.stats['failed_conversions'] = factory_stats['failed_conversions']
         self.stats['validation_errors'] = factory_stats['validation_errors_count']
-        
-        print(f"Conversion complete: {len(dtos)} successful DTOs")
-        return dtos
     
     def populate_database(self, dtos: List[DeckTemplateDTO]) -> bool:
         """Populate database with deck DTOs.
@@ -270,8 +371,8 @@ class DatabaseCreator:
             return False
         
         print(f"Populating database with {len(dtos)} decks...")
-        
-        connection = self.setup_database()
+        metrics = self.metrics
+        connection, bulk_loader = self._open_database()
         
         try:
             # Use transaction for better performance
@@ -283,14 +384,17 @@ class DatabaseCreator:
                 if i % 500 == 0:
                     print(f"Progress: {i}/{len(dtos)} decks inserted")
                 
-                if self.insert_deck_dto(connection, dto):
+                metrics.begin_file(dto.source_filename)
+                metrics.set_file_content(dto)
+                with metrics.stage("insert"):
+                    inserted = self.insert_deck_dto(connection, dto)
+                metrics.end_file()
+                if inserted:
                     successful_inserts += 1
+                
+                self._relieve_memory_pressure(connection, bulk_loader)
             
-            # Update spell summary
-            self.update_spell_summary(connection)
-            
-            # Commit transaction
-            connection.commit()
+            self._finish_database(connection, bulk_loader)
             
             print(f"Database population complete: {successful_inserts}/{len(dtos)} decks inserted")
             return True
@@ -304,6 +408,50 @@ class DatabaseCreator:
             connection.close()
             self.stats['end_time'] = datetime.now()
     
+    def _open_database(self) -> Tuple[sqlite3.Connection, Optional[BulkLoader]]:
+        """Open the database, bulk-loading new ones: indexes are built once all decks are in."""
+        bulk_loader = None
+        with self.metrics.stage("open"):
+            if self.bulk_load and not self.db_path.exists():
+                connection = self.setup_database(defer_indexes=True)
+                bulk_loader = BulkLoader(connection, DatabaseSchema.get_create_index_statements())
+                bulk_loader.begin()
+            else:
+                connection = self.setup_database()
+        return connection, bulk_loader
+    
+    def _relieve_memory_pressure(self, connection: sqlite3.Connection, bulk_loader: Optional[BulkLoader]):
+        """Commit early and cache less when the run approaches its memory budget."""
+        budget = self.metrics.memory_budget
+        if budget and budget.is_under_pressure():
+            with self.metrics.stage("insert"):
+                connection.commit()
+                connection.execute("BEGIN TRANSACTION")
+            if bulk_loader:
+                bulk_loader.set_cache_mb(budget.shrink("SQLite page cache MB", bulk_loader.cache_mb, 16))
+    
+    def _finish_database(self, connection: sqlite3.Connection, bulk_loader: Optional[BulkLoader]):
+        """Update the spell summary, commit, build deferred indexes and save the stage metrics."""
+        metrics = self.metrics
+        with metrics.stage("insert"):
+            self.update_spell_summary(connection)
+            
+            # Commit transaction
+            connection.commit()
+        
+        if bulk_loader:
+            with metrics.stage("index"):
+                bulk_loader.finish()
+        
+        self._insert_stage_metrics(connection)
+    
+    def _insert_stage_metrics(self, connection: sqlite3.Connection):
+        """Insert the stage timings and per-file latencies of this run into the database."""
+        try:
+            self.metrics.save(connection)
+        except Exception as e:
+            print(f"Error inserting stage metrics: {e}")
+    
     def create_full_database(self) -> bool:
         """Complete database creation from deck files.
         
@@ -319,19 +467,25 @@ class DatabaseCreator:
             print(f"Database path: {self.db_path}")
             print(f"Reports directory: {reports_path}")
             
-            # Process deck files
-            dtos = self.process_deck_files(deck_path)
-            
-            if not dtos:
-                print("No DTOs were successfully created")
-                return False
-            
-            # Populate database
-            success = self.populate_database(dtos)
+            # Accumulating keeps every deck in memory, which a budget cannot bound
+            if self.metrics.memory_budget:
+                print("[MEMORY] A memory budget is set, inserting decks as they are converted")
+                success = self.stream_deck_files(deck_path)
+            else:
+                # Process deck files
+                dtos = self.process_deck_files(deck_path)
+                
+                if not dtos:
+                    print("No DTOs were successfully created")
+                    return False
+                
+                # Populate database
+                success = self.populate_database(dtos)
             
             if success:
                 # Generate reports
-                self.generate_reports(reports_path)
+                with self.metrics.stage("report"):
+                    self.generate_reports(reports_path)
                 
                 # Print final statistics
                 self.print_final_stats()
@@ -467,19 +621,22 @@ class DatabaseCreator:
             size_mb = self.db_path.stat().st_size / (1024 * 1024)
             print(f"Database size: {size_mb:.2f} MB")
         
+        print("Stage times:")
+        print(self.metrics.format_summary())
         print("=" * 60)
 
 
-def create_deck_database(db_path: Path) -> bool:
+def create_deck_database(db_path: Path, bulk_load: bool = True) -> bool:
     """Convenience function to create a complete deck database.
     
     Args:
         db_path: Path where to create the database
+        bulk_load: Defer indexes and relax durability when creating a new database
         
     Returns:
         True if database creation successful
     """
-    creator = DatabaseCreator(db_path)
+    creator = DatabaseCreator(db_path, bulk_load)
     return creator.create_full_database()
 
 
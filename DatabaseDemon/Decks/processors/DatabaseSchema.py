@@ -27,6 +27,36 @@ class DatabaseSchema:
     # Current schema version for migration tracking
     SCHEMA_VERSION = 1
     
+    INDEX_STATEMENTS = [
+        # Primary lookup indexes
+        "CREATE INDEX IF NOT EXISTS idx_decks_filename ON decks(filename)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_name ON decks(deck_name)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_type ON decks(deck_type)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_school ON decks(primary_school)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_difficulty ON decks(difficulty)",
+        
+        # Analysis indexes
+        "CREATE INDEX IF NOT EXISTS idx_decks_boss ON decks(is_boss_deck)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_focused ON decks(is_school_focused)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_spell_count ON decks(spell_count)",
+        "CREATE INDEX IF NOT EXISTS idx_decks_behaviors ON decks(has_behaviors)",
+        
+        # Spell reference indexes
+        "CREATE INDEX IF NOT EXISTS idx_deck_spells_deck ON deck_spells(deck_id)",
+        "CREATE INDEX IF NOT EXISTS idx_deck_spells_name ON deck_spells(spell_name)",
+        "CREATE INDEX IF NOT EXISTS idx_deck_spells_position ON deck_spells(position)",
+        
+        # Spell summary indexes
+        "CREATE INDEX IF NOT EXISTS idx_spell_summary_occurrences ON spell_summary(total_occurrences DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_spell_summary_deck_count ON spell_summary(deck_count DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_spell_summary_school ON spell_summary(estimated_school)",
+        
+        # School analysis indexes
+        "CREATE INDEX IF NOT EXISTS idx_school_analysis_deck ON deck_school_analysis(deck_id)",
+        "CREATE INDEX IF NOT EXISTS idx_school_analysis_school ON deck_school_analysis(school_name)",
+        "CREATE INDEX IF NOT EXISTS idx_school_analysis_count ON deck_school_analysis(spell_count DESC)",
+    ]
+    
     def __init__(self, db_path: Path):
         """Initialize schema manager with database path.
         
@@ -147,6 +177,15 @@ class DatabaseSchema:
         connection.commit()
         print("Database tables created successfully")
     
+    @classmethod
+    def get_create_index_statements(cls) -> List[str]:
+        """Get the CREATE INDEX statements of the deck schema.
+        
+        Returns:
+            List of CREATE INDEX statements
+        """
+        return list(cls.INDEX_STATEMENTS)
+    
     def create_indexes(self, connection: sqlite3.Connection):
         """Create database indexes for efficient querying.
         
@@ -155,33 +194,8 @@ class DatabaseSchema:
         """
         cursor = connection.cursor()
         
-        # Primary lookup indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_filename ON decks(filename)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_name ON decks(deck_name)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_type ON decks(deck_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_school ON decks(primary_school)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_difficulty ON decks(difficulty)")
-        
-        # Analysis indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_boss ON decks(is_boss_deck)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_focused ON decks(is_school_focused)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_spell_count ON decks(spell_count)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_decks_behaviors ON decks(has_behaviors)")
-        
-        # Spell reference indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_deck_spells_deck ON deck_spells(deck_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_deck_spells_name ON deck_spells(spell_name)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_deck_spells_position ON deck_spells(position)")
-        
-        # Spell summary indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_spell_summary_occurrences ON spell_summary(total_occurrences DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_spell_summary_deck_count ON spell_summary(deck_count DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_spell_summary_school ON spell_summary(estimated_school)")
-        
-        # School analysis indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_school_analysis_deck ON deck_school_analysis(deck_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_school_analysis_school ON deck_school_analysis(school_name)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_school_analysis_count ON deck_school_analysis(spell_count DESC)")
+        for index_statement in self.get_create_index_statements():
+            cursor.execute(index_statement)
         
         connection.commit()
         print("Database indexes created successfully")
@@ -285,9 +299,12 @@ class DatabaseSchema:
         connection.commit()
         print("Database views created successfully")
     
-    def setup_database(self) -> sqlite3.Connection:
+    def setup_database(self, defer_indexes: bool = False) -> sqlite3.Connection:
         """Complete database setup with tables, indexes, and views.
         
+        Args:
+            defer_indexes: Skip index creation (bulk loads build them after inserting)
+        
         Returns:
             SQLite database connection
         """
@@ -306,7 +323,8 @@ class DatabaseSchema:
         
         # Create schema components
         self.create_tables(connection)
-        self.create_indexes(connection)
+        if not defer_indexes:
+            self.create_indexes(connection)
         self.create_views(connection)
         
         # Update metadata
@@ -38,6 +38,10 @@ except ImportError:
     from DecksDTO import DeckTemplateDTO
     from DecksEnums import TypeHashes
 
+import sys
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.type_list_cache import load_cached_types_data
+
 
 class WADProcessor:
     """Processor for deck XML files following WAD processing patterns."""
@@ -368,9 +372,8 @@ class WADProcessor:
                 print(f"Error: types.json not found at {types_path}")
                 return False
             
-            # Load and validate type definitions
-            with open(types_path, 'r', encoding='utf-8') as f:
-                types_data = json.load(f)
+            # Load and validate type definitions (precompiled cache, rebuilt if types.json changed)
+            types_data = load_cached_types_data(types_path)
             
             # Check for DeckTemplate type
             classes = types_data.get('classes', {})
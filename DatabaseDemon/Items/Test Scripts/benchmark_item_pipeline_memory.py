@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark Item Pipeline Memory
+==============================
+Compare peak memory of the streaming items pipeline against the legacy
+accumulate mode, which extracts every item before inserting any.
+
+Each mode builds a full items database in its own child process so the
+peak RSS of one run does not leak into the other.
+
+Usage:
+    cd DatabaseDemon
+    python "Items/Test Scripts/benchmark_item_pipeline_memory.py" [--modes streaming accumulate]
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add parent directories to Python path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.process_memory import get_peak_rss_mb
+
+RESULT_PREFIX = "BENCHMARK_RESULT "
+
+
+def run_child(mode: str, database_path: Path) -> int:
+    """Build the items database in one mode and report timing and peak RSS"""
+    from Items.processors.DatabaseCreator import ItemsDatabaseCreator
+
+    creator = ItemsDatabaseCreator(
+        database_path=database_path,
+        failed_items_dir=database_path.parent / "failed_items",
+        streaming=(mode == "streaming")
+    )
+
+    try:
+        start = time.perf_counter()
+        if not creator.initialize_database() or not creator.process_all_items_from_wad():
+            print(f"[ERROR] {mode} run failed")
+            return 1
+        elapsed = time.perf_counter() - start
+
+        result = {
+            "mode": mode,
+            "seconds": elapsed,
+            "peak_rss_mb": get_peak_rss_mb(),
+            "items": creator.total_success
+        }
+        print(RESULT_PREFIX + json.dumps(result))
+        return 0
+
+    finally:
+        creator.cleanup()
+
+
+def run_mode(mode: str, work_dir: Path) -> Optional[dict]:
+    """Run one mode in a child process and parse its result line"""
+    database_path = work_dir / f"items_{mode}.db"
+    command = [sys.executable, str(Path(__file__).resolve()), "--child", mode, "--database", str(database_path)]
+
+    print(f"[INFO] Running {mode} mode...")
+    completed = subprocess.run(command, capture_output=True, text=True)
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+
+    print(f"[ERROR] {mode} run produced no result (exit code {completed.returncode})")
+    print(completed.stdout[-2000:])
+    print(completed.stderr[-2000:])
+    return None
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark items pipeline peak memory")
+    parser.add_argument("--modes", nargs="+", choices=["streaming", "accumulate"],
+                        default=["streaming", "accumulate"], help="Modes to compare")
+    parser.add_argument("--child", choices=["streaming", "accumulate"], help=argparse.SUPPRESS)
+    parser.add_argument("--database", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.child, args.database)
+
+    print("Item Pipeline Memory Benchmark")
+    print("=" * 50)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="item_pipeline_bench_"))
+    try:
+        results = [result for result in (run_mode(mode, work_dir) for mode in args.modes) if result]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not results:
+        return 1
+
+    print("\nResults")
+    print("-" * 50)
+    for result in results:
+        peak = f"{result['peak_rss_mb']:.1f} MB" if result["peak_rss_mb"] is not None else "n/a"
+        print(f"{result['mode']:<12} peak RSS: {peak:>12}   time: {result['seconds']:8.1f}s   "
+              f"items: {result['items']}")
+
+    by_mode = {result["mode"]: result for result in results}
+    if "streaming" in by_mode and "accumulate" in by_mode:
+        streaming_peak = by_mode["streaming"]["peak_rss_mb"]
+        accumulate_peak = by_mode["accumulate"]["peak_rss_mb"]
+        if streaming_peak and accumulate_peak:
+            print(f"\nStreaming uses {accumulate_peak - streaming_peak:.1f} MB less peak memory "
+                  f"({accumulate_peak / streaming_peak:.2f}x)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
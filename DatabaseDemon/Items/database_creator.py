@@ -4,9 +4,27 @@ Wizard101 Items Database Creator
 ===============================
 Main script to create complete Items database by processing entire ObjectData
 for WizItemTemplate objects with comprehensive nested type support.
+
+Usage:
+    python database_creator.py [--base-database PATH] [--accumulate] [--no-bulk-load]
+                               [stage metrics options]
+
+Options:
+    --base-database PATH  Patch a copy of a previous build, re-processing only
+                          the ObjectData entries changed since that build
+                          (per its .manifest.json)
+    --accumulate          Extract all items before inserting any (legacy mode,
+                          keeps every item in memory; default is streaming)
+    --no-bulk-load        Create indexes before loading instead of after. By
+                          default a fresh build loads with relaxed durability
+                          and builds all indexes (plus ANALYZE) at the end.
+    Stage metrics options (--profile-slow-files, --profile-dir, --memory-budget,
+    --trace-memory) are listed by --help. A memory budget implies streaming
+    inserts (--accumulate is ignored).
 """
 
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 import traceback
@@ -15,10 +33,35 @@ import traceback
 sys.path.append(str(Path(__file__).parent.parent))
 
 from Items.processors.DatabaseCreator import ItemsDatabaseCreator
+from utils.bulk_load import add_bulk_load_argument
+from utils.stage_metrics import add_metrics_arguments, apply_metrics_arguments
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Create Wizard101 items database from Root.wad"
+    )
+    parser.add_argument(
+        '--base-database',
+        type=Path,
+        default=None,
+        help='Previous items database to patch incrementally (default: full build)'
+    )
+    parser.add_argument(
+        '--accumulate',
+        action='store_true',
+        help='Extract all items in memory before inserting (default: stream items into the database)'
+    )
+    add_bulk_load_argument(parser)
+    add_metrics_arguments(parser)
+    return parser.parse_args()
 
 
 def main():
     """Main function to create Items database"""
+    args = parse_arguments()
+    
     print("Wizard101 Items Database Creator")
     print("=" * 50)
     print("Creating comprehensive database of all WizItemTemplate objects")
@@ -26,7 +69,10 @@ def main():
     print()
     
     # Initialize database creator
-    creator = ItemsDatabaseCreator()
+    creator = ItemsDatabaseCreator(base_database=args.base_database,
+                                   streaming=not args.accumulate,
+                                   bulk_load=not args.no_bulk_load)
+    apply_metrics_arguments(args, creator.metrics)
     
     try:
         print("Initializing database schema...")
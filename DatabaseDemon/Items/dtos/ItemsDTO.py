@@ -10,19 +10,24 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Any, Dict, Union
 from .ItemsEnums import *
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.slotted_dto import SlottedDTO
+
 
 # ===== BASE DTO CLASSES =====
 
-@dataclass
-class BehaviorTemplateDTO:
+@dataclass(slots=True)
+class BehaviorTemplateDTO(SlottedDTO):
     """Base DTO for BehaviorTemplate - foundation for all item behaviors"""
     m_behaviorName: Optional[str] = ""
 
 
 # ===== CORE ITEM DTOS =====
 
-@dataclass
-class StatisticEffectInfoDTO:
+@dataclass(slots=True)
+class StatisticEffectInfoDTO(SlottedDTO):
     """DTO for StatisticEffectInfo (168,047 occurrences) - most common nested type"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -32,8 +37,8 @@ class StatisticEffectInfoDTO:
     m_effectType: Optional[int] = 0
 
 
-@dataclass
-class AvatarOptionDTO:
+@dataclass(slots=True)
+class AvatarOptionDTO(SlottedDTO):
     """DTO for AvatarOption (62,234 occurrences) - avatar customization data"""
     m_mesh: Optional[str] = ""
     m_noMesh: Optional[bool] = False
@@ -43,8 +48,8 @@ class AvatarOptionDTO:
     m_materialName: Optional[str] = ""
 
 
-@dataclass
-class AvatarTextureOptionDTO:
+@dataclass(slots=True)
+class AvatarTextureOptionDTO(SlottedDTO):
     """DTO for AvatarTextureOption (57,232 occurrences) - texture customization"""
     m_conditionFlags: List[str] = field(default_factory=list)
     m_decals: List[str] = field(default_factory=list)
@@ -56,8 +61,8 @@ class AvatarTextureOptionDTO:
     m_useTintColor: Optional[bool] = False
 
 
-@dataclass
-class WizAvatarItemInfoDTO:
+@dataclass(slots=True)
+class WizAvatarItemInfoDTO(SlottedDTO):
     """DTO for WizAvatarItemInfo - container for avatar customization data"""
     m_defaultOption: Optional[AvatarOptionDTO] = None
     m_defaultTextureOption: Optional[AvatarTextureOptionDTO] = None
@@ -70,7 +75,7 @@ class WizAvatarItemInfoDTO:
 
 # ===== BEHAVIOR DTO CLASSES =====
 
-@dataclass
+@dataclass(slots=True)
 class RenderBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for RenderBehaviorTemplate (59,104 occurrences) - rendering behavior"""
     m_assetName: Optional[str] = ""
@@ -83,7 +88,7 @@ class RenderBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_nLightType: Optional[int] = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for EquipmentBehaviorTemplate - equipment statistics and effects"""
     m_equipSlot: Optional[str] = ""
@@ -93,7 +98,7 @@ class EquipmentBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_equipmentFlags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for AnimationBehaviorTemplate - animation and visual effects"""
     m_animationAssetName: Optional[str] = ""
@@ -115,7 +120,7 @@ class AnimationBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_skeletonID: Optional[int] = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for CollisionBehaviorTemplate - collision detection"""
     m_bAutoClickBox: Optional[bool] = True
@@ -125,7 +130,7 @@ class CollisionBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_walkableCollisionFilename: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FurnitureInfoBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for FurnitureInfoBehaviorTemplate - housing furniture properties"""
     m_bounce: Optional[bool] = False
@@ -142,16 +147,16 @@ class FurnitureInfoBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== PET-RELATED DTO CLASSES =====
 
-@dataclass
-class PetStatDTO:
+@dataclass(slots=True)
+class PetStatDTO(SlottedDTO):
     """DTO for PetStat - individual pet statistic"""
     m_name: Optional[str] = ""
     m_statID: Optional[int] = 0
     m_value: Optional[int] = 0
 
 
-@dataclass
-class PetLevelInfoDTO:
+@dataclass(slots=True)
+class PetLevelInfoDTO(SlottedDTO):
     """DTO for PetLevelInfo - pet level progression data"""
     m_level: Optional[int] = 0
     m_lootTable: List[str] = field(default_factory=list)
@@ -163,22 +168,22 @@ class PetLevelInfoDTO:
     m_template: Optional[int] = 0
 
 
-@dataclass
-class MorphingExceptionDTO:
+@dataclass(slots=True)
+class MorphingExceptionDTO(SlottedDTO):
     """DTO for MorphingException - pet morphing rules"""
     m_eggTemplateID: Optional[int] = 0
     m_probability: Optional[float] = 0.0
     m_secondPetTemplateID: Optional[int] = 0
 
 
-@dataclass
-class PetDyeToTextureDTO:
+@dataclass(slots=True)
+class PetDyeToTextureDTO(SlottedDTO):
     """DTO for PetDyeToTexture - pet coloring system"""
     m_dye: Optional[int] = 0
     m_texture: Optional[int] = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PetItemBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for PetItemBehaviorTemplate - pet-specific behavior"""
     m_Levels: List[PetLevelInfoDTO] = field(default_factory=list)
@@ -219,14 +224,14 @@ class PetItemBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== MOUNT-RELATED DTO CLASSES =====
 
-@dataclass
-class MountDyeToTextureDTO:
+@dataclass(slots=True)
+class MountDyeToTextureDTO(SlottedDTO):
     """DTO for MountDyeToTexture - mount coloring system"""
     m_dye: Optional[int] = 0
     m_texture: Optional[int] = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class MountItemBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for MountItemBehaviorTemplate - mount-specific behavior"""
     m_animationEventList: List[Any] = field(default_factory=list)
@@ -250,14 +255,14 @@ class MountItemBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== JEWEL AND SOCKET DTO CLASSES =====
 
-@dataclass
-class JewelSocketDTO:
+@dataclass(slots=True)
+class JewelSocketDTO(SlottedDTO):
     """DTO for JewelSocket - individual socket for jewels"""
     m_bLockable: Optional[bool] = False
     m_socketType: Optional[int] = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class JewelSocketBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for JewelSocketBehaviorTemplate - jewel socketing system"""
     m_jewelSockets: List[JewelSocketDTO] = field(default_factory=list)
@@ -266,16 +271,16 @@ class JewelSocketBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== REQUIREMENT DTO CLASSES =====
 
-@dataclass
-class RequirementListDTO:
+@dataclass(slots=True)
+class RequirementListDTO(SlottedDTO):
     """DTO for RequirementList - container for equipment requirements"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
     m_requirements: List[Any] = field(default_factory=list)
 
 
-@dataclass
-class ReqMagicLevelDTO:
+@dataclass(slots=True)
+class ReqMagicLevelDTO(SlottedDTO):
     """DTO for ReqMagicLevel - magic level requirement"""
     m_applyNOT: Optional[bool] = False
     m_magicSchool: Optional[str] = ""
@@ -284,24 +289,24 @@ class ReqMagicLevelDTO:
     m_operatorType: Optional[int] = 0
 
 
-@dataclass
-class ReqSchoolOfFocusDTO:
+@dataclass(slots=True)
+class ReqSchoolOfFocusDTO(SlottedDTO):
     """DTO for ReqSchoolOfFocus - school requirement"""
     m_applyNOT: Optional[bool] = False
     m_magicSchool: Optional[str] = ""
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqHasBadgeDTO:
+@dataclass(slots=True)
+class ReqHasBadgeDTO(SlottedDTO):
     """DTO for ReqHasBadge - badge requirement"""
     m_applyNOT: Optional[bool] = False
     m_badgeName: Optional[str] = ""
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqHasEntryDTO:
+@dataclass(slots=True)
+class ReqHasEntryDTO(SlottedDTO):
     """DTO for ReqHasEntry - entry requirement"""
     m_applyNOT: Optional[bool] = False
     m_entryName: Optional[str] = ""
@@ -311,8 +316,8 @@ class ReqHasEntryDTO:
     m_questName: Optional[str] = ""
 
 
-@dataclass
-class ReqEnergyDTO:
+@dataclass(slots=True)
+class ReqEnergyDTO(SlottedDTO):
     """DTO for ReqEnergy - energy requirement"""
     m_applyNOT: Optional[bool] = False
     m_numericValue: Optional[float] = 0.0
@@ -320,8 +325,8 @@ class ReqEnergyDTO:
     m_operatorType: Optional[int] = 0
 
 
-@dataclass
-class ReqHealthPercentDTO:
+@dataclass(slots=True)
+class ReqHealthPercentDTO(SlottedDTO):
     """DTO for ReqHealthPercent - health percentage requirement"""
     m_applyNOT: Optional[bool] = False
     m_fMinPercent: Optional[float] = 0.0
@@ -329,8 +334,8 @@ class ReqHealthPercentDTO:
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqManaPercentDTO:
+@dataclass(slots=True)
+class ReqManaPercentDTO(SlottedDTO):
     """DTO for ReqManaPercent - mana percentage requirement"""
     m_applyNOT: Optional[bool] = False
     m_fMinPercent: Optional[float] = 0.0
@@ -338,23 +343,23 @@ class ReqManaPercentDTO:
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqIsGenderDTO:
+@dataclass(slots=True)
+class ReqIsGenderDTO(SlottedDTO):
     """DTO for ReqIsGender - gender requirement"""
     m_applyNOT: Optional[bool] = False
     m_gender: Optional[str] = ""
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqInCombatDTO:
+@dataclass(slots=True)
+class ReqInCombatDTO(SlottedDTO):
     """DTO for ReqInCombat - combat state requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqHighestCharacterLevelOnAccountDTO:
+@dataclass(slots=True)
+class ReqHighestCharacterLevelOnAccountDTO(SlottedDTO):
     """DTO for ReqHighestCharacterLevelOnAccount - account level requirement"""
     m_applyNOT: Optional[bool] = False
     m_numericValue: Optional[float] = 0.0
@@ -364,8 +369,8 @@ class ReqHighestCharacterLevelOnAccountDTO:
 
 # ===== EFFECT DTO CLASSES =====
 
-@dataclass
-class GameEffectInfoDTO:
+@dataclass(slots=True)
+class GameEffectInfoDTO(SlottedDTO):
     """DTO for GameEffectInfo - general game effects"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -376,8 +381,8 @@ class GameEffectInfoDTO:
     m_schoolName: Optional[str] = ""
 
 
-@dataclass
-class TransformationEffectInfoDTO:
+@dataclass(slots=True)
+class TransformationEffectInfoDTO(SlottedDTO):
     """DTO for TransformationEffectInfo - transformation effects"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -390,8 +395,8 @@ class TransformationEffectInfoDTO:
     m_duration: Optional[int] = 0
 
 
-@dataclass
-class SpeedEffectInfoDTO:
+@dataclass(slots=True)
+class SpeedEffectInfoDTO(SlottedDTO):
     """DTO for SpeedEffectInfo - speed modification effects"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -404,8 +409,8 @@ class SpeedEffectInfoDTO:
     m_movementType: Optional[str] = ""
 
 
-@dataclass
-class StartingPipEffectInfoDTO:
+@dataclass(slots=True)
+class StartingPipEffectInfoDTO(SlottedDTO):
     """DTO for StartingPipEffectInfo - starting pip effects"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -417,8 +422,8 @@ class StartingPipEffectInfoDTO:
     m_schoolName: Optional[str] = ""
 
 
-@dataclass
-class FXBySlotEffectInfoDTO:
+@dataclass(slots=True)
+class FXBySlotEffectInfoDTO(SlottedDTO):
     """DTO for FXBySlotEffectInfo - visual effects by equipment slot"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -432,7 +437,7 @@ class FXBySlotEffectInfoDTO:
 
 # ===== HOUSING DTO CLASSES =====
 
-@dataclass
+@dataclass(slots=True)
 class HousingMusicBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for HousingMusicBehaviorTemplate - housing music system"""
     m_musicFiles: List[str] = field(default_factory=list)
@@ -441,7 +446,7 @@ class HousingMusicBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_volume: Optional[float] = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HousingMusicPlayerBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for HousingMusicPlayerBehaviorTemplate - music player housing item"""
     m_playLists: List[str] = field(default_factory=list)
@@ -450,15 +455,15 @@ class HousingMusicPlayerBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_canRepeat: Optional[bool] = True
 
 
-@dataclass
-class PlayListEntryDTO:
+@dataclass(slots=True)
+class PlayListEntryDTO(SlottedDTO):
     """DTO for PlayListEntry - individual playlist entry"""
     m_songName: Optional[str] = ""
     m_songPath: Optional[str] = ""
     m_duration: Optional[float] = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HousingTeleporterBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for HousingTeleporterBehaviorTemplate - teleporter housing item"""
     m_teleportName: Optional[str] = ""
@@ -467,8 +472,8 @@ class HousingTeleporterBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_teleportCost: Optional[int] = 0
 
 
-@dataclass
-class SigilZoneInfoDTO:
+@dataclass(slots=True)
+class SigilZoneInfoDTO(SlottedDTO):
     """DTO for SigilZoneInfo - sigil zone data"""
     m_zoneName: Optional[str] = ""
     m_zoneDisplayName: Optional[str] = ""
@@ -476,14 +481,14 @@ class SigilZoneInfoDTO:
     m_questRequirement: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HousingSigilBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for HousingSigilBehaviorTemplate - sigil housing item"""
     m_sigilZones: List[SigilZoneInfoDTO] = field(default_factory=list)
     m_allowedPlayers: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HousingSignBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for HousingSignBehaviorTemplate - sign housing item"""
     m_signText: Optional[str] = ""
@@ -492,7 +497,7 @@ class HousingSignBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_textColor: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HousingTextureBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for HousingTextureBehaviorTemplate - texture housing item"""
     m_textureFile: Optional[str] = ""
@@ -503,15 +508,15 @@ class HousingTextureBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== SPECIALIZED BEHAVIOR DTO CLASSES =====
 
-@dataclass
-class LeashOffsetOverrideDTO:
+@dataclass(slots=True)
+class LeashOffsetOverrideDTO(SlottedDTO):
     """DTO for LeashOffsetOverride - pet leash positioning"""
     m_offsetX: Optional[float] = 0.0
     m_offsetY: Optional[float] = 0.0
     m_offsetZ: Optional[float] = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LeashBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for LeashBehaviorTemplate - pet leash behavior"""
     m_leashLength: Optional[float] = 5.0
@@ -519,8 +524,8 @@ class LeashBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_allowFreeRoam: Optional[bool] = False
 
 
-@dataclass
-class UserAnimationEventDTO:
+@dataclass(slots=True)
+class UserAnimationEventDTO(SlottedDTO):
     """DTO for UserAnimationEvent - user-triggered animation"""
     m_eventName: Optional[str] = ""
     m_animationName: Optional[str] = ""
@@ -528,7 +533,7 @@ class UserAnimationEventDTO:
     m_particleEffect: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomEmoteBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for CustomEmoteBehaviorTemplate - custom emote system"""
     m_emoteName: Optional[str] = ""
@@ -536,7 +541,7 @@ class CustomEmoteBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_duration: Optional[float] = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for ScriptBehaviorTemplate - scripted item behavior"""
     m_scriptName: Optional[str] = ""
@@ -544,7 +549,7 @@ class ScriptBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_autoExecute: Optional[bool] = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectStateBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for ObjectStateBehaviorTemplate - object state management"""
     m_stateSetName: Optional[str] = ""
@@ -552,8 +557,8 @@ class ObjectStateBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_allowStateChange: Optional[bool] = True
 
 
-@dataclass
-class FidgetStateInfoDTO:
+@dataclass(slots=True)
+class FidgetStateInfoDTO(SlottedDTO):
     """DTO for FidgetStateInfo - fidget animation state"""
     m_stateName: Optional[str] = ""
     m_animationName: Optional[str] = ""
@@ -561,7 +566,7 @@ class FidgetStateInfoDTO:
     m_duration: Optional[float] = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class FidgetBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for FidgetBehaviorTemplate - fidget animation system"""
     m_fidgetStates: List[FidgetStateInfoDTO] = field(default_factory=list)
@@ -571,7 +576,7 @@ class FidgetBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== ELIXIR DTO CLASSES =====
 
-@dataclass
+@dataclass(slots=True)
 class ElixirBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for ElixirBehaviorTemplate - elixir item behavior"""
     m_elixirType: Optional[str] = ""
@@ -580,7 +585,7 @@ class ElixirBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_stackable: Optional[bool] = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ElixirBenefitBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for ElixirBenefitBehaviorTemplate - elixir benefit system"""
     m_benefitType: Optional[str] = ""
@@ -589,23 +594,23 @@ class ElixirBenefitBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_schoolRestriction: Optional[str] = ""
 
 
-@dataclass
-class LevelUpElixirPropertyRegistryEntryDTO:
+@dataclass(slots=True)
+class LevelUpElixirPropertyRegistryEntryDTO(SlottedDTO):
     """DTO for LevelUpElixirPropertyRegistryEntry - level up elixir registry"""
     m_propertyName: Optional[str] = ""
     m_propertyValue: Optional[float] = 0.0
     m_propertyType: Optional[str] = ""
 
 
-@dataclass
-class LevelUpElixirSchoolSpecificDataDTO:
+@dataclass(slots=True)
+class LevelUpElixirSchoolSpecificDataDTO(SlottedDTO):
     """DTO for LevelUpElixirSchoolSpecificData - school-specific elixir data"""
     m_schoolName: Optional[str] = ""
     m_bonusMultiplier: Optional[float] = 1.0
     m_specialEffects: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LevelUpElixirBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for LevelUpElixirBehaviorTemplate - level up elixir behavior"""
     m_levelBonus: Optional[int] = 0
@@ -614,7 +619,7 @@ class LevelUpElixirBehaviorTemplateDTO(BehaviorTemplateDTO):
     m_schoolData: List[LevelUpElixirSchoolSpecificDataDTO] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldElixirBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for WorldElixirBehaviorTemplate - world-specific elixir behavior"""
     m_worldName: Optional[str] = ""
@@ -624,8 +629,8 @@ class WorldElixirBehaviorTemplateDTO(BehaviorTemplateDTO):
 
 # ===== MAIN WIZITEMTEMPLATE DTO =====
 
-@dataclass
-class WizItemTemplateDTO:
+@dataclass(slots=True)
+class WizItemTemplateDTO(SlottedDTO):
     """Main DTO for WizItemTemplate (69,497 occurrences) - the core item class"""
     # Core identification
     m_templateID: Optional[int] = 0
@@ -685,31 +690,31 @@ class WizItemTemplateDTO:
 # would follow the same pattern but are less frequently used. They can be added
 # as needed based on discovery analysis.
 
-@dataclass
-class DependentResourceContainerDTO:
+@dataclass(slots=True)
+class DependentResourceContainerDTO(SlottedDTO):
     """DTO for DependentResourceContainer - dependent resource management"""
     m_resourceName: Optional[str] = ""
     m_resourcePath: Optional[str] = ""
     m_resourceType: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DependentResourcesBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for DependentResourcesBehaviorTemplate - dependent resources behavior"""
     m_resources: List[DependentResourceContainerDTO] = field(default_factory=list)
     m_loadOnDemand: Optional[bool] = True
 
 
-@dataclass
-class CombatTriggerDescriptionDTO:
+@dataclass(slots=True)
+class CombatTriggerDescriptionDTO(SlottedDTO):
     """DTO for CombatTriggerDescription - combat trigger information"""
     m_triggerName: Optional[str] = ""
     m_triggerCondition: Optional[str] = ""
     m_triggerEffect: Optional[str] = ""
 
 
-@dataclass
-class ProvideCombatTriggerInfoDTO:
+@dataclass(slots=True)
+class ProvideCombatTriggerInfoDTO(SlottedDTO):
     """DTO for ProvideCombatTriggerInfo - combat trigger provider"""
     m_effectName: Optional[str] = ""
     m_lookupIndex: Optional[int] = 0
@@ -721,8 +726,8 @@ class ProvideCombatTriggerInfoDTO:
     m_triggerChance: Optional[float] = 0.0
 
 
-@dataclass
-class ProvideSpellEffectInfoDTO:
+@dataclass(slots=True)
+class ProvideSpellEffectInfoDTO(SlottedDTO):
     """DTO for ProvideSpellEffectInfo - spell effect provider"""
     m_spellName: Optional[str] = ""
     m_effectName: Optional[str] = ""
@@ -734,15 +739,15 @@ class ProvideSpellEffectInfoDTO:
     m_castChance: Optional[float] = 0.0
 
 
-@dataclass
-class FXOverrideBehaviorInfoDTO:
+@dataclass(slots=True)
+class FXOverrideBehaviorInfoDTO(SlottedDTO):
     """DTO for FXOverrideBehaviorInfo - FX override information"""
     m_overrideName: Optional[str] = ""
     m_effectPath: Optional[str] = ""
     m_slotName: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FXOverrideBehaviorTemplateDTO(BehaviorTemplateDTO):
     """DTO for FXOverrideBehaviorTemplate - FX override behavior"""
     m_overrides: List[FXOverrideBehaviorInfoDTO] = field(default_factory=list)
@@ -5,9 +5,15 @@ Factory and processing logic for creating item DTOs with graceful error handling
 Handles all 117 discovered nested types for complete WizItemTemplate processing.
 """
 
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, FrozenSet, List, Optional, Any, Type
 from .ItemsDTO import *
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.slotted_dto import INTERNED_FIELDS
+from utils.lazy_dto_builder import LazyDTOBuilder
+
 
 class ItemsDTOFactory:
     """Factory for creating item DTOs with comprehensive type mapping"""
@@ -105,30 +111,53 @@ class ItemsDTOFactory:
         # with their actual hash values extracted from the class definition files
     }
     
+    # Compiled lookups, built once on first use (see _compile)
+    _hash_by_type_name: Optional[Dict[str, int]] = None
+    _fields_by_class: Optional[Dict[Type, FrozenSet[str]]] = None
+    _interned_fields_by_class: Optional[Dict[Type, FrozenSet[str]]] = None
+    
+    @classmethod
+    def _compile(cls):
+        """Precompute the type name -> hash index and the field set of every DTO class"""
+        hash_by_type_name = {}
+        fields_by_class = {}
+        for hash_val, dto_class in cls.TYPE_MAPPING.items():
+            # First mapping wins, like the linear scan it replaces
+            hash_by_type_name.setdefault(dto_class.__name__, hash_val)
+            
+            if dto_class not in fields_by_class:
+                # Fields including inherited ones from parent classes
+                all_fields = set()
+                for class_obj in dto_class.__mro__:
+                    all_fields.update(getattr(class_obj, "__annotations__", {}).keys())
+                fields_by_class[dto_class] = frozenset(all_fields)
+        
+        cls._fields_by_class = fields_by_class
+        cls._interned_fields_by_class = {dto_class: field_names & INTERNED_FIELDS
+                                         for dto_class, field_names in fields_by_class.items()}
+        cls._hash_by_type_name = {name[:-3]: hash_val for name, hash_val in hash_by_type_name.items()
+                                  if name.endswith("DTO")}
+    
     @classmethod
     def create_dto(cls, type_hash: int, item_data: Dict[str, Any]) -> Optional[Any]:
         """Create appropriate DTO instance based on type hash"""
         dto_class = cls.TYPE_MAPPING.get(type_hash)
         if dto_class:
             try:
-                # Process nested objects recursively
-                processed_data = cls.process_nested_objects(item_data)
+                if cls._fields_by_class is None:
+                    cls._compile()
                 
-                # Create kwargs with only the fields that exist in both data and DTO
+                # Only fields the DTO declares are converted, missing fields use defaults
+                field_names = cls._fields_by_class[dto_class]
+                interned_fields = cls._interned_fields_by_class[dto_class]
                 kwargs = {}
-                all_fields = set()
-                
-                # Collect annotations from the class and all parent classes
-                for class_obj in dto_class.__mro__:  # Method Resolution Order includes all parent classes
-                    if hasattr(class_obj, "__annotations__"):
-                        all_fields.update(class_obj.__annotations__.keys())
-                
-                # Add fields that exist in both processed data and DTO class
-                for field_name in all_fields:
-                    if field_name in processed_data:
-                        kwargs[field_name] = processed_data[field_name]
+                for field_name, value in item_data.items():
+                    if field_name in field_names:
+                        if field_name in interned_fields and type(value) is str:
+                            kwargs[field_name] = sys.intern(value)
+                        else:
+                            kwargs[field_name] = cls._convert_value(value)
                 
-                # Create the DTO instance (missing fields will use defaults)
                 return dto_class(**kwargs)
             except Exception as e:
                 print(f"Error creating DTO for hash {type_hash}: {e}")
@@ -137,77 +166,80 @@ class ItemsDTOFactory:
             print(f"No DTO class found for hash {type_hash}")
             return None
     
+    @classmethod
+    def _create_nested_dto(cls, data: Dict[str, Any]) -> Any:
+        """Create the DTO of a nested typed object (the original data if that fails)"""
+        type_hash = data["$__type"]
+        if not isinstance(type_hash, int):
+            # String type name - convert to hash
+            type_hash = cls.find_hash_for_type(type_hash.replace("class ", ""))
+            if not type_hash:
+                return data
+        
+        nested_dto = cls.create_dto(type_hash, data)
+        return nested_dto if nested_dto is not None else data
+    
+    @classmethod
+    def _convert_value(cls, value: Any) -> Any:
+        """Convert nested typed objects (and lists of them) in one field value to DTOs"""
+        if isinstance(value, dict):
+            if "$__type" in value:
+                return cls._create_nested_dto(value)
+            return value
+        
+        if isinstance(value, list):
+            # Process list items
+            processed_list = []
+            for item in value:
+                if isinstance(item, dict):
+                    if "$__type" in item:
+                        processed_list.append(cls._create_nested_dto(item))
+                    else:
+                        # Recursively process nested dicts that might contain $__type
+                        processed_list.append(cls.process_nested_objects(item))
+                else:
+                    processed_list.append(item)
+            return processed_list
+        
+        return value
+    
     @classmethod
     def process_nested_objects(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively process nested objects to create DTOs"""
         if not isinstance(data, dict):
             return data
         
-        processed = {}
+        return {key: cls._convert_value(value) for key, value in data.items()}
+    
+    @classmethod
+    def create_lazy_dto_builder(cls, type_list: Any, collect_unhandled: bool = False) -> LazyDTOBuilder:
+        """
+        Create a builder that makes DTOs straight from LazyObjects (see utils/lazy_dto_builder.py)
         
-        for key, value in data.items():
-            if isinstance(value, dict) and "$__type" in value:
-                # This is a nested typed object
-                nested_type_hash = value["$__type"]
-                if isinstance(nested_type_hash, int):
-                    # Already a hash value
-                    nested_dto = cls.create_dto(nested_type_hash, value)
-                    processed[key] = nested_dto if nested_dto is not None else value
-                else:
-                    # String type name - convert to hash
-                    nested_type = nested_type_hash.replace("class ", "")
-                    nested_hash = cls.find_hash_for_type(nested_type)
-                    if nested_hash:
-                        nested_dto = cls.create_dto(nested_hash, value)
-                        processed[key] = nested_dto if nested_dto is not None else value
-                    else:
-                        processed[key] = value
-            
-            elif isinstance(value, list):
-                # Process list items
-                processed_list = []
-                for item in value:
-                    if isinstance(item, dict) and "$__type" in item:
-                        item_type_hash = item["$__type"]
-                        if isinstance(item_type_hash, int):
-                            # Already a hash value
-                            processed_dto = cls.create_dto(item_type_hash, item)
-                            if processed_dto is not None:
-                                processed_list.append(processed_dto)
-                            else:
-                                processed_list.append(item)
-                        else:
-                            # String type name - convert to hash
-                            nested_type = item_type_hash.replace("class ", "")
-                            nested_hash = cls.find_hash_for_type(nested_type)
-                            if nested_hash:
-                                processed_dto = cls.create_dto(nested_hash, item)
-                                if processed_dto is not None:
-                                    processed_list.append(processed_dto)
-                                else:
-                                    processed_list.append(item)
-                            else:
-                                processed_list.append(item)
-                    elif isinstance(item, dict):
-                        # Recursively process nested dicts that might contain $__type
-                        processed_item = cls.process_nested_objects(item)
-                        processed_list.append(processed_item)
-                    else:
-                        processed_list.append(item)
-                processed[key] = processed_list
+        Args:
+            type_list: TypeList of the archive the objects come from
+            collect_unhandled: Collect fields the DTOs do not declare
             
-            else:
-                processed[key] = value
-        
-        return processed
+        Returns:
+            LazyDTOBuilder resolving types the same way as create_from_json_data
+        """
+        if cls._fields_by_class is None:
+            cls._compile()
+        return LazyDTOBuilder(
+            type_list,
+            lambda type_name: cls.TYPE_MAPPING.get(cls.find_hash_for_type(type_name)),
+            cls._fields_by_class,
+            cls._interned_fields_by_class,
+            collect_unhandled=collect_unhandled,
+            warn_unmapped_list_items=False
+        )
     
     @classmethod
     def find_hash_for_type(cls, type_name: str) -> Optional[int]:
         """Find hash value for a given type name"""
-        for hash_val, dto_class in cls.TYPE_MAPPING.items():
-            if dto_class.__name__ == f"{type_name}DTO":
-                return hash_val
-        return None
+        if cls._hash_by_type_name is None:
+            cls._compile()
+        return cls._hash_by_type_name.get(type_name)
     
     @classmethod
     def create_from_json_data(cls, json_data: Dict[str, Any]) -> Optional[WizItemTemplateDTO]:
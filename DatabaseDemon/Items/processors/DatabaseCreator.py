@@ -11,7 +11,7 @@ import sqlite3
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 import traceback
 
 from .DatabaseSchema import ItemsDatabaseSchema
@@ -22,27 +22,63 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
 sys.path.append(str(Path(__file__).parent.parent))         # Items level
 
-from dtos.ItemsDTO import *
-from dtos.ItemsDTOFactory import ItemsDTOFactory
+from utils.conversion_utils import convert_lazy_object_to_dict
+from utils.lazy_dto_builder import DirectConversionError, LazyDTOBuilder
+from utils.object_data_scanner import ObjectDataConsumer, ObjectDataScanner, WIZ_ITEM_TEMPLATE_HASH
+from utils.wad_session import WadSession
+from utils.bulk_load import BulkLoader
+from utils.process_memory import MemoryBudget
+from utils.stage_metrics import StageMetrics
+from utils.wad_manifest import (
+    WadManifest, get_manifest_path, prepare_base_database, apply_manifest_diff
+)
 
+from ..dtos.ItemsDTO import *
+from ..dtos.ItemsDTOFactory import ItemsDTOFactory
 
-class ItemsDatabaseCreator:
+
+class ItemsDatabaseCreator(ObjectDataConsumer):
     """Creates and manages the Wizard101 items database"""
     
     def __init__(self, database_path: Optional[Path] = None, 
-                 failed_items_dir: Optional[Path] = None):
+                 failed_items_dir: Optional[Path] = None,
+                 base_database: Optional[Path] = None,
+                 streaming: bool = True,
+                 commit_interval: int = 1000,
+                 bulk_load: bool = True,
+                 metrics: Optional[StageMetrics] = None):
         """
         Initialize the items database creator
         
         Args:
             database_path: Path for the database file (auto-generated if None)
             failed_items_dir: Directory for failed item analysis (auto-detected if None)
+            base_database: Previous build to patch incrementally (full build if None)
+            streaming: Insert items as they are extracted instead of collecting them all first
+            commit_interval: Number of streamed items between commits
+            bulk_load: Defer indexes and relax durability while loading a fresh database
+            metrics: Stage metrics shared with the ObjectData scan (own instance if None)
         """
+        self.metrics = metrics or StageMetrics()
         self.database_path = database_path
         self.failed_items_dir = failed_items_dir
+        self.base_database = base_database
+        self.streaming = streaming
+        self.commit_interval = max(1, commit_interval)
+        self.bulk_load = bulk_load
+        self.bulk_loader = None
         self.connection = None
         self.cursor = None
         
+        # WAD manifest tracking (incremental rebuilds)
+        self.base_manifest = None
+        self.manifest = None
+        self.manifest_diff = None
+        self.pending_files = None  # Files to re-process in an incremental update (None = all)
+        
+        # Direct LazyObject -> DTO builder for scanner-routed items (created per type list)
+        self.dto_builder: Optional[LazyDTOBuilder] = None
+        
         # Auto-generate paths if not provided
         if self.database_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -76,6 +112,15 @@ class ItemsDatabaseCreator:
     def initialize_database(self) -> bool:
         """Initialize the database with schema"""
         try:
+            # Patch a copy of the previous build when one with a manifest is available
+            if self.base_database:
+                self.base_manifest = prepare_base_database(self.base_database, self.database_path)
+                if self.base_manifest:
+                    self.connection = sqlite3.connect(str(self.database_path))
+                    self.cursor = self.connection.cursor()
+                    print(f"[OK] Opened items database for incremental update: {self.database_path}")
+                    return True
+            
             print(f"Initializing database: {self.database_path}")
             
             # Connect to database
@@ -87,17 +132,23 @@ class ItemsDatabaseCreator:
             for create_statement in ItemsDatabaseSchema.get_create_table_statements():
                 self.cursor.execute(create_statement)
             
-            # Create indexes
-            print("Creating database indexes...")
-            for index_statement in ItemsDatabaseSchema.get_create_index_statements():
-                try:
-                    self.cursor.execute(index_statement)
-                except sqlite3.OperationalError as e:
-                    if "already exists" not in str(e):
-                        print(f"Warning: Failed to create index: {e}")
+            # Create indexes (deferred until the load completes in bulk-load mode)
+            if self.bulk_load:
+                self.bulk_loader = BulkLoader(self.connection, ItemsDatabaseSchema.get_create_index_statements())
+            else:
+                print("Creating database indexes...")
+                for index_statement in ItemsDatabaseSchema.get_create_index_statements():
+                    try:
+                        self.cursor.execute(index_statement)
+                    except sqlite3.OperationalError as e:
+                        if "already exists" not in str(e):
+                            print(f"Warning: Failed to create index: {e}")
             
             self.connection.commit()
             print("[OK] Database schema created successfully")
+            
+            if self.bulk_loader:
+                self.bulk_loader.begin()
             return True
             
         except Exception as e:
@@ -512,59 +563,68 @@ class ItemsDatabaseCreator:
         else:
             return dto
     
-    def process_all_items_from_wad(self) -> bool:
-        """Process all items from WAD and insert into database"""
+    def process_all_items_from_wad(self, session: Optional[WadSession] = None) -> bool:
+        """
+        Process all items from WAD and insert into database
+        
+        Args:
+            session: Shared WadSession (the WAD processor opens its own if None)
+            
+        Returns:
+            True if processing successful
+        """
         self.start_time = datetime.now()
         
+        # Incremental updates only deserialize the changed entries
+        if self.base_manifest:
+            return self._process_changed_items_from_wad(session)
+        
         try:
             # Initialize WAD processor
             print("Initializing WAD processor...")
-            wad_processor = ItemsWADProcessor()
-            if not wad_processor.initialize():
+            metrics = self.metrics
+            wad_processor = ItemsWADProcessor(session=session, direct_dto=True, metrics=metrics)
+            with metrics.stage("open"):
+                initialized = wad_processor.initialize()
+            if not initialized:
                 print("[ERROR] Failed to initialize WAD processor")
                 return False
             
-            # Process all items
-            print("Processing all items from WAD...")
-            if not wad_processor.process_all_items():
-                print("[ERROR] Failed to process items from WAD")
+            with metrics.stage("list"):
+                item_files = wad_processor.get_all_item_files()
+            if not item_files:
+                print("[ERROR] No item files found")
                 return False
             
-            # Get successful items
-            successful_items = wad_processor.get_successful_items()
-            print(f"Processing {len(successful_items)} successful items...")
+            # Record the WAD manifest so the next build can run incrementally
+            with metrics.stage("list"):
+                self.manifest = WadManifest(ObjectDataScanner.OBJECT_DATA_GLOB)
+                self.manifest.build(wad_processor.archive, item_files)
+            metrics.file_size_lookup = self.manifest.get_size
             
-            # Insert items into database
-            for item_data in successful_items:
-                self.total_processed += 1
-                
-                try:
-                    success = self.insert_item_template(
-                        item_data['file_path'],
-                        item_data['item_dto'],
-                        item_data['raw_dict']
-                    )
-                    
-                    if success:
-                        self.total_success += 1
-                    else:
-                        self.total_failed += 1
-                    
-                    # Progress reporting
-                    if self.total_processed % 100 == 0:
-                        progress = (self.total_processed / len(successful_items)) * 100
-                        print(f"[PROGRESS] {self.total_processed}/{len(successful_items)} ({progress:.1f}%) - "
-                              f"Success: {self.total_success}, Failed: {self.total_failed}")
-                
-                except Exception as e:
-                    self.total_failed += 1
-                    print(f"[ERROR] Failed to process item {item_data['file_path']}: {e}")
+            # Accumulating keeps every item in memory, which a budget cannot bound
+            if not self.streaming and metrics.memory_budget:
+                print("[MEMORY] A memory budget is set, inserting items as they are extracted")
+                self.streaming = True
+            
+            if self.streaming:
+                self._insert_items_streaming(wad_processor, item_files)
+            elif not self._insert_items_accumulated(wad_processor, item_files):
+                return False
             
             # Insert processing statistics
-            self._insert_processing_statistics()
+            with metrics.stage("report"):
+                self._insert_processing_statistics()
             
             # Commit all changes
-            self.connection.commit()
+            with metrics.stage("insert"):
+                self.connection.commit()
+            if self.bulk_loader:
+                with metrics.stage("index"):
+                    self.bulk_loader.finish()
+            with metrics.stage("report"):
+                self.manifest.save(get_manifest_path(self.database_path))
+            self._insert_stage_metrics()
             
             self.end_time = datetime.now()
             
@@ -574,6 +634,8 @@ class ItemsDatabaseCreator:
             print(f"Successfully inserted: {self.total_success}")
             print(f"Failed insertions: {self.total_failed}")
             print(f"Processing time: {self.end_time - self.start_time}")
+            print("Stage times:")
+            print(metrics.format_summary())
             
             # Cleanup
             wad_processor.cleanup()
@@ -585,6 +647,236 @@ class ItemsDatabaseCreator:
             traceback.print_exc()
             return False
     
+    def _insert_items_streaming(self, wad_processor: ItemsWADProcessor, item_files: List[str]):
+        """
+        Insert items while they are extracted, one item in flight at a time
+        
+        Only the current item's DTO and raw dict are alive at any point, so peak
+        memory stays flat regardless of how many items the archive contains.
+        
+        Args:
+            wad_processor: Initialized items WAD processor
+            item_files: ObjectData file paths to process
+        """
+        print(f"Streaming {len(item_files)} files into the database...")
+        
+        for file_path, success, raw_dict, item_dto, error_msg in wad_processor.iter_items(item_files):
+            if success:
+                self._insert_extracted_item(file_path, item_dto, raw_dict)
+                
+                if self.total_processed % self.commit_interval == 0:
+                    with self.metrics.stage("insert"):
+                        self.connection.commit()
+                
+                # Commit sooner and cache less when the run approaches its memory budget
+                if self.metrics.memory_budget and self.metrics.memory_budget.is_under_pressure():
+                    with self.metrics.stage("insert"):
+                        self.connection.commit()
+                    self.commit_interval = self.metrics.memory_budget.shrink(
+                        "commit interval", self.commit_interval, 50)
+                    self._shrink_page_cache()
+            elif not wad_processor.is_non_item_result(error_msg):
+                # Keep only the error, the raw data would defeat streaming
+                wad_processor.failed_items.append({'file_path': file_path, 'error': error_msg})
+                self.manifest.forget(file_path)
+        
+        wad_processor.print_processing_summary()
+    
+    def _insert_items_accumulated(self, wad_processor: ItemsWADProcessor, item_files: List[str]) -> bool:
+        """
+        Extract every item first, then insert them (keeps all items in memory)
+        
+        Args:
+            wad_processor: Initialized items WAD processor
+            item_files: ObjectData file paths to process
+            
+        Returns:
+            True if extraction completed
+        """
+        print("Processing all items from WAD...")
+        if not wad_processor.process_all_items(item_files=item_files):
+            print("[ERROR] Failed to process items from WAD")
+            return False
+        
+        for file_path in wad_processor.failed_files:
+            self.manifest.forget(file_path)
+        
+        # Get successful items
+        successful_items = wad_processor.get_successful_items()
+        print(f"Processing {len(successful_items)} successful items...")
+        
+        # Insert items into database (each item adds to its extraction metrics frame)
+        for item_data in successful_items:
+            self.metrics.begin_file(item_data['file_path'])
+            self._insert_extracted_item(item_data['file_path'], item_data['item_dto'], item_data['raw_dict'])
+            self.metrics.end_file()
+            
+            # Progress reporting
+            if self.total_processed % 100 == 0:
+                progress = (self.total_processed / len(successful_items)) * 100
+                print(f"[PROGRESS] {self.total_processed}/{len(successful_items)} ({progress:.1f}%) - "
+                      f"Success: {self.total_success}, Failed: {self.total_failed}")
+        
+        return True
+    
+    def _insert_extracted_item(self, file_path: str, item_dto: WizItemTemplateDTO, raw_dict: Dict[str, Any]):
+        """Insert one extracted item and record its manifest key"""
+        self.total_processed += 1
+        self.metrics.set_file_content(item_dto)
+        
+        try:
+            with self.metrics.stage("insert"):
+                inserted = self.insert_item_template(file_path, item_dto, raw_dict)
+            if inserted:
+                self.total_success += 1
+                self.manifest.record_key(file_path, Path(file_path).name)
+            else:
+                self.total_failed += 1
+                self.manifest.forget(file_path)
+        
+        except Exception as e:
+            self.total_failed += 1
+            self.manifest.forget(file_path)
+            print(f"[ERROR] Failed to process item {file_path}: {e}")
+    
+    def _shrink_page_cache(self):
+        """Halve the bulk-load page cache to stay under the memory budget"""
+        if self.bulk_loader and self.bulk_loader.active:
+            self.bulk_loader.set_cache_mb(
+                self.metrics.memory_budget.shrink("SQLite page cache MB", self.bulk_loader.cache_mb, 16))
+    
+    def _process_changed_items_from_wad(self, session: Optional[WadSession] = None) -> bool:
+        """
+        Patch the copied base database with the ObjectData entries changed since it was built
+        
+        Args:
+            session: Shared WadSession (a default session is opened if None)
+            
+        Returns:
+            True if processing successful
+        """
+        try:
+            if session is None:
+                session = WadSession()
+            with self.metrics.stage("open"):
+                opened = session.open()
+            if not opened:
+                print("[ERROR] Failed to open WAD session")
+                return False
+            
+            scanner = ObjectDataScanner(session.archive, session.serializer, session.type_list,
+                                        metrics=self.metrics)
+            scanner.register_consumer(WIZ_ITEM_TEMPLATE_HASH, self)
+            return scanner.scan()
+            
+        except Exception as e:
+            print(f"[ERROR] Incremental items update failed: {e}")
+            traceback.print_exc()
+            return False
+    
+    def prepare_scan(self, manifest: WadManifest) -> Optional[Set[str]]:
+        """Diff the ObjectData manifest against the base build and drop stale item rows"""
+        self.manifest = manifest.copy_entries()
+        if not self.base_manifest:
+            return None
+        
+        self.manifest_diff = apply_manifest_diff(self.cursor, "filename", self.manifest, self.base_manifest)
+        self.connection.commit()
+        self.pending_files = set(self.manifest_diff.reprocess_paths)
+        return self.pending_files
+    
+    def consume(self, file_path: str, object_data: Any, type_list: Any):
+        """Convert and insert a WizItemTemplate routed by the ObjectDataScanner"""
+        # Unchanged entries are already in the patched database
+        if self.pending_files is not None and file_path not in self.pending_files:
+            return
+        
+        if self.start_time is None:
+            self.start_time = datetime.now()
+        
+        self.total_processed += 1
+        
+        try:
+            if self.dto_builder is None or self.dto_builder.type_list is not type_list:
+                self.dto_builder = ItemsDTOFactory.create_lazy_dto_builder(type_list)
+            
+            try:
+                with self.metrics.stage("dto"):
+                    item_dto, raw_dict = self.dto_builder.build(object_data, 'class WizItemTemplate')
+            except DirectConversionError:
+                # The dict-based path reports the problem
+                with self.metrics.stage("convert"):
+                    raw_dict = convert_lazy_object_to_dict(object_data, type_list)
+                with self.metrics.stage("dto"):
+                    item_dto = ItemsDTOFactory.create_from_json_data(raw_dict)
+            
+            if item_dto is None:
+                self.total_failed += 1
+                self.insertion_errors.append({
+                    'file_path': file_path,
+                    'error': "Failed to create WizItemTemplate DTO"
+                })
+                if self.manifest is not None:
+                    self.manifest.forget(file_path)
+                return
+            self.metrics.set_file_content(item_dto)
+            
+            with self.metrics.stage("insert"):
+                inserted = self.insert_item_template(file_path, item_dto, raw_dict)
+            if inserted:
+                self.total_success += 1
+                if self.manifest is not None:
+                    self.manifest.record_key(file_path, Path(file_path).name)
+            else:
+                self.total_failed += 1
+                if self.manifest is not None:
+                    self.manifest.forget(file_path)
+        
+        except Exception as e:
+            self.total_failed += 1
+            if self.manifest is not None:
+                self.manifest.forget(file_path)
+            print(f"[ERROR] Failed to process item {file_path}: {e}")
+    
+    def on_batch_complete(self):
+        """Commit the current scanner batch"""
+        if self.connection:
+            with self.metrics.stage("insert"):
+                self.connection.commit()
+    
+    def on_memory_pressure(self, budget: MemoryBudget):
+        """Shrink the bulk-load page cache"""
+        self._shrink_page_cache()
+    
+    def on_scan_complete(self, scanner: ObjectDataScanner):
+        """Write processing statistics after the ObjectData scan"""
+        if self.start_time is None:
+            self.start_time = datetime.now()
+        self.end_time = datetime.now()
+        
+        with self.metrics.stage("report"):
+            self._insert_processing_statistics()
+        with self.metrics.stage("insert"):
+            self.connection.commit()
+        if self.bulk_loader:
+            with self.metrics.stage("index"):
+                self.bulk_loader.finish()
+        if self.manifest is not None:
+            with self.metrics.stage("report"):
+                self.manifest.save(get_manifest_path(self.database_path))
+        self._insert_stage_metrics()
+        
+        print("\n[COMPLETE] Items database creation finished!")
+        print(f"Database saved: {self.database_path}")
+        print(f"Total items processed: {self.total_processed}")
+        print(f"Successfully inserted: {self.total_success}")
+        print(f"Failed insertions: {self.total_failed}")
+        if self.manifest_diff:
+            print(f"Incremental update from {self.base_database}: {self.manifest_diff.summary()}")
+        print(f"Processing time: {self.end_time - self.start_time}")
+        print("Stage times:")
+        print(self.metrics.format_summary())
+    
     def _insert_processing_statistics(self):
         """Insert processing statistics into database"""
         try:
@@ -606,6 +898,13 @@ class ItemsDatabaseCreator:
         except Exception as e:
             print(f"[WARNING] Failed to insert processing statistics: {e}")
     
+    def _insert_stage_metrics(self):
+        """Insert the stage timings and per-file latencies of this run into database"""
+        try:
+            self.metrics.save(self.connection)
+        except Exception as e:
+            print(f"[WARNING] Failed to insert stage metrics: {e}")
+    
     def cleanup(self):
         """Clean up database resources"""
         if self.connection:
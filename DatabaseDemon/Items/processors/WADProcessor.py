@@ -10,17 +10,21 @@ import json
 import os
 import platform
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import traceback
 
 import katsuba
 from katsuba.wad import Archive
-from katsuba.op import LazyObject, LazyList, TypeList, Serializer, SerializerOptions
+from katsuba.op import LazyObject, LazyList, Serializer, SerializerOptions
 
 # Add DatabaseDemon to path for imports
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from utils.conversion_utils import convert_lazy_object_to_dict
+from utils.lazy_dto_builder import DirectConversionError
+from utils.wad_session import WadSession
+from utils.type_list_cache import open_cached_type_list
+from utils.stage_metrics import StageMetrics
 
 # Import item DTOs
 from ..dtos import ItemsDTOFactory
@@ -33,15 +37,23 @@ class ItemsWADProcessor:
     # WizItemTemplate type hash
     WIZITEMTEMPLATE_HASH = 991922385
     
-    def __init__(self, types_path: Optional[Path] = None, max_file_size_mb: int = 100):
+    def __init__(self, types_path: Optional[Path] = None, max_file_size_mb: int = 100,
+                 session: Optional[WadSession] = None, direct_dto: bool = False,
+                 metrics: Optional[StageMetrics] = None):
         """
         Initialize the WAD processor
         
         Args:
             types_path: Path to types.json file (auto-detected if None)
             max_file_size_mb: Maximum file size for processing chunks
+            session: Shared WadSession to reuse instead of opening the WAD again
+            direct_dto: Build DTOs straight from the LazyObjects; successful results then carry
+                        a DirectRecord instead of the full raw dict
+            metrics: Stage metrics receiving per-file timings (own instance if None)
         """
-        self.types_path = types_path
+        self.session = session
+        self.metrics = metrics or StageMetrics()
+        self.types_path = session.types_path if session else types_path
         self.max_file_size = max_file_size_mb * 1024 * 1024
         
         # WAD processing components
@@ -49,11 +61,14 @@ class ItemsWADProcessor:
         self.archive = None
         self.type_list = None
         self.serializer = None
+        self.direct_dto = direct_dto
+        self.dto_builder = None
         
         # Statistics
         self.total_files_processed = 0
         self.total_items_found = 0
         self.total_non_items = 0
+        self.skipped_type_counts = {}  # {root_type_hash: count} skipped before conversion
         self.processing_errors = []
         self.failed_files = []
         
@@ -63,6 +78,8 @@ class ItemsWADProcessor:
         
         # Auto-detect paths
         self._auto_detect_paths()
+        if session:
+            self.wad_path = session.wad_path
     
     def _auto_detect_paths(self):
         """Auto-detect platform-specific paths for WAD and types files"""
@@ -117,6 +134,18 @@ class ItemsWADProcessor:
         print("Initializing Items WAD Processor...")
         print("=" * 50)
         
+        # Reuse the shared session resources if one was provided
+        if self.session:
+            if not self.session.open():
+                print("[ERROR] Failed to open WAD session")
+                return False
+            self.archive = self.session.archive
+            self.type_list = self.session.type_list
+            self.serializer = self.session.serializer
+            self._create_dto_builder()
+            print("[OK] Items WAD Processor using shared WAD session")
+            return True
+        
         # Load type list
         if not self._load_type_list():
             return False
@@ -129,11 +158,17 @@ class ItemsWADProcessor:
         if not self._create_serializer():
             return False
         
+        self._create_dto_builder()
         print("[OK] Items WAD Processor initialized successfully")
         print(f"WAD Path: {self.wad_path}")
         print(f"Types Path: {self.types_path}")
         return True
     
+    def _create_dto_builder(self):
+        """Create the direct LazyObject -> DTO builder if direct DTO mode is enabled"""
+        if self.direct_dto and self.type_list:
+            self.dto_builder = ItemsDTOFactory.create_lazy_dto_builder(self.type_list)
+    
     def _load_type_list(self) -> bool:
         """Load TypeList from types.json"""
         try:
@@ -141,7 +176,7 @@ class ItemsWADProcessor:
                 print(f"[ERROR] Types file not found: {self.types_path}")
                 return False
             
-            self.type_list = TypeList.open(str(self.types_path))
+            self.type_list = open_cached_type_list(self.types_path)
             print(f"[OK] Loaded type definitions from {self.types_path}")
             return True
         except Exception as e:
@@ -201,16 +236,34 @@ class ItemsWADProcessor:
         Returns:
             Tuple of (success, raw_dict, item_dto, error_message)
         """
+        metrics = self.metrics
         try:
             # Deserialize the object data
-            if self.serializer:
-                object_data = self.archive.deserialize(file_path, self.serializer)
-            else:
-                object_data = self.archive[file_path]
+            with metrics.stage("deserialize"):
+                if self.serializer:
+                    object_data = self.archive.deserialize(file_path, self.serializer)
+                else:
+                    object_data = self.archive[file_path]
+            
+            # Peek at the root type hash and skip non-items before any conversion
+            if isinstance(object_data, LazyObject) and object_data.type_hash != self.WIZITEMTEMPLATE_HASH:
+                type_hash = object_data.type_hash
+                self.skipped_type_counts[type_hash] = self.skipped_type_counts.get(type_hash, 0) + 1
+                return False, {'$__type': type_hash}, None, f"Not a WizItemTemplate (type: {type_hash})"
+            
+            # Build the DTO straight from the LazyObject when possible
+            if self.dto_builder and isinstance(object_data, LazyObject):
+                try:
+                    with metrics.stage("dto"):
+                        item_dto, item_record = self.dto_builder.build(object_data, 'class WizItemTemplate')
+                    return True, item_record, item_dto, ""
+                except DirectConversionError:
+                    pass  # The dict-based path below reports the problem
             
             # Convert to dictionary format
             if isinstance(object_data, LazyObject):
-                obj_dict = convert_lazy_object_to_dict(object_data, self.type_list)
+                with metrics.stage("convert"):
+                    obj_dict = convert_lazy_object_to_dict(object_data, self.type_list)
             else:
                 obj_dict = object_data
             
@@ -220,7 +273,8 @@ class ItemsWADProcessor:
                 return False, obj_dict, None, f"Not a WizItemTemplate (type: {obj_type})"
             
             # Create DTO using factory
-            item_dto = ItemsDTOFactory.create_from_json_data(obj_dict)
+            with metrics.stage("dto"):
+                item_dto = ItemsDTOFactory.create_from_json_data(obj_dict)
             if item_dto is None:
                 return False, obj_dict, None, "Failed to create WizItemTemplate DTO"
             
@@ -230,12 +284,76 @@ class ItemsWADProcessor:
             error_msg = f"Processing error: {str(e)}"
             return False, {}, None, error_msg
     
-    def process_all_items(self, progress_callback=None) -> bool:
+    @staticmethod
+    def is_non_item_result(error_msg: str) -> bool:
+        """Check whether a failed result is just a non-item file rather than a processing error"""
+        return "Not a WizItemTemplate" in error_msg
+    
+    def iter_items(self, item_files: List[str], progress_callback=None,
+                   keyed_frames: bool = False) -> Iterator[Tuple[str, bool, Dict[str, Any], Optional[WizItemTemplateDTO], str]]:
+        """
+        Process item files one at a time and yield each result as it is produced
+        
+        Statistics, failed file paths and processing errors are tracked as usual,
+        but no item data is retained, so memory use does not grow with the corpus.
+        Each file's metrics frame stays open while its result is handled, so the
+        caller's insert counts towards the file.
+        
+        Args:
+            item_files: ObjectData file paths to process
+            progress_callback: Optional callback function for progress updates
+            keyed_frames: Key the metrics frames by file path (results are inserted in a later pass)
+            
+        Yields:
+            (file_path, success, raw_dict, item_dto, error_message)
+        """
+        total_files = len(item_files)
+        metrics = self.metrics
+        
+        for i, file_path in enumerate(item_files):
+            self.total_files_processed += 1
+            metrics.begin_file(file_path if keyed_frames else None, name=file_path)
+            
+            try:
+                success, raw_dict, item_dto, error_msg = self.process_single_item(file_path)
+            except Exception as e:
+                self.failed_files.append(file_path)
+                self.processing_errors.append({
+                    'file_path': file_path,
+                    'error': str(e),
+                    'traceback': traceback.format_exc()
+                })
+                success, raw_dict, item_dto, error_msg = False, {}, None, f"Processing error: {e}"
+            else:
+                if success:
+                    self.total_items_found += 1
+                else:
+                    self.total_non_items += 1
+                    if not self.is_non_item_result(error_msg):
+                        # This was a processing error, not just a non-item
+                        self.failed_files.append(file_path)
+            
+            yield file_path, success, raw_dict, item_dto, error_msg
+            metrics.end_file()
+            
+            # Progress reporting
+            if self.total_files_processed % 1000 == 0 or i == total_files - 1:
+                progress = (self.total_files_processed / total_files) * 100
+                print(f"[PROGRESS] {self.total_files_processed}/{total_files} ({progress:.1f}%) - "
+                      f"Found {self.total_items_found} items, {self.total_non_items} non-items, "
+                      f"{len(self.failed_files)} failed")
+                
+                if progress_callback:
+                    progress_callback(self.total_files_processed, total_files, 
+                                   self.total_items_found, len(self.failed_files))
+    
+    def process_all_items(self, progress_callback=None, item_files: Optional[List[str]] = None) -> bool:
         """
-        Process all item files in ObjectData
+        Process all item files in ObjectData, keeping every result in memory
         
         Args:
             progress_callback: Optional callback function for progress updates
+            item_files: ObjectData file paths to process (globbed from the archive if None)
             
         Returns:
             True if processing completed successfully
@@ -245,69 +363,31 @@ class ItemsWADProcessor:
         
         try:
             # Get all item files
-            item_files = self.get_all_item_files()
+            if item_files is None:
+                item_files = self.get_all_item_files()
             if not item_files:
                 print("[ERROR] No item files found")
                 return False
             
-            total_files = len(item_files)
-            print(f"Processing {total_files} files...")
+            print(f"Processing {len(item_files)} files...")
             
-            # Process each file
-            for i, file_path in enumerate(item_files):
-                self.total_files_processed += 1
-                
-                try:
-                    success, raw_dict, item_dto, error_msg = self.process_single_item(file_path)
-                    
-                    if success:
-                        self.total_items_found += 1
-                        self.successful_items.append({
-                            'file_path': file_path,
-                            'raw_dict': raw_dict,
-                            'item_dto': item_dto
-                        })
-                    else:
-                        self.total_non_items += 1
-                        if "Not a WizItemTemplate" not in error_msg:
-                            # This was a processing error, not just a non-item
-                            self.failed_files.append(file_path)
-                            self.failed_items.append({
-                                'file_path': file_path,
-                                'error': error_msg,
-                                'raw_dict': raw_dict
-                            })
-                
-                except Exception as e:
-                    self.failed_files.append(file_path)
-                    self.processing_errors.append({
+            # Process each file (the inserts later reopen each item's metrics frame)
+            for file_path, success, raw_dict, item_dto, error_msg in self.iter_items(item_files, progress_callback,
+                                                                                     keyed_frames=True):
+                if success:
+                    self.successful_items.append({
                         'file_path': file_path,
-                        'error': str(e),
-                        'traceback': traceback.format_exc()
+                        'raw_dict': raw_dict,
+                        'item_dto': item_dto
+                    })
+                elif not self.is_non_item_result(error_msg):
+                    self.failed_items.append({
+                        'file_path': file_path,
+                        'error': error_msg,
+                        'raw_dict': raw_dict
                     })
-                
-                # Progress reporting
-                if self.total_files_processed % 1000 == 0 or i == total_files - 1:
-                    progress = (self.total_files_processed / total_files) * 100
-                    print(f"[PROGRESS] {self.total_files_processed}/{total_files} ({progress:.1f}%) - "
-                          f"Found {self.total_items_found} items, {self.total_non_items} non-items, "
-                          f"{len(self.failed_files)} failed")
-                    
-                    if progress_callback:
-                        progress_callback(self.total_files_processed, total_files, 
-                                       self.total_items_found, len(self.failed_files))
-            
-            print(f"\n[COMPLETE] Processing finished!")
-            print(f"Total files processed: {self.total_files_processed}")
-            print(f"WizItemTemplates found: {self.total_items_found}")
-            print(f"Non-item objects: {self.total_non_items}")
-            print(f"Processing errors: {len(self.processing_errors)}")
-            print(f"Failed files: {len(self.failed_files)}")
-            
-            if self.total_items_found > 0:
-                success_rate = (self.total_items_found / self.total_files_processed) * 100
-                print(f"Item discovery rate: {success_rate:.2f}%")
             
+            self.print_processing_summary()
             return True
             
         except Exception as e:
@@ -315,6 +395,19 @@ class ItemsWADProcessor:
             traceback.print_exc()
             return False
     
+    def print_processing_summary(self):
+        """Print item processing summary"""
+        print(f"\n[COMPLETE] Processing finished!")
+        print(f"Total files processed: {self.total_files_processed}")
+        print(f"WizItemTemplates found: {self.total_items_found}")
+        print(f"Non-item objects: {self.total_non_items} ({len(self.skipped_type_counts)} root types)")
+        print(f"Processing errors: {len(self.processing_errors)}")
+        print(f"Failed files: {len(self.failed_files)}")
+        
+        if self.total_items_found > 0:
+            success_rate = (self.total_items_found / self.total_files_processed) * 100
+            print(f"Item discovery rate: {success_rate:.2f}%")
+    
     def get_processing_statistics(self) -> Dict[str, Any]:
         """Get comprehensive processing statistics"""
         return {
@@ -325,7 +418,8 @@ class ItemsWADProcessor:
             "failed_files": len(self.failed_files),
             "success_rate": (self.total_items_found / max(1, self.total_files_processed)) * 100,
             "successful_items": len(self.successful_items),
-            "failed_items": len(self.failed_items)
+            "failed_items": len(self.failed_items),
+            "skipped_type_counts": dict(self.skipped_type_counts)
         }
     
     def get_successful_items(self) -> List[Dict[str, Any]]:
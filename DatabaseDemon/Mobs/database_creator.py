@@ -12,7 +12,18 @@ This script:
 5. Stores mob data with full behavior relationships
 
 Usage:
-    python database_creator.py
+    python database_creator.py [--base-database PATH] [--compress-failures] [--no-bulk-load]
+                               [stage metrics options]
+
+Options:
+    --base-database PATH  Patch a copy of a previous build instead of rebuilding.
+                          Only ObjectData entries that were added, changed or
+                          removed since that build (per its .manifest.json)
+                          are re-processed.
+    --compress-failures   Gzip the mob_failures.jsonl failure log
+    --no-bulk-load        Create indexes before loading instead of after. By
+                          default a fresh build loads with relaxed durability
+                          and builds all indexes (plus ANALYZE) at the end.
 
 Requirements:
     - types.json file in parent DatabaseDemon directory
@@ -21,11 +32,14 @@ Requirements:
 
 Output:
     - database/mob_templates_{timestamp}.db - SQLite database
-    - failed_mobs/ - Error analysis and failed records
+    - database/mob_templates_{timestamp}.db.manifest.json - WAD manifest for incremental rebuilds
+    - failed_mobs/ - Error analysis and failed records (mob_failures.jsonl[.gz],
+      one failure per line, summarized in processing_summary.json)
 """
 
 import sys
 import os
+import argparse
 from pathlib import Path
 import platform
 from datetime import datetime
@@ -34,6 +48,8 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent))
 
 from processors import MobDatabaseCreator
+from utils.bulk_load import add_bulk_load_argument
+from utils.stage_metrics import METRICS_OPTIONS_HELP, add_metrics_arguments, apply_metrics_arguments
 
 
 def get_platform_paths():
@@ -76,8 +92,31 @@ def check_prerequisites():
     return True
 
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Create Wizard101 mob database from Root.wad"
+    )
+    parser.add_argument(
+        '--base-database',
+        type=Path,
+        default=None,
+        help='Previous mob database to patch incrementally (default: full build)'
+    )
+    parser.add_argument(
+        '--compress-failures',
+        action='store_true',
+        help='Gzip the mob_failures.jsonl failure log'
+    )
+    add_bulk_load_argument(parser)
+    add_metrics_arguments(parser)
+    return parser.parse_args()
+
+
 def main():
     """Main function to create the Wizard101 mob database"""
+    args = parse_arguments()
+    
     print("Wizard101 Mob Database Creator")
     print("=" * 50)
     
@@ -91,7 +130,10 @@ def main():
     
     # Initialize database creator
     print("\nInitializing mob database creator...")
-    creator = MobDatabaseCreator()
+    creator = MobDatabaseCreator(base_database=args.base_database,
+                                 compress_failures=args.compress_failures,
+                                 bulk_load=not args.no_bulk_load)
+    apply_metrics_arguments(args, creator.metrics)
     
     try:
         # Initialize
@@ -161,6 +203,7 @@ def main():
 def show_help():
     """Show help information"""
     print(__doc__)
+    print(METRICS_OPTIONS_HELP)
 
 
 if __name__ == "__main__":
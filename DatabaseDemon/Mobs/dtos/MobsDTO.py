@@ -9,14 +9,19 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Any, Dict, Union
 from .MobsEnums import MobTitle, SchoolType, ObjectType, LightType, PathDirection, PathType
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.slotted_dto import SlottedDTO
 
-@dataclass
-class BehaviorTemplateDTO:
+
+@dataclass(slots=True)
+class BehaviorTemplateDTO(SlottedDTO):
     """Base DTO for BehaviorTemplate (hash: 360231646)"""
     m_behaviorName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationBehaviorDTO(BehaviorTemplateDTO):
     """DTO for AnimationBehavior (hash: 101271634)"""
     m_animationAssetName: Optional[str] = None
@@ -38,7 +43,7 @@ class AnimationBehaviorDTO(BehaviorTemplateDTO):
     m_skeletonID: Optional[int] = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WizardEquipmentBehaviorDTO(BehaviorTemplateDTO):
     """DTO for WizardEquipmentBehavior (hash: 892480983)"""
     m_equipmentTemplate: Optional[str] = None
@@ -46,13 +51,13 @@ class WizardEquipmentBehaviorDTO(BehaviorTemplateDTO):
     m_itemList: Optional[List[int]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicObjectStateBehaviorDTO(BehaviorTemplateDTO):
     """DTO for BasicObjectStateBehavior (hash: 1364452653)"""
     m_stateSetName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PathBehaviorDTO(BehaviorTemplateDTO):
     """DTO for PathBehavior (hash: 185541179)"""
     m_actionList: Optional[List[Any]] = field(default_factory=list)
@@ -63,20 +68,20 @@ class PathBehaviorDTO(BehaviorTemplateDTO):
     m_timeToPause: Optional[float] = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PathMovementBehaviorDTO(BehaviorTemplateDTO):
     """DTO for PathMovementBehavior (hash: 1443896326)"""
     m_movementScale: Optional[float] = 1.0
     m_movementSpeed: Optional[float] = 133.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DuelistBehaviorDTO(BehaviorTemplateDTO):
     """DTO for DuelistBehavior (hash: 290147688)"""
     m_npcProximity: Optional[float] = 350.0
 
 
-@dataclass
+@dataclass(slots=True)
 class NPCBehaviorDTO(BehaviorTemplateDTO):
     """DTO for NPCBehavior (hash: 1701337223)"""
     m_baseEffects: Optional[List[Any]] = field(default_factory=list)
@@ -96,7 +101,7 @@ class NPCBehaviorDTO(BehaviorTemplateDTO):
     m_turnTowardsPlayer: Optional[bool] = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CollisionBehaviorDTO(BehaviorTemplateDTO):
     """DTO for CollisionBehavior (hash: 2052493990)"""
     m_bAutoClickBox: Optional[bool] = True
@@ -106,7 +111,7 @@ class CollisionBehaviorDTO(BehaviorTemplateDTO):
     m_walkableCollisionFilename: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MobMonsterMagicBehaviorDTO(BehaviorTemplateDTO):
     """DTO for MobMonsterMagicBehavior (hash: 959047476)"""
     m_alternateMobTemplateID: Optional[int] = 0
@@ -123,8 +128,8 @@ class MobMonsterMagicBehaviorDTO(BehaviorTemplateDTO):
     m_worldName: Optional[str] = None
 
 
-@dataclass
-class WizGameObjectTemplateDTO:
+@dataclass(slots=True)
+class WizGameObjectTemplateDTO(SlottedDTO):
     """Main DTO for WizGameObjectTemplate (hash: 701229577)"""
     # Core identification
     m_templateID: Optional[int] = None
@@ -6,7 +6,7 @@ and behavior handling.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Type, Union
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple, Type, Union
 from dataclasses import fields
 
 from .MobsDTO import (
@@ -23,6 +23,14 @@ from .MobsDTO import (
     MobMonsterMagicBehaviorDTO
 )
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.slotted_dto import INTERNED_FIELDS
+from utils.conversion_utils import convert_field_value, convert_lazy_object_to_dict_with_hash_only, decode_key
+from utils.lazy_dto_builder import DirectConversionError, DirectRecord
+from katsuba.op import LazyObject, LazyList
+
 
 class MobsDTOFactory:
     """Factory for creating mob DTOs from JSON data"""
@@ -46,6 +54,12 @@ class MobsDTOFactory:
         959047476: MobMonsterMagicBehaviorDTO,   # MobMonsterMagicBehavior
     }
     
+    # Field names per DTO class, computed once per class
+    _fields_by_class: Dict[Type, FrozenSet[str]] = {}
+    
+    # Behavior DTO class -> type hash (reverse of BEHAVIOR_TYPE_MAPPINGS)
+    _behavior_hash_by_class: Optional[Dict[Type, int]] = None
+    
     @classmethod
     def create_from_json_data(cls, data: Dict[str, Any]) -> Optional[WizGameObjectTemplateDTO]:
         """
@@ -79,6 +93,78 @@ class MobsDTOFactory:
             logging.warning(f"Failed to create mob DTO: {e}")
             return None
     
+    @classmethod
+    def create_from_lazy_object(cls, lazy_object: Any, type_list: Any) -> Tuple[WizGameObjectTemplateDTO, DirectRecord]:
+        """
+        Create a mob DTO straight from a LazyObject, converting only the declared fields
+        
+        Gives the same DTO as create_from_json_data on the hash-only dict conversion,
+        without materializing the fields the DTOs do not use.
+        
+        Args:
+            lazy_object: Deserialized ObjectData root object
+            type_list: TypeList of the archive
+            
+        Returns:
+            (mob_dto, record) - the record rebuilds the raw dict for failure logging
+            
+        Raises:
+            DirectConversionError: The object has to go through create_from_json_data
+        """
+        if not isinstance(lazy_object, LazyObject) or lazy_object.type_hash != 701229577:
+            raise DirectConversionError("Not a WizGameObjectTemplate LazyObject")
+        
+        try:
+            # Behaviors stay lazy, each one is converted according to its behavior type
+            data = cls._convert_declared_fields(WizGameObjectTemplateDTO, lazy_object, type_list,
+                                                lazy_fields=frozenset({'m_behaviors'}))
+            
+            if 'm_behaviors' in data:
+                behaviors = data['m_behaviors']
+                if isinstance(behaviors, (LazyList, list)):
+                    data['m_behaviors'] = [cls._convert_lazy_behavior(behavior, type_list) for behavior in behaviors]
+                else:
+                    data['m_behaviors'] = convert_field_value(behaviors, type_list, hash_only=True)
+            
+            mob_dto = cls._create_dto_from_data(WizGameObjectTemplateDTO, data)
+        except DirectConversionError:
+            raise
+        except Exception as e:
+            raise DirectConversionError(str(e)) from e
+        
+        return mob_dto, DirectRecord(
+            701229577, rebuild=lambda: convert_lazy_object_to_dict_with_hash_only(lazy_object, type_list)
+        )
+    
+    @classmethod
+    def _convert_declared_fields(cls, dto_class: Type, lazy_object: LazyObject, type_list: Any,
+                                 lazy_fields: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+        """Convert only the fields of a LazyObject that the DTO class declares (hash-only conversion)"""
+        dto_fields = cls._get_dto_fields(dto_class)
+        
+        data = {}
+        for key, value in lazy_object.items(type_list):
+            key = decode_key(key)
+            if key in dto_fields:
+                data[key] = value if key in lazy_fields else convert_field_value(value, type_list, hash_only=True)
+        return data
+    
+    @classmethod
+    def _convert_lazy_behavior(cls, behavior: Any, type_list: Any) -> Any:
+        """Convert one entry of a lazy m_behaviors list like _process_behaviors does"""
+        if isinstance(behavior, LazyObject):
+            behavior_class = cls.BEHAVIOR_TYPE_MAPPINGS.get(behavior.type_hash)
+            if behavior_class is None:
+                # Unknown behavior type - keep the raw data
+                return convert_field_value(behavior, type_list, hash_only=True)
+            data = cls._convert_declared_fields(behavior_class, behavior, type_list)
+            try:
+                return cls._create_dto_from_data(behavior_class, data)
+            except Exception as e:
+                raise DirectConversionError(f"Failed to create behavior DTO: {e}") from e
+        
+        return convert_field_value(behavior, type_list, hash_only=True)
+    
     @classmethod
     def _process_behaviors(cls, behaviors_data: List[Any]) -> List[Any]:
         """
@@ -133,17 +219,46 @@ class MobsDTOFactory:
             DTO instance with populated fields
         """
         # Get field names for the DTO class
-        dto_fields = {f.name for f in fields(dto_class)}
+        dto_fields = cls._get_dto_fields(dto_class)
         
-        # Extract relevant data for this DTO
+        # Extract relevant data for this DTO (repeated names are interned)
         dto_data = {}
         for key, value in data.items():
             if key in dto_fields:
+                if key in INTERNED_FIELDS and type(value) is str:
+                    value = sys.intern(value)
                 dto_data[key] = value
         
         # Create DTO instance
         return dto_class(**dto_data)
     
+    @classmethod
+    def _get_dto_fields(cls, dto_class: Type) -> FrozenSet[str]:
+        """Get the field names of a DTO class (computed once per class)"""
+        dto_fields = cls._fields_by_class.get(dto_class)
+        if dto_fields is None:
+            dto_fields = frozenset(f.name for f in fields(dto_class))
+            cls._fields_by_class[dto_class] = dto_fields
+        return dto_fields
+    
+    @classmethod
+    def get_behavior_type_hash(cls, behavior: Any) -> int:
+        """
+        Get the type hash of a behavior DTO
+        
+        Args:
+            behavior: Behavior DTO created by this factory
+            
+        Returns:
+            Type hash of the behavior class, 0 if it is not a known behavior DTO
+        """
+        if cls._behavior_hash_by_class is None:
+            behavior_hash_by_class = {}
+            for hash_value, dto_class in cls.BEHAVIOR_TYPE_MAPPINGS.items():
+                behavior_hash_by_class.setdefault(dto_class, hash_value)
+            cls._behavior_hash_by_class = behavior_hash_by_class
+        return cls._behavior_hash_by_class.get(type(behavior), 0)
+    
     @classmethod
     def get_supported_mob_types(cls) -> Dict[int, str]:
         """
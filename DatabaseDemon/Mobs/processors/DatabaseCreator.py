@@ -6,12 +6,13 @@ Creates and populates SQLite database with Wizard101 mob data from ObjectData fi
 Handles WizGameObjectTemplate processing with comprehensive behavior relationship management.
 """
 
+import hashlib
 import json
 import sqlite3
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 import traceback
 
 from .DatabaseSchema import MobDatabaseSchema
@@ -22,29 +23,73 @@ sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
 sys.path.append(str(Path(__file__).parent.parent))         # Mobs level
 
 from utils.conversion_utils import convert_lazy_object_to_dict_with_hash_only
+from utils.lazy_dto_builder import DirectConversionError, DirectRecord
+from utils.object_data_scanner import (
+    ObjectDataConsumer, ObjectDataScanner, WIZ_GAME_OBJECT_TEMPLATE_HASH
+)
+from utils.wad_session import WadSession
+from utils.failure_log import FailureLog, summarize_failures
+from utils.bulk_load import BulkLoader
+from utils.process_memory import MemoryBudget
+from utils.stage_metrics import StageMetrics
+from utils.wad_manifest import (
+    WadManifest, get_manifest_path, prepare_base_database, apply_manifest_diff
+)
 
 # Import mob DTOs
-from dtos import MobsDTOFactory
-from dtos.MobsDTO import *
+try:
+    from ..dtos import MobsDTOFactory
+    from ..dtos.MobsDTO import *
+except ImportError:
+    from dtos import MobsDTOFactory
+    from dtos.MobsDTO import *
 
 
-class MobDatabaseCreator:
+class MobDatabaseCreator(ObjectDataConsumer):
     """Creates and manages the Wizard101 mob database"""
     
+    # mob_templates columns compared for duplicate detection (everything but template_id)
+    MOB_CONTENT_COLUMNS = (
+        "object_name", "display_name", "description", "visual_id", "object_type",
+        "primary_school_name", "aggro_sound", "cast_sound", "death_sound", "hit_sound",
+        "death_particles", "icon_path", "exempt_from_aoi", "location_preference",
+        "leash_offset_override", "type_hash"
+    )
+    
     def __init__(self, database_path: Optional[Path] = None, 
-                 failed_mobs_dir: Optional[Path] = None):
+                 failed_mobs_dir: Optional[Path] = None,
+                 base_database: Optional[Path] = None,
+                 compress_failures: bool = False,
+                 bulk_load: bool = True,
+                 metrics: Optional[StageMetrics] = None):
         """
         Initialize the mob database creator
         
         Args:
             database_path: Path for the database file (auto-generated if None)
             failed_mobs_dir: Directory for failed mob analysis (auto-detected if None)
+            base_database: Previous build to patch incrementally (full build if None)
+            compress_failures: Gzip the mob_failures.jsonl failure log
+            bulk_load: Defer indexes and relax durability while loading a fresh database
+            metrics: Stage metrics shared with the ObjectData scan (own instance if None)
         """
+        self.metrics = metrics or StageMetrics()
         self.database_path = database_path
         self.failed_mobs_dir = failed_mobs_dir
+        self.base_database = base_database
+        self.compress_failures = compress_failures
+        self.bulk_load = bulk_load
+        self.bulk_loader = None
+        self.failure_log = None
         self.connection = None
         self.cursor = None
         
+        # WAD manifest tracking (incremental rebuilds)
+        self.base_manifest = None
+        self.manifest = None
+        self.manifest_diff = None
+        self.pending_files = None  # Files to re-process in an incremental update (None = all)
+        
         # Statistics
         self.total_processed = 0
         self.total_success = 0
@@ -52,11 +97,17 @@ class MobDatabaseCreator:
         self.duplicate_count = 0
         self.processing_start_time = None
         self.processing_end_time = None
+        self.scan_statistics = {}
+        self.skipped_type_counts = {}  # {root_type_hash: count} of non-mob files skipped before conversion
         
         # Error tracking
         self.duplicate_files = []
         self.failed_files = []
         
+        # (object_name, content hash) of mobs already in the database
+        # (seeded from mob_templates on first use)
+        self.existing_mob_keys: Optional[Set[Tuple[str, bytes]]] = None
+        
         # Skipped element tracking
         self.skipped_elements = {}  # {filename: {element_path: (element_type, reason, data)}}
         self.unhandled_fields = {}  # {filename: {field_name: value}}
@@ -92,6 +143,10 @@ class MobDatabaseCreator:
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         self.failed_mobs_dir.mkdir(parents=True, exist_ok=True)
         
+        # Failures are appended as JSON lines, the report is rebuilt at the end
+        self.failure_log = FailureLog(self.failed_mobs_dir / "mob_failures.jsonl",
+                                      compress=self.compress_failures)
+        
         print(f"[OK] Database path: {self.database_path}")
         print(f"[OK] Failed mobs directory: {self.failed_mobs_dir}")
         
@@ -105,6 +160,15 @@ class MobDatabaseCreator:
             True if database creation successful, False otherwise
         """
         try:
+            # Patch a copy of the previous build when one with a manifest is available
+            if self.base_database:
+                self.base_manifest = prepare_base_database(self.base_database, self.database_path)
+                if self.base_manifest:
+                    self.connection = sqlite3.connect(str(self.database_path))
+                    self.cursor = self.connection.cursor()
+                    print(f"[OK] Opened mob database for incremental update: {self.database_path}")
+                    return True
+            
             print(f"Creating mob database: {self.database_path}")
             
             # Connect to database
@@ -117,14 +181,20 @@ class MobDatabaseCreator:
                 print(f"Creating table: {table_name}")
                 self.cursor.execute(create_sql)
             
-            # Create indexes
+            # Create indexes (deferred until the scan completes in bulk-load mode)
             indexes = MobDatabaseSchema.get_create_index_statements()
-            for index_name, index_sql in indexes.items():
-                print(f"Creating index: {index_name}")
-                self.cursor.execute(index_sql)
+            if self.bulk_load:
+                self.bulk_loader = BulkLoader(self.connection, indexes.values())
+            else:
+                for index_name, index_sql in indexes.items():
+                    print(f"Creating index: {index_name}")
+                    self.cursor.execute(index_sql)
             
             self.connection.commit()
             print("[OK] Database created successfully")
+            
+            if self.bulk_loader:
+                self.bulk_loader.begin()
             return True
             
         except Exception as e:
@@ -132,13 +202,15 @@ class MobDatabaseCreator:
             traceback.print_exc()
             return False
     
-    def process_all_mobs(self, wad_path: Path, types_path: Path) -> bool:
+    def process_all_mobs(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None,
+                         session: Optional[WadSession] = None) -> bool:
         """
         Process all mobs from ObjectData files
         
         Args:
-            wad_path: Path to Root.wad file
-            types_path: Path to types.json file
+            wad_path: Path to Root.wad file (ignored when a session is given)
+            types_path: Path to types.json file (ignored when a session is given)
+            session: Shared WadSession (opened from wad_path/types_path if None)
             
         Returns:
             True if processing successful, False otherwise
@@ -147,113 +219,142 @@ class MobDatabaseCreator:
             print("Starting mob processing...")
             self.processing_start_time = datetime.now()
             
-            # Import required classes here to avoid circular imports
-            from katsuba.wad import Archive
-            from katsuba.op import LazyObject, LazyList, TypeList, Serializer, SerializerOptions
-            
-            # Open WAD archive
-            try:
-                archive = Archive.mmap(str(wad_path))
-                print(f"[OK] Opened WAD archive: {wad_path}")
-            except Exception:
-                archive = Archive.heap(str(wad_path))
-                print(f"[OK] Opened WAD archive (heap): {wad_path}")
-            
-            # Load type list
-            type_list = TypeList.open(str(types_path))
-            print(f"[OK] Loaded type definitions: {types_path}")
-            
-            # Create serializer with proper options
-            options = SerializerOptions()
-            options.shallow = False  # Allow deep serialization
-            options.skip_unknown_types = True  # Skip unknown server types
-            serializer = Serializer(options, type_list)
-            print("[OK] Created serializer with deep serialization and skip_unknown_types")
-            
-            # Find all ObjectData XML files
-            object_files = list(archive.iter_glob("ObjectData/**/*.xml"))
-            total_files = len(object_files)
-            print(f"Found {total_files} XML files in ObjectData")
-            
-            # Process files in batches for better performance
-            batch_size = 1000
-            processed_count = 0
-            
-            for i in range(0, len(object_files), batch_size):
-                batch_files = object_files[i:i + batch_size]
-                
-                # Begin transaction for this batch
-                self.cursor.execute("BEGIN TRANSACTION")
-                
-                try:
-                    for file_path in batch_files:
-                        self._process_single_object_file(archive, serializer, type_list, file_path)
-                        processed_count += 1
-                        
-                        # Progress reporting
-                        if processed_count % 5000 == 0:
-                            print(f"[PROGRESS] Processed {processed_count}/{total_files} files, "
-                                  f"{self.total_success} mobs found, {self.total_failures} failures")
-                    
-                    # Commit batch
-                    self.connection.commit()
-                    
-                except Exception as e:
-                    # Rollback batch on error
-                    self.connection.rollback()
-                    print(f"Error processing batch starting at {i}: {e}")
-                    traceback.print_exc()
+            if session is None:
+                session = WadSession(wad_path, types_path)
+            with self.metrics.stage("open"):
+                opened = session.open()
+            if not opened:
+                print("Failed to open WAD session")
+                return False
             
-            self.processing_end_time = datetime.now()
-            self._generate_final_report()
-            return True
+            # Single pass over ObjectData, only WizGameObjectTemplate roots are routed here
+            scanner = ObjectDataScanner(session.archive, session.serializer, session.type_list,
+                                        metrics=self.metrics)
+            scanner.register_consumer(WIZ_GAME_OBJECT_TEMPLATE_HASH, self)
+            return scanner.scan()
             
         except Exception as e:
             print(f"Fatal error during mob processing: {e}")
             traceback.print_exc()
             return False
     
-    def _process_single_object_file(self, archive, serializer, type_list, file_path: str):
-        """Process a single ObjectData file"""
+    def prepare_scan(self, manifest: WadManifest) -> Optional[Set[str]]:
+        """Diff the ObjectData manifest against the base build and drop stale mob rows"""
+        self.manifest = manifest.copy_entries()
+        if not self.base_manifest:
+            return None
+        
+        self.manifest_diff = apply_manifest_diff(self.cursor, "template_id", self.manifest, self.base_manifest)
+        self.connection.commit()
+        self.pending_files = set(self.manifest_diff.reprocess_paths)
+        return self.pending_files
+    
+    def consume(self, file_path: str, object_data: Any, type_list: Any):
+        """Process a WizGameObjectTemplate routed by the ObjectDataScanner"""
+        # Unchanged entries are already in the patched database
+        if self.pending_files is not None and file_path not in self.pending_files:
+            return
+        
+        if self.processing_start_time is None:
+            self.processing_start_time = datetime.now()
+        
         try:
             self.total_processed += 1
-            
-            # Deserialize the object data
-            object_data = archive.deserialize(file_path, serializer)
-            
-            # Convert to dictionary format (use hash-only to preserve integer type hashes)
-            if hasattr(object_data, 'type_hash'):
-                obj_dict = convert_lazy_object_to_dict_with_hash_only(object_data, type_list)
-            else:
-                obj_dict = object_data
-            
-            # Check for conversion errors
-            if isinstance(obj_dict, dict) and "error" in obj_dict:
-                self._log_processing_failure(file_path, obj_dict, "Conversion error")
-                return
-            
-            # Check if this is a WizGameObjectTemplate (mob)
-            obj_type = obj_dict.get('$__type')
-            if obj_type != 701229577:  # Not a mob
-                return
-            
-            # Try to create mob DTO
-            mob_dto = MobsDTOFactory.create_from_json_data(obj_dict)
-            if not mob_dto:
-                self._log_processing_failure(file_path, obj_dict, "Failed to create mob DTO")
-                return
-            
-            # Process the mob
-            success = self._process_single_mob(file_path, obj_dict, mob_dto)
-            if success:
-                self.total_success += 1
-            else:
-                self.total_failures += 1
-                
+            self._process_object_data(file_path, object_data, type_list)
         except Exception as e:
             self._log_processing_failure(file_path, {"error": str(e)}, f"Exception: {e}")
             self.total_failures += 1
     
+    def on_batch_complete(self):
+        """Commit the current scanner batch"""
+        if self.connection:
+            with self.metrics.stage("insert"):
+                self.connection.commit()
+    
+    def on_memory_pressure(self, budget: MemoryBudget):
+        """Shrink the bulk-load page cache"""
+        if self.bulk_loader and self.bulk_loader.active:
+            self.bulk_loader.set_cache_mb(budget.shrink("SQLite page cache MB", self.bulk_loader.cache_mb, 16))
+    
+    def on_scan_complete(self, scanner: ObjectDataScanner):
+        """Finish mob processing after the ObjectData scan"""
+        if self.processing_start_time is None:
+            self.processing_start_time = datetime.now()
+        self.processing_end_time = datetime.now()
+        self.scan_statistics = scanner.get_scan_statistics()
+        skipped_counts = dict(scanner.unrouted_counts)
+        for type_hash, count in scanner.routed_counts.items():
+            if type_hash != WIZ_GAME_OBJECT_TEMPLATE_HASH:
+                skipped_counts[type_hash] = count
+        for type_hash, count in skipped_counts.items():
+            self.skipped_type_counts[type_hash] = self.skipped_type_counts.get(type_hash, 0) + count
+        if self.bulk_loader:
+            with self.metrics.stage("index"):
+                self.bulk_loader.finish()
+        with self.metrics.stage("report"):
+            if self.manifest is not None:
+                self.manifest.save(get_manifest_path(self.database_path))
+            self._generate_final_report()
+        self._insert_stage_metrics()
+    
+    def _insert_stage_metrics(self):
+        """Insert the stage timings and per-file latencies of this run into database"""
+        try:
+            self.metrics.save(self.connection)
+        except Exception as e:
+            print(f"Error inserting stage metrics: {e}")
+    
+    def _process_object_data(self, file_path: str, object_data: Any, type_list: Any):
+        """Convert a deserialized ObjectData object and insert it if it is a mob"""
+        # Build the DTO straight from the LazyObject when possible
+        try:
+            with self.metrics.stage("dto"):
+                mob_dto, obj_dict = MobsDTOFactory.create_from_lazy_object(object_data, type_list)
+        except DirectConversionError:
+            mob_dto, obj_dict = self._create_mob_dto_from_dict(file_path, object_data, type_list)
+            if mob_dto is None:
+                return
+        self.metrics.set_file_content(mob_dto)
+        
+        # Process the mob
+        with self.metrics.stage("insert"):
+            success = self._process_single_mob(file_path, obj_dict, mob_dto)
+        if success:
+            self.total_success += 1
+        else:
+            self.total_failures += 1
+            if self.manifest is not None:
+                self.manifest.forget(file_path)
+    
+    def _create_mob_dto_from_dict(self, file_path: str, object_data: Any,
+                                  type_list: Any) -> Tuple[Optional[WizGameObjectTemplateDTO], Any]:
+        """Create the mob DTO through the raw dict, logging conversion failures"""
+        # Convert to dictionary format (use hash-only to preserve integer type hashes)
+        if hasattr(object_data, 'type_hash'):
+            with self.metrics.stage("convert"):
+                obj_dict = convert_lazy_object_to_dict_with_hash_only(object_data, type_list)
+        else:
+            obj_dict = object_data
+        
+        # Check for conversion errors
+        if isinstance(obj_dict, dict) and "error" in obj_dict:
+            self._log_processing_failure(file_path, obj_dict, "Conversion error")
+            return None, obj_dict
+        
+        # Check if this is a WizGameObjectTemplate (mob)
+        obj_type = obj_dict.get('$__type')
+        if obj_type != WIZ_GAME_OBJECT_TEMPLATE_HASH:  # Not a mob
+            return None, obj_dict
+        
+        # Try to create mob DTO
+        with self.metrics.stage("dto"):
+            mob_dto = MobsDTOFactory.create_from_json_data(obj_dict)
+        if not mob_dto:
+            self._log_processing_failure(file_path, obj_dict, "Failed to create mob DTO")
+            return None, obj_dict
+        
+        return mob_dto, obj_dict
+    
     def _process_single_mob(self, file_path: str, mob_dict: Dict[str, Any], mob_dto: WizGameObjectTemplateDTO) -> bool:
         """
         Process a single mob and insert into database
@@ -268,15 +369,21 @@ class MobDatabaseCreator:
         """
         try:
             # Check for duplicates
-            if self._is_duplicate_mob(mob_dto):
+            mob_key = self._get_mob_key(mob_dto)
+            if self._is_duplicate_mob(mob_key):
                 self.duplicate_count += 1
                 self.duplicate_files.append(file_path)
+                if self.manifest is not None:
+                    self.manifest.forget(file_path)  # Retry if the original mob goes away
                 return True  # Count as success but skip processing
             
             # Insert mob template
             template_id = self._insert_mob_template(mob_dto)
             if not template_id:
                 return False
+            self.existing_mob_keys.add(mob_key)
+            if self.manifest is not None:
+                self.manifest.record_key(file_path, template_id)
             
             # Process adjectives
             if mob_dto.m_adjectiveList:
@@ -296,17 +403,59 @@ class MobDatabaseCreator:
             self._log_processing_failure(file_path, mob_dict, f"Database insertion error: {e}")
             return False
     
-    def _is_duplicate_mob(self, mob_dto: WizGameObjectTemplateDTO) -> bool:
-        """Check if mob already exists in database"""
+    def _is_duplicate_mob(self, mob_key: Tuple[str, bytes]) -> bool:
+        """Check if a mob with the same name and content already exists in the database"""
+        if self.existing_mob_keys is None:
+            self._load_existing_mob_keys()
+        return mob_key in self.existing_mob_keys
+    
+    def _load_existing_mob_keys(self):
+        """Seed the in-memory duplicate index with the mobs already in the database"""
         try:
-            self.cursor.execute(
-                "SELECT COUNT(*) FROM mob_templates WHERE object_name = ?",
-                (mob_dto.m_objectName,)
-            )
-            count = self.cursor.fetchone()[0]
-            return count > 0
-        except Exception:
-            return False
+            self.cursor.execute(f"SELECT {', '.join(self.MOB_CONTENT_COLUMNS)} FROM mob_templates")
+            self.existing_mob_keys = {(row[0], self._hash_mob_content(row)) for row in self.cursor.fetchall()}
+        except sqlite3.Error as e:
+            # Start with an empty index so later inserts still register their keys
+            print(f"[WARNING] Could not load existing mobs for duplicate detection: {e}")
+            self.existing_mob_keys = set()
+    
+    def _get_mob_key(self, mob_dto: WizGameObjectTemplateDTO) -> Tuple[str, bytes]:
+        """Get the (object_name, content hash) duplicate key of a mob"""
+        content = self._get_mob_template_values(mob_dto)[1:]
+        return mob_dto.m_objectName, self._hash_mob_content(content)
+    
+    @staticmethod
+    def _hash_mob_content(values: Tuple[Any, ...]) -> bytes:
+        """Hash mob_templates values identically whether they come from a DTO or a database row"""
+        normalized = []
+        for value in values:
+            # SQLite stores integral REAL values as integers
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            normalized.append(None if value is None else str(value))
+        return hashlib.sha1(repr(normalized).encode('utf-8')).digest()
+    
+    def _get_mob_template_values(self, mob_dto: WizGameObjectTemplateDTO) -> Tuple[Any, ...]:
+        """Get the mob_templates row values for a mob, starting with template_id"""
+        return (
+            mob_dto.m_templateID,
+            mob_dto.m_objectName,
+            mob_dto.m_displayName,
+            mob_dto.m_description,
+            mob_dto.m_visualID,
+            mob_dto.m_nObjectType,
+            mob_dto.m_primarySchoolName,
+            mob_dto.m_aggroSound,
+            mob_dto.m_castSound,
+            mob_dto.m_deathSound,
+            mob_dto.m_hitSound,
+            mob_dto.m_deathParticles,
+            mob_dto.m_sIcon,
+            1 if mob_dto.m_exemptFromAOI else 0,
+            mob_dto.m_locationPreference,
+            str(mob_dto.m_leashOffsetOverride) if mob_dto.m_leashOffsetOverride else None,
+            mob_dto.type_hash
+        )
     
     def _insert_mob_template(self, mob_dto: WizGameObjectTemplateDTO) -> Optional[int]:
         """Insert mob template and return template_id"""
@@ -321,27 +470,7 @@ class MobDatabaseCreator:
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
             
-            values = (
-                mob_dto.m_templateID,
-                mob_dto.m_objectName,
-                mob_dto.m_displayName,
-                mob_dto.m_description,
-                mob_dto.m_visualID,
-                mob_dto.m_nObjectType,
-                mob_dto.m_primarySchoolName,
-                mob_dto.m_aggroSound,
-                mob_dto.m_castSound,
-                mob_dto.m_deathSound,
-                mob_dto.m_hitSound,
-                mob_dto.m_deathParticles,
-                mob_dto.m_sIcon,
-                1 if mob_dto.m_exemptFromAOI else 0,
-                mob_dto.m_locationPreference,
-                str(mob_dto.m_leashOffsetOverride) if mob_dto.m_leashOffsetOverride else None,
-                mob_dto.type_hash
-            )
-            
-            self.cursor.execute(insert_sql, values)
+            self.cursor.execute(insert_sql, self._get_mob_template_values(mob_dto))
             return mob_dto.m_templateID
             
         except Exception as e:
@@ -410,14 +539,7 @@ class MobDatabaseCreator:
             behavior_name = getattr(behavior, 'm_behaviorName', 'Unknown')
             
             # Get behavior type hash by mapping class type to hash
-            behavior_type_hash = 0
-            if hasattr(behavior, '__class__'):
-                behavior_class = behavior.__class__
-                # Reverse lookup in factory mappings to find the hash
-                for hash_value, dto_class in MobsDTOFactory.BEHAVIOR_TYPE_MAPPINGS.items():
-                    if dto_class == behavior_class:
-                        behavior_type_hash = hash_value
-                        break
+            behavior_type_hash = MobsDTOFactory.get_behavior_type_hash(behavior)
             
             behavior_data = json.dumps(behavior.__dict__ if hasattr(behavior, '__dict__') else str(behavior))
             
@@ -614,27 +736,21 @@ class MobDatabaseCreator:
     
     def _log_processing_failure(self, file_path: str, mob_data: Dict[str, Any], reason: str):
         """Log processing failure for analysis"""
+        # Failed entries are re-processed by the next incremental build
+        if self.manifest is not None:
+            self.manifest.forget(file_path)
+        
+        # Direct DTO results only rebuild their raw dict when it is logged
+        if isinstance(mob_data, DirectRecord):
+            mob_data = mob_data.raw_dict()
+        
         try:
-            failure_file = self.failed_mobs_dir / "mob_failures.json"
-            
-            failure_data = {
+            self.failure_log.write({
                 "file_path": file_path,
                 "reason": reason,
                 "timestamp": datetime.now().isoformat(),
                 "mob_data": mob_data
-            }
-            
-            # Append to failures file
-            if failure_file.exists():
-                with open(failure_file, 'r') as f:
-                    failures = json.load(f)
-            else:
-                failures = []
-            
-            failures.append(failure_data)
-            
-            with open(failure_file, 'w') as f:
-                json.dump(failures, f, indent=2)
+            })
                 
         except Exception as e:
             print(f"Error logging failure: {e}")
@@ -647,10 +763,17 @@ class MobDatabaseCreator:
         print("MOB DATABASE CREATION COMPLETE!")
         print("=" * 60)
         print(f"Processing time: {processing_time}")
+        if self.scan_statistics:
+            print(f"ObjectData files scanned: {self.scan_statistics['total_scanned']}")
+        if self.manifest_diff:
+            print(f"Incremental update from {self.base_database}: {self.manifest_diff.summary()}")
         print(f"Total files processed: {self.total_processed}")
         print(f"Successful mobs: {self.total_success}")
         print(f"Failed conversions: {self.total_failures}")
         print(f"Duplicate mobs: {self.duplicate_count}")
+        if self.skipped_type_counts:
+            print(f"Skipped non-mob files: {sum(self.skipped_type_counts.values())} "
+                  f"({len(self.skipped_type_counts)} root types)")
         
         if self.total_processed > 0:
             success_rate = (self.total_success / self.total_processed) * 100
@@ -658,6 +781,18 @@ class MobDatabaseCreator:
         
         print(f"Database file: {self.database_path}")
         print(f"Failed mobs directory: {self.failed_mobs_dir}")
+        print("Stage times:")
+        print(self.metrics.format_summary())
+        
+        # Rebuild the failure report from the append-only log
+        failure_summary = None
+        if self.failure_log:
+            self.failure_log.close()
+            failure_summary = summarize_failures(self.failure_log.path)
+        if failure_summary:
+            print(f"Failure log: {self.failure_log.path} ({failure_summary['total_failures']} entries)")
+            for category, count in list(failure_summary["by_category"].items())[:5]:
+                print(f"  - {category}: {count}")
         
         # Generate summary file
         summary_file = self.failed_mobs_dir / "processing_summary.json"
@@ -669,8 +804,13 @@ class MobDatabaseCreator:
             "duplicate_count": self.duplicate_count,
             "success_rate": (self.total_success / self.total_processed * 100) if self.total_processed > 0 else 0,
             "database_path": str(self.database_path),
+            "scan_statistics": self.scan_statistics,
+            "incremental_base": str(self.base_database) if self.manifest_diff else None,
+            "skipped_type_counts": {str(type_hash): count for type_hash, count in
+                                    sorted(self.skipped_type_counts.items(), key=lambda x: -x[1])},
             "failed_files": self.failed_files[:100],  # Limit to first 100 for size
-            "duplicate_files": self.duplicate_files[:100]
+            "duplicate_files": self.duplicate_files[:100],
+            "failure_summary": failure_summary
         }
         
         with open(summary_file, 'w') as f:
@@ -680,6 +820,8 @@ class MobDatabaseCreator:
     
     def close(self):
         """Close database connection"""
+        if self.failure_log:
+            self.failure_log.close()
         if self.connection:
             self.connection.close()
             print("[OK] Database connection closed")
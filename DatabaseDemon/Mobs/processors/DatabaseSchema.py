@@ -17,7 +17,7 @@ class MobDatabaseSchema:
         "mob_templates": """
             CREATE TABLE mob_templates (
                 template_id INTEGER PRIMARY KEY,
-                object_name TEXT UNIQUE NOT NULL,
+                object_name TEXT NOT NULL,
                 display_name TEXT,
                 description TEXT,
                 visual_id INTEGER DEFAULT 0,
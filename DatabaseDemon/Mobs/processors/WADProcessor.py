@@ -25,28 +25,39 @@ sys.path.append(str(Path(__file__).parent.parent))         # Mobs level
 
 # Import centralized conversion utility
 from utils.conversion_utils import convert_lazy_object_to_dict_with_hash_only
+from utils.wad_session import WadSession
+from utils.type_list_cache import open_cached_type_list
 
 # Import mob DTOs
-from dtos import MobsDTOFactory
+try:
+    from ..dtos import MobsDTOFactory
+except ImportError:
+    from dtos import MobsDTOFactory
 
 
 class MobWADProcessor:
     """Class-based processor for mob data extraction from WAD files"""
     
-    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None):
+    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None,
+                 session: Optional[WadSession] = None):
         """
         Initialize the mob WAD processor
         
         Args:
             wad_path: Path to Root.wad file (auto-detected if None)
             types_path: Path to types.json file (auto-detected if None)
+            session: Shared WadSession to reuse instead of opening the WAD again
         """
-        self.wad_path = wad_path
-        self.types_path = types_path
+        self.session = session
+        self.wad_path = session.wad_path if session else wad_path
+        self.types_path = session.types_path if session else types_path
         self.archive = None
         self.type_list = None
         self.serializer = None
         
+        # Root type hashes skipped before conversion {type_hash: count}
+        self.skipped_type_counts = {}
+        
         # Auto-detect paths if not provided
         if not self.wad_path or not self.types_path:
             self._auto_detect_paths()
@@ -75,6 +86,17 @@ class MobWADProcessor:
         """
         print("Initializing Mob WAD Processor...")
         
+        # Reuse the shared session resources if one was provided
+        if self.session:
+            if not self.session.open():
+                print("Failed to open WAD session")
+                return False
+            self.archive = self.session.archive
+            self.type_list = self.session.type_list
+            self.serializer = self.session.serializer
+            print("[OK] Mob WAD Processor using shared WAD session")
+            return True
+        
         # Load type definitions
         if not self._load_type_list():
             print("Failed to load type definitions")
@@ -103,7 +125,7 @@ class MobWADProcessor:
                 print(f"Error: Types file not found at {self.types_path}")
                 return False
                 
-            self.type_list = TypeList.open(str(self.types_path))
+            self.type_list = open_cached_type_list(self.types_path)
             print(f"[OK] Loaded type definitions from {self.types_path}")
             return True
             
@@ -146,6 +168,12 @@ class MobWADProcessor:
             else:
                 mob_data = self.archive[file_path]
             
+            # Peek at the root type hash and skip non-mobs before any conversion
+            if isinstance(mob_data, LazyObject) and mob_data.type_hash != 701229577:
+                type_hash = mob_data.type_hash
+                self.skipped_type_counts[type_hash] = self.skipped_type_counts.get(type_hash, 0) + 1
+                return False, {'$__type': type_hash}, None, f"Not a WizGameObjectTemplate (type: {type_hash})"
+            
             # Convert to dictionary format (use hash-only to preserve integer type hashes)
             if isinstance(mob_data, LazyObject):
                 mob_dict = convert_lazy_object_to_dict_with_hash_only(mob_data, self.type_list)
@@ -267,6 +295,8 @@ class MobWADProcessor:
                 })
         
         print(f"Mob processing complete: {len(successful_mobs)} successful, {len(failed_mobs)} failed")
+        print(f"Skipped non-mob files: {sum(self.skipped_type_counts.values())} "
+              f"({len(self.skipped_type_counts)} root types)")
         return successful_mobs, failed_mobs
     
     def export_mob_data(self, output_path: Path, format: str = "json") -> bool:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Query Spell Failure Archive
+===========================
+Look up failed and duplicate spells in the failure archive written by the
+spell DatabaseCreator (Reports/Spell Reports/<database>_failures.db).
+
+Usage:
+    python query_failure_archive.py ARCHIVE                    # counts per category
+    python query_failure_archive.py ARCHIVE --file Spells/X.xml
+    python query_failure_archive.py ARCHIVE --kind failed --category "Error inserting spell data" [--limit N]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add DatabaseDemon to path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from utils.failure_archive import FailureArchive
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Query the spell failure archive")
+    parser.add_argument("archive", type=Path, help="Failure archive database")
+    parser.add_argument("--file", help="Show all entries of one spell file")
+    parser.add_argument("--kind", choices=["failed", "duplicate"], help="Entry kind to list")
+    parser.add_argument("--category", help="Error category to list")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum entries to list (default: 20)")
+    parser.add_argument("--data", action="store_true", help="Include the archived spell data")
+    args = parser.parse_args()
+
+    if not args.archive.exists():
+        print(f"[ERROR] Archive not found: {args.archive}")
+        return 1
+
+    with FailureArchive(args.archive, reset=False) as archive:
+        if args.file:
+            entries = archive.lookup(args.file)
+        elif args.kind or args.category:
+            entries = []
+            for entry in archive.iter_entries(args.kind, args.category):
+                entries.append(entry)
+                if len(entries) >= args.limit:
+                    break
+        else:
+            for kind, categories in archive.get_category_counts().items():
+                print(f"{kind}:")
+                for category, count in categories.items():
+                    print(f"  {count:6d}  {category}")
+            return 0
+
+        if not entries:
+            print("No matching entries")
+            return 0
+
+        for entry in entries:
+            print(f"[{entry['kind']}] {entry['filename']} - {entry['error_message']} ({entry['logged_at']})")
+            if args.data:
+                print(json.dumps(entry["data"], indent=2, default=str))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
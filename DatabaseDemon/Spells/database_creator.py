@@ -13,7 +13,28 @@ This script:
 6. Stores raw data for future ML feature engineering
 
 Usage:
-    python database_creator.py
+    python database_creator.py [--workers N] [--base-database PATH] [--flush-size N] [--no-bulk-load]
+                               [stage metrics options]
+
+Options:
+    --workers N   Extract spells with N worker processes (default: 1, serial).
+                  Each worker opens its own Root.wad mapping and type list;
+                  a single writer inserts the results in file order, so the
+                  database matches a serial run.
+    --base-database PATH
+                  Patch a copy of a previous revision's database instead of
+                  rebuilding. Only spell files added, changed or removed since
+                  that build (per its .manifest.json) are re-processed.
+    --flush-size N
+                  Number of buffered rows written per executemany transaction
+                  (default: 5000). A spell whose rows fail is rolled back on
+                  its own; the rest of the batch is still written.
+    --no-bulk-load
+                  Create indexes up front and keep the default journal and
+                  sync settings. By default a fresh build creates the tables
+                  only, loads with relaxed durability and builds all indexes
+                  (plus ANALYZE) at the end. Incremental builds never use
+                  bulk-load mode.
 
 Requirements:
     - types.json file in parent DatabaseDemon directory (correct revision)
@@ -22,17 +43,22 @@ Requirements:
 
 Output:
     - database/r{revision}_spells.db - SQLite database
-    - failed_spells/ - Duplicate analysis and failed records
+    - database/r{revision}_spells.db.manifest.json - WAD manifest for incremental rebuilds
+    - Reports/Spell Reports/r{revision}_spells_failures.db - Failed and duplicate
+      spells in one archive, indexed by filename and error category
 """
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 # Add the current directory to Python path for imports
 sys.path.append(str(Path(__file__).parent))
 
 from processors import DatabaseCreator, RevisionDetector, get_current_revision
+from utils.bulk_load import add_bulk_load_argument
+from utils.stage_metrics import METRICS_OPTIONS_HELP, add_metrics_arguments, apply_metrics_arguments
 
 
 def check_prerequisites():
@@ -65,8 +91,38 @@ def check_prerequisites():
     return True
 
 
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Create Wizard101 spell database from Root.wad"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of spell extraction worker processes (default: 1)'
+    )
+    parser.add_argument(
+        '--base-database',
+        type=Path,
+        default=None,
+        help='Previous spell database to patch incrementally (default: full build)'
+    )
+    parser.add_argument(
+        '--flush-size',
+        type=int,
+        default=5000,
+        help='Buffered rows per executemany transaction (default: 5000)'
+    )
+    add_bulk_load_argument(parser)
+    add_metrics_arguments(parser)
+    return parser.parse_args()
+
+
 def main():
     """Main function to create the Wizard101 spell database"""
+    args = parse_arguments()
+    
     print("Wizard101 Spell Database Creator")
     print("=" * 50)
     
@@ -77,7 +133,9 @@ def main():
     
     # Initialize database creator
     print("\nInitializing database creator...")
-    creator = DatabaseCreator()
+    creator = DatabaseCreator(workers=args.workers, base_database=args.base_database,
+                              flush_size=args.flush_size, bulk_load=not args.no_bulk_load)
+    apply_metrics_arguments(args, creator.metrics)
     
     try:
         # Initialize (loads WAD, types, creates schema)
@@ -87,6 +145,8 @@ def main():
         
         print(f"\nDatabase will be created at: {creator.database_path}")
         print(f"Failed spells will be logged to: {creator.failed_spells_dir}")
+        print(f"Extraction workers: {creator.workers}")
+        print(f"Row flush size: {creator.flush_size}")
         
         # Confirm before processing
         response = input("\nProceed with database creation? (y/N): ").strip().lower()
@@ -107,12 +167,12 @@ def main():
         if creator.duplicate_count > 0:
             print(f"\nWARNING: Found {creator.duplicate_count} duplicate filenames!")
             print("This means filename is not a reliable unique identifier.")
-            print("Check failed_spells/ directory for duplicate analysis.")
+            print(f"Check {creator.failure_archive.path} for duplicate analysis.")
             print("You may need to use a different primary key strategy.")
         
         if creator.total_failures > 0:
             print(f"\nWARNING: {creator.total_failures} spells failed to process")
-            print("Check failed_spells/ directory for detailed error analysis.")
+            print(f"Check {creator.failure_archive.path} for detailed error analysis.")
         
         if creator.duplicate_count == 0 and creator.total_failures < (creator.total_processed * 0.05):
             print("\n🎉 Database creation completed successfully!")
@@ -138,6 +198,7 @@ def main():
 def show_help():
     """Show help information"""
     print(__doc__)
+    print(METRICS_OPTIONS_HELP)
 
 
 if __name__ == "__main__":
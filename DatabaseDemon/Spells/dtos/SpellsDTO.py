@@ -9,11 +9,16 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Any
 from .SpellsEnums import *
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.slotted_dto import SlottedDTO
+
 
 # ===== BASE DTO CLASSES =====
 
-@dataclass
-class ReqGardeningLevelDTO:
+@dataclass(slots=True)
+class ReqGardeningLevelDTO(SlottedDTO):
     """Base DTO for ReqGardeningLevel"""
     m_applyNOT: Optional[bool] = False
     m_numericValue: Optional[float] = 0.0
@@ -21,16 +26,16 @@ class ReqGardeningLevelDTO:
     m_operatorType: Optional[int] = 0
 
 
-@dataclass
-class ReqHasBadgeDTO:
+@dataclass(slots=True)
+class ReqHasBadgeDTO(SlottedDTO):
     """Base DTO for ReqHasBadge"""
     m_applyNOT: Optional[bool] = False
     m_badgeName: Optional[str] = ""
     m_operator: Optional[int] = 0
 
 
-@dataclass
-class ReqMagicLevelDTO:
+@dataclass(slots=True)
+class ReqMagicLevelDTO(SlottedDTO):
     """Base DTO for ReqMagicLevel"""
     m_applyNOT: Optional[bool] = False
     m_magicSchool: Optional[str] = ""
@@ -39,8 +44,8 @@ class ReqMagicLevelDTO:
     m_operatorType: Optional[int] = 0
 
 
-@dataclass
-class RequirementListDTO:
+@dataclass(slots=True)
+class RequirementListDTO(SlottedDTO):
     """Base DTO for RequirementList"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -49,8 +54,8 @@ class RequirementListDTO:
 
 # ===== REQUIREMENT DTO CLASSES =====
 
-@dataclass
-class ReqIsSchoolDTO:
+@dataclass(slots=True)
+class ReqIsSchoolDTO(SlottedDTO):
     """DTO for ReqIsSchool requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -58,8 +63,8 @@ class ReqIsSchoolDTO:
     m_magicSchoolName: Optional[str] = ""
 
 
-@dataclass
-class ReqHangingCharmDTO:
+@dataclass(slots=True)
+class ReqHangingCharmDTO(SlottedDTO):
     """DTO for ReqHangingCharm requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -69,8 +74,8 @@ class ReqHangingCharmDTO:
     m_maxCount: Optional[int] = 0
 
 
-@dataclass
-class ReqHangingWardDTO:
+@dataclass(slots=True)
+class ReqHangingWardDTO(SlottedDTO):
     """DTO for ReqHangingWard requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -80,8 +85,8 @@ class ReqHangingWardDTO:
     m_maxCount: Optional[int] = 0
 
 
-@dataclass
-class ReqHangingOverTimeDTO:
+@dataclass(slots=True)
+class ReqHangingOverTimeDTO(SlottedDTO):
     """DTO for ReqHangingOverTime requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -91,8 +96,8 @@ class ReqHangingOverTimeDTO:
     m_maxCount: Optional[int] = 0
 
 
-@dataclass
-class ReqHangingEffectTypeDTO:
+@dataclass(slots=True)
+class ReqHangingEffectTypeDTO(SlottedDTO):
     """DTO for ReqHangingEffectType requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -108,8 +113,8 @@ class ReqHangingEffectTypeDTO:
     m_globalEffect: Optional[bool] = False
 
 
-@dataclass
-class ReqHangingAuraDTO:
+@dataclass(slots=True)
+class ReqHangingAuraDTO(SlottedDTO):
     """DTO for ReqHangingAura requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -122,8 +127,8 @@ class ReqHangingAuraDTO:
     m_globalEffect: Optional[bool] = False
 
 
-@dataclass
-class ReqSchoolOfFocusDTO:
+@dataclass(slots=True)
+class ReqSchoolOfFocusDTO(SlottedDTO):
     """DTO for ReqSchoolOfFocus requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -131,8 +136,8 @@ class ReqSchoolOfFocusDTO:
     m_magicSchool: Optional[str] = ""
 
 
-@dataclass
-class ReqMinionDTO:
+@dataclass(slots=True)
+class ReqMinionDTO(SlottedDTO):
     """DTO for ReqMinion requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -142,8 +147,8 @@ class ReqMinionDTO:
     m_minionType: Optional[str] = ""
 
 
-@dataclass
-class ReqHasEntryDTO:
+@dataclass(slots=True)
+class ReqHasEntryDTO(SlottedDTO):
     """DTO for ReqHasEntry requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -154,8 +159,8 @@ class ReqHasEntryDTO:
     m_questName: Optional[str] = ""
 
 
-@dataclass
-class ReqCombatHealthDTO:
+@dataclass(slots=True)
+class ReqCombatHealthDTO(SlottedDTO):
     """DTO for ReqCombatHealth requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -164,16 +169,16 @@ class ReqCombatHealthDTO:
     m_fMaxPercent: Optional[float] = 0.0
 
 
-@dataclass
-class ReqPvPCombatDTO:
+@dataclass(slots=True)
+class ReqPvPCombatDTO(SlottedDTO):
     """DTO for ReqPvPCombat requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
     m_targetType: Optional[int] = 0
 
 
-@dataclass
-class ReqShadowPipCountDTO:
+@dataclass(slots=True)
+class ReqShadowPipCountDTO(SlottedDTO):
     """DTO for ReqShadowPipCount requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -182,8 +187,8 @@ class ReqShadowPipCountDTO:
     m_maxPips: Optional[int] = 0
 
 
-@dataclass
-class ReqCombatStatusDTO:
+@dataclass(slots=True)
+class ReqCombatStatusDTO(SlottedDTO):
     """DTO for ReqCombatStatus requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -192,8 +197,8 @@ class ReqCombatStatusDTO:
     m_status: Optional[int] = 0
 
 
-@dataclass
-class ReqPipCountDTO:
+@dataclass(slots=True)
+class ReqPipCountDTO(SlottedDTO):
     """DTO for ReqPipCount requirement"""
     m_applyNOT: Optional[bool] = False
     m_operator: Optional[int] = 0
@@ -202,8 +207,8 @@ class ReqPipCountDTO:
     m_maxPips: Optional[int] = 0
 
 
-@dataclass
-class SpellEffectDTO:
+@dataclass(slots=True)
+class SpellEffectDTO(SlottedDTO):
     """Base DTO for SpellEffect"""
     m_act: Optional[bool] = False
     m_actNum: Optional[int] = 0
@@ -229,8 +234,8 @@ class SpellEffectDTO:
     m_initialBacklash: Optional[bool] = False
 
 
-@dataclass
-class SpellRankDTO:
+@dataclass(slots=True)
+class SpellRankDTO(SlottedDTO):
     """Base DTO for SpellRank"""
     m_balancePips: Optional[int] = 0
     m_deathPips: Optional[int] = 0
@@ -244,8 +249,8 @@ class SpellRankDTO:
     m_xPipSpell: Optional[bool] = False
 
 
-@dataclass
-class SpellTemplateDTO:
+@dataclass(slots=True)
+class SpellTemplateDTO(SlottedDTO):
     """Base DTO for SpellTemplate"""
     m_PvE: Optional[bool] = False
     m_PvP: Optional[bool] = False
@@ -307,8 +312,8 @@ class SpellTemplateDTO:
 
 # ===== SPELL DTO CLASS =====
 
-@dataclass
-class SpellDTO:
+@dataclass(slots=True)
+class SpellDTO(SlottedDTO):
     """DTO for Spell class - represents the root spell object"""
     # Core spell identification
     m_spellID: Optional[int] = 0
@@ -349,7 +354,7 @@ class SpellDTO:
 
 # ===== DERIVED DTO CLASSES =====
 
-@dataclass
+@dataclass(slots=True)
 class CantripsSpellTemplateDTO(SpellTemplateDTO):
     """DTO for CantripsSpellTemplate - inherits from SpellTemplateDTO"""
     m_animationKFMs: List[Any] = field(default_factory=list)
@@ -365,7 +370,7 @@ class CantripsSpellTemplateDTO(SpellTemplateDTO):
     m_soundEffectName: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CastleMagicSpellTemplateDTO(SpellTemplateDTO):
     """DTO for CastleMagicSpellTemplate - inherits from SpellTemplateDTO"""
     m_animationKFM: Optional[str] = ""
@@ -375,7 +380,7 @@ class CastleMagicSpellTemplateDTO(SpellTemplateDTO):
     m_effectSchool: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FishingSpellTemplateDTO(SpellTemplateDTO):
     """DTO for FishingSpellTemplate - inherits from SpellTemplateDTO"""
     m_animationKFM: Optional[str] = ""
@@ -389,7 +394,7 @@ class FishingSpellTemplateDTO(SpellTemplateDTO):
     m_soundEffectName: Optional[str] = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GardenSpellTemplateDTO(SpellTemplateDTO):
     """DTO for GardenSpellTemplate - inherits from SpellTemplateDTO"""
     m_affectedRadius: Optional[int] = 0
@@ -415,7 +420,7 @@ class GardenSpellTemplateDTO(SpellTemplateDTO):
     m_yOffset: Optional[float] = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DelaySpellEffectDTO(SpellEffectDTO):
     """DTO for DelaySpellEffect - inherits from SpellEffectDTO"""
     # Additional fields specific to DelaySpellEffect beyond SpellEffect
@@ -429,13 +434,13 @@ class DelaySpellEffectDTO(SpellEffectDTO):
     m_spell: Optional[Any] = None  # SharedPointer<Spell> -> Any for now
 
 
-@dataclass
+@dataclass(slots=True)
 class RandomSpellEffectDTO(SpellEffectDTO):
     """DTO for RandomSpellEffect - inherits from SpellEffectDTO"""
     m_effectList: List[SpellEffectDTO] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TieredSpellTemplateDTO(SpellTemplateDTO):
     """DTO for TieredSpellTemplate - inherits from SpellTemplateDTO"""
     m_nextTierSpells: List[str] = field(default_factory=list)
@@ -444,7 +449,7 @@ class TieredSpellTemplateDTO(SpellTemplateDTO):
     m_shardCost: Optional[int] = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WhirlyBurlySpellTemplateDTO(SpellTemplateDTO):
     """DTO for WhirlyBurlySpellTemplate - inherits from SpellTemplateDTO"""
     m_specialUnits: Optional[str] = ""
@@ -453,38 +458,38 @@ class WhirlyBurlySpellTemplateDTO(SpellTemplateDTO):
 
 # ===== EFFECT DTO CLASSES =====
 
-@dataclass
-class ConditionalSpellElementDTO:
+@dataclass(slots=True)
+class ConditionalSpellElementDTO(SlottedDTO):
     """DTO for ConditionalSpellElement - simple container for requirement + effect"""
     m_pReqs: Optional['RequirementListDTO'] = None
     m_pEffect: Optional['SpellEffectDTO'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalSpellEffectDTO(SpellEffectDTO):
     """DTO for ConditionalSpellEffect - inherits from SpellEffectDTO"""
     m_elements: List['ConditionalSpellElementDTO'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableSpellEffectDTO(SpellEffectDTO):
     """DTO for VariableSpellEffect - inherits from SpellEffectDTO"""
     m_effectList: List['SpellEffectDTO'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectListSpellEffectDTO(SpellEffectDTO):
     """DTO for EffectListSpellEffect - inherits from SpellEffectDTO"""
     m_effectList: List['SpellEffectDTO'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetCountSpellEffectDTO(SpellEffectDTO):
     """DTO for TargetCountSpellEffect - inherits from SpellEffectDTO"""
     m_effectLists: List['EffectListSpellEffectDTO'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class HangingConversionSpellEffectDTO(SpellEffectDTO):
     """DTO for HangingConversionSpellEffect - inherits from SpellEffectDTO"""
     # Enum fields
@@ -508,20 +513,20 @@ class HangingConversionSpellEffectDTO(SpellEffectDTO):
     m_outputEffect: List['SpellEffectDTO'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShadowSpellEffectDTO(EffectListSpellEffectDTO):
     """DTO for ShadowSpellEffect - inherits from EffectListSpellEffectDTO"""
     m_shadowType: Optional[int] = 0  # Additional shadow-specific field
 
 
-@dataclass
+@dataclass(slots=True)
 class RandomPerTargetSpellEffectDTO(RandomSpellEffectDTO):
     """DTO for RandomPerTargetSpellEffect - inherits from RandomSpellEffectDTO"""
     # Inherits m_effectList from RandomSpellEffectDTO - no additional fields needed
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CountBasedSpellEffectDTO(SpellEffectDTO):
     """DTO for CountBasedSpellEffect - inherits from SpellEffectDTO"""
     m_effectList: List['SpellEffectDTO'] = field(default_factory=list)
@@ -4,9 +4,15 @@ Wizard101 Spell DTO Factory
 Factory and processing logic for creating spell DTOs with graceful error handling.
 """
 
-from typing import Dict, List, Optional, Any, Type
+from typing import Dict, FrozenSet, List, Optional, Any, Type
 from .SpellsDTO import *
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
+from utils.slotted_dto import INTERNED_FIELDS
+from utils.lazy_dto_builder import LazyDTOBuilder
+
 
 class FixedSpellDTOFactory:
     """Fixed factory for creating spell DTOs with graceful error handling"""
@@ -59,31 +65,53 @@ class FixedSpellDTOFactory:
         1382050381: ReqIsSchoolDTO,  # ReqIsSchool
     }
     
+    # Compiled lookups, built once on first use (see _compile)
+    _hash_by_type_name: Optional[Dict[str, Optional[int]]] = None
+    _fields_by_class: Optional[Dict[Type, FrozenSet[str]]] = None
+    _interned_fields_by_class: Optional[Dict[Type, FrozenSet[str]]] = None
+    
+    @classmethod
+    def _compile(cls):
+        """Precompute the type name -> hash index and the field set of every DTO class"""
+        hash_by_type_name = {}
+        fields_by_class = {}
+        for hash_val, dto_class in cls.TYPE_MAPPING.items():
+            # First mapping wins, like the linear scan it replaces
+            hash_by_type_name.setdefault(dto_class.__name__, hash_val)
+            
+            if dto_class not in fields_by_class:
+                # Fields including inherited ones from parent classes
+                all_fields = set()
+                for class_obj in dto_class.__mro__:
+                    all_fields.update(getattr(class_obj, "__annotations__", {}).keys())
+                fields_by_class[dto_class] = frozenset(all_fields)
+        
+        cls._fields_by_class = fields_by_class
+        cls._interned_fields_by_class = {dto_class: field_names & INTERNED_FIELDS
+                                         for dto_class, field_names in fields_by_class.items()}
+        cls._hash_by_type_name = {name[:-3]: hash_val for name, hash_val in hash_by_type_name.items()
+                                  if name.endswith("DTO")}
+    
     @classmethod
     def create_dto(cls, type_hash: int, spell_data: Dict[str, Any]) -> Optional[Any]:
         """Create appropriate DTO instance based on type hash"""
         dto_class = cls.TYPE_MAPPING.get(type_hash)
         if dto_class:
             try:
-                # Process nested objects recursively
-                processed_data = cls.process_nested_objects(spell_data)
+                if cls._fields_by_class is None:
+                    cls._compile()
                 
-                # Create kwargs with only the fields that exist in both data and DTO
-                # Get all fields including inherited ones from parent classes
+                # Only fields the DTO declares are converted, missing fields use defaults
+                field_names = cls._fields_by_class[dto_class]
+                interned_fields = cls._interned_fields_by_class[dto_class]
                 kwargs = {}
-                all_fields = set()
-                
-                # Collect annotations from the class and all parent classes
-                for cls in dto_class.__mro__:  # Method Resolution Order includes all parent classes
-                    if hasattr(cls, "__annotations__"):
-                        all_fields.update(cls.__annotations__.keys())
-                
-                # Add fields that exist in both processed data and DTO class
-                for field_name in all_fields:
-                    if field_name in processed_data:
-                        kwargs[field_name] = processed_data[field_name]
+                for field_name, value in spell_data.items():
+                    if field_name in field_names:
+                        if field_name in interned_fields and type(value) is str:
+                            kwargs[field_name] = sys.intern(value)
+                        else:
+                            kwargs[field_name] = cls._convert_value(value)
                 
-                # Create the DTO instance (missing fields will use defaults)
                 return dto_class(**kwargs)
             except Exception as e:
                 print(f"Error creating DTO for hash {type_hash}: {e}")
@@ -92,61 +120,82 @@ class FixedSpellDTOFactory:
             print(f"No DTO class found for hash {type_hash}")
             return None
     
+    @classmethod
+    def _convert_value(cls, value: Any) -> Any:
+        """Convert nested typed objects (and lists of them) in one field value to DTOs"""
+        if isinstance(value, dict):
+            if "$__type" not in value:
+                return value
+            # This is a nested typed object
+            nested_type = value["$__type"].replace("class ", "")
+            nested_hash = cls.find_hash_for_type(nested_type)
+            if nested_hash:
+                return cls.create_dto(nested_hash, value)
+            return value
+        
+        if isinstance(value, list):
+            # Process list items
+            processed_list = []
+            for item in value:
+                if isinstance(item, dict) and "$__type" in item:
+                    nested_type = item["$__type"].replace("class ", "")
+                    nested_hash = cls.find_hash_for_type(nested_type)
+                    if nested_hash:
+                        processed_dto = cls.create_dto(nested_hash, item)
+                        if processed_dto is not None:
+                            processed_list.append(processed_dto)
+                        else:
+                            print(f"WARNING: Failed to create DTO for type {nested_type} (hash: {nested_hash})")
+                            processed_list.append(item)
+                    else:
+                        print(f"WARNING: No hash mapping found for type {nested_type}")
+                        processed_list.append(item)
+                elif isinstance(item, dict):
+                    # Recursively process nested dicts that might contain $__type
+                    processed_list.append(cls.process_nested_objects(item))
+                else:
+                    processed_list.append(item)
+            return processed_list
+        
+        return value
+    
     @classmethod
     def process_nested_objects(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively process nested objects to create DTOs"""
         if not isinstance(data, dict):
             return data
         
-        processed = {}
+        return {key: cls._convert_value(value) for key, value in data.items()}
+    
+    @classmethod
+    def create_lazy_dto_builder(cls, type_list: Any, collect_unhandled: bool = False) -> LazyDTOBuilder:
+        """
+        Create a builder that makes DTOs straight from LazyObjects (see utils/lazy_dto_builder.py)
         
-        for key, value in data.items():
-            if isinstance(value, dict) and "$__type" in value:
-                # This is a nested typed object
-                nested_type = value["$__type"].replace("class ", "")
-                nested_hash = cls.find_hash_for_type(nested_type)
-                if nested_hash:
-                    processed[key] = cls.create_dto(nested_hash, value)
-                else:
-                    processed[key] = value
+        Args:
+            type_list: TypeList of the archive the objects come from
+            collect_unhandled: Collect fields the DTOs do not declare
             
-            elif isinstance(value, list):
-                # Process list items
-                processed_list = []
-                for item in value:
-                    if isinstance(item, dict) and "$__type" in item:
-                        nested_type = item["$__type"].replace("class ", "")
-                        nested_hash = cls.find_hash_for_type(nested_type)
-                        if nested_hash:
-                            processed_dto = cls.create_dto(nested_hash, item)
-                            if processed_dto is not None:
-                                processed_list.append(processed_dto)
-                            else:
-                                print(f"WARNING: Failed to create DTO for type {nested_type} (hash: {nested_hash})")
-                                processed_list.append(item)
-                        else:
-                            print(f"WARNING: No hash mapping found for type {nested_type}")
-                            processed_list.append(item)
-                    elif isinstance(item, dict):
-                        # Recursively process nested dicts that might contain $__type
-                        processed_item = cls.process_nested_objects(item)
-                        processed_list.append(processed_item)
-                    else:
-                        processed_list.append(item)
-                processed[key] = processed_list
-            
-            else:
-                processed[key] = value
-        
-        return processed
+        Returns:
+            LazyDTOBuilder resolving types the same way as create_from_json_data
+        """
+        if cls._fields_by_class is None:
+            cls._compile()
+        return LazyDTOBuilder(
+            type_list,
+            lambda type_name: cls.TYPE_MAPPING.get(cls.find_hash_for_type(type_name)),
+            cls._fields_by_class,
+            cls._interned_fields_by_class,
+            collect_unhandled=collect_unhandled,
+            warn_unmapped_list_items=True
+        )
     
     @classmethod
     def find_hash_for_type(cls, type_name: str) -> Optional[int]:
         """Find hash value for a given type name"""
-        for hash_val, dto_class in cls.TYPE_MAPPING.items():
-            if dto_class.__name__ == f"{type_name}DTO":
-                return hash_val
-        return None
+        if cls._hash_by_type_name is None:
+            cls._compile()
+        return cls._hash_by_type_name.get(type_name)
     
     @classmethod
     def create_from_json_data(cls, json_data: Dict[str, Any]) -> Optional[Any]:
@@ -11,38 +11,79 @@ import sqlite3
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 import traceback
 
 from .DatabaseSchema import DatabaseSchema
 from .WADProcessor import WADProcessor
 from .RevisionDetector import RevisionDetector
+from .ParallelSpellExtractor import ParallelSpellExtractor
+from .SpellRowBuilder import SpellRows, SpellRowSink, build_spell_rows
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
 sys.path.append(str(Path(__file__).parent.parent))         # Spells level
 
-from dtos import FixedSpellDTOFactory
+try:
+    from ..dtos import FixedSpellDTOFactory
+except ImportError:
+    from dtos import FixedSpellDTOFactory
+from utils.wad_session import WadSession
+from utils.batched_row_writer import BatchedRowWriter
+from utils.failure_archive import FailureArchive
+from utils.bulk_load import BulkLoader
+from utils.lazy_dto_builder import DirectRecord
+from utils.shape_audit import ShapeAudit
+from utils.stage_metrics import StageMetrics
+from utils.wad_manifest import (
+    WadManifest, get_manifest_path, prepare_base_database, apply_manifest_diff
+)
 
 
 class DatabaseCreator:
     """Creates and manages the Wizard101 spell database"""
     
     def __init__(self, database_path: Optional[Path] = None, 
-                 failed_spells_dir: Optional[Path] = None):
+                 failed_spells_dir: Optional[Path] = None,
+                 workers: int = 1,
+                 session: Optional[WadSession] = None,
+                 base_database: Optional[Path] = None,
+                 flush_size: int = 5000,
+                 bulk_load: bool = True):
         """
         Initialize the database creator
         
         Args:
             database_path: Path for the database file (auto-generated if None)
             failed_spells_dir: Directory for failed spell analysis (auto-detected if None)
+            workers: Number of extraction worker processes (1 = serial)
+            session: Shared WadSession (the WAD processor opens its own if None)
+            base_database: Previous build to patch incrementally (full build if None)
+            flush_size: Number of buffered rows written per executemany transaction
+            bulk_load: Defer indexes and relax durability while loading a fresh database
         """
         self.database_path = database_path
         self.failed_spells_dir = failed_spells_dir
+        self.workers = max(1, workers)
+        self.base_database = base_database
+        self.flush_size = flush_size
+        self.bulk_load = bulk_load
+        self.bulk_loader = None
         self.connection = None
         self.cursor = None
+        self.row_writer = None
+        self.row_sink = None
+        self.failure_archive = None
+        
+        # WAD manifest tracking (incremental rebuilds)
+        self.base_manifest = None
+        self.manifest = None
+        self.manifest_diff = None
+        
+        # Stage timings of this run (written to processing_stage_metrics)
+        self.metrics = StageMetrics()
         
         # Initialize WAD processor and revision detector
-        self.wad_processor = WADProcessor()
+        self.wad_processor = WADProcessor(session=session, direct_dto=True, metrics=self.metrics)
         self.revision_detector = RevisionDetector()
         
         # Statistics
@@ -57,15 +98,14 @@ class DatabaseCreator:
         self.duplicate_files = []
         self.failed_files = []
         
-        # Effect counter for unique effect ordering within each spell
-        self.current_effect_counter = 0
-        
-        # Error tracking for current spell
-        self.current_spell_errors = []
+        # Filenames already in the database or accepted for the next flush
+        # (seeded from spell_cards on first use)
+        self.existing_filenames: Optional[Set[str]] = None
         
         # Skipped element tracking
         self.skipped_elements = {}  # {filename: {element_path: (element_type, reason, data)}}
-        self.unhandled_fields = {}  # {filename: {field_name: value}}
+        self.keep_skipped_element_data = True  # Dropped under memory pressure (the DB rows keep it)
+        self.shape_audit = ShapeAudit()  # Unhandled fields per object shape
         self.skipped_element_types = {}  # {element_type: count}
         self.total_skipped_elements = 0
         
@@ -94,7 +134,9 @@ class DatabaseCreator:
         print("Initializing Database Creator...")
         
         # Initialize WAD processor
-        if not self.wad_processor.initialize():
+        with self.metrics.stage("open"):
+            initialized = self.wad_processor.initialize()
+        if not initialized:
             print("Failed to initialize WAD processor")
             return False
         
@@ -107,10 +149,24 @@ class DatabaseCreator:
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         self.failed_spells_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database
-        if not self._create_database():
-            print("Failed to create database")
-            return False
+        # Failed and duplicate spells of this build go into one indexed archive
+        self.failure_archive = FailureArchive(self.failed_spells_dir / f"{self.database_path.stem}_failures.db")
+        
+        # Initialize database (patch a copy of the base build when incremental)
+        with self.metrics.stage("open"):
+            if self.base_database:
+                self.base_manifest = prepare_base_database(self.base_database, self.database_path)
+            if self.base_manifest:
+                if not self._open_existing_database():
+                    print("Failed to open database for incremental update")
+                    return False
+            elif not self._create_database():
+                print("Failed to create database")
+                return False
+        
+        # Spell rows are buffered and written with executemany
+        self.row_writer = BatchedRowWriter(self.connection, self.flush_size, self._on_spell_write_failed)
+        self.row_sink = SpellRowSink(self.row_writer)
         
         print("[OK] Database Creator initialized successfully")
         return True
@@ -131,14 +187,21 @@ class DatabaseCreator:
                 self.cursor.execute(create_sql)
                 print(f"[OK] Created table: {table_name}")
             
-            # Create all indexes
-            for index_name in schema.get_all_index_names():
-                index_sql = schema.get_create_index_sql(index_name)
-                self.cursor.execute(index_sql)
-                print(f"[OK] Created index: {index_name}")
+            # Create all indexes (deferred until the load completes in bulk-load mode)
+            index_statements = [schema.get_create_index_sql(index_name)
+                                for index_name in schema.get_all_index_names()]
+            if self.bulk_load:
+                self.bulk_loader = BulkLoader(self.connection, index_statements)
+            else:
+                for index_name, index_sql in zip(schema.get_all_index_names(), index_statements):
+                    self.cursor.execute(index_sql)
+                    print(f"[OK] Created index: {index_name}")
             
             self.connection.commit()
             print("[OK] Database schema created successfully")
+            
+            if self.bulk_loader:
+                self.bulk_loader.begin()
             return True
             
         except Exception as e:
@@ -146,6 +209,29 @@ class DatabaseCreator:
             traceback.print_exc()
             return False
     
+    def _open_existing_database(self) -> bool:
+        """Connect to a copied base database without recreating the schema"""
+        try:
+            self.connection = sqlite3.connect(str(self.database_path))
+            self.cursor = self.connection.cursor()
+            print(f"[OK] Opened database for incremental update: {self.database_path}")
+            
+            # Tables added to the schema after the base database was built
+            self.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            existing_tables = {row[0] for row in self.cursor.fetchall()}
+            schema = DatabaseSchema()
+            for table_name in schema.get_all_table_names():
+                if table_name not in existing_tables:
+                    self.cursor.execute(schema.get_create_table_sql(table_name))
+                    print(f"[OK] Created table: {table_name}")
+            self.connection.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error opening database: {e}")
+            traceback.print_exc()
+            return False
+    
     def check_duplicate_filename(self, filename: str) -> bool:
         """
         Check if filename already exists in database
@@ -156,18 +242,24 @@ class DatabaseCreator:
         Returns:
             True if duplicate found, False otherwise
         """
+        if self.existing_filenames is None:
+            self._load_existing_filenames()
+        return filename in self.existing_filenames
+    
+    def _load_existing_filenames(self):
+        """Seed the in-memory duplicate index with the spells already in the database"""
         try:
-            self.cursor.execute("SELECT filename FROM spell_cards WHERE filename = ?", (filename,))
-            result = self.cursor.fetchone()
-            return result is not None
-        except Exception as e:
-            print(f"Error checking duplicate filename: {e}")
-            return False
+            self.cursor.execute("SELECT filename FROM spell_cards")
+            self.existing_filenames = {row[0] for row in self.cursor.fetchall()}
+        except sqlite3.Error as e:
+            # Start with an empty index so later inserts still register their filenames
+            print(f"Error loading existing filenames for duplicate detection: {e}")
+            self.existing_filenames = set()
     
     def log_duplicate(self, filename: str, duplicate_type: str, error_message: str, 
                      spell_data: Dict[str, Any]):
         """
-        Log a duplicate to the database and failed_spells directory
+        Log a duplicate to the database and the failure archive
         
         Args:
             filename: The duplicate filename
@@ -176,22 +268,19 @@ class DatabaseCreator:
             spell_data: The spell data that caused the duplicate
         """
         try:
+            spell_data = self._get_raw_spell_data(filename, spell_data)
+            
             # Log to database
             self.cursor.execute("""
                 INSERT INTO duplicate_log (filename, duplicate_type, error_message, spell_data)
                 VALUES (?, ?, ?, ?)
             """, (filename, duplicate_type, error_message, json.dumps(spell_data, default=str)))
             
-            # Log to file system
-            duplicate_file = self.failed_spells_dir / f"duplicate_{self.duplicate_count:04d}_{filename.replace('/', '_')}.json"
-            with open(duplicate_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "filename": filename,
-                    "duplicate_type": duplicate_type,
-                    "error_message": error_message,
-                    "spell_data": spell_data,
-                    "timestamp": datetime.now().isoformat()
-                }, f, indent=2, default=str)
+            # Log to the failure archive
+            self.failure_archive.write("duplicate", filename, error_message, {
+                "duplicate_type": duplicate_type,
+                "spell_data": spell_data
+            })
             
             self.duplicate_count += 1
             self.duplicate_files.append(filename)
@@ -209,23 +298,37 @@ class DatabaseCreator:
             spell_data: The spell data that failed to process
         """
         try:
-            # Log to file system
-            failed_file = self.failed_spells_dir / f"failed_{len(self.failed_files):04d}_{filename.replace('/', '_')}.json"
-            with open(failed_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "filename": filename,
-                    "error_message": error_message,
-                    "spell_data": spell_data,
-                    "timestamp": datetime.now().isoformat()
-                }, f, indent=2, default=str)
+            spell_data = self._get_raw_spell_data(filename, spell_data)
+            
+            # Log to the failure archive
+            self.failure_archive.write("failed", filename, error_message, spell_data)
             
             self.failed_files.append(filename)
             
         except Exception as e:
             print(f"Error logging failed spell: {e}")
     
+    def _get_raw_spell_data(self, filename: str, spell_data: Any) -> Any:
+        """
+        Get the full raw dict of a spell for logging
+        
+        Spells built straight from the LazyObject only carry a DirectRecord, so
+        their raw dict is loaded from the WAD again (failures are rare).
+        
+        Args:
+            filename: The spell filename
+            spell_data: Raw spell dict or DirectRecord
+            
+        Returns:
+            Full raw spell data
+        """
+        if isinstance(spell_data, DirectRecord):
+            return spell_data.raw_dict() or self.wad_processor.load_spell_dict(filename)
+        return spell_data
+    
     def _log_skipped_element(self, filename: str, element_path: str, 
-                            element_type: str, reason: str, element_data: Any = None):
+                            element_type: str, reason: str, element_data: Any = None,
+                            counted: bool = True):
         """
         Log any skipped element during processing
         
@@ -235,6 +338,7 @@ class DatabaseCreator:
             element_type: Type of the element (e.g., "RequirementList", "UnknownEffectType")
             reason: Why it was skipped
             element_data: The actual data that was skipped (optional)
+            counted: Add the element to the skipped element counters
         """
         try:
             # Initialize filename entry if needed
@@ -242,16 +346,18 @@ class DatabaseCreator:
                 self.skipped_elements[filename] = {}
             
             # Store the skipped element
-            self.skipped_elements[filename][element_path] = (element_type, reason, element_data)
+            kept_data = element_data if self.keep_skipped_element_data else None
+            self.skipped_elements[filename][element_path] = (element_type, reason, kept_data)
             
             # Track element type counts
-            self.skipped_element_types[element_type] = self.skipped_element_types.get(element_type, 0) + 1
-            self.total_skipped_elements += 1
+            if counted:
+                self.skipped_element_types[element_type] = self.skipped_element_types.get(element_type, 0) + 1
+                self.total_skipped_elements += 1
             
-            # Also log to database if connection exists
-            if self.cursor:
+            # Also log to database if connection exists (kept even if the spell fails)
+            if self.row_writer:
                 try:
-                    self.cursor.execute("""
+                    self.row_writer.add("""
                         INSERT INTO skipped_elements (filename, element_path, element_type, reason, element_data)
                         VALUES (?, ?, ?, ?, ?)
                     """, (
@@ -260,7 +366,7 @@ class DatabaseCreator:
                         element_type,
                         reason,
                         json.dumps(element_data, default=str) if element_data else None
-                    ))
+                    ), staged=False)
                 except Exception as db_error:
                     # Don't fail if DB logging fails, just print warning
                     print(f"Warning: Could not log skipped element to DB: {db_error}")
@@ -273,60 +379,87 @@ class DatabaseCreator:
         """
         Compare DTO fields with raw dict to find unhandled fields
         
+        Each (type, raw key set) is audited once by the shape audit, repeated
+        shapes only increment the shape's counter.
+        
         Args:
             filename: The spell filename
             dto: The DTO object created
-            raw_dict: The raw dictionary from JSON
+            raw_dict: The raw dictionary from JSON (or the DirectRecord of a direct DTO result)
             path_prefix: Current path in the object hierarchy
         """
         try:
-            # Get all fields that exist in the DTO
-            dto_fields = set()
-            if hasattr(dto, '__dataclass_fields__'):
-                dto_fields = set(dto.__dataclass_fields__.keys())
-            elif hasattr(dto, '__dict__'):
-                dto_fields = set(dto.__dict__.keys())
+            # Direct DTO results collected their unhandled shapes while being built
+            if isinstance(raw_dict, DirectRecord):
+                for class_name, path, field_names, samples in raw_dict.unhandled_shapes:
+                    self._record_unhandled_shape(filename, path, class_name, field_names, samples)
+                return
+            
+            # Fields the raw dict has but the DTO does not declare (cached per shape)
+            dto_fields = getattr(dto, '__dataclass_fields__', None)
+            if dto_fields is None:
+                dto_fields = getattr(dto, '__dict__', {})
+            class_name = type(dto).__name__
+            unhandled = self.shape_audit.get_unhandled_fields(class_name, raw_dict.keys(), dto_fields)
+            if unhandled:
+                self._record_unhandled_shape(filename, path_prefix, class_name, unhandled, raw_dict)
             
-            # Check each field in raw dict
+            # Recursively check nested objects of the handled fields
             for field_name, field_value in raw_dict.items():
-                # Skip internal fields
-                if field_name.startswith('$__'):
+                if not isinstance(field_value, (dict, list)) or field_name not in dto_fields:
                     continue
-                    
-                field_path = f"{path_prefix}.{field_name}" if path_prefix else field_name
                 
-                # Check if field exists in DTO
-                if field_name not in dto_fields:
-                    # This field was not handled!
-                    if filename not in self.unhandled_fields:
-                        self.unhandled_fields[filename] = {}
-                    
-                    self.unhandled_fields[filename][field_path] = field_value
-                    self._log_skipped_element(
-                        filename, 
-                        field_path,
-                        "UnhandledField",
-                        f"Field exists in raw data but not in {type(dto).__name__}",
-                        field_value
-                    )
-                # If field exists in DTO, recursively check nested objects
-                elif hasattr(dto, field_name):
-                    dto_value = getattr(dto, field_name)
-                    if isinstance(field_value, dict) and hasattr(dto_value, '__dict__'):
-                        # Recursive check for nested objects
-                        self._check_unhandled_fields(filename, dto_value, field_value, field_path)
-                    elif isinstance(field_value, list) and isinstance(dto_value, list):
-                        # Check lists of objects
-                        for i, (raw_item, dto_item) in enumerate(zip(field_value, dto_value)):
-                            if isinstance(raw_item, dict) and hasattr(dto_item, '__dict__'):
-                                self._check_unhandled_fields(
-                                    filename, dto_item, raw_item, f"{field_path}[{i}]"
-                                )
+                field_path = f"{path_prefix}.{field_name}" if path_prefix else field_name
+                dto_value = getattr(dto, field_name, None)
+                if isinstance(field_value, dict) and hasattr(dto_value, '__dataclass_fields__'):
+                    self._check_unhandled_fields(filename, dto_value, field_value, field_path)
+                elif isinstance(field_value, list) and isinstance(dto_value, list):
+                    # Check lists of objects
+                    for i, (raw_item, dto_item) in enumerate(zip(field_value, dto_value)):
+                        if isinstance(raw_item, dict) and hasattr(dto_item, '__dataclass_fields__'):
+                            self._check_unhandled_fields(
+                                filename, dto_item, raw_item, f"{field_path}[{i}]"
+                            )
                                 
         except Exception as e:
             print(f"Error checking unhandled fields: {e}")
     
-    def insert_spell_data(self, filename: str, spell_dict: Dict[str, Any], spell_dto: Any) -> bool:
+    def _record_unhandled_shape(self, filename: str, path: str, class_name: str,
+                                field_names: Tuple[str, ...], values: Optional[Dict[str, Any]]):
+        """
+        Count an object with fields its DTO does not declare
+        
+        Only the first object of every (type, unhandled fields) shape is logged to
+        skipped_elements with its values, later objects just increment the counter.
+        
+        Args:
+            filename: The spell filename
+            path: Path of the object in the spell ("" for the root)
+            class_name: DTO class name of the object
+            field_names: Sorted unhandled field names
+            values: Raw values by field name (None if not available)
+        """
+        samples = {name: values[name] for name in field_names} if values else None
+        shape, is_new = self.shape_audit.record(class_name, field_names, filename, path, samples)
+        
+        self.skipped_element_types["UnhandledField"] = (
+            self.skipped_element_types.get("UnhandledField", 0) + len(field_names)
+        )
+        self.total_skipped_elements += len(field_names)
+        
+        if is_new:
+            for field_name in field_names:
+                self._log_skipped_element(
+                    filename,
+                    f"{path}.{field_name}" if path else field_name,
+                    "UnhandledField",
+                    f"Field exists in raw data but not in {class_name}",
+                    samples.get(field_name) if samples else None,
+                    counted=False
+                )
+    
+    def insert_spell_data(self, filename: str, spell_dict: Dict[str, Any], spell_dto: Any,
+                          spell_rows: Optional[SpellRows] = None) -> bool:
         """
         Insert spell data into the database
         
@@ -334,15 +467,12 @@ class DatabaseCreator:
             filename: The spell filename (PRIMARY KEY)
             spell_dict: Raw spell data dictionary
             spell_dto: Processed spell DTO
+            spell_rows: Rows already built by an extraction worker (built here if None)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Reset effect counter and error tracking for this spell
-            self.current_effect_counter = 0
-            self.current_spell_errors = []
-            
             # Check for duplicate filename
             if self.check_duplicate_filename(filename):
                 self.log_duplicate(filename, "filename_collision", 
@@ -350,26 +480,29 @@ class DatabaseCreator:
                 return False
             
             # Check for unhandled fields in the DTO
-            self._check_unhandled_fields(filename, spell_dto, spell_dict)
-            
-            # Insert main spell data
-            if not self._insert_main_spell_data(filename, spell_dict, spell_dto):
-                return False
+            with self.metrics.stage("audit"):
+                self._check_unhandled_fields(filename, spell_dto, spell_dict)
             
-            # Insert nested data
-            if not self._insert_nested_data(filename, spell_dict, spell_dto):
-                return False
+            if spell_rows is None:
+                with self.metrics.stage("rows"):
+                    spell_rows = build_spell_rows(filename, spell_dto, spell_dict)
             
-            # Insert type-specific data
-            if not self._insert_type_specific_data(filename, spell_dict, spell_dto):
-                return False
+            # Skipped elements are logged even if the spell fails
+            for element_path, element_type, reason, element_data in spell_rows.skipped:
+                self._log_skipped_element(filename, element_path, element_type, reason, element_data)
             
-            # Check if any errors occurred during processing
-            if self.current_spell_errors:
-                error_summary = f"Spell had {len(self.current_spell_errors)} processing errors: {'; '.join(self.current_spell_errors[:3])}"
+            # Check if any errors occurred while building the rows
+            if spell_rows.errors:
+                for error_msg in spell_rows.errors:
+                    print(f"ERROR: {error_msg} in {filename}")
+                error_summary = f"Spell had {len(spell_rows.errors)} processing errors: {'; '.join(spell_rows.errors[:3])}"
                 self.log_failed_spell(filename, error_summary, spell_dict)
                 return False
             
+            # All rows of the spell go in as one record so a failed flush drops all of them
+            with self.metrics.stage("insert"):
+                self.row_sink.write(spell_rows, spell_dict)
+            self.existing_filenames.add(filename)
             return True
             
         except Exception as e:
@@ -378,979 +511,64 @@ class DatabaseCreator:
             self.log_failed_spell(filename, error_msg, spell_dict)
             return False
     
-    def _insert_main_spell_data(self, filename: str, spell_dict: Dict[str, Any], spell_dto: Any) -> bool:
-        """Insert data into main spell_cards table"""
-        try:
-            # Prepare data for insertion (handle None values)
-            def safe_get(obj, attr, default=None):
-                """Safely get attribute from object"""
-                if hasattr(obj, attr):
-                    value = getattr(obj, attr)
-                    # Convert boolean to integer for SQLite
-                    if isinstance(value, bool):
-                        return 1 if value else 0
-                    return value
-                return default
-            
-            # Insert into spell_cards table
-            self.cursor.execute("""
-                INSERT INTO spell_cards (
-                    filename, spell_type, m_name, m_PvE, m_PvP, m_Treasure, m_accuracy,
-                    m_advancedDescription, m_alwaysFizzle, m_backRowFriendly, m_baseCost,
-                    m_battlegroundsOnly, m_boosterPackIcon, m_cardFront, m_casterInvisible,
-                    m_cloaked, m_cloakedName, m_creditsCost, m_delayEnchantment,
-                    m_description, m_descriptionCombatHUD, m_descriptionTrainer,
-                    m_displayIndex, m_displayName, m_hiddenFromEffectsWindow,
-                    m_ignoreCharms, m_ignoreDispel, m_imageIndex, m_imageName,
-                    m_leavesPlayWhenCast, m_levelRestriction, m_maxCopies, m_noDiscard,
-                    m_noPvEEnchant, m_noPvPEnchant, m_previousSpellName,
-                    m_pvpCurrencyCost, m_pvpTourneyCurrencyCost, m_requiredSchoolName,
-                    m_sMagicSchoolName, m_sTypeName, m_secondarySchoolName,
-                    m_showPolymorphedName, m_skipTruncation, m_spellBase,
-                    m_spellCategory, m_spellFusion, m_spellSourceType, m_trainingCost,
-                    m_useGloss
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                filename,
-                spell_dict.get("$__type", "").replace("class ", ""),
-                safe_get(spell_dto, "m_name"),
-                safe_get(spell_dto, "m_PvE"),
-                safe_get(spell_dto, "m_PvP"),
-                safe_get(spell_dto, "m_Treasure"),
-                safe_get(spell_dto, "m_accuracy"),
-                safe_get(spell_dto, "m_advancedDescription"),
-                safe_get(spell_dto, "m_alwaysFizzle"),
-                safe_get(spell_dto, "m_backRowFriendly"),
-                safe_get(spell_dto, "m_baseCost"),
-                safe_get(spell_dto, "m_battlegroundsOnly"),
-                safe_get(spell_dto, "m_boosterPackIcon"),
-                safe_get(spell_dto, "m_cardFront"),
-                safe_get(spell_dto, "m_casterInvisible"),
-                safe_get(spell_dto, "m_cloaked"),
-                safe_get(spell_dto, "m_cloakedName"),
-                safe_get(spell_dto, "m_creditsCost"),
-                safe_get(spell_dto, "m_delayEnchantment"),
-                safe_get(spell_dto, "m_description"),
-                safe_get(spell_dto, "m_descriptionCombatHUD"),
-                safe_get(spell_dto, "m_descriptionTrainer"),
-                safe_get(spell_dto, "m_displayIndex"),
-                safe_get(spell_dto, "m_displayName"),
-                safe_get(spell_dto, "m_hiddenFromEffectsWindow"),
-                safe_get(spell_dto, "m_ignoreCharms"),
-                safe_get(spell_dto, "m_ignoreDispel"),
-                safe_get(spell_dto, "m_imageIndex"),
-                safe_get(spell_dto, "m_imageName"),
-                safe_get(spell_dto, "m_leavesPlayWhenCast"),
-                safe_get(spell_dto, "m_levelRestriction"),
-                safe_get(spell_dto, "m_maxCopies"),
-                safe_get(spell_dto, "m_noDiscard"),
-                safe_get(spell_dto, "m_noPvEEnchant"),
-                safe_get(spell_dto, "m_noPvPEnchant"),
-                safe_get(spell_dto, "m_previousSpellName"),
-                safe_get(spell_dto, "m_pvpCurrencyCost"),
-                safe_get(spell_dto, "m_pvpTourneyCurrencyCost"),
-                safe_get(spell_dto, "m_requiredSchoolName"),
-                safe_get(spell_dto, "m_sMagicSchoolName"),
-                safe_get(spell_dto, "m_sTypeName"),
-                safe_get(spell_dto, "m_secondarySchoolName"),
-                safe_get(spell_dto, "m_showPolymorphedName"),
-                safe_get(spell_dto, "m_skipTruncation"),
-                safe_get(spell_dto, "m_spellBase"),
-                safe_get(spell_dto, "m_spellCategory"),
-                safe_get(spell_dto, "m_spellFusion"),
-                safe_get(spell_dto, "m_spellSourceType"),
-                safe_get(spell_dto, "m_trainingCost"),
-                safe_get(spell_dto, "m_useGloss")
-            ))
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error inserting main spell data: {e}")
-            return False
-    
-    def _insert_nested_data(self, filename: str, spell_dict: Dict[str, Any], spell_dto: Any) -> bool:
-        """Insert nested data (effects, ranks, adjectives, etc.)"""
-        try:
-            # Insert spell rank data
-            if hasattr(spell_dto, "m_spellRank") and spell_dto.m_spellRank:
-                rank = spell_dto.m_spellRank
-                self.cursor.execute("""
-                    INSERT INTO spell_ranks (
-                        filename, m_balancePips, m_deathPips, m_firePips, m_icePips,
-                        m_lifePips, m_mythPips, m_shadowPips, m_spellRank,
-                        m_stormPips, m_xPipSpell
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    filename,
-                    getattr(rank, "m_balancePips", 0),
-                    getattr(rank, "m_deathPips", 0),
-                    getattr(rank, "m_firePips", 0),
-                    getattr(rank, "m_icePips", 0),
-                    getattr(rank, "m_lifePips", 0),
-                    getattr(rank, "m_mythPips", 0),
-                    getattr(rank, "m_shadowPips", 0),
-                    getattr(rank, "m_spellRank", 0),
-                    getattr(rank, "m_stormPips", 0),
-                    1 if getattr(rank, "m_xPipSpell", False) else 0
-                ))
-            
-            # Insert spell effects
-            if hasattr(spell_dto, "m_effects") and spell_dto.m_effects:
-                for effect in spell_dto.m_effects:
-                    self._insert_spell_effect(filename, effect, "spell_cards", -1)
-            
-            # Insert adjectives
-            if hasattr(spell_dto, "m_adjectives") and spell_dto.m_adjectives:
-                for adj_order, adjective in enumerate(spell_dto.m_adjectives):
-                    self.cursor.execute("""
-                        INSERT INTO spell_adjectives (filename, adjective_order, adjective_value)
-                        VALUES (?, ?, ?)
-                    """, (filename, adj_order, str(adjective)))
-            
-            # Insert behaviors
-            if hasattr(spell_dto, "m_behaviors") and spell_dto.m_behaviors:
-                for beh_order, behavior in enumerate(spell_dto.m_behaviors):
-                    self.cursor.execute("""
-                        INSERT INTO spell_behaviors (filename, behavior_order, behavior_value)
-                        VALUES (?, ?, ?)
-                    """, (filename, beh_order, str(behavior)))
-            
-            # Insert valid target spells
-            if hasattr(spell_dto, "m_validTargetSpells") and spell_dto.m_validTargetSpells:
-                for target_order, target in enumerate(spell_dto.m_validTargetSpells):
-                    self.cursor.execute("""
-                        INSERT INTO spell_valid_targets (filename, target_order, target_spell)
-                        VALUES (?, ?, ?)
-                    """, (filename, target_order, str(target)))
-            
-            # Process spell-level requirements (m_displayRequirements)
-            if hasattr(spell_dto, "m_displayRequirements") and spell_dto.m_displayRequirements:
-                try:
-                    self._insert_requirement_list(filename, "display_requirements", -1, -1, spell_dto.m_displayRequirements)
-                except Exception as e:
-                    error_msg = f"Error processing m_displayRequirements: {e}"
-                    print(f"ERROR: {error_msg} in {filename}")
-                    self.current_spell_errors.append(error_msg)
-                    self._log_skipped_element(
-                        filename,
-                        "m_displayRequirements",
-                        type(spell_dto.m_displayRequirements).__name__,
-                        f"Failed to process display requirements: {e}",
-                        spell_dto.m_displayRequirements.__dict__ if hasattr(spell_dto.m_displayRequirements, '__dict__') else str(spell_dto.m_displayRequirements)
-                    )
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error inserting nested data: {e}")
-            return False
-    
-    def _insert_spell_effect(self, filename: str, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert a single spell effect into appropriate table based on type"""
-        try:
-            # Check for invalid effect types (debugging)
-            if effect is None:
-                print(f"WARNING: None effect in {filename}, parent_table: {parent_table}")
-                return
-            
-            if isinstance(effect, list):
-                error_msg = f"List effect found - should be DTO object (parent_table: {parent_table})"
-                print(f"ERROR: {error_msg} in {filename}")
-                self.current_spell_errors.append(error_msg)
-                # Try to process each item in the list
-                for item in effect:
-                    if hasattr(item, '__dict__') or isinstance(item, dict):
-                        self._insert_spell_effect(filename, item, parent_table, parent_effect_order)
-                return
-            
-            if isinstance(effect, dict) and "$__type" in effect:
-                error_msg = f"Raw dict effect found - DTO conversion failed (type: {effect.get('$__type', 'unknown')})"
-                print(f"WARNING: {error_msg} in {filename}")
-                self.current_spell_errors.append(error_msg)
-                self._log_skipped_element(
-                    filename,
-                    f"effects[{self.current_effect_counter}]",
-                    effect.get('$__type', 'unknown'),
-                    "DTO conversion failed",
-                    effect
-                )
-                return
-            
-            # Use and increment global effect counter
-            effect_order = self.current_effect_counter
-            self.current_effect_counter += 1
-            
-            effect_type = type(effect).__name__
-            
-            # Route to appropriate insert method based on effect type
-            if effect_type == "SpellEffectDTO":
-                self._insert_base_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "DelaySpellEffectDTO":
-                self._insert_delay_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "ConditionalSpellEffectDTO":
-                self._insert_conditional_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "VariableSpellEffectDTO":
-                self._insert_variable_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "EffectListSpellEffectDTO":
-                self._insert_effect_list_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "RandomSpellEffectDTO":
-                self._insert_random_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "RandomPerTargetSpellEffectDTO":
-                self._insert_random_per_target_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "HangingConversionSpellEffectDTO":
-                self._insert_hanging_conversion_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "TargetCountSpellEffectDTO":
-                self._insert_target_count_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "ShadowSpellEffectDTO":
-                self._insert_shadow_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            elif effect_type == "CountBasedSpellEffectDTO":
-                self._insert_count_based_spell_effect(filename, effect_order, effect, parent_table, parent_effect_order)
-            else:
-                error_msg = f"Unknown effect type: {effect_type}"
-                print(f"ERROR: {error_msg} in {filename}, value: {effect}")
-                self.current_spell_errors.append(error_msg)
-                self._log_skipped_element(
-                    filename,
-                    f"effects[{effect_order}]",
-                    effect_type,
-                    "Unknown effect type - no handler implemented",
-                    effect.__dict__ if hasattr(effect, '__dict__') else str(effect)
-                )
-                
-        except Exception as e:
-            error_msg = f"Exception in spell effect insertion: {e}"
-            print(f"ERROR: {error_msg} in {filename}")
-            self.current_spell_errors.append(error_msg)
-            import traceback
-            traceback.print_exc()
-    
-    def _get_base_effect_values(self, effect: Any):
-        """Get base SpellEffect field values"""
-        def safe_effect_get(attr, default=None):
-            if hasattr(effect, attr):
-                value = getattr(effect, attr)
-                if isinstance(value, bool):
-                    return 1 if value else 0
-                return value
-            return default
-        
-        return (
-            safe_effect_get("m_act"), safe_effect_get("m_actNum"),
-            safe_effect_get("m_armorPiercingParam"), safe_effect_get("m_bypassProtection"),
-            safe_effect_get("m_chancePerTarget"), safe_effect_get("m_cloaked"),
-            safe_effect_get("m_converted"), safe_effect_get("m_damageType"),
-            safe_effect_get("m_disposition"), safe_effect_get("m_effectParam"),
-            safe_effect_get("m_effectTarget"), safe_effect_get("m_effectType"),
-            safe_effect_get("m_enchantmentSpellTemplateID"), safe_effect_get("m_healModifier"),
-            safe_effect_get("m_numRounds"), safe_effect_get("m_paramPerRound"),
-            safe_effect_get("m_pipNum"), safe_effect_get("m_protected"),
-            safe_effect_get("m_rank"), safe_effect_get("m_sDamageType"),
-            safe_effect_get("m_spellTemplateID")
-        )
-    
-    def _insert_base_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert basic SpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-    
-    def _insert_delay_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert DelaySpellEffect with specific fields"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO delay_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID,
-                m_damage, m_rounds, m_spellDelayedTemplateID, m_spellDelayedTemplateDamageID,
-                m_spellEnchanterTemplateID, m_spellHits, m_spell
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values + (
-            getattr(effect, "m_damage", 0),
-            getattr(effect, "m_rounds", 0),
-            getattr(effect, "m_spellDelayedTemplateID", 0),
-            getattr(effect, "m_spellDelayedTemplateDamageID", 0),
-            getattr(effect, "m_spellEnchanterTemplateID", 0),
-            getattr(effect, "m_spellHits", 0),
-            str(getattr(effect, "m_spell", None))
-        ))
-        
-        # Handle m_targetSubcircleList for DelaySpellEffect
-        if hasattr(effect, "m_targetSubcircleList") and effect.m_targetSubcircleList:
-            for subcircle_order, subcircle in enumerate(effect.m_targetSubcircleList):
-                self.cursor.execute("""
-                    INSERT INTO delay_spell_target_subcircles (
-                        filename, effect_order, subcircle_order, subcircle_value
-                    ) VALUES (?, ?, ?, ?)
-                """, (filename, effect_order, subcircle_order, subcircle))
-    
-    def _insert_conditional_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert ConditionalSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO conditional_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-        
-        # Handle ConditionalSpellElement objects in m_elements
-        if hasattr(effect, "m_elements") and effect.m_elements:
-            for element_order, element in enumerate(effect.m_elements):
-                self._insert_conditional_spell_element(filename, effect_order, element_order, element)
-    
-    def _insert_conditional_spell_element(self, filename: str, parent_effect_order: int, element_order: int, element: Any):
-        """Insert ConditionalSpellElement"""
-        self.cursor.execute("""
-            INSERT INTO conditional_spell_elements (
-                filename, parent_effect_order, element_order
-            ) VALUES (?, ?, ?)
-        """, (filename, parent_effect_order, element_order))
-        
-        # Handle nested effects in m_pEffect
-        if hasattr(element, "m_pEffect") and element.m_pEffect:
-            self._insert_spell_effect(filename, element.m_pEffect, "conditional_spell_elements", element_order)
-        
-        # Handle requirements in m_pReqs
-        if hasattr(element, "m_pReqs") and element.m_pReqs:
-            self._insert_requirement_list(filename, "conditional_element", parent_effect_order, element_order, element.m_pReqs)
-    
-    def _insert_variable_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert VariableSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO variable_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-        
-        # Handle nested effects in m_effectList
-        if hasattr(effect, "m_effectList") and effect.m_effectList:
-            for nested_effect in effect.m_effectList:
-                self._insert_spell_effect(filename, nested_effect, "variable_spell_effects", effect_order)
-    
-    def _insert_effect_list_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert EffectListSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO effect_list_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-        
-        # Handle nested effects in m_effectList
-        if hasattr(effect, "m_effectList") and effect.m_effectList:
-            for nested_effect in effect.m_effectList:
-                self._insert_spell_effect(filename, nested_effect, "effect_list_spell_effects", effect_order)
-    
-    def _insert_random_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert RandomSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO random_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-        
-        # Handle nested effects in m_effectList
-        if hasattr(effect, "m_effectList") and effect.m_effectList:
-            for nested_effect in effect.m_effectList:
-                self._insert_spell_effect(filename, nested_effect, "random_spell_effects", effect_order)
-    
-    def _insert_random_per_target_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert RandomPerTargetSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO random_per_target_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-        
-        # Handle nested effects in m_effectList
-        if hasattr(effect, "m_effectList") and effect.m_effectList:
-            for nested_effect in effect.m_effectList:
-                self._insert_spell_effect(filename, nested_effect, "random_per_target_spell_effects", effect_order)
-    
-    def _insert_hanging_conversion_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert HangingConversionSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO hanging_conversion_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID,
-                m_hangingEffectType, m_outputSelector, m_minEffectValue, m_maxEffectValue,
-                m_minEffectCount, m_maxEffectCount, m_notDamageType, m_scaleSourceEffectValue,
-                m_sourceEffectValuePercent, m_applyToEffectSource
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values + (
-            getattr(effect, "m_hangingEffectType", 0),
-            getattr(effect, "m_outputSelector", 0),
-            getattr(effect, "m_minEffectValue", 0),
-            getattr(effect, "m_maxEffectValue", 0),
-            getattr(effect, "m_minEffectCount", 0),
-            getattr(effect, "m_maxEffectCount", 0),
-            getattr(effect, "m_notDamageType", 0),
-            1 if getattr(effect, "m_scaleSourceEffectValue", False) else 0,
-            getattr(effect, "m_sourceEffectValuePercent", 0.0),
-            1 if getattr(effect, "m_applyToEffectSource", False) else 0
-        ))
-        
-        # Handle nested effects in m_outputEffect (LIST of effects)
-        if hasattr(effect, "m_outputEffect") and effect.m_outputEffect:
-            for output_effect in effect.m_outputEffect:
-                self._insert_spell_effect(filename, output_effect, "hanging_conversion_spell_effects", effect_order)
-    
-    def _insert_target_count_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert TargetCountSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO target_count_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values)
-        
-        # Handle nested effects in m_effectLists
-        if hasattr(effect, "m_effectLists") and effect.m_effectLists:
-            for nested_effect in effect.m_effectLists:
-                self._insert_spell_effect(filename, nested_effect, "target_count_spell_effects", effect_order)
-    
-    def _insert_shadow_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert ShadowSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO shadow_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID,
-                m_shadowType
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values + (
-            getattr(effect, "m_shadowType", 0),
-        ))
-        
-        # Handle nested effects in m_effectList
-        if hasattr(effect, "m_effectList") and effect.m_effectList:
-            for nested_effect in effect.m_effectList:
-                self._insert_spell_effect(filename, nested_effect, "shadow_spell_effects", effect_order)
-    
-    def _insert_count_based_spell_effect(self, filename: str, effect_order: int, effect: Any, parent_table: str, parent_effect_order: int):
-        """Insert CountBasedSpellEffect"""
-        base_values = self._get_base_effect_values(effect)
-        
-        self.cursor.execute("""
-            INSERT INTO count_based_spell_effects (
-                filename, effect_order, parent_table, parent_effect_order,
-                m_act, m_actNum, m_armorPiercingParam, m_bypassProtection, m_chancePerTarget,
-                m_cloaked, m_converted, m_damageType, m_disposition,
-                m_effectParam, m_effectTarget, m_effectType,
-                m_enchantmentSpellTemplateID, m_healModifier, m_numRounds,
-                m_paramPerRound, m_pipNum, m_protected, m_rank,
-                m_sDamageType, m_spellTemplateID,
-                m_countThreshold, m_mode
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (filename, effect_order, parent_table, parent_effect_order) + base_values + (
-            getattr(effect, "m_countThreshold", 0),
-            getattr(effect, "m_mode", 0),
-        ))
+    def _on_spell_write_failed(self, filename: str, spell_dict: Dict[str, Any], error_message: str):
+        """
+        Handle a spell whose buffered rows were rejected by the database on flush
         
-        # Handle nested effects in m_effectList
-        if hasattr(effect, "m_effectList") and effect.m_effectList:
-            for nested_effect in effect.m_effectList:
-                self._insert_spell_effect(filename, nested_effect, "count_based_spell_effects", effect_order)
-    
-    def _insert_type_specific_data(self, filename: str, spell_dict: Dict[str, Any], spell_dto: Any) -> bool:
-        """Insert type-specific data based on spell template type"""
-        try:
-            spell_type = type(spell_dto).__name__
-            
-            # Handle TieredSpellTemplateDTO
-            if spell_type == "TieredSpellTemplateDTO":
-                self.cursor.execute("""
-                    INSERT INTO tiered_spell_data (filename, m_levelRestriction, m_retired, m_shardCost)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    filename,
-                    getattr(spell_dto, "m_levelRestriction", None),
-                    1 if getattr(spell_dto, "m_retired", False) else 0,
-                    getattr(spell_dto, "m_shardCost", None)
-                ))
-                
-                # Insert next tier spells
-                if hasattr(spell_dto, "m_nextTierSpells") and spell_dto.m_nextTierSpells:
-                    for tier_order, next_tier in enumerate(spell_dto.m_nextTierSpells):
-                        self.cursor.execute("""
-                            INSERT INTO tiered_spell_next_tiers (filename, tier_order, next_tier_spell)
-                            VALUES (?, ?, ?)
-                        """, (filename, tier_order, str(next_tier)))
-                
-                # Process TieredSpellTemplate requirements (m_requirements)
-                if hasattr(spell_dto, "m_requirements") and spell_dto.m_requirements:
-                    try:
-                        self._insert_requirement_list(filename, "spell_template", -1, -1, spell_dto.m_requirements)
-                    except Exception as e:
-                        error_msg = f"Error processing m_requirements on TieredSpellTemplate: {e}"
-                        print(f"ERROR: {error_msg} in {filename}")
-                        self.current_spell_errors.append(error_msg)
-                        self._log_skipped_element(
-                            filename,
-                            "m_requirements",
-                            type(spell_dto.m_requirements).__name__,
-                            f"Failed to process tiered spell requirements: {e}",
-                            spell_dto.m_requirements.__dict__ if hasattr(spell_dto.m_requirements, '__dict__') else str(spell_dto.m_requirements)
-                        )
-            
-            # Handle other spell template types similarly...
-            # (CantripsSpellTemplateDTO, CastleMagicSpellTemplateDTO, etc.)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error inserting type-specific data: {e}")
-            return False
-    
-    def _insert_requirement_list(self, filename: str, parent_type: str, parent_effect_order: int, 
-                                element_order: int, req_list: Any):
-        """Insert RequirementList into requirement_lists table"""
-        try:
-            # Insert RequirementList data
-            self.cursor.execute("""
-                INSERT INTO requirement_lists (
-                    filename, parent_type, parent_effect_order, element_order, m_applyNOT, m_operator
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                filename,
-                parent_type,
-                parent_effect_order,
-                element_order,
-                1 if getattr(req_list, "m_applyNOT", False) else 0,
-                getattr(req_list, "m_operator", 0)
-            ))
-            
-            # Handle individual requirements in m_requirements array
-            if hasattr(req_list, "m_requirements") and req_list.m_requirements:
-                for requirement_order, requirement in enumerate(req_list.m_requirements):
-                    # Check if this is a nested RequirementList
-                    if type(requirement).__name__ == "RequirementListDTO":
-                        # Handle nested RequirementList (like in the ReqHasEntry example)
-                        self._insert_requirement_list(filename, parent_type, parent_effect_order, 
-                                                    element_order, requirement)
-                    else:
-                        self._insert_individual_requirement(filename, parent_type, parent_effect_order, 
-                                                          element_order, requirement_order, requirement)
-                    
-        except Exception as e:
-            error_msg = f"Error inserting requirement list: {e}"
-            print(f"ERROR: {error_msg} in {filename}")
-            self.current_spell_errors.append(error_msg)
-    
-    def _insert_individual_requirement(self, filename: str, parent_type: str, parent_effect_order: int, 
-                                     element_order: int, requirement_order: int, requirement: Any):
-        """Insert individual requirement into appropriate table based on type"""
-        try:
-            requirement_type = type(requirement).__name__
-            
-            # Route to appropriate insert method based on requirement type
-            if requirement_type == "ReqIsSchoolDTO":
-                self._insert_req_is_school(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqHangingCharmDTO":
-                self._insert_req_hanging_charm(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqHangingWardDTO":
-                self._insert_req_hanging_ward(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqHangingOverTimeDTO":
-                self._insert_req_hanging_over_time(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqHangingEffectTypeDTO":
-                self._insert_req_hanging_effect_type(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqHangingAuraDTO":
-                self._insert_req_hanging_aura(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqSchoolOfFocusDTO":
-                self._insert_req_school_of_focus(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqMinionDTO":
-                self._insert_req_minion(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqHasEntryDTO":
-                self._insert_req_has_entry(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqCombatHealthDTO":
-                self._insert_req_combat_health(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqPvPCombatDTO":
-                self._insert_req_pvp_combat(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqShadowPipCountDTO":
-                self._insert_req_shadow_pip_count(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqCombatStatusDTO":
-                self._insert_req_combat_status(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqPipCountDTO":
-                self._insert_req_pip_count(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            elif requirement_type == "ReqMagicLevelDTO":
-                self._insert_req_magic_level(filename, parent_type, parent_effect_order, element_order, requirement_order, requirement)
-            else:
-                error_msg = f"Unknown requirement type: {requirement_type}"
-                print(f"ERROR: {error_msg} in {filename}")
-                self.current_spell_errors.append(error_msg)
-                
-        except Exception as e:
-            error_msg = f"Error inserting individual requirement: {e}"
-            print(f"ERROR: {error_msg} in {filename}")
-            self.current_spell_errors.append(error_msg)
-    
-    # Individual requirement insertion methods
-    
-    def _insert_req_is_school(self, filename: str, parent_type: str, parent_effect_order: int, 
-                             element_order: int, requirement_order: int, req: Any):
-        """Insert ReqIsSchool requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_is_school (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_magicSchoolName
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_magicSchoolName", "")
-        ))
-    
-    def _insert_req_hanging_charm(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqHangingCharm requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_hanging_charm (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_disposition, m_minCount, m_maxCount
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_disposition", 0),
-            getattr(req, "m_minCount", 0),
-            getattr(req, "m_maxCount", 0)
-        ))
-    
-    def _insert_req_hanging_ward(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqHangingWard requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_hanging_ward (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_disposition, m_minCount, m_maxCount
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_disposition", 0),
-            getattr(req, "m_minCount", 0),
-            getattr(req, "m_maxCount", 0)
-        ))
-    
-    def _insert_req_hanging_over_time(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqHangingOverTime requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_hanging_over_time (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_disposition, m_minCount, m_maxCount
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_disposition", 0),
-            getattr(req, "m_minCount", 0),
-            getattr(req, "m_maxCount", 0)
-        ))
-    
-    def _insert_req_hanging_effect_type(self, filename: str, parent_type: str, parent_effect_order: int, 
-                                       element_order: int, requirement_order: int, req: Any):
-        """Insert ReqHangingEffectType requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_hanging_effect_type (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_effectType, m_minCount, m_maxCount,
-                m_param_low, m_param_high, m_min_count, m_max_count, m_anyType, m_globalEffect
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_effectType", 0),
-            getattr(req, "m_minCount", 0),
-            getattr(req, "m_maxCount", 0),
-            getattr(req, "m_param_low", 0),
-            getattr(req, "m_param_high", 0),
-            getattr(req, "m_min_count", 0),
-            getattr(req, "m_max_count", 0),
-            1 if getattr(req, "m_anyType", False) else 0,
-            1 if getattr(req, "m_globalEffect", False) else 0
-        ))
-    
-    def _insert_req_hanging_aura(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqHangingAura requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_hanging_aura (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_disposition, m_minCount, m_maxCount,
-                m_effectType, m_anyType, m_globalEffect
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_disposition", 0),
-            getattr(req, "m_minCount", 0),
-            getattr(req, "m_maxCount", 0),
-            getattr(req, "m_effectType", 0),
-            1 if getattr(req, "m_anyType", False) else 0,
-            1 if getattr(req, "m_globalEffect", False) else 0
-        ))
-    
-    def _insert_req_school_of_focus(self, filename: str, parent_type: str, parent_effect_order: int, 
-                                   element_order: int, requirement_order: int, req: Any):
-        """Insert ReqSchoolOfFocus requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_school_of_focus (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_magicSchool
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_magicSchool", "")
-        ))
-    
-    def _insert_req_minion(self, filename: str, parent_type: str, parent_effect_order: int, 
-                          element_order: int, requirement_order: int, req: Any):
-        """Insert ReqMinion requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_minion (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_minCount, m_maxCount, m_minionType
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_minCount", 0),
-            getattr(req, "m_maxCount", 0),
-            getattr(req, "m_minionType", "")
-        ))
-    
-    def _insert_req_has_entry(self, filename: str, parent_type: str, parent_effect_order: int, 
-                             element_order: int, requirement_order: int, req: Any):
-        """Insert ReqHasEntry requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_has_entry (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_entryName, m_displayName, m_isQuestRegistry, m_questName
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_entryName", ""),
-            getattr(req, "m_displayName", ""),
-            1 if getattr(req, "m_isQuestRegistry", False) else 0,
-            getattr(req, "m_questName", "")
-        ))
-    
-    def _insert_req_combat_health(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqCombatHealth requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_combat_health (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_fMinPercent, m_fMaxPercent
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_fMinPercent", 0.0),
-            getattr(req, "m_fMaxPercent", 0.0)
-        ))
-    
-    def _insert_req_pvp_combat(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqPvPCombat requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_pvp_combat (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0)
-        ))
-    
-    def _insert_req_shadow_pip_count(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqShadowPipCount requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_shadow_pip_count (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_minPips, m_maxPips
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_minPips", 0),
-            getattr(req, "m_maxPips", 0)
-        ))
-    
-    def _insert_req_combat_status(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqCombatStatus requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_combat_status (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_combatStatus, m_status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_combatStatus", 0),
-            getattr(req, "m_status", 0)
-        ))
-    
-    def _insert_req_pip_count(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqPipCount requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_pip_count (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_operator, m_targetType, m_minPips, m_maxPips
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_targetType", 0),
-            getattr(req, "m_minPips", 0),
-            getattr(req, "m_maxPips", 0)
-        ))
-    
-    def _insert_req_magic_level(self, filename: str, parent_type: str, parent_effect_order: int, element_order: int, requirement_order: int, req: Any):
-        """Insert ReqMagicLevel requirement"""
-        self.cursor.execute("""
-            INSERT INTO req_magic_level (
-                filename, parent_type, parent_effect_order, element_order, requirement_order,
-                m_applyNOT, m_magicSchool, m_numericValue, m_operator, m_operatorType
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            filename, parent_type, parent_effect_order, element_order, requirement_order,
-            1 if getattr(req, "m_applyNOT", False) else 0,
-            getattr(req, "m_magicSchool", ""),
-            getattr(req, "m_numericValue", 0.0),
-            getattr(req, "m_operator", 0),
-            getattr(req, "m_operatorType", 0)
-        ))
+        Args:
+            filename: The spell filename
+            spell_dict: Raw spell data dictionary
+            error_message: Database error description
+        """
+        print(f"ERROR: {error_message} in {filename}")
+        self.total_success -= 1
+        self.total_failures += 1
+        self.existing_filenames.discard(filename)
+        self.manifest.forget(filename)
+        self.log_failed_spell(filename, error_message, spell_dict)
     
     def process_all_spells(self) -> bool:
         """Process all spells from WAD archive into database"""
         print("Starting spell processing...")
         self.processing_start_time = datetime.now()
         
+        metrics = self.metrics
         try:
             # Get all spell files
-            spell_files = self.wad_processor.get_all_spell_files()
+            with metrics.stage("list"):
+                spell_files = self.wad_processor.get_all_spell_files()
             if not spell_files:
                 print("No spell files found")
                 return False
             
+            # Checksum all entries and, when patching a base build, keep only the changed ones
+            with metrics.stage("list"):
+                spell_files = self._select_spell_files(spell_files)
+            metrics.file_size_lookup = self.manifest.get_size
+            
             print(f"Processing {len(spell_files)} spell files...")
             
-            for i, file_path in enumerate(spell_files):
+            # Extraction runs serially or in worker processes, inserts always happen here
+            # (each file's metrics frame is opened by the extraction loop)
+            for file_path, success, spell_dict, spell_dto, error_msg, spell_rows in self._iter_extracted_spells(spell_files):
                 self.total_processed += 1
                 
-                # Process single spell
-                success, spell_dict, spell_dto, error_msg = self.wad_processor.process_single_spell(file_path)
-                
                 if success and spell_dto:
                     # Insert into database
-                    if self.insert_spell_data(file_path, spell_dict, spell_dto):
+                    if self.insert_spell_data(file_path, spell_dict, spell_dto, spell_rows):
                         self.total_success += 1
+                        self.manifest.record_key(file_path, file_path)
                     else:
                         self.total_failures += 1
+                        self.manifest.forget(file_path)
                 else:
                     # Log failure
                     self.total_failures += 1
+                    self.manifest.forget(file_path)
                     if spell_dict:
                         self.log_failed_spell(file_path, error_msg or "Unknown error", spell_dict)
+                metrics.set_file_content(spell_dto if spell_dto is not None else spell_dict)
+                metrics.end_file()
                 
                 # Progress update
                 if self.total_processed % 1000 == 0:
@@ -1358,17 +576,35 @@ class DatabaseCreator:
                           f"{self.total_success} success, {self.total_failures} failed, "
                           f"{self.duplicate_count} duplicates")
                 
-                # Periodic commit
-                if self.total_processed % 100 == 0:
-                    self.connection.commit()
+                # Write buffered rows once enough have accumulated
+                if self.row_writer.pending_rows >= self.row_writer.flush_size:
+                    with metrics.stage("insert"):
+                        self.row_writer.flush()
+                
+                # Shrink the buffers when the run approaches its memory budget
+                if metrics.memory_budget and metrics.memory_budget.is_under_pressure():
+                    self._adapt_to_memory_budget()
             
-            # Final commit
-            self.connection.commit()
+            # Final flush and commit
+            with metrics.stage("insert"):
+                self.row_writer.flush()
             self.processing_end_time = datetime.now()
             
             # Insert processing metadata
-            self._insert_processing_metadata()
+            with metrics.stage("report"):
+                self._insert_processing_metadata()
+                self._insert_unhandled_field_shapes()
             
+            # Build the deferred indexes once all rows are in
+            if self.bulk_loader:
+                with metrics.stage("index"):
+                    self.bulk_loader.finish()
+            
+            # Manifest for the next incremental build
+            with metrics.stage("report"):
+                self.manifest.save(get_manifest_path(self.database_path))
+            
+            self._insert_stage_metrics()
             return True
             
         except Exception as e:
@@ -1376,6 +612,78 @@ class DatabaseCreator:
             traceback.print_exc()
             return False
     
+    def _adapt_to_memory_budget(self):
+        """Flush buffered rows and shrink the row buffer, page cache and skipped element report"""
+        budget = self.metrics.memory_budget
+        with self.metrics.stage("insert"):
+            self.row_writer.flush()
+        self.row_writer.flush_size = budget.shrink("row flush size", self.row_writer.flush_size, 100)
+        
+        if self.bulk_loader and self.bulk_loader.active:
+            self.bulk_loader.set_cache_mb(budget.shrink("SQLite page cache MB", self.bulk_loader.cache_mb, 16))
+        
+        if self.keep_skipped_element_data:
+            # The skipped_elements table keeps the data, only the in-memory copy is dropped
+            self.keep_skipped_element_data = False
+            for elements in self.skipped_elements.values():
+                for element_path, (element_type, reason, _) in elements.items():
+                    elements[element_path] = (element_type, reason, None)
+            budget.record("skipped element data", "dropped from the JSON report (kept in the database)")
+    
+    def _select_spell_files(self, spell_files: List[str]) -> List[str]:
+        """
+        Build the WAD manifest and, when patching a base build, drop stale rows
+        
+        Args:
+            spell_files: All spell file paths inside the WAD archive
+            
+        Returns:
+            Spell files that have to be extracted and inserted
+        """
+        self.manifest = WadManifest("Spells/*", self.revision_detector.get_revision())
+        self.manifest.build(self.wad_processor.archive, spell_files)
+        
+        if not self.base_manifest:
+            return spell_files
+        
+        self.manifest_diff = apply_manifest_diff(self.cursor, "filename", self.manifest, self.base_manifest)
+        self.connection.commit()
+        
+        reprocess = set(self.manifest_diff.reprocess_paths)
+        return [file_path for file_path in spell_files if file_path in reprocess]
+    
+    def _iter_extracted_spells(self, spell_files: List[str]):
+        """
+        Yield extraction results for all spell files in file order
+        
+        Args:
+            spell_files: Spell file paths inside the WAD archive
+            
+        Yields:
+            (file_path, success, spell_dict, spell_dto, error_message, spell_rows)
+            spell_rows is only built ahead by extraction workers, None otherwise.
+            The file's metrics frame is open, the caller ends it after the insert.
+        """
+        if self.workers > 1:
+            # Workers profile their share of each file into the same directory
+            profiler = self.metrics.profiler
+            extractor = ParallelSpellExtractor(
+                self.wad_processor.wad_path, self.wad_processor.types_path, self.workers,
+                direct_dto=self.wad_processor.direct_dto,
+                profile_dir=profiler.output_dir if profiler else None,
+                profile_threshold_ms=profiler.threshold_ms if profiler else None
+            )
+            for *result, stage_seconds in extractor.iter_results(spell_files):
+                self.metrics.begin_file(name=result[0])
+                self.metrics.add(stage_seconds)
+                yield tuple(result)
+            return
+        
+        for file_path in spell_files:
+            self.metrics.begin_file(name=file_path)
+            success, spell_dict, spell_dto, error_msg = self.wad_processor.process_single_spell(file_path)
+            yield file_path, success, spell_dict, spell_dto, error_msg, None
+    
     def _insert_processing_metadata(self):
         """Insert processing metadata into database"""
         try:
@@ -1402,9 +710,40 @@ class DatabaseCreator:
         except Exception as e:
             print(f"Error inserting processing metadata: {e}")
     
+    def _insert_unhandled_field_shapes(self):
+        """Insert the unhandled field shapes of this run into database"""
+        try:
+            self.cursor.executemany("""
+                INSERT INTO unhandled_field_shapes (
+                    type_name, field_names, occurrences, first_filename, first_path, sample_data
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    shape.type_name,
+                    json.dumps(list(shape.field_names)),
+                    shape.occurrences,
+                    shape.first_filename,
+                    shape.first_path,
+                    json.dumps(shape.samples, default=str) if shape.samples else None
+                )
+                for shape in self.shape_audit.shapes.values()
+            ])
+            
+            self.connection.commit()
+            
+        except Exception as e:
+            print(f"Error inserting unhandled field shapes: {e}")
+    
+    def _insert_stage_metrics(self):
+        """Insert the stage timings and per-file latencies of this run into database"""
+        try:
+            self.metrics.save(self.connection)
+        except Exception as e:
+            print(f"Error inserting stage metrics: {e}")
+    
     def _generate_skipped_elements_report(self) -> str:
         """Generate detailed report of skipped elements"""
-        if not self.skipped_elements and not self.unhandled_fields:
+        if not self.skipped_elements and not self.shape_audit.shapes:
             return "No elements were skipped - all data was processed successfully!"
         
         report_lines = []
@@ -1430,15 +769,11 @@ class DatabaseCreator:
             report_lines.append("")
         
         # Unhandled fields summary
-        if self.unhandled_fields:
-            report_lines.append("Unhandled Fields:")
-            all_unhandled = {}
-            for filename, fields in self.unhandled_fields.items():
-                for field_path in fields.keys():
-                    all_unhandled[field_path] = all_unhandled.get(field_path, 0) + 1
-            
-            for field_path, count in sorted(all_unhandled.items(), key=lambda x: x[1], reverse=True)[:20]:
-                report_lines.append(f"  - {field_path}: {count} files affected")
+        if self.shape_audit.shapes:
+            report_lines.append(f"Unhandled Fields ({len(self.shape_audit.shapes)} distinct shapes):")
+            field_counts = self.shape_audit.get_field_counts()
+            for field_name, count in sorted(field_counts.items(), key=lambda x: x[1], reverse=True)[:20]:
+                report_lines.append(f"  - {field_name}: {count} occurrences")
             report_lines.append("")
         
         return "\n".join(report_lines)
@@ -1455,7 +790,7 @@ class DatabaseCreator:
                     "generation_time": datetime.now().isoformat()
                 },
                 "skipped_elements": self.skipped_elements,
-                "unhandled_fields": self.unhandled_fields
+                "unhandled_field_shapes": self.shape_audit.to_list()
             }
             
             with open(report_file, 'w', encoding='utf-8') as f:
@@ -1478,14 +813,27 @@ class DatabaseCreator:
         print(f"Successful: {self.total_success}")
         print(f"Failed: {self.total_failures}")
         print(f"Duplicates: {self.duplicate_count}")
-        print(f"Success rate: {(self.total_success/self.total_processed*100):.1f}%")
+        print(f"Success rate: {(self.total_success/max(1, self.total_processed)*100):.1f}%")
+        if self.manifest_diff:
+            print(f"Incremental update from {self.base_database}: {self.manifest_diff.summary()}")
         if duration:
             print(f"Processing time: {duration}")
+        if self.workers > 1:
+            print("Stage times (extraction stages summed over workers):")
+        else:
+            print("Stage times:")
+        print(self.metrics.format_summary())
         print(f"Failed spells directory: {self.failed_spells_dir}")
         
+        if self.failure_archive and self.failure_archive.count:
+            print(f"Failure archive: {self.failure_archive.path} ({self.failure_archive.count} entries)")
+            for kind, categories in self.failure_archive.get_category_counts().items():
+                for category, count in list(categories.items())[:5]:
+                    print(f"  - {kind}: {category} ({count})")
+        
         if self.duplicate_count > 0:
             print(f"\nWARNING: {self.duplicate_count} duplicate filenames found!")
-            print("Check failed_spells/ directory for analysis")
+            print("Check the failure archive for analysis")
         
         # Print skipped elements summary
         print("\n" + self._generate_skipped_elements_report())
@@ -1495,6 +843,8 @@ class DatabaseCreator:
     
     def cleanup(self):
         """Clean up resources"""
+        if self.failure_archive:
+            self.failure_archive.close()
         if self.connection:
             self.connection.close()
         self.wad_processor.cleanup()
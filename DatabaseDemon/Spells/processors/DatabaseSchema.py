@@ -1035,6 +1035,20 @@ class DatabaseSchema:
                 
                 FOREIGN KEY (filename) REFERENCES spell_cards(filename) ON DELETE CASCADE
             )
+        """,
+        
+        # Unhandled fields per object shape (one row per shape and run)
+        "unhandled_field_shapes": """
+            CREATE TABLE unhandled_field_shapes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                type_name TEXT,                         -- DTO class, e.g. "SpellEffectDTO"
+                field_names TEXT,                       -- JSON list of the unhandled fields
+                occurrences INTEGER,                    -- Objects with this shape in the run
+                first_filename TEXT,                    -- Where the shape was first seen
+                first_path TEXT,                        -- e.g., "m_effects[2]" ("" for the spell itself)
+                sample_data TEXT,                       -- JSON dump of the first values seen
+                detected_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
         """
     }
     
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Parallel Spell Extractor for Wizard101 Spell Data
+=================================================
+Process-pool front end for spell extraction. Each worker opens its own
+memory-mapped Root.wad archive and TypeList and runs deserialize, dict
+conversion and DTO creation, then builds the spell's table rows. Results are
+streamed back to the single database writer in the original file order, so
+the database produced with N workers is identical to a serial run (apart
+from timestamps). Each result carries the seconds its file spent per stage
+in the worker, which the writer merges into its stage metrics. With file
+profiling enabled, workers save the profiles of their slow files themselves.
+"""
+
+import contextlib
+import io
+import multiprocessing
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .WADProcessor import WADProcessor
+from .SpellRowBuilder import SpellRows, build_spell_rows
+
+
+# Per-process WAD processor, created by the pool initializer
+_worker_processor: Optional[WADProcessor] = None
+
+
+def _init_worker(wad_path: str, types_path: str, direct_dto: bool,
+                 profile_dir: Optional[str], profile_threshold_ms: Optional[float]):
+    """Open the archive, type list and serializer once per worker process"""
+    global _worker_processor
+    _worker_processor = WADProcessor(Path(wad_path), Path(types_path), direct_dto=direct_dto)
+    if profile_dir is not None:
+        _worker_processor.metrics.enable_profiling(Path(profile_dir), profile_threshold_ms)
+
+    # Keep worker start-up quiet, the parent already reported these steps
+    with contextlib.redirect_stdout(io.StringIO()):
+        initialized = _worker_processor.initialize()
+
+    if not initialized:
+        raise RuntimeError(f"Worker failed to initialize WAD processor for {wad_path}")
+
+
+# (file_path, success, spell_dict, spell_dto, error_message, spell_rows, stage_seconds)
+ExtractionResult = Tuple[str, bool, Optional[Dict[str, Any]], Optional[Any], Optional[str],
+                         Optional[SpellRows], Dict[str, float]]
+
+
+def _extract_spell_batch(file_paths: List[str]) -> List[ExtractionResult]:
+    """Deserialize, convert, build DTOs and build table rows for a batch of spell files"""
+    metrics = _worker_processor.metrics
+    results = []
+    for file_path in file_paths:
+        metrics.begin_file(name=file_path)
+        success, spell_dict, spell_dto, error_msg = _worker_processor.process_single_spell(file_path)
+        spell_rows = None
+        if success and spell_dto:
+            with metrics.stage("rows"):
+                spell_rows = build_spell_rows(file_path, spell_dto, spell_dict)
+        stage_seconds = metrics.end_file()
+        results.append((file_path, success, spell_dict, spell_dto, error_msg, spell_rows, stage_seconds))
+    return results
+
+
+class ParallelSpellExtractor:
+    """Runs spell extraction across a pool of worker processes"""
+
+    def __init__(self, wad_path: Path, types_path: Path, workers: int, batch_size: int = 64,
+                 direct_dto: bool = False, profile_dir: Optional[Path] = None,
+                 profile_threshold_ms: Optional[float] = None):
+        """
+        Initialize the parallel extractor
+
+        Args:
+            wad_path: Path to Root.wad file
+            types_path: Path to types.json file
+            workers: Number of worker processes
+            batch_size: Number of spell files handed to a worker at a time
+            direct_dto: Build DTOs straight from the LazyObjects (see WADProcessor)
+            profile_dir: Directory for the profiles of slow files (None = no profiling)
+            profile_threshold_ms: Worker time per file from which its profile is saved
+        """
+        self.wad_path = wad_path
+        self.types_path = types_path
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.direct_dto = direct_dto
+        self.profile_dir = profile_dir
+        self.profile_threshold_ms = profile_threshold_ms
+
+    def _make_batches(self, spell_files: List[str]) -> List[List[str]]:
+        """Split the file list into ordered batches"""
+        return [spell_files[i:i + self.batch_size] for i in range(0, len(spell_files), self.batch_size)]
+
+    def iter_results(self, spell_files: List[str]) -> Iterator[ExtractionResult]:
+        """
+        Extract all spell files and yield results in input order
+
+        Args:
+            spell_files: Spell file paths inside the WAD archive
+
+        Yields:
+            (file_path, success, spell_dict, spell_dto, error_message, spell_rows, stage_seconds)
+        """
+        batches = self._make_batches(spell_files)
+        print(f"[INFO] Extracting {len(spell_files)} spell files with {self.workers} workers "
+              f"({len(batches)} batches of up to {self.batch_size})")
+
+        pool = multiprocessing.Pool(
+            processes=self.workers,
+            initializer=_init_worker,
+            initargs=(str(self.wad_path), str(self.types_path), self.direct_dto,
+                      str(self.profile_dir) if self.profile_dir else None, self.profile_threshold_ms)
+        )
+        completed = False
+        try:
+            # imap keeps batch order so the writer sees files in serial order
+            for batch_results in pool.imap(_extract_spell_batch, batches):
+                for result in batch_results:
+                    yield result
+            completed = True
+        finally:
+            # Stop outstanding workers if the writer bailed out early
+            if completed:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Wizard101 Spell Row Builder
+===========================
+Turns one spell DTO into the rows of every spell table, without a database.
+
+build_spell_rows walks a spell with the table mappings of SpellTableMapping
+and returns a SpellRows bundle: the row tuples per table, the processing
+errors and the skipped elements of that spell. It keeps no state between
+spells and never touches SQLite, so extraction workers can build bundles in
+parallel while the single writer process only persists them through a
+SpellRowSink.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from .SpellTableMapping import (
+    TableMapping, SPELL_CARD_TABLE, SPELL_RANK_TABLE, SPELL_ADJECTIVE_TABLE, SPELL_BEHAVIOR_TABLE,
+    SPELL_VALID_TARGET_TABLE, TIERED_SPELL_TABLE, TIERED_NEXT_TIER_TABLE, EFFECT_TABLES,
+    CONDITIONAL_ELEMENT_TABLE, REQUIREMENT_LIST_TABLE, REQUIREMENT_TABLES, EFFECTS, ELEMENTS, VALUES
+)
+
+
+# (element_path, element_type, reason, element_data)
+SkippedElement = Tuple[str, str, str, Any]
+
+
+class SpellRows:
+    """Rows, errors and skipped elements of one spell"""
+
+    __slots__ = ("filename", "rows", "statements", "errors", "skipped")
+
+    def __init__(self, filename: str):
+        """
+        Initialize an empty bundle
+
+        Args:
+            filename: The spell filename
+        """
+        self.filename = filename
+        self.rows: Dict[str, List[Tuple[Any, ...]]] = {}  # {table: [row, ...]}
+        self.statements: Dict[str, str] = {}  # {table: INSERT statement}
+        self.errors: List[str] = []
+        self.skipped: List[SkippedElement] = []
+
+    def add(self, mapping: TableMapping, row: Tuple[Any, ...]):
+        """Add one row of a mapped table"""
+        table_rows = self.rows.get(mapping.table)
+        if table_rows is None:
+            table_rows = self.rows[mapping.table] = []
+            self.statements[mapping.table] = mapping.sql
+        table_rows.append(row)
+
+    def error(self, message: str):
+        """Record a processing error (the spell is rejected)"""
+        self.errors.append(message)
+
+    def skip(self, element_path: str, element_type: str, reason: str, element_data: Any = None):
+        """Record an element that was not written"""
+        self.skipped.append((element_path, element_type, reason, element_data))
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows over all tables"""
+        return sum(len(table_rows) for table_rows in self.rows.values())
+
+
+def _describe(obj: Any) -> Any:
+    """Element data logged for an object that could not be written"""
+    return obj.__dict__ if hasattr(obj, '__dict__') else str(obj)
+
+
+class _SpellRowWalker:
+    """Walks one spell DTO, emitting its rows into a SpellRows bundle"""
+
+    def __init__(self, rows: SpellRows):
+        self.rows = rows
+        self.filename = rows.filename
+
+        # Global effect counter for unique effect ordering within the spell
+        self.effect_counter = 0
+
+    def add_spell(self, spell_type: str, spell_dto: Any):
+        """Add spell_cards, nested and type-specific rows"""
+        rows = self.rows
+        filename = self.filename
+
+        rows.add(SPELL_CARD_TABLE, (filename, spell_type) + SPELL_CARD_TABLE.extract(spell_dto))
+
+        rank = getattr(spell_dto, "m_spellRank", None)
+        if rank:
+            rows.add(SPELL_RANK_TABLE, (filename,) + SPELL_RANK_TABLE.extract(rank))
+
+        for effect in getattr(spell_dto, "m_effects", None) or ():
+            self.add_effect(effect, "spell_cards", -1)
+
+        for adj_order, adjective in enumerate(getattr(spell_dto, "m_adjectives", None) or ()):
+            rows.add(SPELL_ADJECTIVE_TABLE, (filename, adj_order, str(adjective)))
+        for beh_order, behavior in enumerate(getattr(spell_dto, "m_behaviors", None) or ()):
+            rows.add(SPELL_BEHAVIOR_TABLE, (filename, beh_order, str(behavior)))
+        for target_order, target in enumerate(getattr(spell_dto, "m_validTargetSpells", None) or ()):
+            rows.add(SPELL_VALID_TARGET_TABLE, (filename, target_order, str(target)))
+
+        # Spell-level requirements (m_displayRequirements)
+        self.add_spell_requirements(spell_dto, "m_displayRequirements", "display_requirements",
+                                    "Failed to process display requirements")
+
+        # Type-specific data
+        if type(spell_dto).__name__ == "TieredSpellTemplateDTO":
+            rows.add(TIERED_SPELL_TABLE, (filename,) + TIERED_SPELL_TABLE.extract(spell_dto))
+            for tier_order, next_tier in enumerate(getattr(spell_dto, "m_nextTierSpells", None) or ()):
+                rows.add(TIERED_NEXT_TIER_TABLE, (filename, tier_order, str(next_tier)))
+            self.add_spell_requirements(spell_dto, "m_requirements", "spell_template",
+                                        "Failed to process tiered spell requirements")
+
+    def add_spell_requirements(self, spell_dto: Any, attr: str, parent_type: str, reason: str):
+        """Add a spell-level RequirementList, skipping it if it cannot be walked"""
+        req_list = getattr(spell_dto, attr, None)
+        if not req_list:
+            return
+        try:
+            self.add_requirement_list(parent_type, -1, -1, req_list)
+        except Exception as e:
+            self.rows.error(f"Error processing {attr}: {e}")
+            self.rows.skip(attr, type(req_list).__name__, f"{reason}: {e}", _describe(req_list))
+
+    def add_effect(self, effect: Any, parent_table: str, parent_effect_order: int):
+        """Add one effect row to its mapped table, then walk its child collections"""
+        rows = self.rows
+        try:
+            if effect is None:
+                return
+
+            if isinstance(effect, list):
+                rows.error(f"List effect found - should be DTO object (parent_table: {parent_table})")
+                # Try to process each item in the list
+                for item in effect:
+                    if hasattr(item, '__dict__') or isinstance(item, dict):
+                        self.add_effect(item, parent_table, parent_effect_order)
+                return
+
+            if isinstance(effect, dict) and "$__type" in effect:
+                effect_type = effect.get('$__type', 'unknown')
+                rows.error(f"Raw dict effect found - DTO conversion failed (type: {effect_type})")
+                rows.skip(f"effects[{self.effect_counter}]", effect_type, "DTO conversion failed", effect)
+                return
+
+            effect_order = self.effect_counter
+            self.effect_counter += 1
+
+            effect_type = type(effect).__name__
+            mapping = EFFECT_TABLES.get(effect_type)
+            if mapping is None:
+                rows.error(f"Unknown effect type: {effect_type}")
+                rows.skip(f"effects[{effect_order}]", effect_type,
+                          "Unknown effect type - no handler implemented", _describe(effect))
+                return
+
+            rows.add(mapping, (self.filename, effect_order, parent_table, parent_effect_order)
+                     + mapping.extract(effect))
+
+            for child in mapping.children:
+                items = getattr(effect, child.attr, None)
+                if not items:
+                    continue
+
+                if child.kind == EFFECTS:
+                    for nested_effect in items:
+                        self.add_effect(nested_effect, mapping.table, effect_order)
+                elif child.kind == ELEMENTS:
+                    for element_order, element in enumerate(items):
+                        self.add_conditional_element(effect_order, element_order, element)
+                elif child.kind == VALUES:
+                    for value_order, value in enumerate(items):
+                        rows.add(child.table, (self.filename, effect_order, value_order, value))
+
+        except Exception as e:
+            rows.error(f"Exception in spell effect insertion: {e}")
+
+    def add_conditional_element(self, parent_effect_order: int, element_order: int, element: Any):
+        """Add a ConditionalSpellElement with its nested effect and requirements"""
+        self.rows.add(CONDITIONAL_ELEMENT_TABLE, (self.filename, parent_effect_order, element_order))
+
+        p_effect = getattr(element, "m_pEffect", None)
+        if p_effect:
+            self.add_effect(p_effect, CONDITIONAL_ELEMENT_TABLE.table, element_order)
+
+        p_reqs = getattr(element, "m_pReqs", None)
+        if p_reqs:
+            self.add_requirement_list("conditional_element", parent_effect_order, element_order, p_reqs)
+
+    def add_requirement_list(self, parent_type: str, parent_effect_order: int, element_order: int, req_list: Any):
+        """Add a RequirementList and its requirements (nested lists share the parent's keys)"""
+        rows = self.rows
+        try:
+            keys = (self.filename, parent_type, parent_effect_order, element_order)
+            rows.add(REQUIREMENT_LIST_TABLE, keys + REQUIREMENT_LIST_TABLE.extract(req_list))
+
+            for requirement_order, requirement in enumerate(getattr(req_list, "m_requirements", None) or ()):
+                requirement_type = type(requirement).__name__
+                if requirement_type == "RequirementListDTO":
+                    self.add_requirement_list(parent_type, parent_effect_order, element_order, requirement)
+                    continue
+
+                mapping = REQUIREMENT_TABLES.get(requirement_type)
+                if mapping is None:
+                    rows.error(f"Unknown requirement type: {requirement_type}")
+                    continue
+                rows.add(mapping, keys + (requirement_order,) + mapping.extract(requirement))
+
+        except Exception as e:
+            rows.error(f"Error inserting requirement list: {e}")
+
+
+def build_spell_rows(filename: str, spell_dto: Any, spell_dict: Dict[str, Any]) -> SpellRows:
+    """
+    Build the rows of every spell table for one spell
+
+    Args:
+        filename: The spell filename (PRIMARY KEY)
+        spell_dto: Processed spell DTO
+        spell_dict: Raw spell data dictionary (or DirectRecord)
+
+    Returns:
+        SpellRows bundle (rejected if its errors list is not empty)
+    """
+    rows = SpellRows(filename)
+    spell_type = spell_dict.get("$__type", "").replace("class ", "")
+    try:
+        _SpellRowWalker(rows).add_spell(spell_type, spell_dto)
+    except Exception as e:
+        rows.error(f"Error building spell rows: {e}")
+    return rows
+
+
+class SpellRowSink:
+    """Writes SpellRows bundles through a BatchedRowWriter"""
+
+    def __init__(self, row_writer: Any):
+        """
+        Initialize the sink
+
+        Args:
+            row_writer: BatchedRowWriter of the spell database
+        """
+        self.row_writer = row_writer
+
+    def write(self, rows: SpellRows, context: Any = None):
+        """
+        Buffer all rows of a spell as one record
+
+        Args:
+            rows: Accepted spell bundle
+            context: Data handed back if the record fails to flush (e.g. the raw spell)
+        """
+        writer = self.row_writer
+        writer.begin_record()
+        for table, table_rows in rows.rows.items():
+            sql = rows.statements[table]
+            for row in table_rows:
+                writer.add(sql, row)
+        writer.commit_record(rows.filename, context)
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Wizard101 Spell Table Mapping
+=============================
+Declarative mapping from spell DTO classes to database tables.
+
+Every spell, effect and requirement DTO class maps to its table, the columns
+read from the DTO and the child collections walked below it. Each mapping
+builds its INSERT statement once, and compiles one operator.attrgetter based
+row extractor per DTO class the first time it sees that class, so rows are
+emitted as plain tuples without a getattr call per column. Supporting a new
+effect or requirement type is a new entry in EFFECT_TABLES or
+REQUIREMENT_TABLES.
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+
+class Column(NamedTuple):
+    """
+    One column read from a DTO attribute
+
+    kind is "value" (the attribute, default if the DTO does not have it),
+    "flag" (1 if the attribute is truthy, else 0) or "text" (str() of the attribute).
+    """
+    attr: str
+    default: Any = None
+    kind: str = "value"
+
+
+def flag(attr: str) -> Column:
+    """Boolean column stored as 1/0"""
+    return Column(attr, False, "flag")
+
+
+def text(attr: str) -> Column:
+    """Column stored as the str() of the attribute"""
+    return Column(attr, None, "text")
+
+
+# Child collection kinds
+EFFECTS = "effects"    # Nested effects, parented to this effect's table and order
+ELEMENTS = "elements"  # ConditionalSpellElements (m_pEffect and m_pReqs below each)
+VALUES = "values"      # Plain values stored in a side table, one row per item
+
+
+def _to_flag(value: Any) -> int:
+    return 1 if value else 0
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "flag": _to_flag,
+    "text": str,
+}
+
+
+class RowExtractor:
+    """Row values of one DTO class for one table, read with a single attrgetter"""
+
+    def __init__(self, dto_class: Type, columns: Sequence[Column]):
+        """
+        Compile the extractor
+
+        Args:
+            dto_class: Class of the objects the extractor reads
+            columns: Columns in table order
+        """
+        declared = getattr(dto_class, "__dataclass_fields__", None)
+        self._columns = columns
+        self._dynamic = declared is None
+
+        if self._dynamic:
+            # Not a DTO (e.g. an unconverted dict), read column by column with getattr defaults
+            return
+
+        fetched = [column.attr for column in columns if column.attr in declared]
+        if len(fetched) > 1:
+            self._getter = attrgetter(*fetched)
+        elif fetched:
+            single_getter = attrgetter(fetched[0])
+            self._getter = lambda obj: (single_getter(obj),)
+        else:
+            self._getter = lambda obj: ()
+
+        # Attributes the class does not declare always give the default
+        self._constants = [(index, self._convert(column, column.default))
+                           for index, column in enumerate(columns) if column.attr not in declared]
+        self._conversions = [(index, _CONVERTERS[column.kind])
+                             for index, column in enumerate(columns)
+                             if column.attr in declared and column.kind != "value"]
+        self._plain = not self._constants and not self._conversions
+
+    @staticmethod
+    def _convert(column: Column, value: Any) -> Any:
+        """Convert one attribute value for its column"""
+        if column.kind == "value":
+            return value
+        return _CONVERTERS[column.kind](value)
+
+    def __call__(self, obj: Any) -> Tuple[Any, ...]:
+        """
+        Get the row values of an object
+
+        Args:
+            obj: Object of the compiled class
+
+        Returns:
+            Column values in table order
+        """
+        if self._dynamic:
+            return tuple(self._convert(column, getattr(obj, column.attr, column.default))
+                         for column in self._columns)
+
+        values = self._getter(obj)
+        if self._plain:
+            return values
+
+        values = list(values)
+        for index, value in self._constants:
+            values.insert(index, value)
+        for index, convert in self._conversions:
+            values[index] = convert(values[index])
+        return tuple(values)
+
+
+class ChildCollection(NamedTuple):
+    """Collection attribute walked below an object"""
+    attr: str
+    kind: str
+    table: Optional["TableMapping"] = None  # Side table of VALUES children
+
+
+class TableMapping:
+    """Table, key columns, DTO columns and child collections of one DTO type"""
+
+    def __init__(self, table: str, key_columns: Sequence[str], columns: Sequence[Column] = (),
+                 children: Sequence[ChildCollection] = ()):
+        """
+        Initialize the mapping and build its INSERT statement
+
+        Args:
+            table: Table name
+            key_columns: Leading columns supplied by the caller (filename, orders...)
+            columns: Columns read from the DTO, after the key columns
+            children: Collections walked below the object
+        """
+        self.table = table
+        self.key_columns = tuple(key_columns)
+        self.columns = tuple(columns)
+        self.children = tuple(children)
+
+        column_names = self.key_columns + tuple(column.attr for column in self.columns)
+        placeholders = ", ".join("?" for _ in column_names)
+        self.sql = f"INSERT INTO {table} ({', '.join(column_names)}) VALUES ({placeholders})"
+
+        # DTO class -> compiled extractor
+        self._extractors: Dict[Type, RowExtractor] = {}
+
+    def extract(self, obj: Any) -> Tuple[Any, ...]:
+        """Get the DTO column values of an object (extractor compiled once per class)"""
+        obj_class = type(obj)
+        extractor = self._extractors.get(obj_class)
+        if extractor is None:
+            extractor = RowExtractor(obj_class, self.columns)
+            self._extractors[obj_class] = extractor
+        return extractor(obj)
+
+
+# Key columns of the nested tables
+EFFECT_KEY_COLUMNS = ("filename", "effect_order", "parent_table", "parent_effect_order")
+REQUIREMENT_LIST_KEY_COLUMNS = ("filename", "parent_type", "parent_effect_order", "element_order")
+REQUIREMENT_KEY_COLUMNS = REQUIREMENT_LIST_KEY_COLUMNS + ("requirement_order",)
+
+
+# Spell level tables
+SPELL_CARD_TABLE = TableMapping("spell_cards", ("filename", "spell_type"), [
+    Column(attr) for attr in (
+        "m_name", "m_PvE", "m_PvP", "m_Treasure", "m_accuracy",
+        "m_advancedDescription", "m_alwaysFizzle", "m_backRowFriendly", "m_baseCost",
+        "m_battlegroundsOnly", "m_boosterPackIcon", "m_cardFront", "m_casterInvisible",
+        "m_cloaked", "m_cloakedName", "m_creditsCost", "m_delayEnchantment",
+        "m_description", "m_descriptionCombatHUD", "m_descriptionTrainer",
+        "m_displayIndex", "m_displayName", "m_hiddenFromEffectsWindow",
+        "m_ignoreCharms", "m_ignoreDispel", "m_imageIndex", "m_imageName",
+        "m_leavesPlayWhenCast", "m_levelRestriction", "m_maxCopies", "m_noDiscard",
+        "m_noPvEEnchant", "m_noPvPEnchant", "m_previousSpellName",
+        "m_pvpCurrencyCost", "m_pvpTourneyCurrencyCost", "m_requiredSchoolName",
+        "m_sMagicSchoolName", "m_sTypeName", "m_secondarySchoolName",
+        "m_showPolymorphedName", "m_skipTruncation", "m_spellBase",
+        "m_spellCategory", "m_spellFusion", "m_spellSourceType", "m_trainingCost",
+        "m_useGloss",
+    )
+])
+
+SPELL_RANK_TABLE = TableMapping("spell_ranks", ("filename",), [
+    Column("m_balancePips", 0), Column("m_deathPips", 0), Column("m_firePips", 0),
+    Column("m_icePips", 0), Column("m_lifePips", 0), Column("m_mythPips", 0),
+    Column("m_shadowPips", 0), Column("m_spellRank", 0), Column("m_stormPips", 0),
+    flag("m_xPipSpell"),
+])
+
+# Plain value lists of the spell (the caller supplies every column)
+SPELL_ADJECTIVE_TABLE = TableMapping("spell_adjectives", ("filename", "adjective_order", "adjective_value"))
+SPELL_BEHAVIOR_TABLE = TableMapping("spell_behaviors", ("filename", "behavior_order", "behavior_value"))
+SPELL_VALID_TARGET_TABLE = TableMapping("spell_valid_targets", ("filename", "target_order", "target_spell"))
+
+# TieredSpellTemplate only tables
+TIERED_SPELL_TABLE = TableMapping("tiered_spell_data", ("filename",), [
+    Column("m_levelRestriction"), flag("m_retired"), Column("m_shardCost"),
+])
+TIERED_NEXT_TIER_TABLE = TableMapping("tiered_spell_next_tiers", ("filename", "tier_order", "next_tier_spell"))
+
+
+# Columns shared by every SpellEffect table (None if the effect does not have them)
+BASE_EFFECT_COLUMNS = [
+    Column(attr) for attr in (
+        "m_act", "m_actNum", "m_armorPiercingParam", "m_bypassProtection",
+        "m_chancePerTarget", "m_cloaked", "m_converted", "m_damageType",
+        "m_disposition", "m_effectParam", "m_effectTarget", "m_effectType",
+        "m_enchantmentSpellTemplateID", "m_healModifier", "m_numRounds",
+        "m_paramPerRound", "m_pipNum", "m_protected", "m_rank",
+        "m_sDamageType", "m_spellTemplateID",
+    )
+]
+
+
+def _effect_table(table: str, extra_columns: Sequence[Column] = (),
+                  children: Sequence[ChildCollection] = ()) -> TableMapping:
+    """Mapping of a SpellEffect table (base effect columns plus the type's own)"""
+    return TableMapping(table, EFFECT_KEY_COLUMNS, BASE_EFFECT_COLUMNS + list(extra_columns), children)
+
+
+DELAY_TARGET_SUBCIRCLE_TABLE = TableMapping(
+    "delay_spell_target_subcircles", ("filename", "effect_order", "subcircle_order", "subcircle_value")
+)
+
+CONDITIONAL_ELEMENT_TABLE = TableMapping(
+    "conditional_spell_elements", ("filename", "parent_effect_order", "element_order")
+)
+
+# Effect DTO class name -> table mapping
+EFFECT_TABLES: Dict[str, TableMapping] = {
+    "SpellEffectDTO": _effect_table("spell_effects"),
+    "DelaySpellEffectDTO": _effect_table("delay_spell_effects", [
+        Column("m_damage", 0), Column("m_rounds", 0), Column("m_spellDelayedTemplateID", 0),
+        Column("m_spellDelayedTemplateDamageID", 0), Column("m_spellEnchanterTemplateID", 0),
+        Column("m_spellHits", 0), text("m_spell"),
+    ], [ChildCollection("m_targetSubcircleList", VALUES, DELAY_TARGET_SUBCIRCLE_TABLE)]),
+    "ConditionalSpellEffectDTO": _effect_table("conditional_spell_effects", children=[
+        ChildCollection("m_elements", ELEMENTS),
+    ]),
+    "VariableSpellEffectDTO": _effect_table("variable_spell_effects", children=[
+        ChildCollection("m_effectList", EFFECTS),
+    ]),
+    "EffectListSpellEffectDTO": _effect_table("effect_list_spell_effects", children=[
+        ChildCollection("m_effectList", EFFECTS),
+    ]),
+    "RandomSpellEffectDTO": _effect_table("random_spell_effects", children=[
+        ChildCollection("m_effectList", EFFECTS),
+    ]),
+    "RandomPerTargetSpellEffectDTO": _effect_table("random_per_target_spell_effects", children=[
+        ChildCollection("m_effectList", EFFECTS),
+    ]),
+    "HangingConversionSpellEffectDTO": _effect_table("hanging_conversion_spell_effects", [
+        Column("m_hangingEffectType", 0), Column("m_outputSelector", 0),
+        Column("m_minEffectValue", 0), Column("m_maxEffectValue", 0),
+        Column("m_minEffectCount", 0), Column("m_maxEffectCount", 0),
+        Column("m_notDamageType", 0), flag("m_scaleSourceEffectValue"),
+        Column("m_sourceEffectValuePercent", 0.0), flag("m_applyToEffectSource"),
+    ], [ChildCollection("m_outputEffect", EFFECTS)]),
+    "TargetCountSpellEffectDTO": _effect_table("target_count_spell_effects", children=[
+        ChildCollection("m_effectLists", EFFECTS),
+    ]),
+    "ShadowSpellEffectDTO": _effect_table("shadow_spell_effects", [
+        Column("m_shadowType", 0),
+    ], [ChildCollection("m_effectList", EFFECTS)]),
+    "CountBasedSpellEffectDTO": _effect_table("count_based_spell_effects", [
+        Column("m_countThreshold", 0), Column("m_mode", 0),
+    ], [ChildCollection("m_effectList", EFFECTS)]),
+}
+
+
+# Requirements
+REQUIREMENT_LIST_TABLE = TableMapping("requirement_lists", REQUIREMENT_LIST_KEY_COLUMNS, [
+    flag("m_applyNOT"), Column("m_operator", 0),
+])
+
+# Columns shared by most requirement tables
+BASE_REQUIREMENT_COLUMNS = [flag("m_applyNOT"), Column("m_operator", 0), Column("m_targetType", 0)]
+
+# Columns of the hanging charm/ward/over time requirements
+HANGING_COUNT_COLUMNS = [Column("m_disposition", 0), Column("m_minCount", 0), Column("m_maxCount", 0)]
+
+
+def _requirement_table(table: str, extra_columns: Sequence[Column] = (),
+                       base_columns: Optional[List[Column]] = None) -> TableMapping:
+    """Mapping of a requirement table (base requirement columns plus the type's own)"""
+    if base_columns is None:
+        base_columns = BASE_REQUIREMENT_COLUMNS
+    return TableMapping(table, REQUIREMENT_KEY_COLUMNS, base_columns + list(extra_columns))
+
+
+# Requirement DTO class name -> table mapping
+REQUIREMENT_TABLES: Dict[str, TableMapping] = {
+    "ReqIsSchoolDTO": _requirement_table("req_is_school", [Column("m_magicSchoolName", "")]),
+    "ReqHangingCharmDTO": _requirement_table("req_hanging_charm", HANGING_COUNT_COLUMNS),
+    "ReqHangingWardDTO": _requirement_table("req_hanging_ward", HANGING_COUNT_COLUMNS),
+    "ReqHangingOverTimeDTO": _requirement_table("req_hanging_over_time", HANGING_COUNT_COLUMNS),
+    "ReqHangingEffectTypeDTO": _requirement_table("req_hanging_effect_type", [
+        Column("m_effectType", 0), Column("m_minCount", 0), Column("m_maxCount", 0),
+        Column("m_param_low", 0), Column("m_param_high", 0),
+        Column("m_min_count", 0), Column("m_max_count", 0),
+        flag("m_anyType"), flag("m_globalEffect"),
+    ]),
+    "ReqHangingAuraDTO": _requirement_table("req_hanging_aura", HANGING_COUNT_COLUMNS + [
+        Column("m_effectType", 0), flag("m_anyType"), flag("m_globalEffect"),
+    ]),
+    "ReqSchoolOfFocusDTO": _requirement_table("req_school_of_focus", [Column("m_magicSchool", "")]),
+    "ReqMinionDTO": _requirement_table("req_minion", [
+        Column("m_minCount", 0), Column("m_maxCount", 0), Column("m_minionType", ""),
+    ]),
+    "ReqHasEntryDTO": _requirement_table("req_has_entry", [
+        Column("m_entryName", ""), Column("m_displayName", ""),
+        flag("m_isQuestRegistry"), Column("m_questName", ""),
+    ]),
+    "ReqCombatHealthDTO": _requirement_table("req_combat_health", [
+        Column("m_fMinPercent", 0.0), Column("m_fMaxPercent", 0.0),
+    ]),
+    "ReqPvPCombatDTO": _requirement_table("req_pvp_combat"),
+    "ReqShadowPipCountDTO": _requirement_table("req_shadow_pip_count", [
+        Column("m_minPips", 0), Column("m_maxPips", 0),
+    ]),
+    "ReqCombatStatusDTO": _requirement_table("req_combat_status", [
+        Column("m_combatStatus", 0), Column("m_status", 0),
+    ]),
+    "ReqPipCountDTO": _requirement_table("req_pip_count", [
+        Column("m_minPips", 0), Column("m_maxPips", 0),
+    ]),
+    "ReqMagicLevelDTO": _requirement_table("req_magic_level", base_columns=[
+        flag("m_applyNOT"), Column("m_magicSchool", ""), Column("m_numericValue", 0.0),
+        Column("m_operator", 0), Column("m_operatorType", 0),
+    ]),
+}
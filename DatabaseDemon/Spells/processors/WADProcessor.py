@@ -24,21 +24,44 @@ sys.path.append(str(Path(__file__).parent.parent))         # Spells level
 
 # Import centralized conversion utility
 from utils.conversion_utils import convert_lazy_object_to_dict
+from utils.lazy_dto_builder import DirectConversionError
+from utils.wad_session import WadSession
+from utils.type_list_cache import open_cached_type_list
+from utils.stage_metrics import StageMetrics
 
 # Import our DTOs
-from dtos import FixedSpellDTOFactory
+try:
+    from ..dtos import FixedSpellDTOFactory
+except ImportError:
+    from dtos import FixedSpellDTOFactory
 
 
 class WADProcessor:
     """Class-based processor for handling WAD file processing and spell data extraction"""
     
-    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None):
-        """Initialize the WAD processor with paths"""
-        self.wad_path = wad_path
-        self.types_path = types_path
+    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None,
+                 session: Optional[WadSession] = None, direct_dto: bool = False,
+                 metrics: Optional[StageMetrics] = None):
+        """
+        Initialize the WAD processor with paths
+        
+        Args:
+            wad_path: Path to Root.wad file (auto-detected if None)
+            types_path: Path to types.json file (auto-detected if None)
+            session: Shared WadSession to reuse instead of opening the WAD again
+            direct_dto: Build DTOs straight from the LazyObjects; successful results then carry
+                        a DirectRecord (type and unhandled fields) instead of the full raw dict
+            metrics: Stage metrics receiving deserialize/convert/dto timings (own instance if None)
+        """
+        self.session = session
+        self.metrics = metrics or StageMetrics()
+        self.wad_path = session.wad_path if session else wad_path
+        self.types_path = session.types_path if session else types_path
         self.archive = None
         self.type_list = None
         self.serializer = None
+        self.direct_dto = direct_dto
+        self.dto_builder = None
         
         # Statistics
         self.total_processed = 0
@@ -73,6 +96,18 @@ class WADProcessor:
         """Initialize the processor by loading type list and opening WAD archive"""
         print("Initializing WAD Processor...")
         
+        # Reuse the shared session resources if one was provided
+        if self.session:
+            if not self.session.open():
+                print("Failed to open WAD session")
+                return False
+            self.archive = self.session.archive
+            self.type_list = self.session.type_list
+            self.serializer = self.session.serializer
+            self._create_dto_builder()
+            print("[OK] WAD Processor using shared WAD session")
+            return True
+        
         # Load type definitions
         if not self._load_type_list():
             print("Failed to load type definitions")
@@ -91,9 +126,15 @@ class WADProcessor:
             self.serializer = Serializer(options, self.type_list)
             print("[OK] Created serializer with deep serialization and skip_unknown_types enabled")
         
+        self._create_dto_builder()
         print("[OK] WAD Processor initialized successfully")
         return True
     
+    def _create_dto_builder(self):
+        """Create the direct LazyObject -> DTO builder if direct DTO mode is enabled"""
+        if self.direct_dto and self.type_list:
+            self.dto_builder = FixedSpellDTOFactory.create_lazy_dto_builder(self.type_list, collect_unhandled=True)
+    
     def _load_type_list(self) -> bool:
         """Load TypeList from the types JSON file"""
         try:
@@ -102,7 +143,7 @@ class WADProcessor:
                 print("Check if the type dump (types.json) is the correct version for this revision")
                 return False
                 
-            self.type_list = TypeList.open(str(self.types_path))
+            self.type_list = open_cached_type_list(self.types_path)
             print(f"[OK] Loaded type definitions from {self.types_path}")
             return True
             
@@ -140,16 +181,25 @@ class WADProcessor:
         Returns:
             (success, spell_dict, spell_dto, error_message)
         """
+        metrics = self.metrics
         try:
             # Deserialize the spell data
-            if self.serializer:
-                spell_data = self.archive.deserialize(file_path, self.serializer)
-            else:
-                spell_data = self.archive[file_path]
+            with metrics.stage("deserialize"):
+                spell_data = self._deserialize(file_path)
+            
+            # Build the DTO straight from the LazyObject when possible
+            if self.dto_builder and isinstance(spell_data, LazyObject):
+                try:
+                    with metrics.stage("dto"):
+                        spell_dto, spell_record = self.dto_builder.build(spell_data)
+                    return True, spell_record, spell_dto, None
+                except DirectConversionError:
+                    pass  # The dict-based path below reports the problem
             
             # Convert to dictionary format
             if isinstance(spell_data, LazyObject):
-                spell_dict = convert_lazy_object_to_dict(spell_data, self.type_list)
+                with metrics.stage("convert"):
+                    spell_dict = convert_lazy_object_to_dict(spell_data, self.type_list)
             else:
                 spell_dict = spell_data
             
@@ -159,7 +209,8 @@ class WADProcessor:
             
             # Try to create DTO
             try:
-                spell_dto = FixedSpellDTOFactory.create_from_json_data(spell_dict)
+                with metrics.stage("dto"):
+                    spell_dto = FixedSpellDTOFactory.create_from_json_data(spell_dict)
                 
                 if spell_dto:
                     return True, spell_dict, spell_dto, None
@@ -174,6 +225,30 @@ class WADProcessor:
             error_dict = {"file_path": file_path, "processing_error": str(e)}
             return False, error_dict, None, f"File processing failed: {e}"
     
+    def _deserialize(self, file_path: str) -> Any:
+        """Deserialize one spell file from the archive"""
+        if self.serializer:
+            return self.archive.deserialize(file_path, self.serializer)
+        return self.archive[file_path]
+    
+    def load_spell_dict(self, file_path: str) -> Dict[str, Any]:
+        """
+        Load the full raw dict of a spell file (used for failure logging of direct DTO results)
+        
+        Args:
+            file_path: Spell file path inside the WAD archive
+            
+        Returns:
+            Raw spell dictionary, or a dict describing the error
+        """
+        try:
+            spell_data = self._deserialize(file_path)
+            if isinstance(spell_data, LazyObject):
+                return convert_lazy_object_to_dict(spell_data, self.type_list)
+            return spell_data
+        except Exception as e:
+            return {"file_path": file_path, "processing_error": str(e)}
+    
     def analyze_nested_dtos(self, dto_obj: Any, path: str = "", depth: int = 0) -> Tuple[List[str], int]:
         """Recursively analyze created DTOs to show nesting structure"""
         nested_dtos = []
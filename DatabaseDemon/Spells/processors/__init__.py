@@ -8,12 +8,14 @@ from .WADProcessor import WADProcessor
 from .RevisionDetector import RevisionDetector, get_current_revision, get_database_name, validate_types_file
 from .DatabaseCreator import DatabaseCreator
 from .DatabaseSchema import DatabaseSchema
+from .ParallelSpellExtractor import ParallelSpellExtractor
 
 __all__ = [
     'WADProcessor', 
     'RevisionDetector', 
     'DatabaseCreator', 
     'DatabaseSchema',
+    'ParallelSpellExtractor',
     'get_current_revision', 
     'get_database_name', 
     'validate_types_file'
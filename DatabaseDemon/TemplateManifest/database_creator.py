@@ -14,7 +14,7 @@ This script:
 5. Enables fast lookup of template IDs to deck filenames
 
 Usage:
-    python database_creator.py [--output-dir PATH] [--skip-validation]
+    python database_creator.py [--output-dir PATH] [--skip-validation] [--no-bulk-load]
 
 Requirements:
     - types.json file in parent DatabaseDemon directory
@@ -43,6 +43,7 @@ from datetime import datetime
 sys.path.append(str(Path(__file__).parent))
 
 from processors import TemplateManifestDatabaseCreator
+from utils.bulk_load import add_bulk_load_argument
 
 
 def get_platform_paths():
@@ -138,6 +139,8 @@ Output:
         help='Enable verbose output'
     )
     
+    add_bulk_load_argument(parser)
+    
     return parser.parse_args()
 
 
@@ -201,7 +204,7 @@ def main():
         
         # Create database
         print("\nStarting TemplateManifest database creation...")
-        creator = TemplateManifestDatabaseCreator(args.output_dir)
+        creator = TemplateManifestDatabaseCreator(args.output_dir, bulk_load=not args.no_bulk_load)
         
         success = creator.create_database(skip_validation=args.skip_validation)
         
@@ -26,23 +26,38 @@ import traceback
 sys.path.append(str(Path(__file__).parent.parent.parent))
 sys.path.append(str(Path(__file__).parent.parent))
 
-from processors.WADProcessor import TemplateManifestWADProcessor, create_template_manifest_processor
-from processors.DatabaseSchema import TemplateManifestDatabaseSchema, create_database_schema
-from dtos import TemplateManifestDTO, TemplateLocationDTO
-from dtos.TemplateManifestEnums import validate_template_id, validate_filename, get_validation_errors
+try:
+    from .WADProcessor import TemplateManifestWADProcessor, create_template_manifest_processor
+    from .DatabaseSchema import TemplateManifestDatabaseSchema, create_database_schema
+    from ..dtos import TemplateManifestDTO, TemplateLocationDTO
+    from ..dtos.TemplateManifestEnums import validate_template_id, validate_filename, get_validation_errors, TEMPLATE_MANIFEST_PATH
+except ImportError:
+    from processors.WADProcessor import TemplateManifestWADProcessor, create_template_manifest_processor
+    from processors.DatabaseSchema import TemplateManifestDatabaseSchema, create_database_schema
+    from dtos import TemplateManifestDTO, TemplateLocationDTO
+    from dtos.TemplateManifestEnums import validate_template_id, validate_filename, get_validation_errors, TEMPLATE_MANIFEST_PATH
+from utils.wad_session import WadSession
+from utils.bulk_load import BulkLoader
+from utils.stage_metrics import StageMetrics
 
 
 class TemplateManifestDatabaseCreator:
     """Main database creator for TemplateManifest system"""
     
-    def __init__(self, output_dir: Optional[Path] = None):
+    def __init__(self, output_dir: Optional[Path] = None, session: Optional[WadSession] = None,
+                 bulk_load: bool = True):
         """
         Initialize database creator
         
         Args:
             output_dir: Output directory for database and reports
+            session: Shared WadSession (the WAD processor opens its own if None)
+            bulk_load: Defer indexes and relax durability while loading the database
         """
         self.output_dir = output_dir or Path(".")
+        self.session = session
+        self.bulk_load = bulk_load
+        self.bulk_loader = None
         self.database_dir = self.output_dir / "database"
         self.reports_dir = self.output_dir / "Reports" / "TemplateManifest Reports"
         
@@ -62,6 +77,9 @@ class TemplateManifestDatabaseCreator:
             'processing_errors': 0
         }
         
+        # Stage timings of this run; TemplateManifest.xml is the only file
+        self.metrics = StageMetrics()
+        
         # Data storage
         self.template_manifest = None
         self.validation_results = {}
@@ -86,27 +104,35 @@ class TemplateManifestDatabaseCreator:
             print("=" * 60)
             
             self.processing_stats['start_time'] = datetime.now()
+            metrics = self.metrics
+            metrics.begin_file(name=TEMPLATE_MANIFEST_PATH)
             
             # Step 1: Process TemplateManifest from WAD
             if not self._process_template_manifest():
                 return False
             
             # Step 2: Create database schema
-            if not self._create_database_schema():
-                return False
+            with metrics.stage("open"):
+                if not self._create_database_schema():
+                    return False
             
             # Step 3: Populate database
             if not self._populate_database():
                 return False
+            metrics.set_file_content(self.template_manifest)
+            metrics.end_file()
             
             # Step 4: Validate data (optional)
-            if not skip_validation:
-                if not self._validate_database():
-                    print("[WARNING] Database validation found issues")
+            with metrics.stage("report"):
+                if not skip_validation:
+                    if not self._validate_database():
+                        print("[WARNING] Database validation found issues")
+                
+                # Step 5: Generate reports
+                if not self._generate_reports():
+                    print("[WARNING] Report generation failed")
             
-            # Step 5: Generate reports
-            if not self._generate_reports():
-                print("[WARNING] Report generation failed")
+            self._insert_stage_metrics()
             
             self.processing_stats['end_time'] = datetime.now()
             self.processing_stats['duration'] = (
@@ -117,6 +143,8 @@ class TemplateManifestDatabaseCreator:
             print(f"Database: {self.db_path}")
             print(f"Processing time: {self.processing_stats['duration']:.2f} seconds")
             print(f"Templates processed: {self.processing_stats['templates_processed']}")
+            print("Stage times:")
+            print(self.metrics.format_summary())
             
             return True
             
@@ -133,7 +161,7 @@ class TemplateManifestDatabaseCreator:
             print("\n--- Step 1: Processing TemplateManifest ---")
             
             # Create WAD processor
-            self.wad_processor = create_template_manifest_processor()
+            self.wad_processor = create_template_manifest_processor(session=self.session, metrics=self.metrics)
             print("[OK] WAD processor initialized")
             
             # Process TemplateManifest
@@ -171,10 +199,15 @@ class TemplateManifestDatabaseCreator:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.db_path = self.database_dir / f"template_manifest_{timestamp}.db"
             
-            # Create schema
-            self.database_schema = create_database_schema(self.db_path)
+            # Create schema (indexes are built after populating in bulk-load mode)
+            self.database_schema = create_database_schema(self.db_path, defer_indexes=self.bulk_load)
             print(f"[OK] Database schema created: {self.db_path}")
             
+            if self.bulk_load:
+                self.bulk_loader = BulkLoader(self.database_schema.connection,
+                                              TemplateManifestDatabaseSchema.get_create_index_statements())
+                self.bulk_loader.begin()
+            
             # Validate schema
             schema_validation = self.database_schema.validate_schema()
             if not schema_validation['valid']:
@@ -200,37 +233,42 @@ class TemplateManifestDatabaseCreator:
             insert_count = 0
             error_count = 0
             
-            for template in self.template_manifest.m_serializedTemplates:
-                try:
-                    # Simple validation - just check basic requirements
-                    is_valid = template.m_id > 0 and bool(template.m_filename)
-                    
-                    # Insert template location
-                    cursor.execute("""
-                        INSERT INTO template_locations (
-                            template_id, filename, file_name, file_type, file_directory, is_valid
-                        ) VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        template.m_id,
-                        template.m_filename,
-                        template.file_name,
-                        template.file_type,
-                        template.file_directory,
-                        is_valid
-                    ))
-                    
-                    insert_count += 1
-                    
-                except Exception as e:
-                    error_count += 1
-                    if error_count < 10:  # Only print first 10 errors
-                        print(f"[ERROR] Failed to insert template {template.m_id}: {e}")
-            
-            # Insert statistics summary
-            self._insert_statistics_summary(cursor)
-            
-            # Commit changes
-            self.database_schema.connection.commit()
+            with self.metrics.stage("insert"):
+                for template in self.template_manifest.m_serializedTemplates:
+                    try:
+                        # Simple validation - just check basic requirements
+                        is_valid = template.m_id > 0 and bool(template.m_filename)
+                        
+                        # Insert template location
+                        cursor.execute("""
+                            INSERT INTO template_locations (
+                                template_id, filename, file_name, file_type, file_directory, is_valid
+                            ) VALUES (?, ?, ?, ?, ?, ?)
+                        """, (
+                            template.m_id,
+                            template.m_filename,
+                            template.file_name,
+                            template.file_type,
+                            template.file_directory,
+                            is_valid
+                        ))
+                        
+                        insert_count += 1
+                        
+                    except Exception as e:
+                        error_count += 1
+                        if error_count < 10:  # Only print first 10 errors
+                            print(f"[ERROR] Failed to insert template {template.m_id}: {e}")
+                
+                # Insert statistics summary
+                self._insert_statistics_summary(cursor)
+                
+                # Commit changes
+                self.database_schema.connection.commit()
+            
+            if self.bulk_loader:
+                with self.metrics.stage("index"):
+                    self.bulk_loader.finish()
             
             self.processing_stats['templates_inserted'] = insert_count
             print(f"[OK] Inserted {insert_count} template locations")
@@ -267,6 +305,13 @@ class TemplateManifestDatabaseCreator:
             "TemplateManifest.xml"
         ))
     
+    def _insert_stage_metrics(self):
+        """Insert the stage timings of this run into the database"""
+        try:
+            self.metrics.save(self.database_schema.connection)
+        except Exception as e:
+            print(f"[WARNING] Failed to insert stage metrics: {e}")
+    
     def _validate_database(self) -> bool:
         """Validate database contents"""
         try:
@@ -479,18 +524,20 @@ class TemplateManifestDatabaseCreator:
         return stats
 
 
-def create_template_manifest_database(output_dir: Optional[Path] = None, skip_validation: bool = False) -> bool:
+def create_template_manifest_database(output_dir: Optional[Path] = None, skip_validation: bool = False,
+                                      bulk_load: bool = True) -> bool:
     """
     Create TemplateManifest database with all processing steps
     
     Args:
         output_dir: Output directory for database and reports
         skip_validation: Skip validation for faster processing
+        bulk_load: Defer indexes and relax durability while loading the database
         
     Returns:
         True if successful, False otherwise
     """
-    creator = TemplateManifestDatabaseCreator(output_dir)
+    creator = TemplateManifestDatabaseCreator(output_dir, bulk_load=bulk_load)
     return creator.create_database(skip_validation)
 
 
@@ -23,6 +23,20 @@ import json
 # Schema version for migration tracking
 SCHEMA_VERSION = 1
 
+INDEX_STATEMENTS = [
+    # Primary lookup indexes
+    "CREATE INDEX IF NOT EXISTS idx_template_id ON template_locations(template_id)",
+    "CREATE INDEX IF NOT EXISTS idx_filename ON template_locations(filename)",
+    "CREATE INDEX IF NOT EXISTS idx_file_name ON template_locations(file_name)",
+    
+    # File type classification indexes
+    "CREATE INDEX IF NOT EXISTS idx_file_type ON template_locations(file_type)",
+    "CREATE INDEX IF NOT EXISTS idx_file_directory ON template_locations(file_directory)",
+    
+    # Validation indexes
+    "CREATE INDEX IF NOT EXISTS idx_valid_templates ON template_locations(is_valid)",
+]
+
 
 class TemplateManifestDatabaseSchema:
     """Manages database schema for TemplateManifest system"""
@@ -41,10 +55,13 @@ class TemplateManifestDatabaseSchema:
             self.connection = sqlite3.connect(str(db_path))
             self.connection.row_factory = sqlite3.Row  # Enable column access by name
     
-    def create_schema(self) -> bool:
+    def create_schema(self, defer_indexes: bool = False) -> bool:
         """
         Create complete database schema
         
+        Args:
+            defer_indexes: Skip index creation (bulk loads build them after inserting)
+        
         Returns:
             True if successful, False otherwise
         """
@@ -57,7 +74,8 @@ class TemplateManifestDatabaseSchema:
             self._create_template_statistics_table(cursor)
             
             # Create indexes
-            self._create_indexes(cursor)
+            if not defer_indexes:
+                self._create_indexes(cursor)
             
             # Create views
             self._create_views(cursor)
@@ -131,20 +149,15 @@ class TemplateManifestDatabaseSchema:
         """)
     
     
+    @staticmethod
+    def get_create_index_statements() -> List[str]:
+        """Get the CREATE INDEX statements of the schema"""
+        return list(INDEX_STATEMENTS)
+    
     def _create_indexes(self, cursor: sqlite3.Cursor):
         """Create database indexes for optimal performance"""
-        
-        # Primary lookup indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_template_id ON template_locations(template_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_filename ON template_locations(filename)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_name ON template_locations(file_name)")
-        
-        # File type classification indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_type ON template_locations(file_type)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_directory ON template_locations(file_directory)")
-        
-        # Validation indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_valid_templates ON template_locations(is_valid)")
+        for index_statement in INDEX_STATEMENTS:
+            cursor.execute(index_statement)
     
     def _create_views(self, cursor: sqlite3.Cursor):
         """Create database views for common queries"""
@@ -292,19 +305,20 @@ class TemplateManifestDatabaseSchema:
             self.connection = None
 
 
-def create_database_schema(db_path: Path) -> TemplateManifestDatabaseSchema:
+def create_database_schema(db_path: Path, defer_indexes: bool = False) -> TemplateManifestDatabaseSchema:
     """
     Create and initialize database schema
     
     Args:
         db_path: Path to SQLite database file
+        defer_indexes: Skip index creation (bulk loads build them after inserting)
         
     Returns:
         Initialized TemplateManifestDatabaseSchema
     """
     schema = TemplateManifestDatabaseSchema(db_path)
     
-    if not schema.create_schema():
+    if not schema.create_schema(defer_indexes):
         raise RuntimeError(f"Failed to create database schema at {db_path}")
     
     return schema
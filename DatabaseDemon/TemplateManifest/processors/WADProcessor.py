@@ -19,7 +19,7 @@ import traceback
 
 import katsuba
 from katsuba.wad import Archive
-from katsuba.op import LazyObject, LazyList, TypeList, Serializer, SerializerOptions
+from katsuba.op import LazyObject, LazyList, Serializer, SerializerOptions
 
 # Add parent directories to Python path for imports
 sys.path.append(str(Path(__file__).parent.parent.parent))  # DatabaseDemon level
@@ -27,25 +27,37 @@ sys.path.append(str(Path(__file__).parent.parent))         # TemplateManifest le
 
 # Import centralized conversion utility
 from utils.conversion_utils import convert_lazy_object_to_dict_with_hash_only
+from utils.wad_session import WadSession
+from utils.type_list_cache import open_cached_type_list
+from utils.stage_metrics import StageMetrics
 
 # Import TemplateManifest DTOs
-from dtos import TemplateManifestDTOFactory, TemplateManifestDTO, TemplateLocationDTO
-from dtos.TemplateManifestEnums import TypeHashes, TEMPLATE_MANIFEST_PATH
+try:
+    from ..dtos import TemplateManifestDTOFactory, TemplateManifestDTO, TemplateLocationDTO
+    from ..dtos.TemplateManifestEnums import TypeHashes, TEMPLATE_MANIFEST_PATH
+except ImportError:
+    from dtos import TemplateManifestDTOFactory, TemplateManifestDTO, TemplateLocationDTO
+    from dtos.TemplateManifestEnums import TypeHashes, TEMPLATE_MANIFEST_PATH
 
 
 class TemplateManifestWADProcessor:
     """Class-based processor for TemplateManifest data extraction from WAD files"""
     
-    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None):
+    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None,
+                 session: Optional[WadSession] = None, metrics: Optional[StageMetrics] = None):
         """
         Initialize the TemplateManifest WAD processor
         
         Args:
             wad_path: Path to Root.wad file (auto-detected if None)
             types_path: Path to types.json file (auto-detected if None)
+            session: Shared WadSession to reuse instead of opening the WAD again
+            metrics: Stage metrics of the run (own instance if None)
         """
-        self.wad_path = wad_path
-        self.types_path = types_path
+        self.session = session
+        self.metrics = metrics or StageMetrics()
+        self.wad_path = session.wad_path if session else wad_path
+        self.types_path = session.types_path if session else types_path
         self.archive = None
         self.type_list = None
         self.serializer = None
@@ -91,18 +103,28 @@ class TemplateManifestWADProcessor:
         """
         print("Initializing TemplateManifest WAD Processor...")
         
-        # Load type definitions
-        if not self._load_type_list():
-            print("Failed to load type definitions")
-            return False
-        
-        # Open WAD archive
-        if not self._open_wad_archive():
-            print("Failed to open WAD archive")
-            return False
+        if self.session:
+            # Reuse the shared session resources
+            if not self.session.open():
+                print("Failed to open WAD session")
+                return False
+            self.archive = self.session.archive
+            self.type_list = self.session.type_list
+            self.serializer = self.session.serializer
+            print("[OK] Using shared WAD session")
+        else:
+            # Load type definitions
+            if not self._load_type_list():
+                print("Failed to load type definitions")
+                return False
+            
+            # Open WAD archive
+            if not self._open_wad_archive():
+                print("Failed to open WAD archive")
+                return False
         
         # Create serializer
-        if self.type_list:
+        if self.type_list and not self.serializer:
             options = SerializerOptions()
             options.shallow = False  # Allow deep serialization (required for skip_unknown_types)
             options.skip_unknown_types = True  # Equivalent to CLI --ignore-unknown-types
@@ -129,7 +151,7 @@ class TemplateManifestWADProcessor:
                 print(f"Error: Types file not found at {self.types_path}")
                 return False
                 
-            self.type_list = TypeList.open(str(self.types_path))
+            self.type_list = open_cached_type_list(self.types_path)
             print(f"[OK] Loaded type definitions from {self.types_path}")
             return True
             
@@ -173,7 +195,8 @@ class TemplateManifestWADProcessor:
             print(f"[INFO] Processing {TEMPLATE_MANIFEST_PATH}...")
             
             # Deserialize using archive method (like Mobs system)
-            lazy_object = self.archive.deserialize(TEMPLATE_MANIFEST_PATH, self.serializer)
+            with self.metrics.stage("deserialize"):
+                lazy_object = self.archive.deserialize(TEMPLATE_MANIFEST_PATH, self.serializer)
             print(f"[OK] Deserialized {TEMPLATE_MANIFEST_PATH}")
             
             # Validate type
@@ -188,7 +211,8 @@ class TemplateManifestWADProcessor:
             print(f"[OK] Verified TemplateManifest type hash: {lazy_object.type_hash}")
             
             # Convert to DTO
-            dto = self.dto_factory.create_template_manifest_dto(lazy_object)
+            with self.metrics.stage("dto"):
+                dto = self.dto_factory.create_template_manifest_dto(lazy_object)
             if not dto:
                 print("[ERROR] Failed to create TemplateManifestDTO")
                 return None
@@ -335,20 +359,26 @@ class TemplateManifestWADProcessor:
         self.cleanup()
 
 
-def create_template_manifest_processor(wad_path: Optional[Path] = None, types_path: Optional[Path] = None) -> TemplateManifestWADProcessor:
+def create_template_manifest_processor(wad_path: Optional[Path] = None, types_path: Optional[Path] = None,
+                                       session: Optional[WadSession] = None,
+                                       metrics: Optional[StageMetrics] = None) -> TemplateManifestWADProcessor:
     """
     Factory function to create and initialize a TemplateManifest processor
     
     Args:
         wad_path: Path to Root.wad file (auto-detected if None)
         types_path: Path to types.json file (auto-detected if None)
+        session: Shared WadSession to reuse instead of opening the WAD again
+        metrics: Stage metrics of the run (own instance if None)
         
     Returns:
         Initialized TemplateManifestWADProcessor
     """
-    processor = TemplateManifestWADProcessor(wad_path, types_path)
+    processor = TemplateManifestWADProcessor(wad_path, types_path, session=session, metrics=metrics)
     
-    if not processor.initialize():
+    with processor.metrics.stage("open"):
+        initialized = processor.initialize()
+    if not initialized:
         raise RuntimeError("Failed to initialize TemplateManifest processor")
     
     return processor
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Benchmark Database Builders
+===========================
+End-to-end benchmark of the Spells, Mobs, Items, Decks and TemplateManifest
+database builders on a synthetic Root.wad (utils/synthetic_wad.py).
+
+Every builder runs in its own child process against the same fixture, so the
+module state and peak RSS of one builder do not leak into the next. The child
+wraps the builder's existing methods with a StageTimer (utils/stage_timer.py)
+and reports wall time per stage:
+
+    open, list, deserialize, convert, dto, insert, index, report
+
+Time not covered by any stage is reported as "other". In direct DTO mode the
+LazyObject -> DTO build is one step and counts as "dto"; "convert" only
+covers the raw dict conversion (fallback path and failure logging).
+
+Results are stored in a JSON file keyed by git commit and fixture. The run
+fails (exit code 1) if a builder fails, or if its files/sec dropped by more
+than --threshold against the baseline: the given --baseline commit, or else
+the latest other commit benchmarked on the same fixture.
+
+Files per builder: spell files, scanned ObjectData files (mobs and items),
+deck files and template locations (TemplateManifest).
+
+Usage:
+    cd DatabaseDemon
+    python "Test Scripts/benchmark_builders.py" [--entries N] [--builders spells mobs ...]
+        [--fixture DIR] [--results PATH] [--baseline COMMIT] [--threshold 0.15]
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add DatabaseDemon to path for imports
+DATABASE_DEMON_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(DATABASE_DEMON_DIR))
+from utils.process_memory import get_peak_rss_mb
+from utils.stage_timer import PIPELINE_STAGES, StageTimer, TimedProxy
+from utils.synthetic_wad import SyntheticFixtureSpec, generate_fixture, load_fixture
+
+RESULT_PREFIX = "BENCHMARK_RESULT "
+BUILDERS = ("spells", "mobs", "items", "decks", "template_manifest")
+DEFAULT_RESULTS_PATH = DATABASE_DEMON_DIR / "Reports" / "Benchmarks" / "builder_benchmarks.json"
+
+# Archive methods timed through a proxy (the native Archive cannot be patched)
+ARCHIVE_STAGES = {"deserialize": "deserialize", "iter_glob": "list"}
+
+
+# ===== CHILD: ONE BUILDER =====
+
+def instrument_shared_utils(timer: StageTimer):
+    """Time the utilities every WAD builder goes through"""
+    from utils.wad_manifest import WadManifest
+    from utils.lazy_dto_builder import LazyDTOBuilder
+    from utils.bulk_load import BulkLoader
+    from utils.batched_row_writer import BatchedRowWriter
+    from utils.object_data_scanner import ObjectDataScanner
+
+    timer.instrument(WadManifest, "build", "list")
+    timer.instrument(WadManifest, "save", "report")
+    timer.instrument(ObjectDataScanner, "get_object_files", "list")
+    timer.instrument(LazyDTOBuilder, "build", "dto")
+    timer.instrument(BatchedRowWriter, "flush", "insert")
+    timer.instrument(BulkLoader, "finish", "index")
+
+
+def create_timed_session(fixture, timer: StageTimer):
+    """Create a WadSession whose open is timed and whose archive is proxied"""
+    from utils.wad_session import WadSession
+
+    session = WadSession(fixture.wad_path, fixture.types_path)
+    open_session = session.open
+
+    def open_and_proxy() -> bool:
+        opened = open_session()
+        if opened and not isinstance(session.archive, TimedProxy):
+            session.archive = TimedProxy(session.archive, timer, ARCHIVE_STAGES)
+        return opened
+
+    session.open = timer.timed(open_and_proxy, "open")
+    return session
+
+
+def run_spells(fixture, work_dir: Path, timer: StageTimer) -> Tuple[bool, int, int]:
+    """Build the spell database (serial extraction)"""
+    # Import the modules by name: processors packages re-export classes named like their modules
+    creator_module = importlib.import_module("Spells.processors.DatabaseCreator")
+    wad_module = importlib.import_module("Spells.processors.WADProcessor")
+
+    timer.instrument(wad_module, "convert_lazy_object_to_dict", "convert")
+    timer.instrument(wad_module.FixedSpellDTOFactory, "create_from_json_data", "dto")
+
+    creator = creator_module.DatabaseCreator(database_path=work_dir / "spells.db",
+                                             failed_spells_dir=work_dir / "Spell Reports",
+                                             session=create_timed_session(fixture, timer))
+    try:
+        with timer.stage("open"):
+            if not creator.initialize():
+                return False, 0, 0
+
+        timer.instrument(creator, "_select_spell_files", "list")
+        timer.instrument(creator, "insert_spell_data", "insert")
+        timer.instrument(creator, "_insert_processing_metadata", "report")
+        timer.instrument(creator, "_insert_unhandled_field_shapes", "report")
+
+        success = creator.process_all_spells()
+        with timer.stage("report"):
+            creator.print_summary()
+        return success, creator.total_processed, creator.total_success
+
+    finally:
+        creator.cleanup()
+
+
+def run_mobs(fixture, work_dir: Path, timer: StageTimer) -> Tuple[bool, int, int]:
+    """Build the mob database through the ObjectData scanner"""
+    creator_module = importlib.import_module("Mobs.processors.DatabaseCreator")
+
+    timer.instrument(creator_module, "convert_lazy_object_to_dict_with_hash_only", "convert")
+    timer.instrument(creator_module.MobsDTOFactory, "create_from_lazy_object", "dto")
+    timer.instrument(creator_module.MobsDTOFactory, "create_from_json_data", "dto")
+
+    creator = creator_module.MobDatabaseCreator(database_path=work_dir / "mobs.db",
+                                                failed_mobs_dir=work_dir / "Mob Reports")
+    session = create_timed_session(fixture, timer)
+    try:
+        with timer.stage("open"):
+            if not creator.initialize() or not creator.create_database() or not session.open():
+                return False, 0, 0
+
+        timer.instrument(creator, "_process_single_mob", "insert")
+        timer.instrument(creator, "on_batch_complete", "insert")
+        timer.instrument(creator, "_generate_final_report", "report")
+
+        success = creator.process_all_mobs(session=session)
+        return success, creator.scan_statistics.get("total_scanned", 0), creator.total_success
+
+    finally:
+        if creator.connection:
+            creator.close()
+
+
+def run_items(fixture, work_dir: Path, timer: StageTimer) -> Tuple[bool, int, int]:
+    """Build the items database (streaming mode)"""
+    creator_module = importlib.import_module("Items.processors.DatabaseCreator")
+    wad_module = importlib.import_module("Items.processors.WADProcessor")
+
+    timer.instrument(wad_module.ItemsWADProcessor, "initialize", "open")
+    timer.instrument(wad_module.ItemsWADProcessor, "get_all_item_files", "list")
+    timer.instrument(wad_module.ItemsWADProcessor, "print_processing_summary", "report")
+    timer.instrument(wad_module, "convert_lazy_object_to_dict", "convert")
+    timer.instrument(wad_module.ItemsDTOFactory, "create_from_json_data", "dto")
+
+    creator = creator_module.ItemsDatabaseCreator(database_path=work_dir / "items.db",
+                                                  failed_items_dir=work_dir / "failed_items")
+    session = create_timed_session(fixture, timer)
+    try:
+        with timer.stage("open"):
+            if not creator.initialize_database() or not session.open():
+                return False, 0, 0
+
+        timer.instrument(creator, "_insert_extracted_item", "insert")
+        timer.instrument(creator, "_insert_processing_statistics", "report")
+
+        success = creator.process_all_items_from_wad(session=session)
+        files = len(creator.manifest.entries) if creator.manifest else 0
+        return success, files, creator.total_success
+
+    finally:
+        creator.cleanup()
+
+
+def run_decks(fixture, work_dir: Path, timer: StageTimer) -> Tuple[bool, int, int]:
+    """Build the deck database from the fixture's MobDecks directory"""
+    creator_module = importlib.import_module("Decks.processors.DatabaseCreator")
+
+    creator = creator_module.DatabaseCreator(work_dir / "decks.db")
+    timer.instrument(creator, "setup_database", "open")
+    timer.instrument(creator.factory, "load_xml_file", "deserialize")
+    timer.instrument(creator.factory, "convert_from_xml_data", "dto")
+    timer.instrument(creator, "insert_deck_dto", "insert")
+    timer.instrument(creator, "update_spell_summary", "insert")
+
+    with timer.stage("list"):
+        deck_files = list(fixture.decks_dir.glob("*.xml"))
+
+    dtos = creator.process_deck_files(fixture.decks_dir)
+    success = bool(dtos) and creator.populate_database(dtos)
+    if success:
+        with timer.stage("report"):
+            reports_dir = work_dir / "Deck Reports"
+            reports_dir.mkdir(parents=True, exist_ok=True)
+            creator.generate_reports(reports_dir)
+            creator.print_final_stats()
+    return success, len(deck_files), creator.stats['successful_conversions']
+
+
+def run_template_manifest(fixture, work_dir: Path, timer: StageTimer) -> Tuple[bool, int, int]:
+    """Build the TemplateManifest database"""
+    creator_module = importlib.import_module("TemplateManifest.processors.DatabaseCreator")
+
+    timer.instrument(creator_module, "create_template_manifest_processor", "open")
+    timer.instrument(creator_module.TemplateManifestWADProcessor, "process_template_manifest", "dto")
+
+    creator = creator_module.TemplateManifestDatabaseCreator(output_dir=work_dir / "TemplateManifest",
+                                                             session=create_timed_session(fixture, timer))
+    timer.instrument(creator, "_create_database_schema", "open")
+    timer.instrument(creator, "_populate_database", "insert")
+    timer.instrument(creator, "_validate_database", "report")
+    timer.instrument(creator, "_generate_reports", "report")
+
+    success = creator.create_database()
+    stats = creator.processing_stats
+    return success, stats['templates_processed'], stats['templates_inserted']
+
+
+BUILDER_RUNNERS: Dict[str, Callable[[Any, Path, StageTimer], Tuple[bool, int, int]]] = {
+    "spells": run_spells,
+    "mobs": run_mobs,
+    "items": run_items,
+    "decks": run_decks,
+    "template_manifest": run_template_manifest,
+}
+
+
+def run_child(builder: str, fixture_dir: Path, work_dir: Path) -> int:
+    """Run one builder against the fixture and print its result line"""
+    fixture = load_fixture(fixture_dir)
+    if fixture is None:
+        print(f"[ERROR] No synthetic fixture in {fixture_dir}")
+        return 1
+
+    timer = StageTimer()
+    instrument_shared_utils(timer)
+
+    success, files, records = False, 0, 0
+    start = time.perf_counter()
+    try:
+        success, files, records = BUILDER_RUNNERS[builder](fixture, work_dir, timer)
+    except Exception as e:
+        print(f"[ERROR] {builder} builder failed: {e}")
+        traceback.print_exc()
+    elapsed = time.perf_counter() - start
+
+    stages = timer.totals()
+    stages["other"] = max(0.0, elapsed - timer.total_seconds)
+
+    result = {
+        "builder": builder,
+        # A run that stored nothing measured only the failure path
+        "success": bool(success) and records > 0,
+        "files": files,
+        "records": records,
+        "seconds": elapsed,
+        "files_per_sec": files / elapsed if elapsed > 0 else 0.0,
+        "peak_rss_mb": get_peak_rss_mb(),
+        "stages": stages,
+        "stage_calls": dict(timer.calls),
+    }
+    print(RESULT_PREFIX + json.dumps(result))
+    return 0 if success else 1
+
+
+# ===== PARENT: SUITE =====
+
+def run_builder(builder: str, fixture_dir: Path, work_dir: Path, verbose: bool) -> Optional[dict]:
+    """Run one builder in a child process and parse its result line"""
+    builder_dir = work_dir / builder
+    builder_dir.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, str(Path(__file__).resolve()), "--child", builder,
+               "--fixture", str(fixture_dir), "--work-dir", str(builder_dir)]
+
+    print(f"[INFO] Running {builder} builder...")
+    # Run inside the work directory so relative report paths stay out of the tree
+    completed = subprocess.run(command, capture_output=True, text=True, cwd=builder_dir)
+    if verbose:
+        print(completed.stdout)
+
+    for line in completed.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+            if not result["success"] and not verbose:
+                print(completed.stdout[-2000:])
+                print(completed.stderr[-2000:])
+            return result
+
+    print(f"[ERROR] {builder} run produced no result (exit code {completed.returncode})")
+    print(completed.stdout[-2000:])
+    print(completed.stderr[-2000:])
+    return None
+
+
+def get_git_commit() -> str:
+    """Short commit of the working tree ("-dirty" if tracked files are modified)"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=DATABASE_DEMON_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                cwd=DATABASE_DEMON_DIR, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if status.strip() else commit
+
+
+def load_results(results_path: Path) -> Dict[str, Dict[str, dict]]:
+    """Load stored results {commit: {fixture label: run}}"""
+    if not results_path.exists():
+        return {}
+    with open(results_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(results_path: Path, results: Dict[str, Dict[str, dict]]):
+    """Write results back (atomically, so an interrupted run keeps the old file)"""
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = results_path.with_suffix(".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    temp_path.replace(results_path)
+
+
+def find_baseline(results: Dict[str, Dict[str, dict]], commit: str, label: str,
+                  baseline_commit: Optional[str]) -> Optional[dict]:
+    """Get the baseline run on the same fixture (latest other commit if not given)"""
+    if baseline_commit:
+        return results.get(baseline_commit, {}).get(label)
+
+    candidates = [runs[label] for other, runs in results.items() if other != commit and label in runs]
+    return max(candidates, key=lambda run: run["recorded_at"], default=None)
+
+
+def find_regressions(run: dict, baseline: dict, threshold: float) -> List[str]:
+    """Builders whose files/sec dropped by more than threshold against the baseline"""
+    regressions = []
+    for builder, result in run["builders"].items():
+        previous = baseline["builders"].get(builder)
+        if not previous or not previous["success"] or not result["success"]:
+            continue
+        if previous["files_per_sec"] <= 0:
+            continue
+        change = result["files_per_sec"] / previous["files_per_sec"] - 1
+        if change < -threshold:
+            regressions.append(f"{builder}: {result['files_per_sec']:.1f} files/s vs "
+                               f"{previous['files_per_sec']:.1f} at {baseline['commit']} ({change:+.1%})")
+    return regressions
+
+
+def print_results(run: dict, baseline: Optional[dict]):
+    """Print throughput and per-stage tables"""
+    print("\nThroughput")
+    print("-" * 86)
+    print(f"{'Builder':<18} {'Files':>8} {'Seconds':>9} {'Files/s':>10} {'Peak RSS':>10} "
+          f"{'Baseline':>10} {'Change':>8}")
+    for builder, result in run["builders"].items():
+        peak = f"{result['peak_rss_mb']:.1f} MB" if result["peak_rss_mb"] is not None else "n/a"
+        previous = baseline["builders"].get(builder) if baseline else None
+        if previous and previous["files_per_sec"] > 0:
+            base = f"{previous['files_per_sec']:.1f}"
+            change = f"{result['files_per_sec'] / previous['files_per_sec'] - 1:+.1%}"
+        else:
+            base, change = "-", "-"
+        status = "" if result["success"] else "  FAILED"
+        print(f"{builder:<18} {result['files']:>8,} {result['seconds']:>9.2f} "
+              f"{result['files_per_sec']:>10.1f} {peak:>10} {base:>10} {change:>8}{status}")
+
+    stages = list(PIPELINE_STAGES) + ["other"]
+    print("\nSeconds per stage")
+    print("-" * (18 + 12 * len(stages)))
+    print(f"{'Builder':<18}" + "".join(f"{stage:>12}" for stage in stages))
+    for builder, result in run["builders"].items():
+        print(f"{builder:<18}" + "".join(f"{result['stages'].get(stage, 0.0):>12.3f}" for stage in stages))
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark the database builders on synthetic data")
+    parser.add_argument("--builders", nargs="+", choices=BUILDERS, default=list(BUILDERS),
+                        help="Builders to run (default: all)")
+    parser.add_argument("--entries", type=int, default=2000,
+                        help="Synthetic fixture size in template files (default: 2000)")
+    parser.add_argument("--seed", type=int, default=1, help="Fixture random seed (default: 1)")
+    parser.add_argument("--compress", action="store_true", help="Store fixture entries zlib compressed")
+    parser.add_argument("--fixture", type=Path,
+                        help="Fixture directory to reuse (generated there if missing, temporary if None)")
+    parser.add_argument("--results", type=Path, default=DEFAULT_RESULTS_PATH,
+                        help="Results JSON keyed by git commit")
+    parser.add_argument("--baseline", help="Commit to compare against (default: latest other commit)")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed files/sec drop against the baseline (default: 0.15 = 15%%)")
+    parser.add_argument("--no-save", action="store_true", help="Do not record this run")
+    parser.add_argument("--verbose", action="store_true", help="Show builder output")
+    parser.add_argument("--child", choices=BUILDERS, help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.child, args.fixture, args.work_dir)
+
+    print("Database Builder Benchmark")
+    print("=" * 50)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="builder_bench_"))
+    try:
+        fixture_dir = args.fixture or work_dir / "fixture"
+        fixture = load_fixture(fixture_dir)
+        if fixture is None:
+            spec = SyntheticFixtureSpec.for_entries(args.entries, seed=args.seed, compress=args.compress)
+            print(f"[INFO] Generating synthetic fixture ({spec.entry_count:,} entries) in {fixture_dir}")
+            fixture = generate_fixture(fixture_dir, spec)
+        print(f"[INFO] Fixture: {fixture.spec.label}")
+
+        commit = get_git_commit()
+        run = {
+            "commit": commit,
+            "recorded_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fixture": fixture.spec.label,
+            "builders": {},
+        }
+        for builder in args.builders:
+            result = run_builder(builder, fixture_dir, work_dir, args.verbose)
+            if result:
+                result.pop("builder")
+                run["builders"][builder] = result
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = load_results(args.results)
+    baseline = find_baseline(results, commit, fixture.spec.label, args.baseline)
+    if args.baseline and baseline is None:
+        print(f"[WARNING] No results for baseline {args.baseline} on fixture {fixture.spec.label}")
+
+    print_results(run, baseline)
+    failed = [builder for builder in args.builders
+              if builder not in run["builders"] or not run["builders"][builder]["success"]]
+    regressions = find_regressions(run, baseline, args.threshold) if baseline else []
+
+    if not args.no_save:
+        # Keep builders that this run skipped (e.g. --builders decks)
+        previous = results.setdefault(commit, {}).get(fixture.spec.label)
+        if previous:
+            run["builders"] = {**previous["builders"], **run["builders"]}
+        results[commit][fixture.spec.label] = run
+        save_results(args.results, results)
+        print(f"\n[OK] Results recorded for {commit} in {args.results}")
+
+
+    if failed:
+        print(f"\n[FAIL] Builders failed: {', '.join(failed)}")
+    if regressions:
+        print(f"\n[FAIL] Throughput regressed more than {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  - {regression}")
+    if failed or regressions:
+        return 1
+
+    if baseline:
+        print(f"\n[OK] No builder regressed more than {args.threshold:.0%} against {baseline['commit']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark Bulk Load
+===================
+Compare database build time with indexes created up front (default pragmas)
+against bulk-load mode (utils/bulk_load.py): tables only, relaxed journal and
+sync settings while loading, then all indexes and ANALYZE at the end.
+
+Synthetic rows are generated from each table's declared column types, so the
+benchmark runs without Root.wad and measures only the SQLite side. Rows are
+written in executemany transactions of --batch-size rows, like the database
+creators do.
+
+Usage:
+    cd DatabaseDemon
+    python "Test Scripts/benchmark_bulk_load.py" [--schemas spells mobs items] [--rows N] [--batch-size N]
+"""
+
+import argparse
+import importlib.util
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add DatabaseDemon to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.bulk_load import BulkLoader
+
+DATABASE_DEMON_DIR = Path(__file__).parent.parent
+
+
+def load_schema_module(relative_path: str):
+    """Load a DatabaseSchema module by path (its package imports need katsuba)"""
+    path = DATABASE_DEMON_DIR / relative_path
+    spec = importlib.util.spec_from_file_location(f"benchmark_{path.parent.parent.name}_schema", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_schema(name: str) -> Tuple[List[str], List[str]]:
+    """Get the (CREATE TABLE, CREATE INDEX) statements of a schema"""
+    if name == "spells":
+        schema = load_schema_module("Spells/processors/DatabaseSchema.py").DatabaseSchema
+        return ([schema.get_create_table_sql(table) for table in schema.get_all_table_names()],
+                [schema.get_create_index_sql(index) for index in schema.get_all_index_names()])
+    if name == "mobs":
+        schema = load_schema_module("Mobs/processors/DatabaseSchema.py").MobDatabaseSchema
+        return (list(schema.get_create_table_statements().values()),
+                list(schema.get_create_index_statements().values()))
+    schema = load_schema_module("Items/processors/DatabaseSchema.py").ItemsDatabaseSchema
+    return schema.get_create_table_statements(), schema.get_create_index_statements()
+
+
+def build_row_plan(connection: sqlite3.Connection) -> Dict[str, Tuple[str, List[str]]]:
+    """Get the INSERT statement and column types of every table"""
+    plan = {}
+    tables = [row[0] for row in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )]
+    for table in tables:
+        columns = []
+        for _, column, column_type, _, _, pk in connection.execute(f"PRAGMA table_info({table})"):
+            # Leave INTEGER PRIMARY KEY columns to SQLite
+            if pk == 1 and column_type.upper() == "INTEGER":
+                continue
+            columns.append((column, column_type.upper()))
+        if columns:
+            placeholders = ", ".join("?" * len(columns))
+            sql = f"INSERT INTO {table} ({', '.join(c for c, _ in columns)}) VALUES ({placeholders})"
+            plan[table] = (sql, [t for _, t in columns])
+    return plan
+
+
+def make_row(column_types: List[str], row_number: int, rng: random.Random) -> tuple:
+    """Build one synthetic row (text values are unique so UNIQUE keys hold)"""
+    values = []
+    for column_type in column_types:
+        if "INT" in column_type or "BOOL" in column_type:
+            values.append(rng.randrange(1000))
+        elif "REAL" in column_type or "FLOAT" in column_type:
+            values.append(rng.random() * 100)
+        else:
+            values.append(f"Benchmark/Row_{row_number:08d}_{rng.randrange(1000)}.xml")
+    return tuple(values)
+
+
+def build_database(database_path: Path, schema: str, rows: int, batch_size: int,
+                   bulk_load: bool) -> Dict[str, float]:
+    """Build one synthetic database and return its timings"""
+    create_tables, create_indexes = get_schema(schema)
+
+    connection = sqlite3.connect(str(database_path))
+    for statement in create_tables:
+        connection.execute(statement)
+
+    bulk_loader = None
+    if bulk_load:
+        bulk_loader = BulkLoader(connection, create_indexes)
+    else:
+        for statement in create_indexes:
+            connection.execute(statement)
+    connection.commit()
+
+    if bulk_loader:
+        bulk_loader.begin()
+
+    # Rows are generated before timing so only SQLite work is measured
+    plan = build_row_plan(connection)
+    rng = random.Random(42)
+    table_rows = {table: [make_row(column_types, row_number, rng) for row_number in range(rows)]
+                  for table, (_, column_types) in plan.items()}
+
+    start = time.perf_counter()
+    for table, (sql, _) in plan.items():
+        for batch_start in range(0, rows, batch_size):
+            connection.executemany(sql, table_rows[table][batch_start:batch_start + batch_size])
+            connection.commit()
+    load_seconds = time.perf_counter() - start
+
+    index_start = time.perf_counter()
+    if bulk_loader:
+        bulk_loader.finish()
+    index_seconds = time.perf_counter() - index_start
+
+    index_count = connection.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name NOT LIKE 'sqlite_%'"
+    ).fetchone()[0]
+    connection.close()
+
+    return {
+        "tables": len(plan),
+        "indexes": index_count,
+        "load": load_seconds,
+        "index": index_seconds,
+        "total": load_seconds + index_seconds
+    }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark bulk-load mode against indexed inserts")
+    parser.add_argument("--schemas", nargs="+", choices=["spells", "mobs", "items"],
+                        default=["spells", "mobs", "items"], help="Schemas to benchmark")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows per table (default: 20000)")
+    parser.add_argument("--batch-size", type=int, default=5000,
+                        help="Rows per executemany transaction (default: 5000)")
+    parser.add_argument("--work-dir", type=Path, default=None,
+                        help="Directory for the benchmark databases (default: a temp dir)")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bulk_load_bench_", dir=args.work_dir))
+    print(f"Rows per table: {args.rows}, batch size: {args.batch_size}")
+    print(f"Work directory: {work_dir}")
+
+    try:
+        print(f"\n{'Schema':<8} {'Mode':<8} {'Tables':>6} {'Indexes':>7} {'Load':>9} {'Index':>9} {'Total':>9}")
+        print("-" * 62)
+        for schema in args.schemas:
+            results = {}
+            for mode in ("indexed", "bulk"):
+                database_path = work_dir / f"{schema}_{mode}.db"
+                results[mode] = build_database(database_path, schema, args.rows, args.batch_size,
+                                               bulk_load=(mode == "bulk"))
+                r = results[mode]
+                print(f"{schema:<8} {mode:<8} {r['tables']:>6} {r['indexes']:>7} "
+                      f"{r['load']:>8.2f}s {r['index']:>8.2f}s {r['total']:>8.2f}s")
+
+            speedup = results["indexed"]["total"] / max(results["bulk"]["total"], 1e-9)
+            print(f"{schema:<8} speedup: {speedup:.2f}x")
+            if results["indexed"]["indexes"] != results["bulk"]["indexes"]:
+                print(f"[WARNING] {schema}: index count differs between modes")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
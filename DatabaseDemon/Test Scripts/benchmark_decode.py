@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark Decode
+================
+Measure leaf and key conversions per second of decode_bytes_to_string and
+decode_key (utils/conversion_utils.py) against the previous isinstance chain.
+
+A synthetic corpus of nested objects is built with the shape of converted WAD
+records: dicts keyed by a fixed vocabulary of property names (as bytes, fresh
+objects per record), nested objects and lists, and leaves that are mostly
+ints, floats, bools, strings and None with some bytes mixed in. Both variants
+walk the same corpus and convert every key and leaf.
+
+- before: isinstance chain for every leaf, every key decoded again
+- after:  type dispatch with immediate return for primitives, keys decoded once and interned
+
+Usage:
+    cd DatabaseDemon
+    python "Test Scripts/benchmark_decode.py" [--objects N] [--depth N] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List
+
+# Add DatabaseDemon to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from katsuba.op import Vec3, Quaternion, Matrix, Euler, PointInt, PointFloat, SizeInt, RectInt, RectFloat, Color
+from utils.conversion_utils import decode_bytes_to_string, decode_key
+
+# Property names repeated in every record
+KEY_VOCABULARY = [
+    "m_name", "m_displayName", "m_description", "m_school", "m_accuracy", "m_pipCost",
+    "m_effectType", "m_effectParam", "m_effectTarget", "m_numRounds", "m_damageType",
+    "m_sMagicSchoolName", "m_bPvP", "m_bBoosterPackSpell", "m_templateID", "m_objectName",
+    "m_behaviors", "m_effects", "m_requirements", "m_spellRank", "m_level", "m_rarity",
+]
+
+STRING_VOCABULARY = ["Fire", "Ice", "Storm", "Myth", "Life", "Death", "Balance", "Damage", "Heal", "Charm"]
+
+
+def legacy_decode_bytes_to_string(value: Any) -> Any:
+    """decode_bytes_to_string before the type dispatch (isinstance chain)"""
+    if isinstance(value, Vec3):
+        return f"(x={value.x}, y={value.y}, z={value.z})"
+    elif isinstance(value, Quaternion):
+        return f"(x={value.x}, y={value.y}, z={value.z}, w={value.w})"
+    elif isinstance(value, Matrix):
+        return f"[{value.i}, {value.j}, {value.k}]"
+    elif isinstance(value, Euler):
+        return f"(pitch={value.pitch}, yaw={value.yaw}, roll={value.roll})"
+    elif isinstance(value, (PointInt, PointFloat)):
+        return f"(x={value.x}, y={value.y})"
+    elif isinstance(value, SizeInt):
+        return f"({value.width}, {value.height})"
+    elif isinstance(value, (RectInt, RectFloat)):
+        return f"(left={value.left}, top={value.top}, right={value.right}, bottom={value.bottom})"
+    elif isinstance(value, Color):
+        return f"(r={value.r}, g={value.g}, b={value.b}, a={value.a})"
+    elif isinstance(value, bytes):
+        try:
+            return value.decode('utf-8')
+        except UnicodeDecodeError:
+            try:
+                return value.decode('latin-1')
+            except UnicodeDecodeError:
+                return str(value)
+    return value
+
+
+def make_leaf(rng: random.Random) -> Any:
+    """Build one leaf value (primitives dominate, like real records)"""
+    roll = rng.random()
+    if roll < 0.35:
+        return rng.randrange(100000)
+    if roll < 0.55:
+        return rng.random() * 100
+    if roll < 0.70:
+        return rng.random() < 0.5
+    if roll < 0.85:
+        return rng.choice(STRING_VOCABULARY)
+    if roll < 0.90:
+        return None
+    return rng.choice(STRING_VOCABULARY).encode("utf-8")
+
+
+def make_object(rng: random.Random, depth: int) -> dict:
+    """Build one nested object with bytes keys"""
+    obj = {}
+    for key in rng.sample(KEY_VOCABULARY, rng.randrange(6, 14)):
+        roll = rng.random()
+        if depth > 0 and roll < 0.10:
+            value = make_object(rng, depth - 1)
+        elif depth > 0 and roll < 0.20:
+            value = [make_object(rng, depth - 1) for _ in range(rng.randrange(1, 4))]
+        elif roll < 0.30:
+            value = [make_leaf(rng) for _ in range(rng.randrange(1, 6))]
+        else:
+            value = make_leaf(rng)
+        obj[key.encode("utf-8")] = value
+    return obj
+
+
+def walk(obj: Any, decode_value: Callable[[Any], Any], decode_name: Callable[[Any], Any]) -> int:
+    """Convert every key and leaf of a nested object, returning the number of conversions"""
+    conversions = 0
+    for key, value in obj.items():
+        decode_name(key)
+        conversions += 1
+        if isinstance(value, dict):
+            conversions += walk(value, decode_value, decode_name)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    conversions += walk(item, decode_value, decode_name)
+                else:
+                    decode_value(item)
+                    conversions += 1
+        else:
+            decode_value(value)
+            conversions += 1
+    return conversions
+
+
+def run(corpus: List[dict], decode_value: Callable[[Any], Any], decode_name: Callable[[Any], Any],
+        repeat: int) -> float:
+    """Best conversions per second over repeat runs"""
+    best = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conversions = sum(walk(obj, decode_value, decode_name) for obj in corpus)
+        elapsed = time.perf_counter() - start
+        best = max(best, conversions / elapsed)
+    return best
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark decode_bytes_to_string against the isinstance chain")
+    parser.add_argument("--objects", type=int, default=2000, help="Root objects in the corpus (default: 2000)")
+    parser.add_argument("--depth", type=int, default=3, help="Maximum nesting depth (default: 3)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant, best is reported (default: 3)")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    corpus = [make_object(rng, args.depth) for _ in range(args.objects)]
+    conversions = sum(walk(obj, lambda value: value, lambda key: key) for obj in corpus)
+    print(f"Corpus: {args.objects} objects, {conversions} keys and leaves")
+
+    # Both variants must produce the same values
+    for obj in corpus[:1000]:
+        for key, value in obj.items():
+            assert legacy_decode_bytes_to_string(key) == decode_key(key)
+            if not isinstance(value, (dict, list)):
+                assert legacy_decode_bytes_to_string(value) == decode_bytes_to_string(value)
+
+    before = run(corpus, legacy_decode_bytes_to_string, legacy_decode_bytes_to_string, args.repeat)
+    after = run(corpus, decode_bytes_to_string, decode_key, args.repeat)
+
+    print(f"\n{'Variant':<8} {'Conversions/s':>15}")
+    print("-" * 24)
+    print(f"{'before':<8} {before:>15,.0f}")
+    print(f"{'after':<8} {after:>15,.0f}")
+    print(f"\nSpeedup: {after / before:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
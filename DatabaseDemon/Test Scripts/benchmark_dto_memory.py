@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark DTO Memory
+====================
+Measure the per-object memory of the slotted spell, item and mob DTOs
+(utils/slotted_dto.py) against equivalent plain dataclasses with a
+per-instance __dict__.
+
+A synthetic corpus is built for every DTO family: each object gets realistic
+field values, and string values are decoded freshly from bytes for every
+object, like the WAD conversion does. Three variants are measured with
+tracemalloc:
+
+- dict:     plain dataclass copies of the DTOs, strings not interned (old layout)
+- slotted:  the slotted DTOs, strings not interned
+- interned: the slotted DTOs with repeated names interned (what the factories build)
+
+Usage:
+    cd DatabaseDemon
+    python "Test Scripts/benchmark_dto_memory.py" [--objects N] [--families spells items mobs]
+"""
+
+import argparse
+import dataclasses
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+# Add DatabaseDemon to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.slotted_dto import intern_field_value
+
+# Values seen over and over in real data (schools, effect and behavior names...)
+STRING_VOCABULARY = [
+    "Fire", "Ice", "Storm", "Myth", "Life", "Death", "Balance", "Star", "Sun", "Moon", "Shadow",
+    "Max Health", "Max Mana", "Power Pip", "Accuracy", "Critical Rating", "Block Rating",
+    "Damage", "Heal", "Charm", "Ward", "NPCBehavior", "AnimationBehavior", "PathBehavior",
+]
+
+
+def get_dto_classes(family: str) -> List[Type]:
+    """Get the DTO classes of one family"""
+    if family == "spells":
+        from Spells.dtos import FixedSpellDTOFactory
+        mapping = FixedSpellDTOFactory.TYPE_MAPPING
+    elif family == "items":
+        from Items.dtos import ItemsDTOFactory
+        mapping = ItemsDTOFactory.TYPE_MAPPING
+    else:
+        from Mobs.dtos import MobsDTOFactory
+        mapping = {**MobsDTOFactory.MOB_TYPE_MAPPINGS, **MobsDTOFactory.BEHAVIOR_TYPE_MAPPINGS}
+    return list(dict.fromkeys(mapping.values()))
+
+
+def make_dict_class(dto_class: Type) -> Type:
+    """Build a plain (unslotted) dataclass with the same fields as a DTO class"""
+    dict_fields = []
+    for dto_field in dataclasses.fields(dto_class):
+        if dto_field.default_factory is not dataclasses.MISSING:
+            default = dataclasses.field(default_factory=dto_field.default_factory)
+        else:
+            default = dataclasses.field(default=dto_field.default)
+        dict_fields.append((dto_field.name, dto_field.type, default))
+    return dataclasses.make_dataclass(f"{dto_class.__name__}Dict", dict_fields)
+
+
+def make_record(dto_class: Type, rng: random.Random) -> Dict[str, Any]:
+    """Build the synthetic field values of one object (fresh string objects every time)"""
+    record = {}
+    for dto_field in dataclasses.fields(dto_class):
+        type_name = str(dto_field.type)
+        if "List" in type_name or "Dict" in type_name:
+            continue
+        if "str" in type_name:
+            record[dto_field.name] = rng.choice(STRING_VOCABULARY).encode("utf-8").decode("utf-8")
+        elif "float" in type_name:
+            record[dto_field.name] = rng.random() * 1000
+        elif "bool" in type_name:
+            record[dto_field.name] = rng.random() < 0.5
+        elif "int" in type_name:
+            record[dto_field.name] = rng.randrange(100000)
+    return record
+
+
+def measure(build: Callable[[], List[Any]]) -> Tuple[int, List[Any]]:
+    """Measure the memory retained by the objects a builder returns"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, objects
+
+
+def benchmark_family(family: str, object_count: int) -> Dict[str, float]:
+    """Build the synthetic corpus of one family in all three variants"""
+    classes = get_dto_classes(family)
+    dict_classes = {dto_class: make_dict_class(dto_class) for dto_class in classes}
+
+    def records():
+        rng = random.Random(7)
+        for i in range(object_count):
+            dto_class = classes[i % len(classes)]
+            yield dto_class, make_record(dto_class, rng)
+
+    def build_dict():
+        return [dict_classes[dto_class](**record) for dto_class, record in records()]
+
+    def build_slotted():
+        return [dto_class(**record) for dto_class, record in records()]
+
+    def build_interned():
+        return [dto_class(**{name: intern_field_value(name, value) for name, value in record.items()})
+                for dto_class, record in records()]
+
+    results = {}
+    for variant, build in (("dict", build_dict), ("slotted", build_slotted), ("interned", build_interned)):
+        size, objects = measure(build)
+        results[variant] = size / object_count
+        del objects
+    results["classes"] = len(classes)
+    return results
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark slotted DTO memory against plain dataclasses")
+    parser.add_argument("--objects", type=int, default=50000, help="Objects per DTO family (default: 50000)")
+    parser.add_argument("--families", nargs="+", choices=["spells", "items", "mobs"],
+                        default=["spells", "items", "mobs"], help="DTO families to benchmark")
+    args = parser.parse_args()
+
+    print(f"Objects per family: {args.objects}")
+    print(f"\n{'Family':<8} {'Classes':>7} {'dict B/obj':>11} {'slotted B/obj':>14} "
+          f"{'interned B/obj':>15} {'Saved':>7} {'Corpus saved':>13}")
+    print("-" * 82)
+
+    for family in args.families:
+        r = benchmark_family(family, args.objects)
+        saved = 1 - r["interned"] / r["dict"]
+        corpus_saved_mb = (r["dict"] - r["interned"]) * args.objects / (1024 * 1024)
+        print(f"{family:<8} {r['classes']:>7} {r['dict']:>11.0f} {r['slotted']:>14.0f} "
+              f"{r['interned']:>15.0f} {saved:>6.0%} {corpus_saved_mb:>10.1f} MB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark Type List Startup
+===========================
+Compare pipeline start-up cost of loading types.json directly against the
+cached compact type dump (utils/type_list_cache.py).
+
+Measures:
+- TypeList.open on the original types.json
+- Cold cache build (hash + minified dump + marshal snapshot)
+- Warm cached TypeList load
+- json.load of types.json vs the warm marshal snapshot
+
+Usage:
+    cd DatabaseDemon
+    python "Test Scripts/benchmark_type_list_startup.py" [types.json] [--runs N]
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add DatabaseDemon to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.type_list_cache import TypeListCache
+
+
+def time_call(func, runs: int) -> float:
+    """Run func the given number of times and return the best time in seconds"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def benchmark(types_path: Path, runs: int):
+    """Run the start-up benchmark against one types.json"""
+    from katsuba.op import TypeList
+
+    print("Type List Startup Benchmark")
+    print("=" * 50)
+    print(f"Types file: {types_path} ({types_path.stat().st_size / (1024 * 1024):.1f} MB)")
+    print(f"Runs per measurement: {runs} (best time reported)\n")
+
+    cache_dir = Path(tempfile.mkdtemp(prefix="type_cache_bench_"))
+    try:
+        # Fixed revision so the benchmark does not depend on an installed client
+        revision = "benchmark"
+
+        def load_json():
+            with open(types_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        direct_type_list = time_call(lambda: TypeList.open(str(types_path)), runs)
+        direct_json = time_call(load_json, runs)
+
+        def cold_build():
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            TypeListCache(types_path, cache_dir=cache_dir, revision=revision).rebuild()
+
+        cold = time_call(cold_build, 1)
+
+        warm_type_list = time_call(
+            lambda: TypeListCache(types_path, cache_dir=cache_dir, revision=revision).load_type_list(), runs)
+        warm_snapshot = time_call(
+            lambda: TypeListCache(types_path, cache_dir=cache_dir, revision=revision).load_types_data(), runs)
+
+        print("\nResults")
+        print("-" * 50)
+        print(f"TypeList.open(types.json):        {direct_type_list * 1000:10.1f} ms")
+        print(f"Cached TypeList (warm):           {warm_type_list * 1000:10.1f} ms "
+              f"({direct_type_list / warm_type_list:.2f}x)")
+        print(f"json.load(types.json):            {direct_json * 1000:10.1f} ms")
+        print(f"Marshal snapshot (warm):          {warm_snapshot * 1000:10.1f} ms "
+              f"({direct_json / warm_snapshot:.2f}x)")
+        print(f"Cold cache build (one-off):       {cold * 1000:10.1f} ms")
+
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark types.json start-up cost")
+    parser.add_argument("types_path", nargs="?", default=str(Path(__file__).parent.parent / "types.json"),
+                        help="Path to types.json (default: DatabaseDemon/types.json)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement (default: 5)")
+    args = parser.parse_args()
+
+    types_path = Path(args.types_path)
+    if not types_path.exists():
+        print(f"[ERROR] Types file not found: {types_path}")
+        return 1
+
+    benchmark(types_path, max(1, args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Generate Synthetic WAD
+======================
+Build an offline Root.wad fixture (utils/synthetic_wad.py) for tests and
+benchmarks on machines without a Wizard101 install.
+
+Writes to the output directory:
+- Root.wad: spells, ObjectData mobs/items/decks and TemplateManifest.xml
+- types.json: types dump of the synthetic classes
+- MobDecks/: deck JSON files for the Decks pipeline
+
+Usage:
+    cd DatabaseDemon
+    python "Test Scripts/generate_synthetic_wad.py" output_dir [--entries N] [--compress] [--verify]
+    python "Test Scripts/generate_synthetic_wad.py" output_dir --spells 2000 --mobs 500 --items 0 --decks 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add DatabaseDemon to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.synthetic_wad import SyntheticFixtureSpec, generate_fixture
+
+
+def verify_fixture(fixture, sample: int = 200):
+    """Deserialize a sample of every glob the pipelines use"""
+    from katsuba.wad import Archive
+    from katsuba.op import TypeList, Serializer, SerializerOptions
+
+    options = SerializerOptions()
+    options.shallow = False
+    options.skip_unknown_types = True
+    serializer = Serializer(options, TypeList.open(str(fixture.types_path)))
+    archive = Archive.heap(str(fixture.wad_path))
+
+    for pattern in ("Spells/*", "ObjectData/**/*.xml", "TemplateManifest.xml"):
+        files = list(archive.iter_glob(pattern))
+        for file_path in files[:sample]:
+            archive.deserialize(file_path, serializer)
+        print(f"[OK] {pattern}: {len(files):,} files ({min(sample, len(files)):,} deserialized)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Root.wad fixture")
+    parser.add_argument("output_dir", type=Path, help="Directory for Root.wad, types.json and MobDecks/")
+    parser.add_argument("--entries", type=int, default=1000,
+                        help="Total template files, split over spells/mobs/items/decks (default: 1000)")
+    parser.add_argument("--spells", type=int, help="Override number of spells")
+    parser.add_argument("--mobs", type=int, help="Override number of mobs")
+    parser.add_argument("--items", type=int, help="Override number of items")
+    parser.add_argument("--decks", type=int, help="Override number of decks")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument("--compress", action="store_true", help="Store entries zlib compressed")
+    parser.add_argument("--verify", action="store_true", help="Read the fixture back with katsuba")
+    args = parser.parse_args()
+
+    spec = SyntheticFixtureSpec.for_entries(args.entries, seed=args.seed, compress=args.compress)
+    for kind in ("spells", "mobs", "items", "decks"):
+        if getattr(args, kind) is not None:
+            setattr(spec, kind, getattr(args, kind))
+
+    print("Synthetic WAD Generator")
+    print("=" * 50)
+    print(f"Spells: {spec.spells:,}  Mobs: {spec.mobs:,}  Items: {spec.items:,}  Decks: {spec.decks:,}")
+    print(f"Seed: {spec.seed}  Compressed: {spec.compress}\n")
+
+    start = time.perf_counter()
+    fixture = generate_fixture(args.output_dir, spec, progress_interval=50000)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n[OK] Generated {spec.entry_count:,} entries in {elapsed:.1f}s")
+    print(f"  WAD:   {fixture.wad_path} ({fixture.wad_path.stat().st_size / (1024 * 1024):.1f} MB)")
+    print(f"  Types: {fixture.types_path}")
+    print(f"  Decks: {fixture.decks_dir}")
+
+    if args.verify:
+        print()
+        verify_fixture(fixture)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Wizard101 Database Diff - Cross-Revision Comparison
+===================================================
+Compares two revision databases of the same kind (spells, mobs or items)
+and reports added, removed and modified records with field-level changes,
+including nested effects, requirements and behaviors.
+
+Records are matched by hashing their full row tree, so unchanged records
+are skipped without a deep comparison.
+
+Usage:
+    cd DatabaseDemon
+    python database_diff.py OLD_DB NEW_DB [--kind spells|mobs|items] [--output REPORT.json]
+
+Options:
+    --kind KIND      Database kind (detected from the schema by default)
+    --output PATH    Write the full diff as JSON (default: print summary only)
+    --show N         Number of modified records to print (default: 20)
+
+Output:
+    - Summary of added/removed/modified records on stdout
+    - Optional JSON report with every field-level change
+"""
+
+import sys
+import argparse
+import time
+import traceback
+from pathlib import Path
+
+# Add DatabaseDemon to Python path for package imports
+sys.path.append(str(Path(__file__).parent))
+
+from utils.database_diff import DatabaseDiffer, DIFF_PROFILES, save_diff_report
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Diff two Wizard101 revision databases"
+    )
+    parser.add_argument('old_database', type=Path, help='Database of the older revision')
+    parser.add_argument('new_database', type=Path, help='Database of the newer revision')
+    parser.add_argument(
+        '--kind',
+        choices=sorted(DIFF_PROFILES.keys()),
+        default=None,
+        help='Database kind (default: detected from the schema)'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=None,
+        help='Write the full diff report as JSON'
+    )
+    parser.add_argument(
+        '--show',
+        type=int,
+        default=20,
+        help='Number of modified records to print (default: 20)'
+    )
+    return parser.parse_args()
+
+
+def print_diff(result, show: int):
+    """Print a human-readable diff summary"""
+    print("\n" + "=" * 60)
+    print(f"{result.kind.upper()} DIFF: {result.old_database} -> {result.new_database}")
+    print("=" * 60)
+    print(result.summary())
+
+    if result.added:
+        print(f"\nAdded ({len(result.added)}):")
+        for key in result.added[:show]:
+            print(f"  + {key}")
+
+    if result.removed:
+        print(f"\nRemoved ({len(result.removed)}):")
+        for key in result.removed[:show]:
+            print(f"  - {key}")
+
+    if result.modified:
+        print(f"\nModified ({len(result.modified)}):")
+        for record in result.modified[:show]:
+            label = f" ({record.label})" if record.label else ""
+            print(f"  * {record.key}{label}")
+            for table, table_diff in record.tables.items():
+                for changed in table_diff.changed_rows:
+                    row = ", ".join(f"{k}={v}" for k, v in changed["row"].items())
+                    for column, (old, new) in changed["changes"].items():
+                        location = f"{table}[{row}]" if row else table
+                        print(f"      {location}.{column}: {old!r} -> {new!r}")
+                if table_diff.added_rows:
+                    print(f"      {table}: {len(table_diff.added_rows)} rows added")
+                if table_diff.removed_rows:
+                    print(f"      {table}: {len(table_diff.removed_rows)} rows removed")
+
+    hidden = max(0, len(result.modified) - show)
+    if hidden:
+        print(f"\n... {hidden} more modified records (use --output for the full report)")
+
+
+def main():
+    """Main function to diff two revision databases"""
+    args = parse_arguments()
+
+    print("Wizard101 Database Diff")
+    print("=" * 50)
+
+    try:
+        start = time.perf_counter()
+        result = DatabaseDiffer(args.old_database, args.new_database, kind=args.kind).diff()
+        if result is None:
+            print("[ERROR] Database diff failed")
+            return 1
+        elapsed = time.perf_counter() - start
+
+        print_diff(result, args.show)
+        print(f"\nDiff time: {elapsed:.2f}s")
+
+        if args.output:
+            if not save_diff_report(result, args.output):
+                return 1
+            print(f"Report saved to: {args.output}")
+
+        return 0
+
+    except Exception as e:
+        print(f"\nUnexpected error: {e}")
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
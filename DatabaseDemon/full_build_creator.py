@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Wizard101 Full Build - Combined Entry Point
+===========================================
+Creates every DatabaseDemon database in one process from one Root.wad session.
+
+This script:
+1. Opens Root.wad and loads types.json once (WadSession)
+2. Builds the spell database from Spells/*.xml
+3. Builds the TemplateManifest database
+4. Builds the mob and items databases from one ObjectData scan
+5. Builds the deck database from the extracted MobDecks XML files
+
+Steps 2-4 share the archive mapping, TypeList and Serializer of the session,
+so the archive and the type list are loaded once instead of once per
+pipeline. The deck pipeline reads loose XML files and needs neither.
+
+Usage:
+    cd DatabaseDemon
+    python full_build_creator.py [--builders NAME ...] [--workers N] [--no-bulk-load]
+                                 [stage metrics options]
+
+Options:
+    --builders NAME ...   Databases to build: spells, template_manifest,
+                          object_data (mobs and items), decks (default: all)
+    --workers N           Extract spells with N worker processes (default: 1).
+                          Workers open their own archive and type list.
+    --no-bulk-load        Create indexes before loading instead of after.
+
+Stage metrics options apply to every database built; see --help.
+
+Requirements:
+    - types.json file in the DatabaseDemon directory
+    - Wizard101 installed with accessible Root.wad file
+    - Python packages: katsuba, sqlite3 (built-in)
+
+Output:
+    - database/ - Spell, TemplateManifest, mob and items databases
+    - Decks/database/wizard101_decks.db - Deck database
+"""
+
+import sys
+import argparse
+import time
+import traceback
+from pathlib import Path
+
+# Add DatabaseDemon to Python path for package imports
+sys.path.append(str(Path(__file__).parent))
+
+from utils.wad_session import WadSession
+from utils.bulk_load import add_bulk_load_argument
+from utils.stage_metrics import StageMetrics, add_metrics_arguments, apply_metrics_arguments
+from object_data_creator import create_object_data_databases, get_platform_paths
+from Spells.processors.DatabaseCreator import DatabaseCreator as SpellDatabaseCreator
+from TemplateManifest.processors.DatabaseCreator import TemplateManifestDatabaseCreator
+from Mobs.processors.DatabaseCreator import MobDatabaseCreator
+from Items.processors.DatabaseCreator import ItemsDatabaseCreator
+from Decks.processors.DatabaseCreator import DatabaseCreator as DeckDatabaseCreator
+
+
+BUILDERS = ("spells", "template_manifest", "object_data", "decks")
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Create all Wizard101 databases from one Root.wad session"
+    )
+    parser.add_argument(
+        '--builders',
+        nargs='+',
+        choices=BUILDERS,
+        default=list(BUILDERS),
+        metavar='NAME',
+        help=f'Databases to build (default: all of {", ".join(BUILDERS)})'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of spell extraction worker processes (default: 1, serial)'
+    )
+    add_bulk_load_argument(parser)
+    add_metrics_arguments(parser)
+    return parser.parse_args()
+
+
+def build_spells(session: WadSession, args) -> bool:
+    """Build the spell database from the shared session"""
+    creator = SpellDatabaseCreator(workers=args.workers, session=session,
+                                   bulk_load=not args.no_bulk_load)
+    apply_metrics_arguments(args, creator.metrics)
+    try:
+        if not creator.initialize():
+            print("[ERROR] Failed to initialize spell database creator")
+            return False
+        if not creator.process_all_spells():
+            print("[ERROR] Spell processing failed")
+            return False
+        creator.print_summary()
+        return True
+    finally:
+        creator.cleanup()
+
+
+def build_template_manifest(session: WadSession, args) -> bool:
+    """Build the TemplateManifest database from the shared session"""
+    creator = TemplateManifestDatabaseCreator(session=session, bulk_load=not args.no_bulk_load)
+    apply_metrics_arguments(args, creator.metrics)
+    return creator.create_database()
+
+
+def build_object_data(session: WadSession, args) -> bool:
+    """Build the mob and items databases from one scan of the shared session"""
+    metrics = StageMetrics()
+    apply_metrics_arguments(args, metrics)
+    mob_creator = MobDatabaseCreator(bulk_load=not args.no_bulk_load, metrics=metrics)
+    items_creator = ItemsDatabaseCreator(bulk_load=not args.no_bulk_load, metrics=metrics)
+    try:
+        return create_object_data_databases(session, mob_creator, items_creator, metrics)
+    finally:
+        if mob_creator.connection:
+            mob_creator.close()
+        items_creator.cleanup()
+
+
+def build_decks(args) -> bool:
+    """Build the deck database from the extracted MobDecks XML files"""
+    database_dir = Path(__file__).parent / "Decks" / "database"
+    database_dir.mkdir(parents=True, exist_ok=True)
+    creator = DeckDatabaseCreator(database_dir / "wizard101_decks.db", bulk_load=not args.no_bulk_load)
+    apply_metrics_arguments(args, creator.metrics)
+    return creator.create_full_database()
+
+
+def main():
+    """Main function to create all databases from one WAD session"""
+    args = parse_arguments()
+
+    print("Wizard101 Full Database Build")
+    print("=" * 50)
+
+    wad_path, types_path = get_platform_paths()
+    if not types_path.exists():
+        print(f"ERROR: types.json file not found at {types_path}")
+        return 1
+    if not wad_path.exists():
+        print(f"ERROR: Root.wad file not found at {wad_path}")
+        return 1
+
+    session = WadSession(wad_path, types_path)
+    results = {}
+    seconds = {}
+
+    try:
+        open_start = time.perf_counter()
+        if not session.open():
+            print("[ERROR] Failed to open WAD session")
+            return 1
+        print(f"[OK] WAD session opened once for all builders in {time.perf_counter() - open_start:.2f}s")
+
+        for builder in args.builders:
+            print(f"\n{'=' * 50}\nBuilding {builder}\n{'=' * 50}")
+            start = time.perf_counter()
+            try:
+                if builder == "spells":
+                    results[builder] = build_spells(session, args)
+                elif builder == "template_manifest":
+                    results[builder] = build_template_manifest(session, args)
+                elif builder == "object_data":
+                    results[builder] = build_object_data(session, args)
+                else:
+                    results[builder] = build_decks(args)
+            except Exception as e:
+                print(f"[ERROR] {builder} build failed: {e}")
+                traceback.print_exc()
+                results[builder] = False
+            seconds[builder] = time.perf_counter() - start
+
+    except KeyboardInterrupt:
+        print("\nDatabase creation interrupted by user")
+        return 1
+
+    finally:
+        session.close()
+
+    print(f"\n{'=' * 50}\nFull build summary\n{'=' * 50}")
+    for builder, success in results.items():
+        print(f"{builder:<20} {'OK' if success else 'FAILED':<8} {seconds[builder]:>8.2f}s")
+
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
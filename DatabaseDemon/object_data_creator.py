@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Wizard101 ObjectData Database Creator - Combined Entry Point
+===========================================================
+Creates the mob and item SQLite databases from a single pass over Root.wad.
+
+This script:
+1. Opens Root.wad and types.json once
+2. Walks ObjectData/**/*.xml once, deserializing every file a single time
+3. Routes WizGameObjectTemplate objects to the mob database creator
+4. Routes WizItemTemplate objects to the items database creator
+5. Writes both databases and their reports in the same run
+
+Usage:
+    cd DatabaseDemon
+    python object_data_creator.py [--base-mob-database PATH] [--base-items-database PATH]
+                                  [--compress-failures] [--no-bulk-load]
+                                  [stage metrics options]
+
+Options:
+    --base-mob-database PATH    Patch a copy of a previous mob database
+    --base-items-database PATH  Patch a copy of a previous items database
+                                Only ObjectData entries added, changed or removed
+                                since the base build (per its .manifest.json) are
+                                deserialized and re-inserted.
+    --compress-failures         Gzip the mob_failures.jsonl failure log
+    --no-bulk-load              Create indexes before loading instead of after.
+                                By default fresh builds load with relaxed
+                                durability and build all indexes (plus ANALYZE)
+                                once the scan completes.
+
+Requirements:
+    - types.json file in the DatabaseDemon directory
+    - Wizard101 installed with accessible Root.wad file
+    - Python packages: katsuba, sqlite3 (built-in)
+
+Output:
+    - database/mob_templates_{timestamp}.db - Mob database
+    - database/item_templates_{timestamp}.db - Items database
+    - *.db.manifest.json - WAD manifests for incremental rebuilds
+"""
+
+import sys
+import argparse
+import platform
+import traceback
+from pathlib import Path
+
+# Add DatabaseDemon to Python path for package imports
+sys.path.append(str(Path(__file__).parent))
+
+from utils.object_data_scanner import (
+    ObjectDataScanner, WIZ_GAME_OBJECT_TEMPLATE_HASH, WIZ_ITEM_TEMPLATE_HASH
+)
+from utils.wad_session import WadSession
+from utils.bulk_load import add_bulk_load_argument
+from utils.stage_metrics import (
+    METRICS_OPTIONS_HELP, StageMetrics, add_metrics_arguments, apply_metrics_arguments
+)
+from Mobs.processors.DatabaseCreator import MobDatabaseCreator
+from Items.processors.DatabaseCreator import ItemsDatabaseCreator
+
+
+def get_platform_paths():
+    """Get platform-specific paths for WAD and types files"""
+    system = platform.system().lower()
+
+    if system == "windows":
+        wad_path = Path("C:/ProgramData/KingsIsle Entertainment/Wizard101/Data/GameData/Root.wad")
+    else:  # Linux or other
+        wad_path = Path("/mnt/c/ProgramData/KingsIsle Entertainment/Wizard101/Data/GameData/Root.wad")
+    types_path = Path(__file__).parent / "types.json"
+
+    return wad_path, types_path
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Create the Wizard101 mob and items databases in one pass over Root.wad"
+    )
+    parser.add_argument(
+        '--base-mob-database',
+        type=Path,
+        default=None,
+        help='Previous mob database to patch incrementally (default: full build)'
+    )
+    parser.add_argument(
+        '--base-items-database',
+        type=Path,
+        default=None,
+        help='Previous items database to patch incrementally (default: full build)'
+    )
+    parser.add_argument(
+        '--compress-failures',
+        action='store_true',
+        help='Gzip the mob_failures.jsonl failure log'
+    )
+    add_bulk_load_argument(parser)
+    add_metrics_arguments(parser)
+    return parser.parse_args()
+
+
+def create_object_data_databases(session: WadSession, mob_creator: MobDatabaseCreator,
+                                 items_creator: ItemsDatabaseCreator, metrics: StageMetrics) -> bool:
+    """
+    Create the mob and items databases from one ObjectData scan
+
+    Args:
+        session: WAD session to scan (opened here if needed)
+        mob_creator: Mob database creator (consumer of WizGameObjectTemplate)
+        items_creator: Items database creator (consumer of WizItemTemplate)
+        metrics: Stage metrics shared by both databases
+
+    Returns:
+        True if both databases were written
+    """
+    if not mob_creator.initialize() or not mob_creator.create_database():
+        print("[ERROR] Failed to create mob database")
+        return False
+
+    if not items_creator.initialize_database():
+        print("[ERROR] Failed to initialize items database")
+        return False
+
+    with metrics.stage("open"):
+        opened = session.open()
+    if not opened:
+        print("[ERROR] Failed to open WAD session")
+        return False
+
+    scanner = ObjectDataScanner(session.archive, session.serializer, session.type_list,
+                                metrics=metrics)
+    scanner.register_consumer(WIZ_GAME_OBJECT_TEMPLATE_HASH, mob_creator)
+    scanner.register_consumer(WIZ_ITEM_TEMPLATE_HASH, items_creator)
+
+    print("\nScanning ObjectData for mobs and items...")
+    if not scanner.scan():
+        print("[ERROR] ObjectData scan failed")
+        return False
+
+    print(f"\nMob database: {mob_creator.database_path}")
+    print(f"Items database: {items_creator.database_path}")
+    return True
+
+
+def main():
+    """Main function to create the mob and item databases in one pass"""
+    args = parse_arguments()
+
+    print("Wizard101 ObjectData Database Creator")
+    print("=" * 50)
+
+    wad_path, types_path = get_platform_paths()
+    if not types_path.exists():
+        print(f"ERROR: types.json file not found at {types_path}")
+        return 1
+    if not wad_path.exists():
+        print(f"ERROR: Root.wad file not found at {wad_path}")
+        return 1
+
+    # Both databases record the stage metrics of the shared scan
+    metrics = StageMetrics()
+    apply_metrics_arguments(args, metrics)
+    mob_creator = MobDatabaseCreator(base_database=args.base_mob_database,
+                                     compress_failures=args.compress_failures,
+                                     bulk_load=not args.no_bulk_load,
+                                     metrics=metrics)
+    items_creator = ItemsDatabaseCreator(base_database=args.base_items_database,
+                                         bulk_load=not args.no_bulk_load,
+                                         metrics=metrics)
+
+    try:
+        session = WadSession(wad_path, types_path)
+        if not create_object_data_databases(session, mob_creator, items_creator, metrics):
+            return 1
+        return 0
+
+    except KeyboardInterrupt:
+        print("\nDatabase creation interrupted by user")
+        return 1
+
+    except Exception as e:
+        print(f"\nUnexpected error: {e}")
+        traceback.print_exc()
+        return 1
+
+    finally:
+        if mob_creator.connection:
+            mob_creator.close()
+        items_creator.cleanup()
+
+
+def show_help():
+    """Show help information"""
+    print(__doc__)
+    print(METRICS_OPTIONS_HELP)
+
+
+if __name__ == "__main__":
+    # Check for help flag
+    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help', 'help']:
+        show_help()
+        sys.exit(0)
+
+    sys.exit(main())
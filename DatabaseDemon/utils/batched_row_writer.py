@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Batched Row Writer
+==================
+Buffers INSERT rows per statement and writes them with executemany in one
+transaction per flush, instead of one cursor.execute per row.
+
+Rows are staged per record (one spell, item, mob...). A record's rows only
+reach the flush buffer once the record is accepted, so a record that fails
+during extraction is dropped as a whole. If a flush hits a database error,
+the batch is rolled back and replayed record by record, so only the records
+whose own rows fail are rejected and every other record is still written.
+"""
+
+import sqlite3
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# (statement, parameters)
+BufferedRow = Tuple[str, Sequence[Any]]
+
+
+class BatchedRowWriter:
+    """Accumulates rows per statement and flushes them with executemany"""
+
+    def __init__(self, connection: sqlite3.Connection, flush_size: int = 5000,
+                 on_record_failed: Optional[Callable[[Any, Any, str], None]] = None):
+        """
+        Initialize the writer
+
+        Args:
+            connection: SQLite connection to write to
+            flush_size: Number of buffered rows that triggers a flush
+            on_record_failed: Called with (key, context, error) for each record
+                              rejected by the database during a flush
+        """
+        self.connection = connection
+        self.flush_size = max(1, flush_size)
+        self.on_record_failed = on_record_failed
+
+        # Rows of the record currently being built
+        self._staged_rows: List[BufferedRow] = []
+        self._record_open = False
+
+        # Accepted records waiting for the next flush: (key, context, rows)
+        self._records: List[Tuple[Any, Any, List[BufferedRow]]] = []
+        self._buffered_row_count = 0
+
+        # Statistics
+        self.total_rows_written = 0
+        self.total_flushes = 0
+        self.total_failed_records = 0
+
+    def begin_record(self):
+        """Start staging the rows of a new record (discards an unfinished one)"""
+        self._staged_rows = []
+        self._record_open = True
+
+    def add(self, sql: str, params: Sequence[Any], staged: bool = True):
+        """
+        Buffer one row
+
+        Rows added while a record is open belong to that record. Rows added
+        outside a record, or with staged=False (logs that must survive a
+        failed record), are buffered on their own.
+
+        Args:
+            sql: INSERT statement with ? placeholders
+            params: Parameters for the statement
+            staged: Whether the row belongs to the open record
+        """
+        if staged and self._record_open:
+            self._staged_rows.append((sql, params))
+        else:
+            self._records.append((None, None, [(sql, params)]))
+            self._buffered_row_count += 1
+
+    def commit_record(self, key: Any, context: Any = None):
+        """
+        Accept the open record so its rows are written with the next flush
+
+        The record is not flushed here, so callers can finish their own
+        bookkeeping for it before calling flush_if_full().
+
+        Args:
+            key: Record key reported back if the record fails to flush
+            context: Optional data handed to on_record_failed (e.g. the raw record)
+        """
+        rows = self._staged_rows
+        self._staged_rows = []
+        self._record_open = False
+
+        self._records.append((key, context, rows))
+        self._buffered_row_count += len(rows)
+
+    def discard_record(self):
+        """Drop all rows staged for the open record"""
+        self._staged_rows = []
+        self._record_open = False
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of accepted rows not yet written"""
+        return self._buffered_row_count
+
+    def flush_if_full(self) -> List[Any]:
+        """
+        Flush once the buffered rows reach flush_size
+
+        Returns:
+            Keys of records rejected by the database (empty if nothing was flushed)
+        """
+        if self._buffered_row_count >= self.flush_size:
+            return self.flush()
+        return []
+
+    def flush(self) -> List[Any]:
+        """
+        Write all accepted records and commit
+
+        Returns:
+            Keys of records rejected by the database
+        """
+        if not self._records:
+            self.connection.commit()
+            return []
+
+        records = self._records
+        self._records = []
+        self._buffered_row_count = 0
+
+        cursor = self.connection.cursor()
+        failed_keys = []
+
+        cursor.execute("SAVEPOINT batched_row_writer")
+        try:
+            self._execute_grouped(cursor, records)
+            cursor.execute("RELEASE SAVEPOINT batched_row_writer")
+        except sqlite3.Error:
+            # Replay record by record so only the offending records are rejected
+            cursor.execute("ROLLBACK TO SAVEPOINT batched_row_writer")
+            cursor.execute("RELEASE SAVEPOINT batched_row_writer")
+            failed_keys = self._execute_isolated(cursor, records)
+
+        self.connection.commit()
+        self.total_flushes += 1
+        return failed_keys
+
+    def _execute_grouped(self, cursor: sqlite3.Cursor, records: List[Tuple[Any, Any, List[BufferedRow]]]):
+        """Write all rows with one executemany per statement, in first-seen statement order"""
+        grouped: Dict[str, List[Sequence[Any]]] = {}
+        for _, _, rows in records:
+            for sql, params in rows:
+                grouped.setdefault(sql, []).append(params)
+
+        for sql, params_list in grouped.items():
+            cursor.executemany(sql, params_list)
+
+        self.total_rows_written += sum(len(params_list) for params_list in grouped.values())
+
+    def _execute_isolated(self, cursor: sqlite3.Cursor,
+                          records: List[Tuple[Any, Any, List[BufferedRow]]]) -> List[Any]:
+        """Write records one at a time, rolling back and reporting the ones that fail"""
+        failed_keys = []
+
+        for key, context, rows in records:
+            cursor.execute("SAVEPOINT batched_row_record")
+            try:
+                for sql, params in rows:
+                    cursor.execute(sql, params)
+                cursor.execute("RELEASE SAVEPOINT batched_row_record")
+                self.total_rows_written += len(rows)
+            except sqlite3.Error as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT batched_row_record")
+                cursor.execute("RELEASE SAVEPOINT batched_row_record")
+                if key is None:
+                    print(f"[ERROR] Failed to write row: {e}")
+                    continue
+                failed_keys.append(key)
+                self.total_failed_records += 1
+                if self.on_record_failed:
+                    self.on_record_failed(key, context, f"Database error: {e}")
+                else:
+                    print(f"[ERROR] Failed to write record {key}: {e}")
+
+        return failed_keys
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+SQLite Bulk Load
+================
+Bulk-load mode for freshly created databases.
+
+Tables are created up front, but index creation is deferred until all rows
+are loaded, so inserts do not have to maintain ~45 B-trees row by row. While
+loading, the connection runs with an in-memory rollback journal, no fsync
+and a large page cache. At the end all indexes are built in one go, ANALYZE
+refreshes the query planner statistics and the original journal and sync
+settings are restored.
+
+The journal is kept in memory rather than switched off, so ROLLBACK and
+SAVEPOINT keep working (the batched spell writer relies on them for
+per-record error isolation). A crash mid-build can corrupt the database,
+which is acceptable for a fresh build that would be rerun anyway; the mode
+is not used when patching an existing database.
+
+Under a memory budget the page cache can be shrunk while loading with
+set_cache_mb().
+
+Builder scripts expose the mode through the --no-bulk-load option added by
+add_bulk_load_argument().
+"""
+
+import argparse
+import sqlite3
+import time
+from typing import Iterable, List
+
+
+# Page cache size while loading
+BULK_LOAD_CACHE_MB = 256
+
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    f"PRAGMA cache_size = -{BULK_LOAD_CACHE_MB * 1024}",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class BulkLoader:
+    """Defers index creation and relaxes durability while a fresh database is loaded"""
+
+    def __init__(self, connection: sqlite3.Connection, index_statements: Iterable[str]):
+        """
+        Initialize the bulk loader
+
+        Args:
+            connection: Connection of the freshly created database
+            index_statements: CREATE INDEX statements to run once loading is done
+        """
+        self.connection = connection
+        self.index_statements: List[str] = list(index_statements)
+        self.active = False
+        self.cache_mb = BULK_LOAD_CACHE_MB
+
+        self._journal_mode = None
+        self._synchronous = None
+        self._cache_size = None
+
+        # Timing
+        self.load_start = None
+        self.load_seconds = 0.0
+        self.index_seconds = 0.0
+
+    def begin(self):
+        """Switch the connection to bulk-load settings"""
+        if self.active:
+            return
+
+        self.connection.commit()
+        self._journal_mode = self.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self._synchronous = self.connection.execute("PRAGMA synchronous").fetchone()[0]
+        self._cache_size = self.connection.execute("PRAGMA cache_size").fetchone()[0]
+
+        for pragma in BULK_LOAD_PRAGMAS:
+            self.connection.execute(pragma)
+
+        self.active = True
+        self.load_start = time.perf_counter()
+        print(f"[INFO] Bulk-load mode: {len(self.index_statements)} indexes deferred until the load completes")
+
+    def set_cache_mb(self, cache_mb: int):
+        """Resize the page cache used while loading (e.g. to stay under a memory budget)"""
+        self.cache_mb = cache_mb
+        if self.active:
+            self.connection.execute(f"PRAGMA cache_size = -{cache_mb * 1024}")
+
+    def finish(self) -> bool:
+        """
+        Build the deferred indexes, run ANALYZE and restore the connection settings
+
+        Returns:
+            True if every index was created
+        """
+        if not self.active:
+            return True
+
+        self.connection.commit()
+        self.load_seconds = time.perf_counter() - self.load_start
+
+        index_start = time.perf_counter()
+        failed = 0
+        for index_statement in self.index_statements:
+            try:
+                self.connection.execute(index_statement)
+            except sqlite3.OperationalError as e:
+                if "already exists" not in str(e):
+                    failed += 1
+                    print(f"Warning: Failed to create index: {e}")
+
+        self.connection.execute("ANALYZE")
+        self.connection.commit()
+        self.index_seconds = time.perf_counter() - index_start
+
+        self.connection.execute(f"PRAGMA journal_mode = {self._journal_mode}")
+        self.connection.execute(f"PRAGMA synchronous = {self._synchronous}")
+        self.connection.execute(f"PRAGMA cache_size = {self._cache_size}")
+        self.active = False
+
+        print(f"[OK] Bulk load finished: load {self.load_seconds:.2f}s, "
+              f"{len(self.index_statements) - failed} indexes + ANALYZE {self.index_seconds:.2f}s")
+        return failed == 0
+
+
+def add_bulk_load_argument(parser: argparse.ArgumentParser):
+    """Add the --no-bulk-load option shared by the builder scripts"""
+    parser.add_argument(
+        '--no-bulk-load',
+        action='store_true',
+        help='Create indexes before loading instead of after (default: bulk-load fresh builds)'
+    )
@@ -71,9 +71,8 @@ class ClassDefinitionExtractor:
             with open(self.types_json_path, 'r', encoding='utf-8') as f:
                 self.types_content = f.read()
             
-            # Also load as JSON for validation
-            with open(self.types_json_path, 'r', encoding='utf-8') as f:
-                self.types_data = json.load(f)
+            # Parse the same text for validation instead of reading the file again
+            self.types_data = json.loads(self.types_content)
             
             print(f"[OK] Loaded types data ({len(self.types_content):,} characters)")
             print(f"[OK] Found {len(self.types_data):,} type definitions")
@@ -5,58 +5,100 @@ Centralized utilities for converting katsuba LazyObjects to dictionaries
 with proper byte string decoding and type handling.
 """
 
-from typing import Dict, Any, Optional, List
+import sys
+from typing import Any, Callable, Dict, List, Optional
 from katsuba.op import LazyObject, LazyList, TypeList, Vec3, Quaternion, Matrix, Euler, PointInt, PointFloat, SizeInt, RectInt, RectFloat, Color
 
 
+def _decode_bytes(value: bytes) -> str:
+    """Decode bytes as UTF-8, falling back to latin-1"""
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        # If UTF-8 fails, try latin-1 as fallback
+        try:
+            return value.decode('latin-1')
+        except UnicodeDecodeError:
+            # If all decoding fails, return as string representation
+            return str(value)
+
+
+# Converters for katsuba geometric/color objects and bytes, keyed by exact type
+_DECODERS: Dict[type, Callable[[Any], str]] = {
+    Vec3: lambda value: f"(x={value.x}, y={value.y}, z={value.z})",
+    Quaternion: lambda value: f"(x={value.x}, y={value.y}, z={value.z}, w={value.w})",
+    Matrix: lambda value: f"[{value.i}, {value.j}, {value.k}]",
+    Euler: lambda value: f"(pitch={value.pitch}, yaw={value.yaw}, roll={value.roll})",
+    PointInt: lambda value: f"(x={value.x}, y={value.y})",
+    PointFloat: lambda value: f"(x={value.x}, y={value.y})",
+    SizeInt: lambda value: f"({value.width}, {value.height})",
+    RectInt: lambda value: f"(left={value.left}, top={value.top}, right={value.right}, bottom={value.bottom})",
+    RectFloat: lambda value: f"(left={value.left}, top={value.top}, right={value.right}, bottom={value.bottom})",
+    Color: lambda value: f"(r={value.r}, g={value.g}, b={value.b}, a={value.a})",
+    bytes: _decode_bytes,
+}
+
+# Leaf types that are returned unchanged (the vast majority of values)
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, str, type(None)})
+
+# Decoded and interned property names, the same few hundred repeat in every object
+_KEY_CACHE: Dict[Any, Any] = {}
+_KEY_CACHE_LIMIT = 65536
+
+
 def decode_bytes_to_string(value: Any) -> Any:
     """
     Decode bytes objects to UTF-8 strings and convert katsuba objects to readable strings.
     
+    Plain ints, floats, bools, strings and None return immediately; bytes and
+    katsuba objects are dispatched on their exact type. Subclasses of those
+    types fall back to isinstance checks.
+    
     Args:
         value: Any value that might be a bytes object or katsuba geometric/color object
         
     Returns:
         Decoded/converted string if input was bytes or katsuba object, otherwise original value
     """
-    # Handle katsuba geometric and color objects
-    if isinstance(value, Vec3):
-        return f"(x={value.x}, y={value.y}, z={value.z})"
-    
-    elif isinstance(value, Quaternion):
-        return f"(x={value.x}, y={value.y}, z={value.z}, w={value.w})"
+    value_type = type(value)
+    if value_type in _PASSTHROUGH_TYPES:
+        return value
     
-    elif isinstance(value, Matrix):
-        return f"[{value.i}, {value.j}, {value.k}]"
+    decoder = _DECODERS.get(value_type)
+    if decoder is not None:
+        return decoder(value)
     
-    elif isinstance(value, Euler):
-        return f"(pitch={value.pitch}, yaw={value.yaw}, roll={value.roll})"
+    for decoder_type, decoder in _DECODERS.items():
+        if isinstance(value, decoder_type):
+            return decoder(value)
     
-    elif isinstance(value, (PointInt, PointFloat)):
-        return f"(x={value.x}, y={value.y})"
-    
-    elif isinstance(value, SizeInt):
-        return f"({value.width}, {value.height})"
-    
-    elif isinstance(value, (RectInt, RectFloat)):
-        return f"(left={value.left}, top={value.top}, right={value.right}, bottom={value.bottom})"
-    
-    elif isinstance(value, Color):
-        return f"(r={value.r}, g={value.g}, b={value.b}, a={value.a})"
+    return value
+
+
+def decode_key(key: Any) -> Any:
+    """
+    Decode a property name once and return the shared interned string
     
-    # Handle bytes objects
-    elif isinstance(value, bytes):
-        try:
-            return value.decode('utf-8')
-        except UnicodeDecodeError:
-            # If UTF-8 fails, try latin-1 as fallback
-            try:
-                return value.decode('latin-1')
-            except UnicodeDecodeError:
-                # If all decoding fails, return as string representation
-                return str(value)
+    Args:
+        key: Property name from LazyObject.items()
+        
+    Returns:
+        Decoded, interned property name
+    """
+    try:
+        return _KEY_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable key, nothing to cache
+        return decode_bytes_to_string(key)
     
-    return value
+    decoded = decode_bytes_to_string(key)
+    if type(decoded) is str:
+        decoded = sys.intern(decoded)
+    if len(_KEY_CACHE) < _KEY_CACHE_LIMIT:
+        _KEY_CACHE[key] = decoded
+    return decoded
 
 
 def convert_lazy_object_to_dict(obj: Any, type_list: Optional[TypeList] = None) -> Dict[str, Any]:
@@ -98,8 +140,8 @@ def convert_lazy_object_to_dict(obj: Any, type_list: Optional[TypeList] = None)
             # Convert LazyObject to dictionary
             result = {}
             for key, value in obj.items(type_list):
-                # Ensure key is also decoded if it's bytes
-                decoded_key = decode_bytes_to_string(key)
+                # Ensure key is also decoded if it's bytes (once per distinct key)
+                decoded_key = decode_key(key)
                 
                 if isinstance(value, (LazyObject, LazyList)):
                     # Recursively convert nested LazyObjects/LazyLists
@@ -133,6 +175,32 @@ def convert_lazy_object_to_dict(obj: Any, type_list: Optional[TypeList] = None)
     return decode_bytes_to_string(obj)
 
 
+def convert_field_value(value: Any, type_list: Optional[TypeList] = None, hash_only: bool = False) -> Any:
+    """
+    Convert a single field value of a LazyObject exactly as the dict conversion does.
+    
+    Used when only some fields of an object are materialized (see utils/lazy_dto_builder.py).
+    
+    Args:
+        value: Field value from LazyObject.items()
+        type_list: Optional TypeList for resolving type names
+        hash_only: Use type hashes instead of type names for nested objects
+        
+    Returns:
+        Converted value (dict, list or decoded primitive)
+    """
+    convert = convert_lazy_object_to_dict_with_hash_only if hash_only else convert_lazy_object_to_dict
+    
+    if isinstance(value, (LazyObject, LazyList)):
+        return convert(value, type_list)
+    
+    if isinstance(value, list):
+        # Primitive items are decoded by the converters as well
+        return [convert(item, type_list) for item in value]
+    
+    return decode_bytes_to_string(value)
+
+
 def convert_lazy_object_to_dict_with_hash_only(obj: Any, type_list: Optional[TypeList] = None) -> Dict[str, Any]:
     """
     Alternative conversion that uses type hash instead of type name.
@@ -163,7 +231,7 @@ def convert_lazy_object_to_dict_with_hash_only(obj: Any, type_list: Optional[Typ
         try:
             result = {}
             for key, value in obj.items(type_list):
-                decoded_key = decode_bytes_to_string(key)
+                decoded_key = decode_key(key)
                 
                 if isinstance(value, (LazyObject, LazyList)):
                     result[decoded_key] = convert_lazy_object_to_dict_with_hash_only(value, type_list)
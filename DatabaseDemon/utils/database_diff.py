@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Database Diff
+=============
+Cross-revision diff engine for the spell, mob and item databases.
+
+Every record (a spell_cards/mob_templates/item_templates row plus all rows
+keyed to it in the child tables) is reduced to a single hash of its full row
+tree. The hashes of both databases are computed table by table with one
+query per table, so unchanged records are matched without ever being
+compared field by field. Only records whose hashes differ are loaded again
+and diffed down to the changed columns of each nested row (effects,
+requirements, behaviors, ...).
+
+Surrogate ids and timestamps differ between builds of identical data and are
+excluded from both the hash and the field-level comparison.
+"""
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+# Columns whose values depend on the build, not on the game data
+IGNORED_COLUMNS = {
+    "id", "behavior_id", "equipment_behavior_id",
+    "created_at", "updated_at", "processed_at", "detected_at",
+}
+
+
+@dataclass
+class DiffProfile:
+    """Describes how records are laid out in one database kind"""
+    kind: str
+    root_table: str
+    key_column: str
+    label_column: str
+    excluded_tables: Set[str] = field(default_factory=set)
+
+
+DIFF_PROFILES = {
+    "spells": DiffProfile("spells", "spell_cards", "filename", "m_name",
+                          {"processing_metadata", "duplicate_log", "skipped_elements"}),
+    "mobs": DiffProfile("mobs", "mob_templates", "template_id", "object_name"),
+    "items": DiffProfile("items", "item_templates", "filename", "m_displayName",
+                         {"item_processing_stats"}),
+}
+
+
+@dataclass
+class TableDiff:
+    """Row-level changes of one table within a record"""
+    changed_rows: List[Dict[str, Any]] = field(default_factory=list)  # {"row": identity, "changes": {col: [old, new]}}
+    added_rows: List[Dict[str, Any]] = field(default_factory=list)
+    removed_rows: List[Dict[str, Any]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Check whether the table has no changes"""
+        return not (self.changed_rows or self.added_rows or self.removed_rows)
+
+
+@dataclass
+class RecordDiff:
+    """Field-level changes of one modified record"""
+    key: Any
+    label: Optional[str]
+    tables: Dict[str, TableDiff] = field(default_factory=dict)
+
+
+@dataclass
+class DatabaseDiffResult:
+    """Result of diffing two databases of the same kind"""
+    kind: str
+    old_database: str
+    new_database: str
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    modified: List[RecordDiff] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    def summary(self) -> str:
+        """One-line summary of the diff"""
+        return (f"{len(self.added)} added, {len(self.removed)} removed, "
+                f"{len(self.modified)} modified, {self.unchanged_count} unchanged")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
+
+
+def detect_database_kind(connection: sqlite3.Connection) -> Optional[str]:
+    """Detect whether a database holds spells, mobs or items"""
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for kind, profile in DIFF_PROFILES.items():
+        if profile.root_table in tables:
+            return kind
+    return None
+
+
+class DatabaseDiffer:
+    """Diffs two revision databases of the same kind"""
+
+    def __init__(self, old_database: Path, new_database: Path, kind: Optional[str] = None,
+                 chunk_size: int = 500):
+        """
+        Initialize the differ
+
+        Args:
+            old_database: Database of the older revision
+            new_database: Database of the newer revision
+            kind: "spells", "mobs" or "items" (detected from the schema if None)
+            chunk_size: Number of keys per query when loading modified records
+        """
+        self.old_database = Path(old_database)
+        self.new_database = Path(new_database)
+        self.kind = kind
+        self.chunk_size = chunk_size
+        self.profile = None
+        self.old_connection = None
+        self.new_connection = None
+
+        # Table layout shared by both databases {table: (compared columns, identity columns)}
+        self.table_layouts: Dict[str, Tuple[List[str], List[str]]] = {}
+        self.single_row_tables: Set[str] = set()  # Tables with one row per record (root, spell_ranks, ...)
+
+    def _connect(self) -> bool:
+        """Open both databases read-only and resolve the diff profile"""
+        try:
+            for path in (self.old_database, self.new_database):
+                if not path.exists():
+                    print(f"[ERROR] Database not found: {path}")
+                    return False
+
+            self.old_connection = sqlite3.connect(self.old_database.resolve().as_uri() + "?mode=ro", uri=True)
+            self.new_connection = sqlite3.connect(self.new_database.resolve().as_uri() + "?mode=ro", uri=True)
+
+            old_kind = detect_database_kind(self.old_connection)
+            new_kind = detect_database_kind(self.new_connection)
+            if old_kind != new_kind:
+                print(f"[ERROR] Database kinds differ: {old_kind} vs {new_kind}")
+                return False
+
+            kind = self.kind or old_kind
+            if kind not in DIFF_PROFILES:
+                print(f"[ERROR] Unsupported database kind: {kind}")
+                return False
+
+            self.profile = DIFF_PROFILES[kind]
+            self._load_table_layouts()
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to open databases: {e}")
+            return False
+
+    def _get_record_tables(self, connection: sqlite3.Connection) -> Dict[str, List[Tuple[str, int]]]:
+        """Get {table: [(column, pk position), ...]} for tables keyed by the record key"""
+        tables = {}
+        for (table,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"):
+            if table in self.profile.excluded_tables:
+                continue
+            columns = [(row[1], row[5]) for row in connection.execute(f"PRAGMA table_info({table})")]
+            if self.profile.key_column in [name for name, _ in columns]:
+                tables[table] = columns
+        return tables
+
+    def _load_table_layouts(self):
+        """Compare the columns both databases share, identified by natural primary keys"""
+        old_tables = self._get_record_tables(self.old_connection)
+        new_tables = self._get_record_tables(self.new_connection)
+
+        for table in sorted(set(old_tables) | set(new_tables)):
+            if table not in old_tables or table not in new_tables:
+                print(f"[WARNING] Table {table} only exists in one database, skipping")
+                continue
+
+            new_columns = {name for name, _ in new_tables[table]}
+            columns = [name for name, _ in old_tables[table]
+                       if name in new_columns and name not in IGNORED_COLUMNS]
+
+            # Natural identity of a row inside its record (e.g. effect_order); tables keyed
+            # by a surrogate id only are compared as row multisets
+            primary_key = [name for name, pk in sorted(old_tables[table], key=lambda c: c[1]) if pk > 0]
+            identity = [name for name in primary_key if name in columns and name != self.profile.key_column]
+            if table == self.profile.root_table or primary_key == [self.profile.key_column]:
+                self.single_row_tables.add(table)
+
+            self.table_layouts[table] = (columns, identity)
+
+    def _compute_record_hashes(self, connection: sqlite3.Connection) -> Dict[Any, str]:
+        """
+        Hash every record's full row tree with one query per table
+
+        Args:
+            connection: Database connection
+
+        Returns:
+            {record key: hex digest}
+        """
+        key_column = self.profile.key_column
+        hashers: Dict[Any, Any] = {}
+
+        for (key,) in connection.execute(f"SELECT {key_column} FROM {self.profile.root_table}"):
+            hashers[key] = hashlib.sha1()
+
+        for table in sorted(self.table_layouts):
+            columns, _ = self.table_layouts[table]
+            column_sql = ", ".join(columns)
+
+            # Group row reprs per key, sorted so row order in the table does not matter
+            rows_by_key: Dict[Any, List[str]] = {}
+            key_index = columns.index(key_column)
+            for row in connection.execute(f"SELECT {column_sql} FROM {table}"):
+                rows_by_key.setdefault(row[key_index], []).append(repr(row))
+
+            table_tag = table.encode()
+            for key, rows in rows_by_key.items():
+                hasher = hashers.get(key)
+                if hasher is None:
+                    continue  # Orphan rows without a root record
+                rows.sort()
+                hasher.update(table_tag)
+                hasher.update("\n".join(rows).encode())
+
+        return {key: hasher.hexdigest() for key, hasher in hashers.items()}
+
+    def _load_record_trees(self, connection: sqlite3.Connection,
+                           keys: List[Any]) -> Dict[Any, Dict[str, List[Dict[str, Any]]]]:
+        """Load the full row trees of the given records {key: {table: [row dict, ...]}}"""
+        key_column = self.profile.key_column
+        trees: Dict[Any, Dict[str, List[Dict[str, Any]]]] = {key: {} for key in keys}
+
+        for table in sorted(self.table_layouts):
+            columns, _ = self.table_layouts[table]
+            column_sql = ", ".join(columns)
+            for i in range(0, len(keys), self.chunk_size):
+                chunk = keys[i:i + self.chunk_size]
+                placeholders = ", ".join("?" for _ in chunk)
+                for row in connection.execute(
+                        f"SELECT {column_sql} FROM {table} WHERE {key_column} IN ({placeholders})", chunk):
+                    row_dict = dict(zip(columns, row))
+                    trees[row_dict[key_column]].setdefault(table, []).append(row_dict)
+
+        return trees
+
+    def _diff_table(self, table: str, old_rows: List[Dict[str, Any]],
+                    new_rows: List[Dict[str, Any]]) -> TableDiff:
+        """Diff the rows of one table belonging to one record"""
+        columns, identity = self.table_layouts[table]
+        result = TableDiff()
+
+        if table in self.single_row_tables and old_rows and new_rows:
+            changes = {column: [old_rows[0][column], new_rows[0][column]]
+                       for column in columns if old_rows[0][column] != new_rows[0][column]}
+            if changes:
+                result.changed_rows.append({"row": {}, "changes": changes})
+            return result
+
+        if not identity:
+            # No natural identity: compare as multisets of rows
+            old_counts: Dict[tuple, int] = {}
+            for row in old_rows:
+                values = tuple(row[column] for column in columns)
+                old_counts[values] = old_counts.get(values, 0) + 1
+            for row in new_rows:
+                values = tuple(row[column] for column in columns)
+                if old_counts.get(values, 0) > 0:
+                    old_counts[values] -= 1
+                else:
+                    result.added_rows.append(row)
+            for values, count in old_counts.items():
+                result.removed_rows.extend([dict(zip(columns, values))] * count)
+            return result
+
+        old_by_identity = {tuple(row[column] for column in identity): row for row in old_rows}
+        new_by_identity = {tuple(row[column] for column in identity): row for row in new_rows}
+
+        for row_identity, new_row in new_by_identity.items():
+            old_row = old_by_identity.get(row_identity)
+            if old_row is None:
+                result.added_rows.append(new_row)
+                continue
+            changes = {column: [old_row[column], new_row[column]]
+                       for column in columns if old_row[column] != new_row[column]}
+            if changes:
+                result.changed_rows.append({"row": dict(zip(identity, row_identity)), "changes": changes})
+
+        for row_identity, old_row in old_by_identity.items():
+            if row_identity not in new_by_identity:
+                result.removed_rows.append(old_row)
+
+        return result
+
+    def _diff_records(self, keys: List[Any]) -> List[RecordDiff]:
+        """Field-level diff of records whose hashes differ"""
+        old_trees = self._load_record_trees(self.old_connection, keys)
+        new_trees = self._load_record_trees(self.new_connection, keys)
+
+        record_diffs = []
+        for key in keys:
+            old_tree, new_tree = old_trees[key], new_trees[key]
+            root_rows = new_tree.get(self.profile.root_table) or old_tree.get(self.profile.root_table) or [{}]
+            record = RecordDiff(key=key, label=root_rows[0].get(self.profile.label_column))
+
+            for table in sorted(set(old_tree) | set(new_tree)):
+                table_diff = self._diff_table(table, old_tree.get(table, []), new_tree.get(table, []))
+                if not table_diff.is_empty():
+                    record.tables[table] = table_diff
+
+            record_diffs.append(record)
+
+        return record_diffs
+
+    def diff(self) -> Optional[DatabaseDiffResult]:
+        """
+        Diff the two databases
+
+        Returns:
+            DatabaseDiffResult, or None if the databases could not be compared
+        """
+        if not self._connect():
+            return None
+
+        try:
+            old_hashes = self._compute_record_hashes(self.old_connection)
+            new_hashes = self._compute_record_hashes(self.new_connection)
+
+            result = DatabaseDiffResult(self.profile.kind, str(self.old_database), str(self.new_database))
+            result.added = sorted((key for key in new_hashes if key not in old_hashes), key=str)
+            result.removed = sorted((key for key in old_hashes if key not in new_hashes), key=str)
+
+            modified_keys = []
+            for key, new_hash in new_hashes.items():
+                old_hash = old_hashes.get(key)
+                if old_hash is None:
+                    continue
+                if old_hash == new_hash:
+                    result.unchanged_count += 1
+                else:
+                    modified_keys.append(key)
+
+            modified_keys.sort(key=str)
+            result.modified = self._diff_records(modified_keys)
+            return result
+
+        finally:
+            self.close()
+
+    def close(self):
+        """Close both database connections"""
+        for connection in (self.old_connection, self.new_connection):
+            if connection:
+                connection.close()
+        self.old_connection = None
+        self.new_connection = None
+
+
+def save_diff_report(result: DatabaseDiffResult, output_path: Path) -> bool:
+    """
+    Write a diff result as JSON
+
+    Args:
+        result: Diff result
+        output_path: Output file path
+
+    Returns:
+        True if written, False otherwise
+    """
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(result.to_dict(), f, indent=2, default=str)
+        return True
+    except Exception as e:
+        print(f"[ERROR] Failed to save diff report: {e}")
+        return False
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Failure Archive
+===============
+Single-file archive of the records a pipeline failed to process or skipped
+as duplicates.
+
+All entries of a run go into one SQLite side database instead of one
+pretty-printed JSON file per record. Payloads are stored as zlib-compressed
+JSON, writes are buffered and flushed with executemany, and the archive is
+indexed by filename and by (kind, error category), so looking up a single
+failure stays instant regardless of how many there are.
+"""
+
+import json
+import re
+import sqlite3
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def get_error_category(error_message: str) -> str:
+    """Get the category of an error message (the text before the first ':', counts masked)"""
+    category = re.sub(r"\d+", "N", error_message.split(":", 1)[0].strip())
+    return category or "Unknown"
+
+
+class FailureArchive:
+    """Buffered writer and indexed reader for a failure archive database"""
+
+    CREATE_SQL = """
+        CREATE TABLE IF NOT EXISTS failure_archive (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            error_category TEXT NOT NULL,
+            error_message TEXT,
+            payload BLOB,
+            logged_at TEXT
+        )
+    """
+    INDEX_SQL = (
+        "CREATE INDEX IF NOT EXISTS idx_failure_archive_filename ON failure_archive(filename)",
+        "CREATE INDEX IF NOT EXISTS idx_failure_archive_category ON failure_archive(kind, error_category)",
+    )
+    INSERT_SQL = """
+        INSERT INTO failure_archive (kind, filename, error_category, error_message, payload, logged_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def __init__(self, path: Path, buffer_size: int = 500, reset: bool = True):
+        """
+        Open (and create) a failure archive
+
+        Args:
+            path: Archive database path
+            buffer_size: Number of entries buffered before they are written
+            reset: Drop the entries of a previous run
+        """
+        self.path = Path(path)
+        self.buffer_size = max(1, buffer_size)
+        self.count = 0
+        self._buffer: List[tuple] = []
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute(self.CREATE_SQL)
+        for index_sql in self.INDEX_SQL:
+            self.connection.execute(index_sql)
+        if reset:
+            self.connection.execute("DELETE FROM failure_archive")
+        self.connection.commit()
+
+    def write(self, kind: str, filename: str, error_message: str, data: Any = None):
+        """
+        Archive one failed or duplicate record
+
+        Args:
+            kind: Entry kind (e.g. "failed", "duplicate")
+            filename: Source file of the record
+            error_message: Error description
+            data: JSON-serializable record data (stored compressed)
+        """
+        payload = None
+        if data is not None:
+            payload = zlib.compress(json.dumps(data, default=str, separators=(",", ":")).encode("utf-8"))
+
+        self._buffer.append((kind, filename, get_error_category(error_message), error_message,
+                             payload, datetime.now().isoformat()))
+        self.count += 1
+
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered entries"""
+        if not self._buffer:
+            return
+        self.connection.executemany(self.INSERT_SQL, self._buffer)
+        self.connection.commit()
+        self._buffer = []
+
+    def close(self):
+        """Flush the remaining entries and close the archive"""
+        if self.connection is None:
+            return
+        self.flush()
+        self.connection.close()
+        self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _row_to_entry(self, row: tuple) -> Dict[str, Any]:
+        """Convert an archive row into an entry dict with the payload decoded"""
+        kind, filename, error_category, error_message, payload, logged_at = row
+        return {
+            "kind": kind,
+            "filename": filename,
+            "error_category": error_category,
+            "error_message": error_message,
+            "data": json.loads(zlib.decompress(payload)) if payload is not None else None,
+            "logged_at": logged_at
+        }
+
+    def lookup(self, filename: str) -> List[Dict[str, Any]]:
+        """
+        Get all archived entries of one file
+
+        Args:
+            filename: Source file of the record
+
+        Returns:
+            Entries in the order they were logged
+        """
+        self.flush()
+        rows = self.connection.execute(
+            "SELECT kind, filename, error_category, error_message, payload, logged_at "
+            "FROM failure_archive WHERE filename = ? ORDER BY id", (filename,)
+        ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def iter_entries(self, kind: Optional[str] = None,
+                     error_category: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream archived entries, optionally filtered by kind and error category
+
+        Args:
+            kind: Entry kind to keep (all if None)
+            error_category: Error category to keep (all if None)
+
+        Yields:
+            Entries in the order they were logged
+        """
+        self.flush()
+        conditions, params = [], []
+        if kind is not None:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if error_category is not None:
+            conditions.append("error_category = ?")
+            params.append(error_category)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor = self.connection.execute(
+            "SELECT kind, filename, error_category, error_message, payload, logged_at "
+            f"FROM failure_archive {where} ORDER BY id", params
+        )
+        for row in cursor:
+            yield self._row_to_entry(row)
+
+    def get_category_counts(self) -> Dict[str, Dict[str, int]]:
+        """Get entry counts per kind and error category"""
+        self.flush()
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind, error_category, count in self.connection.execute(
+            "SELECT kind, error_category, COUNT(*) FROM failure_archive "
+            "GROUP BY kind, error_category ORDER BY COUNT(*) DESC"
+        ):
+            counts.setdefault(kind, {})[error_category] = count
+        return counts
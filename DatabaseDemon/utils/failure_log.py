@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Failure Log
+===========
+Append-only JSONL sink for records a pipeline failed to process.
+
+Each failure is one JSON line. Lines are buffered and appended in blocks, so
+logging a failure costs the same whether it is the first or the ten
+thousandth one (rewriting one JSON array per failure made large failure runs
+quadratic). Logs can optionally be gzip compressed.
+
+The aggregate report is rebuilt once at the end of a run with
+summarize_failures(), which streams the log instead of loading it whole.
+"""
+
+import gzip
+import json
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+GZIP_SUFFIX = ".gz"
+
+
+def _open_log(path: Path, mode: str):
+    """Open a plain or gzip compressed JSONL file in text mode"""
+    if path.suffix == GZIP_SUFFIX:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class FailureLog:
+    """Buffered, append-only JSONL writer for pipeline failures"""
+
+    def __init__(self, path: Path, compress: bool = False, buffer_size: int = 256,
+                 append: bool = False):
+        """
+        Initialize the failure log
+
+        The file is only created on the first failure. Without append, the
+        log of a previous run at the same path is removed right away, so a
+        run without failures is not summarized with stale entries.
+
+        Args:
+            path: JSONL file path (".gz" is appended when compressing)
+            compress: Write a gzip compressed log
+            buffer_size: Number of failures buffered before they are written
+            append: Keep the entries of a previous run instead of starting a new log
+        """
+        path = Path(path)
+        if compress and path.suffix != GZIP_SUFFIX:
+            path = path.with_name(path.name + GZIP_SUFFIX)
+
+        self.path = path
+        self.buffer_size = max(1, buffer_size)
+        self.append = append
+        self.count = 0
+
+        self._buffer: List[str] = []
+        self._handle = None
+
+        if not append:
+            path.unlink(missing_ok=True)
+
+    def write(self, entry: Dict[str, Any]):
+        """
+        Record one failure
+
+        Args:
+            entry: JSON-serializable failure data (a timestamp is added if missing)
+        """
+        if "timestamp" not in entry:
+            entry = dict(entry, timestamp=datetime.now().isoformat())
+
+        self._buffer.append(json.dumps(entry, default=str, separators=(",", ":")))
+        self.count += 1
+
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Append the buffered failures to the log file"""
+        if not self._buffer:
+            return
+
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = _open_log(self.path, "a" if self.append else "w")
+
+        self._handle.write("\n".join(self._buffer) + "\n")
+        self._handle.flush()
+        self._buffer = []
+
+    def close(self):
+        """Flush the remaining failures and close the file"""
+        self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def iter_failures(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read the entries of a failure log
+
+    Args:
+        path: JSONL failure log (plain or .gz)
+
+    Yields:
+        Failure entries in the order they were written (a truncated last line is skipped)
+    """
+    path = Path(path)
+    if not path.exists():
+        return
+
+    with _open_log(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def summarize_failures(path: Path, reason_key: str = "reason", path_key: str = "file_path",
+                       top: int = 50, samples_per_reason: int = 5) -> Optional[Dict[str, Any]]:
+    """
+    Build the aggregate report of a failure log in one streaming pass
+
+    Reasons are grouped exactly and by category (the text before the first ":"),
+    so thousands of "Exception: ..." variants still collapse into one line.
+
+    Args:
+        path: JSONL failure log (plain or .gz)
+        reason_key: Entry field holding the failure reason
+        path_key: Entry field holding the failed file path
+        top: Number of most frequent reasons to keep
+        samples_per_reason: Example file paths kept per reason
+
+    Returns:
+        Summary dict, or None if the log does not exist
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    reasons = Counter()
+    categories = Counter()
+    samples: Dict[str, List[str]] = {}
+    total = 0
+
+    for entry in iter_failures(path):
+        total += 1
+        reason = str(entry.get(reason_key, "Unknown"))
+        reasons[reason] += 1
+        categories[reason.split(":", 1)[0].strip()] += 1
+
+        reason_samples = samples.setdefault(reason, [])
+        if len(reason_samples) < samples_per_reason and path_key in entry:
+            reason_samples.append(entry[path_key])
+
+    return {
+        "failure_log": str(path),
+        "total_failures": total,
+        "by_category": dict(categories.most_common()),
+        "by_reason": [
+            {"reason": reason, "count": count, "sample_files": samples.get(reason, [])}
+            for reason, count in reasons.most_common(top)
+        ],
+        "distinct_reasons": len(reasons)
+    }
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Lazy DTO Builder
+================
+Builds DTOs straight from katsuba LazyObjects, without the intermediate raw dict.
+
+The dict-based path converts every record twice: convert_lazy_object_to_dict
+materializes the whole object tree (every string decoded, every geometry
+value formatted), then the DTO factory walks that tree again to build DTOs.
+LazyDTOBuilder walks LazyObject.items() once and only converts the fields the
+target DTO declares. Fields the DTO does not declare are skipped, or collected
+as unhandled fields when the caller audits them. Their values are only
+converted the first time the builder sees a shape (DTO class plus unhandled
+field names), see utils/shape_audit.py.
+
+The builder only takes the happy path. Anything the factories would report or
+patch up (unknown root type, failed DTO construction, unresolvable type name)
+raises DirectConversionError, and the caller falls back to the dict-based
+path, which produces exactly the same result and error reporting as before.
+
+Instead of the raw dict, callers get a DirectRecord: a dict holding only the
+$__type entry, plus the unhandled field shapes. The full raw dict is rebuilt only
+when failure logging needs it.
+"""
+
+import sys
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Type
+
+from katsuba.op import LazyObject, LazyList, TypeList
+
+from .conversion_utils import convert_field_value, decode_bytes_to_string, decode_key
+
+
+# (DTO class name, object path, unhandled field names, sample values or None)
+UnhandledObject = Tuple[str, str, Tuple[str, ...], Optional[Dict[str, Any]]]
+
+
+class DirectConversionError(Exception):
+    """The object needs the dict-based conversion path"""
+
+
+class DirectRecord(dict):
+    """
+    Stand-in for the raw dict of an object converted straight to a DTO
+
+    The dict itself only holds "$__type". Unhandled shapes are
+    (DTO class name, object path, sorted unhandled field names, sample values)
+    tuples, one per object with unhandled fields (e.g. "m_effects[2]" with
+    ("m_unknownField",)). Sample values are None for shapes the builder saw before.
+    """
+
+    def __init__(self, type_name: Any, unhandled_shapes: Optional[List[UnhandledObject]] = None,
+                 rebuild: Optional[Callable[[], Dict[str, Any]]] = None):
+        """
+        Initialize the record
+
+        Args:
+            type_name: The "$__type" value the raw dict would have
+            unhandled_shapes: Objects with fields not declared by their DTOs
+            rebuild: Optional callable that rebuilds the full raw dict
+        """
+        super().__init__({"$__type": type_name})
+        self.unhandled_shapes = unhandled_shapes or []
+        self.rebuild = rebuild
+
+    def __reduce__(self):
+        # The rebuild callable holds the source LazyObject, which cannot cross process boundaries
+        return (DirectRecord, (self["$__type"], self.unhandled_shapes))
+
+    def raw_dict(self) -> Optional[Dict[str, Any]]:
+        """Rebuild the full raw dict (None if the source object is not available)"""
+        return self.rebuild() if self.rebuild else None
+
+
+class LazyDTOBuilder:
+    """Builds DTOs from LazyObjects, converting only the declared fields"""
+
+    def __init__(self, type_list: TypeList, resolve_class: Callable[[str], Optional[Type]],
+                 fields_by_class: Dict[Type, FrozenSet[str]],
+                 interned_fields_by_class: Dict[Type, FrozenSet[str]],
+                 collect_unhandled: bool = False, warn_unmapped_list_items: bool = False):
+        """
+        Initialize the builder
+
+        Args:
+            type_list: TypeList used to iterate LazyObjects and resolve type names
+            resolve_class: Maps a type name (without "class ") to its DTO class, None if unmapped
+            fields_by_class: Declared field names of every DTO class
+            interned_fields_by_class: Fields whose string values are interned, per DTO class
+            collect_unhandled: Collect fields the DTOs do not declare
+            warn_unmapped_list_items: Print a warning for unmapped typed objects in lists
+        """
+        self.type_list = type_list
+        self.resolve_class = resolve_class
+        self.fields_by_class = fields_by_class
+        self.interned_fields_by_class = interned_fields_by_class
+        self.collect_unhandled = collect_unhandled
+        self.warn_unmapped_list_items = warn_unmapped_list_items
+
+        # type hash -> (type name, DTO class or None), resolved once per type
+        self._types: Dict[int, Tuple[str, Optional[Type]]] = {}
+
+        # (DTO class, unhandled field names) seen so far, their values are not converted again
+        self._seen_shapes: Set[Tuple[Type, Tuple[str, ...]]] = set()
+
+        # Per-build state, (DTO class, path, unhandled field names, raw values) in audit order
+        # (None for objects without unhandled fields)
+        self._unhandled: List[Optional[Tuple[Type, str, Tuple[str, ...], Dict[str, Any]]]] = []
+        self._unmapped_warnings: List[str] = []
+
+    def build(self, lazy_object: LazyObject, expected_type_name: Optional[str] = None) -> Tuple[Any, DirectRecord]:
+        """
+        Build the DTO of a root object
+
+        Args:
+            lazy_object: Deserialized root object
+            expected_type_name: Required "$__type" of the root (e.g. "class WizItemTemplate")
+
+        Returns:
+            (dto, record)
+
+        Raises:
+            DirectConversionError: The object has to go through the dict-based path
+        """
+        if not isinstance(lazy_object, LazyObject):
+            raise DirectConversionError("Not a LazyObject")
+
+        self._unhandled = []
+        self._unmapped_warnings = []
+
+        try:
+            type_name, dto_class = self._resolve(lazy_object.type_hash)
+            if dto_class is None:
+                raise DirectConversionError(f"No DTO class for {type_name}")
+            if expected_type_name is not None and type_name != expected_type_name:
+                raise DirectConversionError(f"Unexpected root type {type_name}")
+
+            # Field paths are only tracked when unhandled fields are collected
+            dto = self._build_dto(lazy_object, dto_class, "" if self.collect_unhandled else None)
+            unhandled_shapes = self._get_unhandled_shapes()
+        except DirectConversionError:
+            raise
+        except Exception as e:
+            raise DirectConversionError(str(e)) from e
+
+        for warning in self._unmapped_warnings:
+            print(warning)
+
+        return dto, DirectRecord(type_name, unhandled_shapes)
+
+    def _resolve(self, type_hash: int) -> Tuple[str, Optional[Type]]:
+        """Get the type name and DTO class of a type hash"""
+        resolved = self._types.get(type_hash)
+        if resolved is None:
+            type_name = self.type_list.name_for(type_hash)
+            resolved = (type_name, self.resolve_class(type_name.replace("class ", "")))
+            self._types[type_hash] = resolved
+        return resolved
+
+    def _build_dto(self, lazy_object: LazyObject, dto_class: Type, path: Optional[str]) -> Any:
+        """Build one DTO from the fields its class declares"""
+        field_names = self.fields_by_class[dto_class]
+        interned_fields = self.interned_fields_by_class[dto_class]
+
+        kwargs = {}
+        unhandled = None
+        if path is not None:
+            # Objects are audited parent first, like the dict-based audit walks them
+            unhandled_slot = len(self._unhandled)
+            self._unhandled.append(None)
+        for key, value in lazy_object.items(self.type_list):
+            key = decode_key(key)
+
+            if key in field_names:
+                if isinstance(value, (LazyObject, LazyList, list)):
+                    value = self._convert_value(value, self._child_path(path, key))
+                else:
+                    value = decode_bytes_to_string(value)
+                    if key in interned_fields and type(value) is str:
+                        value = sys.intern(value)
+                kwargs[key] = value
+            elif path is not None:
+                if unhandled is None:
+                    unhandled = {}
+                unhandled[key] = value
+
+        if unhandled:
+            self._unhandled[unhandled_slot] = (dto_class, path, tuple(sorted(unhandled)), unhandled)
+
+        try:
+            return dto_class(**kwargs)
+        except Exception as e:
+            raise DirectConversionError(f"Error creating {dto_class.__name__}: {e}") from e
+
+    def _get_unhandled_shapes(self) -> List[UnhandledObject]:
+        """Get the unhandled shapes of the built object, converting values only for new shapes"""
+        unhandled_shapes = []
+        for unhandled in self._unhandled:
+            if unhandled is None:
+                continue
+            dto_class, path, field_names, values = unhandled
+            shape_key = (dto_class, field_names)
+            samples = None
+            if shape_key not in self._seen_shapes:
+                self._seen_shapes.add(shape_key)
+                samples = {name: convert_field_value(values[name], self.type_list) for name in field_names}
+            unhandled_shapes.append((dto_class.__name__, path, field_names, samples))
+        return unhandled_shapes
+
+    @staticmethod
+    def _child_path(path: Optional[str], key: str) -> Optional[str]:
+        """Path of a field below path (None while paths are not tracked)"""
+        if path is None:
+            return None
+        return f"{path}.{key}" if path else key
+
+    def _convert_value(self, value: Any, path: Optional[str]) -> Any:
+        """Convert one declared field value, building DTOs for mapped nested objects"""
+        if isinstance(value, LazyObject):
+            type_name, dto_class = self._resolve(value.type_hash)
+            if dto_class is None:
+                return convert_field_value(value, self.type_list)
+            return self._build_dto(value, dto_class, path)
+
+        if isinstance(value, (LazyList, list)):
+            converted = []
+            for i, item in enumerate(value):
+                if isinstance(item, LazyObject):
+                    type_name, dto_class = self._resolve(item.type_hash)
+                    if dto_class is not None:
+                        item_path = f"{path}[{i}]" if path is not None else None
+                        converted.append(self._build_dto(item, dto_class, item_path))
+                        continue
+                    if self.warn_unmapped_list_items:
+                        self._unmapped_warnings.append(
+                            f"WARNING: No hash mapping found for type {type_name.replace('class ', '')}"
+                        )
+                converted.append(convert_field_value(item, self.type_list))
+            return converted
+
+        return decode_bytes_to_string(value)
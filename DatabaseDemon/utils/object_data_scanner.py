@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+ObjectData Scanner
+==================
+Single-pass scan engine for the ObjectData/**/*.xml files in Root.wad.
+
+Every file is deserialized exactly once and routed by the root object's
+type hash to the consumers registered for that hash. This lets several
+databases (mobs, items) be populated from one walk over the archive instead
+of each pipeline globbing and deserializing all ~95k files on its own.
+
+Before scanning, a WadManifest of all ObjectData entries is built and offered
+to every consumer. Consumers patching a previous build return the subset of
+files they need, and only the union of those subsets is deserialized.
+
+The scanner frames every file in its StageMetrics and times the list and
+deserialize stages; consumers sharing the metrics time their own stages
+inside the frame. The manifest supplies the byte sizes of the slowest files.
+"""
+
+import traceback
+from typing import Dict, List, Any, Optional, Set
+
+from .wad_manifest import WadManifest
+from .process_memory import MemoryBudget
+from .stage_metrics import StageMetrics
+
+
+# Root type hashes of the ObjectData templates handled by the pipelines
+WIZ_GAME_OBJECT_TEMPLATE_HASH = 701229577  # Mobs
+WIZ_ITEM_TEMPLATE_HASH = 991922385         # Items
+
+
+class ObjectDataConsumer:
+    """Base class for pipelines fed by the ObjectDataScanner"""
+
+    def consume(self, file_path: str, object_data: Any, type_list: Any):
+        """
+        Handle one deserialized ObjectData file routed to this consumer
+
+        Args:
+            file_path: Path of the file inside the WAD archive
+            object_data: Deserialized root LazyObject
+            type_list: TypeList used by the serializer
+        """
+        raise NotImplementedError
+
+    def prepare_scan(self, manifest: WadManifest) -> Optional[Set[str]]:
+        """
+        Called with the manifest of the ObjectData files before scanning starts
+
+        Args:
+            manifest: Checksums of all ObjectData entries in the archive
+
+        Returns:
+            Files this consumer needs (incremental update), or None for all files
+        """
+        return None
+
+    def on_batch_complete(self):
+        """Called after every scanner batch (commit point for database writers)"""
+        pass
+
+    def on_memory_pressure(self, budget: MemoryBudget):
+        """Called after a batch when the run approaches its memory budget (shrink caches here)"""
+        pass
+
+    def on_scan_complete(self, scanner: "ObjectDataScanner"):
+        """Called once after the scan finished (final commit and reports)"""
+        pass
+
+
+class ObjectDataScanner:
+    """Walks ObjectData once and dispatches each file by root type hash"""
+
+    OBJECT_DATA_GLOB = "ObjectData/**/*.xml"
+
+    def __init__(self, archive, serializer, type_list,
+                 batch_size: int = 1000, progress_interval: int = 5000,
+                 metrics: Optional[StageMetrics] = None):
+        """
+        Initialize the scanner
+
+        Args:
+            archive: Opened katsuba WAD Archive
+            serializer: Configured katsuba Serializer
+            type_list: TypeList used by the serializer
+            batch_size: Number of files between consumer batch callbacks
+            progress_interval: Number of files between progress reports
+            metrics: Stage metrics of the run (own instance if None)
+        """
+        self.archive = archive
+        self.serializer = serializer
+        self.type_list = type_list
+        self.batch_size = batch_size
+        self.progress_interval = progress_interval
+        self.metrics = metrics or StageMetrics()
+
+        # Registered consumers {type_hash: [consumer, ...]}
+        self.consumers: Dict[int, List[ObjectDataConsumer]] = {}
+
+        # Statistics
+        self.total_files = 0
+        self.total_scanned = 0
+        self.total_routed = 0
+        self.total_unrouted = 0
+        self.total_failures = 0
+        self.routed_counts: Dict[int, int] = {}
+        self.unrouted_counts: Dict[int, int] = {}  # Skipped root types, never converted
+        self.failed_files: List[Dict[str, str]] = []
+        self.manifest = None
+
+    def register_consumer(self, type_hash: int, consumer: ObjectDataConsumer):
+        """
+        Register a consumer for objects whose root type hash matches
+
+        Args:
+            type_hash: Root type hash to route (e.g. WIZ_ITEM_TEMPLATE_HASH)
+            consumer: Consumer receiving the deserialized objects
+        """
+        self.consumers.setdefault(type_hash, []).append(consumer)
+
+    def _all_consumers(self) -> List[ObjectDataConsumer]:
+        """Get every registered consumer once, in registration order"""
+        unique = []
+        for consumers in self.consumers.values():
+            for consumer in consumers:
+                if consumer not in unique:
+                    unique.append(consumer)
+        return unique
+
+    def get_object_files(self) -> List[str]:
+        """Get list of all ObjectData XML files"""
+        object_files = list(self.archive.iter_glob(self.OBJECT_DATA_GLOB))
+        print(f"Found {len(object_files)} XML files in ObjectData")
+        return object_files
+
+    def scan(self) -> bool:
+        """
+        Scan all ObjectData files and route them to the registered consumers
+
+        Returns:
+            True if the scan completed, False on a fatal error
+        """
+        if not self.consumers:
+            print("[WARNING] No ObjectData consumers registered, nothing to scan")
+            return False
+
+        consumers = self._all_consumers()
+        metrics = self.metrics
+
+        try:
+            with metrics.stage("list"):
+                object_files = self._select_object_files(self.get_object_files(), consumers)
+            self.total_files = len(object_files)
+            metrics.file_size_lookup = self.manifest.get_size
+
+            for file_path in object_files:
+                # Only files routed to a consumer get a latency sample
+                metrics.begin_file(name=file_path)
+                if self._scan_single_file(file_path):
+                    metrics.end_file()
+                else:
+                    metrics.discard_file()
+
+                if self.total_scanned % self.batch_size == 0:
+                    for consumer in consumers:
+                        consumer.on_batch_complete()
+                    if metrics.memory_budget and metrics.memory_budget.is_under_pressure():
+                        self._relieve_memory_pressure(consumers)
+
+                if self.total_scanned % self.progress_interval == 0:
+                    print(f"[PROGRESS] Scanned {self.total_scanned}/{self.total_files} files, "
+                          f"{self.total_routed} routed, {self.total_failures} failures")
+
+            for consumer in consumers:
+                consumer.on_batch_complete()
+
+            self._print_scan_summary()
+
+            for consumer in consumers:
+                consumer.on_scan_complete(self)
+
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] ObjectData scan failed: {e}")
+            traceback.print_exc()
+            return False
+
+    def _relieve_memory_pressure(self, consumers: List[ObjectDataConsumer]):
+        """Commit in smaller batches and let the consumers shrink their caches"""
+        budget = self.metrics.memory_budget
+        self.batch_size = budget.shrink("scanner batch size", self.batch_size, 50)
+        for consumer in consumers:
+            consumer.on_memory_pressure(budget)
+
+    def _select_object_files(self, object_files: List[str],
+                             consumers: List[ObjectDataConsumer]) -> List[str]:
+        """Build the ObjectData manifest and keep only the files some consumer needs"""
+        self.manifest = WadManifest(self.OBJECT_DATA_GLOB)
+        self.manifest.build(self.archive, object_files)
+
+        # Every consumer must see the manifest, even if an earlier one needs all files
+        needed: Set[str] = set()
+        full_scan = False
+        for consumer in consumers:
+            consumer_files = consumer.prepare_scan(self.manifest)
+            if consumer_files is None:
+                full_scan = True
+            else:
+                needed.update(consumer_files)
+
+        if full_scan:
+            return object_files
+
+        print(f"[INFO] Incremental scan: {len(needed)} of {len(object_files)} files changed")
+        return [file_path for file_path in object_files if file_path in needed]
+
+    def _scan_single_file(self, file_path: str) -> bool:
+        """
+        Deserialize one file and hand it to the consumers for its root type
+
+        Returns:
+            True if the file was routed to at least one consumer
+        """
+        self.total_scanned += 1
+
+        try:
+            with self.metrics.stage("deserialize"):
+                object_data = self.archive.deserialize(file_path, self.serializer)
+        except Exception as e:
+            self._record_failure(file_path, f"Deserialize error: {e}")
+            return False
+
+        type_hash = getattr(object_data, 'type_hash', None)
+        consumers = self.consumers.get(type_hash)
+        if not consumers:
+            self.total_unrouted += 1
+            self.unrouted_counts[type_hash] = self.unrouted_counts.get(type_hash, 0) + 1
+            return False
+
+        self.total_routed += 1
+        self.routed_counts[type_hash] = self.routed_counts.get(type_hash, 0) + 1
+
+        for consumer in consumers:
+            try:
+                consumer.consume(file_path, object_data, self.type_list)
+            except Exception as e:
+                self._record_failure(file_path, f"Consumer {type(consumer).__name__} error: {e}")
+        return True
+
+    def _record_failure(self, file_path: str, error: str):
+        """Record a file that could not be scanned or consumed"""
+        self.total_failures += 1
+        self.failed_files.append({"file_path": file_path, "error": error})
+
+    def get_scan_statistics(self) -> Dict[str, Any]:
+        """Get scan statistics"""
+        return {
+            "total_files": self.total_files,
+            "total_scanned": self.total_scanned,
+            "total_routed": self.total_routed,
+            "total_unrouted": self.total_unrouted,
+            "total_failures": self.total_failures,
+            "routed_counts": dict(self.routed_counts),
+            "unrouted_counts": dict(self.unrouted_counts),
+        }
+
+    def _print_scan_summary(self):
+        """Print scan summary"""
+        print("\n[COMPLETE] ObjectData scan finished!")
+        print(f"Files scanned: {self.total_scanned}/{self.total_files}")
+        print(f"Files routed: {self.total_routed}")
+        for type_hash, count in sorted(self.routed_counts.items()):
+            print(f"  - type {type_hash}: {count}")
+        print(f"Files without consumer: {self.total_unrouted} ({len(self.unrouted_counts)} root types)")
+        print(f"Failures: {self.total_failures}")
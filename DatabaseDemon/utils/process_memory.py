@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Process Memory
+==============
+Resident memory of the current process: peak and current RSS, peak memory
+per pipeline stage, and a memory budget the pipelines adapt their buffers to.
+
+Uses the resource module and /proc where available (Linux, macOS) and
+psutil on Windows. Readers return None when neither is available, so callers
+can report "n/a" instead of failing.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+
+MB = 1024 * 1024
+
+
+def _make_peak_rss_reader() -> Optional[Callable[[], float]]:
+    """Get a cheap callable returning the peak RSS in MB (None if unavailable)"""
+    try:
+        import resource
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        scale = MB if sys.platform == "darwin" else 1024
+        return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    except ImportError:
+        pass
+
+    try:
+        import psutil
+        process = psutil.Process()
+
+        def read_peak() -> float:
+            memory_info = process.memory_info()
+            return (getattr(memory_info, "peak_wset", None) or memory_info.rss) / MB
+        return read_peak
+    except ImportError:
+        return None
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MB (None if unavailable)"""
+    read_peak = _make_peak_rss_reader()
+    return read_peak() if read_peak else None
+
+
+def get_rss_mb() -> Optional[float]:
+    """Get the current resident set size of this process in MB (None if unavailable)"""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / MB
+    except ImportError:
+        return None
+
+
+class StageMemory:
+    """
+    Peak memory reached while each stage was running
+
+    sample() is called at every stage boundary with the stage that ran in the
+    interval that just ended. A stage's peak RSS is the highest process peak
+    it pushed the process to, so stages that never raised the high-water mark
+    have none. With tracing enabled, tracemalloc's peak is reset at every
+    boundary, which gives each stage its own peak of traced Python memory.
+    """
+
+    def __init__(self):
+        """Initialize empty stage peaks"""
+        self._read_peak_rss = _make_peak_rss_reader()
+        self._last_peak_rss = self._read_peak_rss() if self._read_peak_rss else 0.0
+        self.peak_rss_mb: Dict[str, float] = {}
+        self.peak_python_mb: Dict[str, float] = {}
+        self.tracing = False
+        self._started_tracemalloc = False
+
+    def start_tracing(self):
+        """Trace Python allocations (slows allocation-heavy code down noticeably)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+        self.tracing = True
+
+    def stop_tracing(self):
+        """Stop tracing Python allocations (if tracing was started here)"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.tracing = False
+
+    def sample(self, stage: Optional[str]):
+        """
+        Attribute the memory peak of the interval that just ended
+
+        Args:
+            stage: Stage that ran in the interval (None = outside any stage)
+        """
+        if self._read_peak_rss is not None:
+            peak = self._read_peak_rss()
+            if peak > self._last_peak_rss:
+                self._last_peak_rss = peak
+                if stage is not None:
+                    self.peak_rss_mb[stage] = peak
+
+        if self.tracing:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            if stage is not None and peak / MB > self.peak_python_mb.get(stage, 0.0):
+                self.peak_python_mb[stage] = peak / MB
+
+    @property
+    def peak_mb(self) -> Optional[float]:
+        """Peak RSS of the process so far"""
+        return self._read_peak_rss() if self._read_peak_rss else None
+
+
+class MemoryBudget:
+    """
+    Resident memory limit that the pipelines shrink their buffers to stay under
+
+    Pipelines ask is_under_pressure() at their checkpoints (row flushes,
+    batch commits...). Once the current RSS is above the high-water fraction
+    of the limit, they shrink batch sizes and caches with shrink(). Checks are
+    rate-limited, so each pressure reading shrinks a buffer at most once per
+    check interval.
+    """
+
+    def __init__(self, limit_mb: float, high_water: float = 0.8, check_seconds: float = 1.0,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the budget
+
+        Args:
+            limit_mb: Resident memory limit in MB
+            high_water: Fraction of the limit from which buffers are shrunk
+            check_seconds: Minimum time between two RSS readings
+            clock: Monotonic clock returning seconds
+        """
+        self.limit_mb = limit_mb
+        self.high_water = high_water
+        self.check_seconds = check_seconds
+        self.clock = clock
+
+        self.pressure_count = 0
+        self.last_rss_mb = get_rss_mb()
+        self.adjustments: Dict[str, str] = {}  # {buffer: "original -> current"}
+        self._original_sizes: Dict[str, int] = {}
+        self._next_check = 0.0
+
+        if self.last_rss_mb is None:
+            print("[WARNING] Current RSS cannot be read on this platform (install psutil), "
+                  "the memory budget is not enforced")
+
+    @property
+    def threshold_mb(self) -> float:
+        """RSS from which buffers are shrunk"""
+        return self.limit_mb * self.high_water
+
+    def is_under_pressure(self) -> bool:
+        """Check (at most once per check interval) whether RSS is above the high-water mark"""
+        now = self.clock()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.check_seconds
+
+        rss = get_rss_mb()
+        if rss is None:
+            return False
+        self.last_rss_mb = rss
+        if rss < self.threshold_mb:
+            return False
+        self.pressure_count += 1
+        return True
+
+    def shrink(self, name: str, size: int, minimum: int) -> int:
+        """
+        Halve a batch size or buffer limit under memory pressure
+
+        Args:
+            name: Buffer name for the log and summary (e.g. "row flush size")
+            size: Current size
+            minimum: Size the buffer is never shrunk below
+
+        Returns:
+            New size
+        """
+        new_size = max(minimum, size // 2)
+        if new_size < size:
+            original = self._original_sizes.setdefault(name, size)
+            self.adjustments[name] = f"{original} -> {new_size}"
+            print(f"[MEMORY] RSS {self.last_rss_mb:.0f} MB is over {self.threshold_mb:.0f} MB "
+                  f"({self.high_water:.0%} of the {self.limit_mb:g} MB budget), {name}: {size} -> {new_size}")
+        return new_size
+
+    def record(self, name: str, description: str):
+        """Record a non-numeric adaptation (e.g. dropping report payloads)"""
+        if name not in self.adjustments:
+            print(f"[MEMORY] RSS {self.last_rss_mb:.0f} MB is over {self.threshold_mb:.0f} MB, {name}: {description}")
+        self.adjustments[name] = description
+
+    def format_summary(self) -> str:
+        """Format the budget and the adaptations it caused for the run summary"""
+        lines = [f"Memory budget: {self.limit_mb:g} MB (buffers shrink above {self.threshold_mb:.0f} MB, "
+                 f"pressure seen {self.pressure_count} times)"]
+        for name, adjustment in self.adjustments.items():
+            lines.append(f"  {name}: {adjustment}")
+        return "\n".join(lines)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Shape Audit
+===========
+Per-type cache for the unhandled-field audit.
+
+Objects of a well-known type almost always have the same set of raw fields,
+so checking every record against its DTO fields gives the same answer over
+and over. ShapeAudit caches the unhandled fields per (type, raw key set) and
+aggregates findings per (type, unhandled fields) shape: the first record of a
+shape is reported with sample values, every further record only increments
+the shape's counter.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class UnhandledShape:
+    """Unhandled fields of one type, with where they were first seen"""
+    type_name: str
+    field_names: Tuple[str, ...]
+    first_filename: str
+    first_path: str
+    occurrences: int = 0
+    samples: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the shape as a JSON-serializable dict"""
+        return {
+            "type_name": self.type_name,
+            "field_names": list(self.field_names),
+            "occurrences": self.occurrences,
+            "first_filename": self.first_filename,
+            "first_path": self.first_path,
+            "samples": self.samples,
+        }
+
+
+class ShapeAudit:
+    """Caches unhandled fields per raw object shape and counts repeated shapes"""
+
+    def __init__(self):
+        """Initialize empty caches"""
+        # (type name, raw key set) -> sorted unhandled field names
+        self._unhandled_by_raw_shape: Dict[Tuple[str, FrozenSet[str]], Tuple[str, ...]] = {}
+
+        # (type name, unhandled field names) -> shape
+        self.shapes: Dict[Tuple[str, Tuple[str, ...]], UnhandledShape] = {}
+
+    def get_unhandled_fields(self, type_name: str, raw_keys: Iterable[str],
+                             declared_fields: Collection[str]) -> Tuple[str, ...]:
+        """
+        Get the raw fields a DTO type does not declare (computed once per raw key set)
+
+        Args:
+            type_name: DTO class name
+            raw_keys: Field names of the raw dict ("$__" entries are ignored)
+            declared_fields: Field names the DTO class declares
+
+        Returns:
+            Sorted unhandled field names (empty if all fields are handled)
+        """
+        shape_key = (type_name, frozenset(raw_keys))
+        unhandled = self._unhandled_by_raw_shape.get(shape_key)
+        if unhandled is None:
+            unhandled = tuple(sorted(
+                name for name in shape_key[1]
+                if not name.startswith('$__') and name not in declared_fields
+            ))
+            self._unhandled_by_raw_shape[shape_key] = unhandled
+        return unhandled
+
+    def record(self, type_name: str, field_names: Tuple[str, ...], filename: str, path: str,
+               samples: Optional[Dict[str, Any]] = None) -> Tuple[UnhandledShape, bool]:
+        """
+        Count one object with unhandled fields
+
+        Args:
+            type_name: DTO class name
+            field_names: Sorted unhandled field names
+            filename: File the object belongs to
+            path: Path of the object inside the record ("" for the root)
+            samples: Values of the unhandled fields, only kept for a shape's first record
+
+        Returns:
+            (shape, is_new) - is_new is True for the first record of the shape
+        """
+        shape_key = (type_name, field_names)
+        shape = self.shapes.get(shape_key)
+        is_new = shape is None
+        if is_new:
+            shape = UnhandledShape(type_name, field_names, filename, path)
+            self.shapes[shape_key] = shape
+        if samples and not shape.samples:
+            shape.samples = samples
+        shape.occurrences += 1
+        return shape, is_new
+
+    def get_field_counts(self) -> Dict[str, int]:
+        """Get the number of occurrences of every unhandled "Type.field" """
+        counts: Dict[str, int] = {}
+        for shape in self.shapes.values():
+            for field_name in shape.field_names:
+                key = f"{shape.type_name}.{field_name}"
+                counts[key] = counts.get(key, 0) + shape.occurrences
+        return counts
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Get all shapes as JSON-serializable dicts, most frequent first"""
+        shapes = sorted(self.shapes.values(), key=lambda shape: shape.occurrences, reverse=True)
+        return [shape.to_dict() for shape in shapes]
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Slotted DTOs
+============
+Memory-compact base for the spell, item and mob DTO dataclasses.
+
+The DTOs are declared with @dataclass(slots=True), so instances store their
+fields in fixed slots instead of a per-instance __dict__. SlottedDTO keeps a
+read-only __dict__ view of the fields, so code that serializes DTOs with
+obj.__dict__ or detects them with hasattr(obj, '__dict__') keeps working.
+
+Strings that repeat across thousands of records (school names, effect and
+behavior names, type names...) are interned by the DTO factories, so every
+DTO shares one copy of each value instead of holding its own decoded string.
+"""
+
+import sys
+from typing import Any, Dict
+
+
+# Fields whose string values repeat across records and are interned on DTO creation
+INTERNED_FIELDS = frozenset({
+    # School names
+    "m_magicSchool", "m_magicSchoolName", "m_sMagicSchoolName", "m_schoolName",
+    "m_school", "m_equipSchool", "m_schoolOfFocus", "m_secondarySchoolOfFocus",
+    "m_schoolRestriction", "m_primarySchoolName",
+    # Type and behavior names
+    "m_sTypeName", "m_behaviorName", "m_effectName", "m_effectType", "m_pipType",
+    "m_slotName", "m_stateSetName", "m_resourceType", "m_benefitType",
+    "m_elixirType", "m_movementType", "m_propertyType",
+})
+
+
+def intern_field_value(field_name: str, value: Any) -> Any:
+    """Intern a string value of one of the INTERNED_FIELDS (other values are returned as is)"""
+    if type(value) is str and field_name in INTERNED_FIELDS:
+        return sys.intern(value)
+    return value
+
+
+class SlottedDTO:
+    """Base class of slotted dataclass DTOs"""
+
+    __slots__ = ()
+
+    @property
+    def __dict__(self) -> Dict[str, Any]:
+        """Field values as a new dict (read-only view, slotted DTOs have no instance dict)"""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
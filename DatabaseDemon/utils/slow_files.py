@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Slow Files
+==========
+Outlier capture for the per-file pipeline stages.
+
+SlowFileTracker keeps a bounded min-heap of the N slowest files of a run,
+each with its byte size, the nesting depth of its converted data and the
+seconds it spent per stage. Only files that make it into the heap are
+described, so tracking costs one comparison per file.
+
+FileProfiler is the opt-in deep dive: it runs cProfile around every file
+and, for files slower than a threshold, appends the profile as collapsed
+stacks ("frame;frame;frame microseconds" lines) to <file>.folded, which
+flamegraph.pl, speedscope and inferno read directly.
+
+cProfile records caller/callee pairs rather than full stacks, so the stacks
+are rebuilt from the call graph: the time of a function reached through
+several callers is split in proportion to each caller's cumulative time.
+"""
+
+import cProfile
+import heapq
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Stacks deeper than this are cut off (guards against runaway call graphs)
+MAX_STACK_DEPTH = 200
+
+# Call graph edges below this many seconds are left out of the collapsed stacks
+MIN_EDGE_SECONDS = 1e-6
+
+
+@dataclass
+class SlowFile:
+    """One of the slowest files of a run"""
+    name: str
+    seconds: float
+    size_bytes: Optional[int] = None
+    nesting_depth: Optional[int] = None
+    stages: Dict[str, float] = field(default_factory=dict)  # Seconds per stage
+    profile_path: Optional[str] = None
+
+
+def get_nesting_depth(value: Any) -> int:
+    """Deepest level of nested dicts, lists and DTO objects in a value (0 for a scalar)"""
+    depth = 0
+    pending = [(value, 1)]
+    while pending:
+        current, level = pending.pop()
+        if isinstance(current, dict):
+            children = current.values()
+        elif isinstance(current, (list, tuple)):
+            children = current
+        elif hasattr(current, "__dict__") and not isinstance(current, (type, Enum)):
+            children = current.__dict__.values()
+        else:
+            continue
+        if level > depth:
+            depth = level
+        pending.extend((child, level + 1) for child in children)
+    return depth
+
+
+class SlowFileTracker:
+    """Bounded heap of the slowest files of a run"""
+
+    def __init__(self, limit: int = 20):
+        """
+        Initialize an empty tracker
+
+        Args:
+            limit: Number of slowest files to keep
+        """
+        self.limit = limit
+        self.files: Dict[int, SlowFile] = {}      # {file sample index: slow file}
+        self._heap: List[Tuple[float, int]] = []  # (seconds, file index), fastest kept file first
+
+    def admits(self, index: int, seconds: float) -> bool:
+        """Check whether a file with this latency belongs in the heap"""
+        if self.limit <= 0:
+            return False
+        return index in self.files or len(self._heap) < self.limit or seconds > self._heap[0][0]
+
+    def record(self, index: int, slow_file: SlowFile):
+        """
+        Add or update a file (call only when admits() is True)
+
+        Args:
+            index: File sample index (the same file framed again updates its entry)
+            slow_file: Description of the file
+        """
+        if index in self.files:
+            # Latencies only grow, so the heap just needs its order restored
+            self.files[index] = slow_file
+            self._heap = [(kept.seconds, kept_index) for kept_index, kept in self.files.items()]
+            heapq.heapify(self._heap)
+            return
+
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, (slow_file.seconds, index))
+        else:
+            _, evicted = heapq.heapreplace(self._heap, (slow_file.seconds, index))
+            del self.files[evicted]
+        self.files[index] = slow_file
+
+    def get_slowest(self) -> List[SlowFile]:
+        """Get the kept files, slowest first"""
+        return sorted(self.files.values(), key=lambda slow_file: slow_file.seconds, reverse=True)
+
+
+def _frame_label(function: Tuple[str, int, str]) -> str:
+    """Flame graph frame name of a cProfile function key"""
+    filename, lineno, name = function
+    if filename == "~":
+        label = name  # Built-in, e.g. "<built-in method builtins.len>"
+    else:
+        label = f"{name} ({Path(filename).name}:{lineno})"
+    return label.replace(";", ":")
+
+
+def get_collapsed_stacks(profile: cProfile.Profile) -> Dict[str, int]:
+    """
+    Rebuild collapsed stacks from a finished profile
+
+    Args:
+        profile: Disabled cProfile profile
+
+    Returns:
+        {"frame;frame;frame": self time in microseconds}
+    """
+    profile.create_stats()
+    stats = profile.stats
+
+    # {caller: {callee: cumulative seconds of the calls}}
+    callees: Dict[Any, Dict[Any, float]] = {}
+    roots = []
+    for function, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            roots.append(function)
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[function] = edge[3]
+
+    stacks: Dict[str, int] = {}
+
+    def walk(function, path: Tuple[str, ...], on_path: frozenset, scale: float):
+        _, _, own_seconds, cumulative_seconds, _ = stats[function]
+        path = path + (_frame_label(function),)
+        micros = int(own_seconds * scale * 1_000_000)
+        if micros:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + micros
+
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+        on_path = on_path | {function}
+        for callee, edge_seconds in callees.get(function, {}).items():
+            if callee in on_path:
+                continue  # Recursion is folded into the outermost call
+            callee_seconds = stats[callee][3]
+            share = edge_seconds * scale
+            if share < MIN_EDGE_SECONDS or callee_seconds <= 0:
+                continue
+            walk(callee, path, on_path, share / callee_seconds)
+
+    for root in roots:
+        walk(root, (), frozenset(), 1.0)
+    return stacks
+
+
+class FileProfiler:
+    """Profiles files one at a time and keeps the profiles of slow files"""
+
+    def __init__(self, output_dir: Path, threshold_ms: float):
+        """
+        Initialize the profiler
+
+        Args:
+            output_dir: Directory receiving the .folded files
+            threshold_ms: Files at least this slow (end to end) get their profile saved
+        """
+        self.output_dir = Path(output_dir)
+        self.threshold_ms = threshold_ms
+        self.profiled_files = 0
+        self._profile: Optional[cProfile.Profile] = None
+
+    def start(self) -> bool:
+        """
+        Start profiling the current file
+
+        Returns:
+            False if another profiler is already active
+        """
+        self._profile = cProfile.Profile()
+        try:
+            self._profile.enable()
+        except ValueError as e:
+            print(f"[WARNING] File profiling unavailable: {e}")
+            self._profile = None
+            return False
+        return True
+
+    def cancel(self):
+        """Stop profiling the current file and drop its profile"""
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile = None
+
+    def stop(self, name: str, seconds: float) -> Optional[Path]:
+        """
+        Stop profiling the current file
+
+        Args:
+            name: File name (used for the output file)
+            seconds: End-to-end latency of the file
+
+        Returns:
+            Path of the .folded file if the file was slow enough, None otherwise
+        """
+        profile = self._profile
+        self._profile = None
+        if profile is None:
+            return None
+        profile.disable()
+
+        if seconds * 1000 < self.threshold_ms:
+            return None
+
+        stacks = get_collapsed_stacks(profile)
+        if not stacks:
+            return None
+
+        # A file framed in several passes adds its stacks to the same file
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self.output_dir / (re.sub(r"[^\w.-]+", "_", name).strip("_") + ".folded")
+        with open(output_path, "a", encoding="utf-8") as f:
+            for stack, micros in stacks.items():
+                f.write(f"{stack} {micros}\n")
+
+        self.profiled_files += 1
+        return output_path
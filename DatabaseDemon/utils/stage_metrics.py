@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Stage Metrics
+=============
+Per-stage timings of one pipeline run, persisted into the output database.
+
+A StageMetrics combines a StageTimer (cumulative time and call counts per
+stage) with per-file latencies: every file is framed by begin_file() and
+end_file(), and the time each stage spent on the file is kept in a compact
+float array. The run's totals and the p50/p95/p99/max per-file latency of
+every stage go into the processing_stage_metrics table; the "file" row holds
+the end-to-end latency per file.
+
+Pipelines that extract and insert in separate passes (all DTOs first, then
+all inserts) frame the same file twice with the same key, so its latencies
+cover both passes. Stage time measured in worker processes is merged with
+add().
+
+The slowest files are kept in a SlowFileTracker and written to the
+processing_slow_files table. With enable_profiling(), every file runs under
+cProfile and files above the threshold leave a collapsed-stack profile.
+
+Every stage also records the peak RSS it pushed the process to (and, with
+enable_memory_tracing(), its peak of traced Python memory). A MemoryBudget
+attached to the metrics travels with them to every pipeline component.
+
+Builder scripts share their metrics options through add_metrics_arguments()
+and apply_metrics_arguments().
+"""
+
+import argparse
+import json
+import math
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .stage_timer import StageTimer
+from .slow_files import FileProfiler, SlowFile, SlowFileTracker, get_nesting_depth
+from .process_memory import MemoryBudget, StageMemory
+
+
+# Stage name of the end-to-end latency per file
+FILE_STAGE = "file"
+
+
+@dataclass
+class StageSummary:
+    """Totals and per-file latency percentiles of one stage"""
+    stage: str
+    calls: int
+    total_seconds: float
+    files: int
+    p50_ms: Optional[float]
+    p95_ms: Optional[float]
+    p99_ms: Optional[float]
+    max_ms: Optional[float]
+    peak_rss_mb: Optional[float] = None
+    peak_python_mb: Optional[float] = None
+
+
+def get_percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list (fraction 0.95 = p95)"""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class StageMetrics:
+    """Stage timer plus per-file stage latencies of one pipeline run"""
+
+    CREATE_SQL = """
+        CREATE TABLE IF NOT EXISTS processing_stage_metrics (
+            stage TEXT PRIMARY KEY,
+            calls INTEGER NOT NULL,
+            files INTEGER NOT NULL,
+            total_seconds REAL NOT NULL,
+            p50_ms REAL,
+            p95_ms REAL,
+            p99_ms REAL,
+            max_ms REAL,
+            peak_rss_mb REAL,
+            peak_python_mb REAL,
+            recorded_at TEXT
+        )
+    """
+    INSERT_SQL = """
+        INSERT INTO processing_stage_metrics (
+            stage, calls, files, total_seconds, p50_ms, p95_ms, p99_ms, max_ms,
+            peak_rss_mb, peak_python_mb, recorded_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    CREATE_SLOW_FILES_SQL = """
+        CREATE TABLE IF NOT EXISTS processing_slow_files (
+            rank INTEGER PRIMARY KEY,
+            file_path TEXT,
+            latency_ms REAL NOT NULL,
+            size_bytes INTEGER,
+            nesting_depth INTEGER,
+            stage_ms TEXT,
+            profile_path TEXT,
+            recorded_at TEXT
+        )
+    """
+    INSERT_SLOW_FILES_SQL = """
+        INSERT INTO processing_slow_files (
+            rank, file_path, latency_ms, size_bytes, nesting_depth, stage_ms, profile_path, recorded_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, slow_file_limit: int = 20):
+        """
+        Initialize empty metrics
+
+        Args:
+            clock: Monotonic clock returning seconds
+            slow_file_limit: Number of slowest files to keep
+        """
+        self.clock = clock
+        self.timer = StageTimer(clock)
+
+        # Slowest files; the size lookup maps a file name to its byte size
+        self.slow_files = SlowFileTracker(slow_file_limit)
+        self.file_size_lookup: Optional[Callable[[str], Optional[int]]] = None
+        self.profiler: Optional[FileProfiler] = None
+
+        # Peak memory per stage, and the budget pipelines adapt their buffers to
+        self.memory = StageMemory()
+        self.timer.memory = self.memory
+        self.memory_budget: Optional[MemoryBudget] = None
+
+        # Seconds per file (index = file sample), end-to-end and per stage
+        self.file_seconds = array('d')
+        self.stage_file_seconds: Dict[str, array] = {}
+        self._file_index: Dict[str, int] = {}  # Keyed files framed more than once
+
+        # Current file frame
+        self._current: Optional[int] = None
+        self._file_key: Optional[str] = None
+        self._new_file = False  # Frame opened for the first time (not a later pass of a keyed file)
+        self._file_start = 0.0
+        self._file_added = 0.0  # Seconds merged from workers into the current file
+        self._snapshot: Dict[str, float] = {}
+        self._file_name: Optional[str] = None
+        self._file_content: Any = None
+        self._profiling = False
+
+    def stage(self, name: str):
+        """Time a block as one stage (context manager)"""
+        return self.timer.stage(name)
+
+    def timed(self, func: Callable, stage: str) -> Callable:
+        """Wrap a callable so every call is timed as the given stage"""
+        return self.timer.timed(func, stage)
+
+    @property
+    def file_count(self) -> int:
+        """Number of files framed so far"""
+        return len(self.file_seconds)
+
+    def enable_profiling(self, output_dir: Path, threshold_ms: float):
+        """
+        Profile every file and keep the collapsed stacks of files slower than a threshold
+
+        Args:
+            output_dir: Directory receiving the .folded files
+            threshold_ms: End-to-end latency from which a file's profile is saved
+        """
+        self.profiler = FileProfiler(output_dir, threshold_ms)
+
+    def enable_memory_tracing(self):
+        """Record each stage's peak of traced Python memory (tracemalloc) as well"""
+        self.memory.start_tracing()
+
+    def set_memory_budget(self, limit_mb: float):
+        """
+        Make the pipelines shrink their buffers to keep RSS under a limit
+
+        Args:
+            limit_mb: Resident memory limit in MB
+        """
+        self.memory_budget = MemoryBudget(limit_mb)
+
+    def begin_file(self, key: Optional[str] = None, name: Optional[str] = None):
+        """
+        Start timing one file
+
+        Args:
+            key: File identity for pipelines that frame a file in several passes
+                 (None = always a new file)
+            name: File name reported for slow files (defaults to key)
+        """
+        self._file_name = name if name is not None else key
+        self._file_content = None
+        self._file_key = key
+        self._new_file = not (key is not None and key in self._file_index)
+        if self._new_file:
+            self._current = len(self.file_seconds)
+            self.file_seconds.append(0.0)
+            if key is not None:
+                self._file_index[key] = self._current
+        else:
+            self._current = self._file_index[key]
+        self._snapshot = dict(self.timer.seconds)
+        self._file_added = 0.0
+        if self.profiler is not None:
+            self._profiling = self.profiler.start()
+        self._file_start = self.clock()
+
+    def set_file_content(self, content: Any):
+        """
+        Attach the converted data of the current file (its nesting depth is
+        only measured if the file turns out to be one of the slowest)
+        """
+        self._file_content = content
+
+    def end_file(self) -> Dict[str, float]:
+        """
+        Stop timing the current file
+
+        Returns:
+            Seconds per stage spent on the file in this frame
+        """
+        elapsed = self.clock() - self._file_start
+        index = self._current
+        self._current = None
+
+        file_stages = {}
+        for stage, seconds in self.timer.seconds.items():
+            spent = seconds - self._snapshot.get(stage, 0.0)
+            if spent > 0:
+                file_stages[stage] = spent
+                self._get_stage_samples(stage, index)[index] += spent
+
+        # Time merged from workers was spent before this process's frame started
+        self.file_seconds[index] += elapsed + self._file_added
+        seconds = self.file_seconds[index]
+
+        profile_path = None
+        if self._profiling:
+            self._profiling = False
+            profile_path = self.profiler.stop(self._file_name or f"file #{index + 1}", seconds)
+
+        if self.slow_files.admits(index, seconds):
+            self._record_slow_file(index, seconds, profile_path)
+        self._file_content = None
+        return file_stages
+
+    def discard_file(self):
+        """
+        Stop timing the current file without recording it (e.g. a scanned file
+        that no consumer of this database wanted). Its stage time still counts
+        in the stage totals, but it adds no latency sample and is never one of
+        the slowest files.
+        """
+        self._current = None
+        if self._profiling:
+            self._profiling = False
+            self.profiler.cancel()
+        self._file_content = None
+
+        # Only a frame opened for the first time is removed, earlier passes of a keyed file stay
+        if self._new_file:
+            self.file_seconds.pop()
+            if self._file_key is not None:
+                del self._file_index[self._file_key]
+            self._new_file = False
+
+    def _record_slow_file(self, index: int, seconds: float, profile_path: Optional[Path]):
+        """Describe the current file for the slowest-files heap"""
+        # Files framed in several passes keep what earlier passes found out
+        previous = self.slow_files.files.get(index)
+        name = self._file_name or (previous.name if previous else f"file #{index + 1}")
+
+        size_bytes = previous.size_bytes if previous else None
+        if size_bytes is None and self.file_size_lookup is not None and self._file_name:
+            size_bytes = self.file_size_lookup(self._file_name)
+
+        nesting_depth = previous.nesting_depth if previous else None
+        if self._file_content is not None:
+            nesting_depth = get_nesting_depth(self._file_content)
+
+        if profile_path is None and previous:
+            profile_path = previous.profile_path
+
+        stages = {
+            stage: samples[index]
+            for stage, samples in self.stage_file_seconds.items()
+            if index < len(samples) and samples[index] > 0
+        }
+        self.slow_files.record(index, SlowFile(
+            name, seconds, size_bytes, nesting_depth, stages,
+            str(profile_path) if profile_path else None
+        ))
+
+    def add(self, stage_seconds: Dict[str, float]):
+        """
+        Add stage time measured elsewhere (a worker's end_file() result) to the current file
+
+        Args:
+            stage_seconds: Seconds per stage
+        """
+        for stage, seconds in stage_seconds.items():
+            self.timer.add(stage, seconds)
+            self._file_added += seconds
+
+    def _get_stage_samples(self, stage: str, index: int) -> array:
+        """Get the per-file samples of a stage, grown to hold the given file index"""
+        samples = self.stage_file_seconds.get(stage)
+        if samples is None:
+            samples = self.stage_file_seconds[stage] = array('d')
+        if len(samples) <= index:
+            samples.extend(array('d', bytes(8 * (index + 1 - len(samples)))))
+        return samples
+
+    def _summarize(self, stage: str, calls: int, total_seconds: float, samples: array) -> StageSummary:
+        """Summarize one stage (files without time in the stage are left out)"""
+        values = sorted(value for value in samples if value > 0)
+        peak_rss_mb = self.memory.peak_rss_mb.get(stage)
+        peak_python_mb = self.memory.peak_python_mb.get(stage)
+        if not values:
+            return StageSummary(stage, calls, total_seconds, 0, None, None, None, None,
+                                peak_rss_mb, peak_python_mb)
+        return StageSummary(
+            stage, calls, total_seconds, len(values),
+            get_percentile(values, 0.50) * 1000,
+            get_percentile(values, 0.95) * 1000,
+            get_percentile(values, 0.99) * 1000,
+            values[-1] * 1000,
+            peak_rss_mb, peak_python_mb
+        )
+
+    def get_summaries(self) -> List[StageSummary]:
+        """Get the summary of every stage in pipeline order, then the per-file row"""
+        summaries = [
+            self._summarize(stage, self.timer.calls.get(stage, 0), seconds,
+                            self.stage_file_seconds.get(stage, array('d')))
+            for stage, seconds in self.timer.totals().items()
+        ]
+        summaries.append(self._summarize(FILE_STAGE, self.file_count, sum(self.file_seconds),
+                                         self.file_seconds))
+        return summaries
+
+    def save(self, connection):
+        """
+        Replace the processing_stage_metrics rows of a database with this run's metrics
+
+        Args:
+            connection: SQLite connection of the output database
+        """
+        recorded_at = datetime.now().isoformat()
+
+        # Incremental builds copy the base database, whose tables may predate newer columns
+        connection.execute("DROP TABLE IF EXISTS processing_stage_metrics")
+        connection.execute(self.CREATE_SQL)
+        connection.executemany(self.INSERT_SQL, [
+            (summary.stage, summary.calls, summary.files, summary.total_seconds,
+             summary.p50_ms, summary.p95_ms, summary.p99_ms, summary.max_ms,
+             summary.peak_rss_mb, summary.peak_python_mb, recorded_at)
+            for summary in self.get_summaries()
+        ])
+
+        connection.execute("DROP TABLE IF EXISTS processing_slow_files")
+        connection.execute(self.CREATE_SLOW_FILES_SQL)
+        connection.executemany(self.INSERT_SLOW_FILES_SQL, [
+            (rank, slow_file.name, slow_file.seconds * 1000, slow_file.size_bytes, slow_file.nesting_depth,
+             json.dumps({stage: round(seconds * 1000, 3) for stage, seconds in slow_file.stages.items()}),
+             slow_file.profile_path, recorded_at)
+            for rank, slow_file in enumerate(self.slow_files.get_slowest(), 1)
+        ])
+        connection.commit()
+
+    def format_summary(self, slow_files: int = 10) -> str:
+        """Format the stage summaries and the slowest files for the run summary"""
+        def format_value(value: Optional[float], precision: int = 2) -> str:
+            return f"{value:>9.{precision}f}" if value is not None else f"{'-':>9}"
+
+        tracing = self.memory.tracing or bool(self.memory.peak_python_mb)
+        header = (f"{'Stage':<12} {'Seconds':>9} {'Calls':>9} {'Files':>9} "
+                  f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'RSS MB':>9}")
+        lines = [header + (f" {'Py MB':>9}" if tracing else "")]
+        for summary in self.get_summaries():
+            line = (f"{summary.stage:<12} {summary.total_seconds:>9.2f} {summary.calls:>9} "
+                    f"{summary.files:>9} {format_value(summary.p50_ms)} {format_value(summary.p95_ms)} "
+                    f"{format_value(summary.p99_ms)} {format_value(summary.max_ms)} "
+                    f"{format_value(summary.peak_rss_mb, 1)}")
+            lines.append(line + (f" {format_value(summary.peak_python_mb, 1)}" if tracing else ""))
+
+        peak_mb = self.memory.peak_mb
+        if peak_mb is not None:
+            lines.append(f"Peak RSS: {peak_mb:.1f} MB (RSS MB = process peak reached during the stage)")
+        if self.memory_budget is not None:
+            lines.append(self.memory_budget.format_summary())
+
+        slowest = self.slow_files.get_slowest()[:slow_files]
+        if slowest:
+            lines.append("")
+            lines.append(f"Slowest files ({len(slowest)} of {len(self.slow_files.files)} kept):")
+            for slow_file in slowest:
+                size = f"{slow_file.size_bytes:,} B" if slow_file.size_bytes is not None else "? B"
+                depth = slow_file.nesting_depth if slow_file.nesting_depth is not None else "?"
+                top_stages = sorted(slow_file.stages.items(), key=lambda item: item[1], reverse=True)[:3]
+                breakdown = ", ".join(f"{stage} {seconds * 1000:.1f}" for stage, seconds in top_stages)
+                lines.append(f"  {slow_file.seconds * 1000:>9.2f} ms  {size:>12}  depth {depth:>3}  "
+                             f"{slow_file.name} ({breakdown})")
+        if self.profiler is not None:
+            lines.append(f"Profiled files over {self.profiler.threshold_ms:g} ms: "
+                         f"{self.profiler.profiled_files} (collapsed stacks in {self.profiler.output_dir})")
+        return "\n".join(lines)
+
+
+# Help text of the options added by add_metrics_arguments(), for scripts that print their docstring
+METRICS_OPTIONS_HELP = """Stage metrics options (shared by all builder scripts):
+    --profile-slow-files MS
+                  Run every file under cProfile and save the profile of each
+                  file slower than MS milliseconds as collapsed stacks
+                  (<file>.folded, readable by flamegraph.pl and speedscope).
+                  Slows the run down; parallel spell workers each profile
+                  their own part of a file. The slowest files are always
+                  listed in the processing_slow_files table.
+    --profile-dir PATH
+                  Directory for the .folded profiles (default: slow_file_profiles)
+    --memory-budget MB
+                  Keep resident memory under MB megabytes: above 80% of it the
+                  pipelines shrink their batch sizes, row buffers and the
+                  bulk-load page cache, and stream instead of accumulating.
+                  Only the main process is measured, not spell extraction
+                  workers. Peak RSS per stage is always reported.
+    --trace-memory
+                  Also record each stage's peak of traced Python memory
+                  (tracemalloc). Slows the run down noticeably.
+"""
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser):
+    """Add the stage metrics options shared by the builder scripts"""
+    group = parser.add_argument_group("stage metrics")
+    group.add_argument(
+        '--profile-slow-files',
+        type=float,
+        default=None,
+        metavar='MS',
+        help='Save cProfile collapsed stacks of files slower than MS milliseconds (default: off)'
+    )
+    group.add_argument(
+        '--profile-dir',
+        type=Path,
+        default=Path('slow_file_profiles'),
+        help='Directory for the slow file profiles (default: slow_file_profiles)'
+    )
+    group.add_argument(
+        '--memory-budget',
+        type=float,
+        default=None,
+        metavar='MB',
+        help='Shrink batch sizes and caches to keep resident memory under MB megabytes (default: off)'
+    )
+    group.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Also record peak traced Python memory per stage with tracemalloc (slower)'
+    )
+
+
+def apply_metrics_arguments(args: argparse.Namespace, metrics: StageMetrics):
+    """
+    Configure stage metrics from the options added by add_metrics_arguments()
+
+    Args:
+        args: Parsed command line arguments
+        metrics: Stage metrics of the run
+    """
+    if args.profile_slow_files is not None:
+        metrics.enable_profiling(args.profile_dir, args.profile_slow_files)
+    if args.memory_budget is not None:
+        metrics.set_memory_budget(args.memory_budget)
+    if args.trace_memory:
+        metrics.enable_memory_tracing()
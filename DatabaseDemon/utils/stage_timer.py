@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Stage Timer
+===========
+Cumulative wall-clock time per pipeline stage.
+
+Stages nest: while an inner stage runs, the enclosing stage is paused, so
+every second is attributed to exactly one stage and the stage totals add up
+to the measured run. Re-entering a stage that is already active (recursion,
+or a wrapped method calling another method of the same stage) counts as one
+call.
+
+Existing code can be measured without editing it: instrument() replaces a
+method or function attribute of a class, instance or module with a timed
+version, and TimedProxy wraps objects whose methods cannot be replaced
+(such as the native katsuba Archive).
+
+An optional memory sampler (see process_memory.StageMemory) is called at
+every stage boundary, so memory peaks are attributed like the time.
+"""
+
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Stages shared by all database builders, in pipeline order
+PIPELINE_STAGES = ("open", "list", "deserialize", "convert", "dto", "insert", "index", "report")
+
+
+class StageTimer:
+    """Accumulates exclusive wall time and call counts per stage"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize the timer
+
+        Args:
+            clock: Monotonic clock returning seconds
+        """
+        self.clock = clock
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._active: List[str] = []  # Stack of running stages
+        self._mark = 0.0              # Time the innermost stage was (re)started
+        self.memory: Optional[Any] = None  # Called with the stage of each ended interval
+
+    def start(self, stage: str):
+        """Enter a stage, pausing the enclosing one"""
+        now = self.clock()
+        if self.memory is not None:
+            self.memory.sample(self._active[-1] if self._active else None)
+        if self._active:
+            outer = self._active[-1]
+            self.seconds[outer] = self.seconds.get(outer, 0.0) + now - self._mark
+        if stage not in self._active:
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+        self._active.append(stage)
+        self._mark = now
+
+    def stop(self):
+        """Leave the innermost stage, resuming the enclosing one"""
+        now = self.clock()
+        stage = self._active.pop()
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + now - self._mark
+        if self.memory is not None:
+            self.memory.sample(stage)
+        self._mark = now
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as one stage"""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def timed(self, func: Callable, stage: str) -> Callable:
+        """Wrap a callable so every call is timed as the given stage"""
+        @functools.wraps(func)
+        def timed_call(*args, **kwargs):
+            self.start(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.stop()
+        return timed_call
+
+    def instrument(self, owner: Any, attr: str, stage: str):
+        """
+        Replace owner.attr with a timed version
+
+        Args:
+            owner: Class, instance or module holding the callable
+            attr: Attribute name of the method or function
+            stage: Stage the calls are attributed to
+        """
+        if isinstance(owner, type) and isinstance(inspect.getattr_static(owner, attr),
+                                                  (classmethod, staticmethod)):
+            # Keep calling the bound classmethod, whether called on the class or an instance
+            setattr(owner, attr, staticmethod(self.timed(getattr(owner, attr), stage)))
+        else:
+            setattr(owner, attr, self.timed(getattr(owner, attr), stage))
+
+    def add(self, stage: str, seconds: float, calls: int = 1):
+        """Add time measured elsewhere (e.g. in a worker process) to a stage"""
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    def totals(self) -> Dict[str, float]:
+        """Seconds per stage, pipeline stages first"""
+        ordered = {stage: self.seconds[stage] for stage in PIPELINE_STAGES if stage in self.seconds}
+        ordered.update((stage, seconds) for stage, seconds in self.seconds.items() if stage not in ordered)
+        return ordered
+
+    @property
+    def total_seconds(self) -> float:
+        """Seconds over all stages"""
+        return sum(self.seconds.values())
+
+
+class TimedProxy:
+    """Forwards everything to a target object, timing selected methods"""
+
+    def __init__(self, target: Any, timer: StageTimer, stages: Dict[str, str]):
+        """
+        Initialize the proxy
+
+        Args:
+            target: Wrapped object (e.g. a katsuba Archive)
+            timer: Timer receiving the measurements
+            stages: {method name: stage} of the methods to time
+        """
+        self._target = target
+        for method, stage in stages.items():
+            setattr(self, method, timer.timed(getattr(target, method), stage))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._target[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._target
+
+    def __len__(self) -> int:
+        return len(self._target)
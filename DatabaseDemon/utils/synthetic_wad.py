@@ -0,0 +1,868 @@
+#!/usr/bin/env python3
+"""
+Synthetic WAD Fixtures
+======================
+Generates an offline Root.wad stand-in and a matching types dump.
+
+The pipelines type-check against katsuba's native LazyObject, so the fixture
+is a real KIWAD archive of binary ObjectProperty files rather than a Python
+imitation of Archive. Everything katsuba needs to read it back is written
+here: the archive table (optionally zlib compressed), the bit-packed object
+encoding and a small types.json that declares only the synthetic classes.
+The classes reuse the real type hashes of the DTO factories, so every
+pipeline routes the synthetic files exactly like the game's.
+
+A fixture contains:
+- Spells/*.xml: SpellTemplates and TieredSpellTemplates with nested
+  conditional, random, delay and effect-list effects and requirement lists
+- ObjectData/Mobs/**: WizGameObjectTemplates with NPC, duelist and
+  monstrous behaviors
+- ObjectData/Items/**: WizItemTemplates with equip effects and
+  equipment behaviors
+- ObjectData/Decks/*.xml: DeckTemplates, mirrored as JSON into MobDecks/
+- TemplateManifest.xml: template IDs of all mobs, items and decks
+
+Generation is deterministic for a given spec and seed and streams entries
+through a spool file, so fixtures of several hundred thousand entries are
+built without holding the archive in memory.
+"""
+
+import json
+import random
+import shutil
+import struct
+import tempfile
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# ===== KIWAD ARCHIVE =====
+
+class KIWADWriter:
+    """Writes a KIWAD (version 2) archive entry by entry"""
+
+    def __init__(self, path: Path, compress: bool = False):
+        """
+        Initialize the writer
+
+        Args:
+            path: Output archive path
+            compress: Store entries zlib compressed (like most of Root.wad)
+        """
+        self.path = Path(path)
+        self.compress = compress
+        # (name, data offset, uncompressed size, stored size, compressed, crc)
+        self.entries: List[Tuple[bytes, int, int, int, bool, int]] = []
+        self._spool = tempfile.TemporaryFile()
+        self._spool_size = 0
+
+    def add(self, name: str, data: bytes):
+        """Append one file to the archive"""
+        stored = zlib.compress(data) if self.compress else data
+        crc = zlib.crc32(stored, 0xFFFFFFFF) ^ 0xFFFFFFFF
+        self.entries.append((name.encode() + b'\0', self._spool_size, len(data), len(stored),
+                             self.compress, crc))
+        self._spool.write(stored)
+        self._spool_size += len(stored)
+
+    def close(self):
+        """Write header, file table and file data to the output path"""
+        header = b'KIWAD' + struct.pack('<IIB', 2, len(self.entries), 1)
+        data_start = len(header) + sum(21 + len(name) for name, *_ in self.entries)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'wb') as f:
+            f.write(header)
+            for name, offset, size, stored_size, compressed, crc in self.entries:
+                f.write(struct.pack('<IIIBII', data_start + offset, size, stored_size,
+                                    1 if compressed else 0, crc, len(name)))
+                f.write(name)
+            self._spool.seek(0)
+            shutil.copyfileobj(self._spool, f)
+        self._spool.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit (the archive is only written on success)"""
+        if exc_type is None:
+            self.close()
+        else:
+            self._spool.close()
+
+
+# ===== SYNTHETIC SCHEMA =====
+
+# Property kinds -> (types.json type, container, pointer)
+#   "obj:X"   SharedPointer to a class derived from X (None for null)
+#   "class:X" embedded object of class X
+#   "<kind>[]" List container of that kind
+_SCALAR_TYPES = {
+    "bool": "bool",
+    "int": "int",
+    "uint": "unsigned int",
+    "float": "float",
+    "str": "std::string",
+    "color": "class Color",
+}
+
+
+def _property_hash(name: str, type_name: str) -> int:
+    """Stable property hash (only has to agree between dump and data)"""
+    return zlib.crc32(f"{type_name} {name}".encode()) & 0x7FFFFFFF
+
+
+_SPELL_EFFECT = [
+    ("m_act", "bool"), ("m_actNum", "int"), ("m_armorPiercingParam", "int"),
+    ("m_bypassProtection", "bool"), ("m_chancePerTarget", "int"), ("m_cloaked", "bool"),
+    ("m_converted", "bool"), ("m_damageType", "uint"), ("m_disposition", "int"),
+    ("m_effectParam", "int"), ("m_effectTarget", "int"), ("m_effectType", "int"),
+    ("m_enchantmentSpellTemplateID", "uint"), ("m_healModifier", "float"), ("m_numRounds", "int"),
+    ("m_paramPerRound", "int"), ("m_pipNum", "int"), ("m_protected", "bool"), ("m_rank", "int"),
+    ("m_sDamageType", "str"), ("m_spellTemplateID", "uint"),
+]
+
+_SPELL_TEMPLATE = [
+    ("m_name", "str"), ("m_displayName", "str"), ("m_description", "str"),
+    ("m_advancedDescription", "str"), ("m_imageName", "str"), ("m_imageIndex", "int"),
+    ("m_cardFront", "str"), ("m_spellBase", "str"), ("m_spellCategory", "str"),
+    ("m_sMagicSchoolName", "str"), ("m_sTypeName", "str"), ("m_accuracy", "int"),
+    ("m_baseCost", "int"), ("m_trainingCost", "int"), ("m_levelRestriction", "int"),
+    ("m_maxCopies", "int"), ("m_spellSourceType", "int"), ("m_PvE", "bool"), ("m_PvP", "bool"),
+    ("m_Treasure", "bool"), ("m_noDiscard", "bool"), ("m_leavesPlayWhenCast", "bool"),
+    ("m_spellRank", "class:SpellRank"), ("m_effects", "obj:SpellEffect[]"),
+    ("m_adjectives", "str[]"), ("m_validTargetSpells", "str[]"),
+    ("m_displayRequirements", "obj:RequirementList"),
+]
+
+_REQUIREMENT = [("m_applyNOT", "bool"), ("m_operator", "int")]
+
+_BEHAVIOR = [("m_behaviorName", "str")]
+
+_GAME_OBJECT = [
+    ("m_templateID", "uint"), ("m_objectName", "str"), ("m_displayName", "str"),
+    ("m_description", "str"), ("m_visualID", "uint"), ("m_nObjectType", "int"),
+    ("m_sIcon", "str"), ("m_exemptFromAOI", "bool"), ("m_adjectiveList", "str[]"),
+    ("m_behaviors", "obj:BehaviorTemplate[]"),
+]
+
+# Class name -> (type hash, [(property, kind)], base class name)
+SYNTHETIC_CLASSES: Dict[str, Tuple[int, List[Tuple[str, str]], Optional[str]]] = {
+    # Spells
+    "SpellTemplate": (1864220976, _SPELL_TEMPLATE, None),
+    "TieredSpellTemplate": (1015536062, _SPELL_TEMPLATE + [
+        ("m_nextTierSpells", "str[]"), ("m_requirements", "obj:RequirementList"),
+        ("m_retired", "bool"), ("m_shardCost", "int"),
+    ], "SpellTemplate"),
+    "SpellRank": (853452777, [
+        ("m_spellRank", "uint"), ("m_xPipSpell", "bool"), ("m_balancePips", "uint"),
+        ("m_deathPips", "uint"), ("m_firePips", "uint"), ("m_icePips", "uint"),
+        ("m_lifePips", "uint"), ("m_mythPips", "uint"), ("m_stormPips", "uint"),
+        ("m_shadowPips", "uint"),
+    ], None),
+    "SpellEffect": (1225309305, _SPELL_EFFECT, None),
+    "ConditionalSpellEffect": (1545841998, _SPELL_EFFECT + [
+        ("m_elements", "obj:ConditionalSpellElement[]"),
+    ], "SpellEffect"),
+    "ConditionalSpellElement": (1601626199, [
+        ("m_pReqs", "obj:RequirementList"), ("m_pEffect", "obj:SpellEffect"),
+    ], None),
+    "RandomSpellEffect": (1906855338, _SPELL_EFFECT + [
+        ("m_effectList", "obj:SpellEffect[]"),
+    ], "SpellEffect"),
+    "EffectListSpellEffect": (1760816619, _SPELL_EFFECT + [
+        ("m_effectList", "obj:SpellEffect[]"),
+    ], "SpellEffect"),
+    "DelaySpellEffect": (1928119170, _SPELL_EFFECT + [
+        ("m_damage", "int"), ("m_rounds", "int"), ("m_spellDelayedTemplateID", "uint"),
+        ("m_spellDelayedTemplateDamageID", "uint"), ("m_spellEnchanterTemplateID", "uint"),
+        ("m_targetSubcircleList", "int[]"), ("m_spellHits", "int"),
+    ], "SpellEffect"),
+
+    # Requirements
+    "RequirementList": (1558190673, _REQUIREMENT + [
+        ("m_requirements", "obj:Requirement[]"),
+    ], "Requirement"),
+    "ReqIsSchool": (1382050381, _REQUIREMENT + [
+        ("m_targetType", "int"), ("m_magicSchoolName", "str"),
+    ], "Requirement"),
+    "ReqMagicLevel": (258825572, _REQUIREMENT + [
+        ("m_numericValue", "float"), ("m_operatorType", "int"), ("m_magicSchool", "str"),
+    ], "Requirement"),
+    "ReqPvPCombat": (1501176517, _REQUIREMENT + [("m_targetType", "int")], "Requirement"),
+    "ReqPipCount": (1670595781, _REQUIREMENT + [
+        ("m_targetType", "int"), ("m_minPips", "int"), ("m_maxPips", "int"),
+    ], "Requirement"),
+
+    # Mobs
+    "WizGameObjectTemplate": (701229577, _GAME_OBJECT + [
+        ("m_primarySchoolName", "str"), ("m_lootTable", "str[]"), ("m_deathSound", "str"),
+    ], None),
+    "BehaviorTemplate": (360231646, _BEHAVIOR, None),
+    "NPCBehaviorTemplate": (1701337223, _BEHAVIOR + [
+        ("m_nStartingHealth", "int"), ("m_nLevel", "int"), ("m_fIntelligence", "float"),
+        ("m_fSelfishFactor", "float"), ("m_nAggressiveFactor", "int"), ("m_bossMob", "bool"),
+        ("m_turnTowardsPlayer", "bool"), ("m_mobTitle", "int"), ("m_maxShadowPips", "int"),
+        ("m_cylinderScaleValue", "float"), ("m_nameColor", "color"),
+        ("m_schoolOfFocus", "str"), ("m_secondarySchoolOfFocus", "str"),
+    ], "BehaviorTemplate"),
+    "DuelistBehaviorTemplate": (290147688, _BEHAVIOR + [
+        ("m_npcProximity", "float"),
+    ], "BehaviorTemplate"),
+    "MobMonsterMagicBehaviorTemplate": (959047476, _BEHAVIOR + [
+        ("m_alternateMobTemplateID", "uint"), ("m_collectedAsTemplateID", "uint"),
+        ("m_collectionResistance", "int"), ("m_goldPerKillTC", "int"),
+        ("m_essencesPerKillTC", "int"), ("m_isBoss", "bool"), ("m_worldName", "str"),
+    ], "BehaviorTemplate"),
+
+    # Items
+    "WizItemTemplate": (991922385, _GAME_OBJECT + [
+        ("m_school", "str"), ("m_rarity", "int"), ("m_rank", "int"), ("m_baseCost", "float"),
+        ("m_creditsCost", "float"), ("m_itemLimit", "int"),
+        ("m_equipEffects", "obj:StatisticEffectInfo[]"),
+    ], None),
+    "StatisticEffectInfo": (2081595736, [
+        ("m_effectName", "str"), ("m_lookupIndex", "int"), ("m_effectValue", "float"),
+        ("m_effectPercent", "float"), ("m_schoolName", "str"), ("m_effectType", "int"),
+    ], None),
+    "EquipmentBehaviorTemplate": (892480983, _BEHAVIOR + [
+        ("m_equipSlot", "str"), ("m_equipSchool", "str"), ("m_levelRequirement", "int"),
+        ("m_statisticEffects", "obj:StatisticEffectInfo[]"), ("m_equipmentFlags", "str[]"),
+    ], "BehaviorTemplate"),
+
+    # Decks
+    "DeckTemplate": (4737210, [
+        ("m_name", "str"), ("m_spellNameList", "str[]"), ("m_behaviors", "obj:BehaviorTemplate[]"),
+    ], None),
+
+    # TemplateManifest
+    "TemplateManifest": (171021254, [
+        ("m_serializedTemplates", "obj:TemplateLocation[]"),
+    ], None),
+    "TemplateLocation": (1128060484, [("m_filename", "str"), ("m_id", "uint")], None),
+}
+
+
+def _type_name(kind: str) -> Tuple[str, bool]:
+    """types.json type string and pointer flag of a property kind"""
+    if kind.startswith("obj:"):
+        return f"class SharedPointer<class {kind[4:]}>", True
+    if kind.startswith("class:"):
+        return f"class {kind[6:]}", False
+    return _SCALAR_TYPES[kind], False
+
+
+def build_types_dump() -> Dict[str, Any]:
+    """
+    Build the types dump (wiztype format, version 2) of the synthetic classes
+
+    Returns:
+        Dictionary ready to be written as types.json
+    """
+    classes = {}
+    for class_name, (type_hash, properties, base) in SYNTHETIC_CLASSES.items():
+        class_properties = {}
+        for index, (name, kind) in enumerate(properties):
+            is_list = kind.endswith("[]")
+            type_name, pointer = _type_name(kind[:-2] if is_list else kind)
+            class_properties[name] = {
+                "type": type_name,
+                "id": index,
+                "offset": 0,
+                "flags": 31,
+                "container": "List" if is_list else "Static",
+                "dynamic": is_list,
+                "singleton": False,
+                "pointer": pointer,
+                "hash": _property_hash(name, type_name),
+                "enum_options": {},
+            }
+        classes[str(type_hash)] = {
+            "bases": [f"class {base}"] if base else [],
+            "name": f"class {class_name}",
+            "hash": type_hash,
+            "singleton": False,
+            "properties": class_properties,
+        }
+    return {"version": 2, "classes": classes}
+
+
+# ===== OBJECT ENCODING =====
+
+class BitWriter:
+    """Little-endian bit stream used by the binary ObjectProperty serializer"""
+
+    __slots__ = ("buffer", "_bits", "_bit_count")
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._bits = 0        # Pending bits of the current byte
+        self._bit_count = 0
+
+    def position(self) -> int:
+        """Current position in bits"""
+        return len(self.buffer) * 8 + self._bit_count
+
+    def align(self):
+        """Pad to the next byte boundary"""
+        if self._bit_count:
+            self.buffer.append(self._bits)
+            self._bits = 0
+            self._bit_count = 0
+
+    def write_bool(self, value: bool):
+        """Write a single bit"""
+        if value:
+            self._bits |= 1 << self._bit_count
+        self._bit_count += 1
+        if self._bit_count == 8:
+            self.align()
+
+    def write(self, fmt: str, value: Any):
+        """Write a byte-aligned struct value"""
+        self.align()
+        self.buffer += struct.pack(fmt, value)
+
+    def write_bytes(self, data: bytes):
+        """Write byte-aligned raw bytes"""
+        self.align()
+        self.buffer += data
+
+    def patch_u32(self, bit_position: int, value: int):
+        """Overwrite a byte-aligned u32 written earlier"""
+        struct.pack_into('<I', self.buffer, bit_position // 8, value)
+
+    def getvalue(self) -> bytes:
+        """Encoded bytes (a trailing partial byte is flushed)"""
+        self.align()
+        return bytes(self.buffer)
+
+
+# A synthetic object: (class name, {property: value}); missing properties use defaults
+SyntheticObject = Tuple[str, Dict[str, Any]]
+
+
+def _write_str(writer: BitWriter, value: Any):
+    data = value.encode() if isinstance(value, str) else bytes(value)
+    writer.write('<H', len(data))
+    writer.write_bytes(data)
+
+
+def _write_color(writer: BitWriter, value: Any):
+    writer.write_bytes(bytes(value))
+
+
+def _scalar_writer(kind: str) -> Tuple[Callable[[BitWriter, Any], None], Any]:
+    """Value writer and default value of a scalar property kind"""
+    if kind == "bool":
+        return BitWriter.write_bool, False
+    if kind == "int":
+        return lambda w, v: w.write('<i', v), 0
+    if kind == "uint":
+        return lambda w, v: w.write('<I', v), 0
+    if kind == "float":
+        return lambda w, v: w.write('<f', v), 0.0
+    if kind == "str":
+        return _write_str, ""
+    if kind == "color":
+        return _write_color, (255, 255, 255, 255)
+    raise ValueError(f"Unknown property kind: {kind}")
+
+
+class ObjectEncoder:
+    """Encodes SyntheticObjects into the binary format read by katsuba"""
+
+    # "BINd" magic followed by the serializer flags (none)
+    FILE_HEADER = b'BINd' + struct.pack('<I', 0)
+
+    def __init__(self, classes: Dict[str, Tuple[int, List[Tuple[str, str]], Optional[str]]] = None):
+        """
+        Initialize the encoder
+
+        Args:
+            classes: Class schema (SYNTHETIC_CLASSES if None)
+        """
+        self.classes = classes if classes is not None else SYNTHETIC_CLASSES
+        # Class name -> (type hash, [(property, property hash, writer, default)])
+        self._layouts: Dict[str, Tuple[int, List[Tuple[str, int, Callable, Any]]]] = {}
+        for class_name, (type_hash, properties, _) in self.classes.items():
+            layout = []
+            for name, kind in properties:
+                is_list = kind.endswith("[]")
+                element_kind = kind[:-2] if is_list else kind
+                type_name, _ = _type_name(element_kind)
+                if element_kind.startswith(("obj:", "class:")):
+                    write_value, default = self._write_object, None
+                else:
+                    write_value, default = _scalar_writer(element_kind)
+                if is_list:
+                    write_value, default = self._list_writer(write_value), ()
+                layout.append((name, _property_hash(name, type_name), write_value, default))
+            self._layouts[class_name] = (type_hash, layout)
+
+    @staticmethod
+    def _list_writer(write_element: Callable) -> Callable[[BitWriter, Any], None]:
+        def write_list(writer: BitWriter, values: Any):
+            writer.write('<I', len(values))
+            for value in values:
+                write_element(writer, value)
+        return write_list
+
+    def _write_object(self, writer: BitWriter, obj: Optional[SyntheticObject]):
+        """Write a nested object (a zero type hash is a null pointer)"""
+        if obj is None:
+            writer.write('<I', 0)
+            return
+
+        class_name, values = obj
+        type_hash, layout = self._layouts[class_name]
+        writer.write('<I', type_hash)
+
+        # Object size in bits, counted from the size field itself
+        object_start = writer.position()
+        writer.write('<I', 0)
+        for name, property_hash, write_value, default in layout:
+            # Property size in bits, counted from before alignment of its header
+            property_start = writer.position()
+            writer.write('<I', 0)
+            size_position = writer.position() - 32
+            writer.write('<I', property_hash)
+            write_value(writer, values.get(name, default))
+            writer.patch_u32(size_position, writer.position() - property_start)
+        writer.patch_u32(object_start, writer.position() - object_start)
+
+    def encode(self, obj: SyntheticObject) -> bytes:
+        """Encode a root object as file contents"""
+        writer = BitWriter()
+        writer.write_bytes(self.FILE_HEADER)
+        self._write_object(writer, obj)
+        return writer.getvalue()
+
+
+# ===== CONTENT GENERATION =====
+
+SCHOOLS = ["Fire", "Ice", "Storm", "Myth", "Life", "Death", "Balance"]
+EQUIP_SLOTS = ["Hat", "Robe", "Shoes", "Weapon", "Athame", "Amulet", "Ring", "Deck"]
+STAT_EFFECTS = ["CanonicalDamage", "CanonicalResist", "CanonicalAccuracy",
+                "CanonicalCriticalHit", "CanonicalMaxHealth", "CanonicalPowerPip"]
+
+
+@dataclass
+class SyntheticFixtureSpec:
+    """Number of templates per kind in a synthetic fixture"""
+
+    spells: int = 500
+    mobs: int = 250
+    items: int = 150
+    decks: int = 100
+    seed: int = 1
+    compress: bool = False
+
+    # Share of each kind when sizing by total entry count
+    ENTRY_SHARES = (("spells", 0.5), ("mobs", 0.25), ("items", 0.15), ("decks", 0.1))
+
+    @classmethod
+    def for_entries(cls, entries: int, seed: int = 1, compress: bool = False) -> "SyntheticFixtureSpec":
+        """
+        Size a fixture by its total number of archive entries
+
+        Args:
+            entries: Total template files (e.g. 1,000 to 500,000)
+            seed: Random seed
+            compress: Store entries zlib compressed
+
+        Returns:
+            Spec splitting the entries over spells, mobs, items and decks
+        """
+        counts = {kind: max(1, int(entries * share)) for kind, share in cls.ENTRY_SHARES}
+        counts["spells"] += max(0, entries - sum(counts.values()))
+        return cls(seed=seed, compress=compress, **counts)
+
+    @property
+    def entry_count(self) -> int:
+        """Archive entries (templates plus TemplateManifest.xml)"""
+        return self.spells + self.mobs + self.items + self.decks + 1
+
+    @property
+    def label(self) -> str:
+        """Short identifier of the fixture contents (e.g. for benchmark results)"""
+        compressed = "-zlib" if self.compress else ""
+        return (f"s{self.spells}-m{self.mobs}-i{self.items}-d{self.decks}"
+                f"-seed{self.seed}{compressed}")
+
+
+@dataclass
+class SyntheticFixture:
+    """Paths of a generated fixture"""
+
+    wad_path: Path
+    types_path: Path
+    decks_dir: Path
+    spec: SyntheticFixtureSpec
+
+
+# Spec of a generated fixture, written next to Root.wad
+FIXTURE_SPEC_FILENAME = "fixture.json"
+
+class _ContentGenerator:
+    """Deterministic synthetic template content"""
+
+    # Template ID ranges per kind (unique across the manifest)
+    MOB_ID_BASE = 100000
+    ITEM_ID_BASE = 2000000
+    DECK_ID_BASE = 4000000
+    SPELL_ID_BASE = 6000000
+
+    def __init__(self, spec: SyntheticFixtureSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+
+    # ----- spells -----
+
+    @staticmethod
+    def spell_filename(index: int) -> str:
+        return f"Spells/Synthetic_{index:06d}.xml"
+
+    @staticmethod
+    def spell_name(index: int) -> str:
+        return f"Synthetic Spell {index:06d}"
+
+    def spell(self, index: int) -> SyntheticObject:
+        rng = self.rng
+        school = rng.choice(SCHOOLS)
+        tiered = rng.random() < 0.1
+        values = {
+            "m_name": self.spell_name(index),
+            "m_displayName": f"Spell_Synthetic_{index:06d}_Name",
+            "m_description": f"Spell_Synthetic_{index:06d}_Desc",
+            "m_advancedDescription": f"Spell_Synthetic_{index:06d}_AdvDesc",
+            "m_imageName": f"GUI/Spells/{school}_{index % 97:02d}.dds",
+            "m_imageIndex": index % 64,
+            "m_cardFront": f"GUI/Cards/{school}.dds",
+            "m_spellBase": "Default",
+            "m_spellCategory": rng.choice(["Damage", "Heal", "Charm", "Ward", "Global"]),
+            "m_sMagicSchoolName": school,
+            "m_sTypeName": rng.choice(["Damage", "Healing", "Charm", "Ward", "Steal"]),
+            "m_accuracy": rng.choice([70, 75, 80, 85, 90, 100]),
+            "m_baseCost": rng.randrange(0, 5000, 25),
+            "m_trainingCost": rng.randrange(0, 4),
+            "m_levelRestriction": rng.randrange(0, 170),
+            "m_maxCopies": rng.choice([1, 2, 4]),
+            "m_spellSourceType": rng.randrange(0, 4),
+            "m_PvE": True,
+            "m_PvP": rng.random() < 0.9,
+            "m_Treasure": rng.random() < 0.3,
+            "m_noDiscard": rng.random() < 0.05,
+            "m_leavesPlayWhenCast": rng.random() < 0.05,
+            "m_spellRank": self.spell_rank(school),
+            "m_effects": [self.effect(0) for _ in range(rng.randint(1, 3))],
+            "m_adjectives": rng.sample(["Damage", "AOE", "Shadow", "Ench", "Boss"], rng.randint(0, 2)),
+            "m_validTargetSpells": [],
+            "m_displayRequirements": self.requirement_list(1) if rng.random() < 0.2 else None,
+        }
+        if tiered:
+            values.update({
+                "m_nextTierSpells": [self.spell_name((index + step) % self.spec.spells) for step in (1, 2)],
+                "m_requirements": self.requirement_list(1),
+                "m_retired": rng.random() < 0.1,
+                "m_shardCost": rng.randrange(0, 200, 10),
+            })
+            return "TieredSpellTemplate", values
+        return "SpellTemplate", values
+
+    def spell_rank(self, school: str) -> SyntheticObject:
+        rng = self.rng
+        rank = rng.randint(0, 10)
+        values = {"m_spellRank": rank, "m_xPipSpell": rng.random() < 0.05}
+        if rng.random() < 0.2:
+            values[f"m_{school.lower()}Pips"] = rng.randint(1, 3)
+        if rng.random() < 0.05:
+            values["m_shadowPips"] = 1
+        return "SpellRank", values
+
+    def effect(self, depth: int) -> SyntheticObject:
+        rng = self.rng
+        roll = rng.random() if depth < 3 else 1.0
+        if roll < 0.12:
+            return "ConditionalSpellEffect", self.effect_values(
+                m_elements=[self.conditional_element(depth + 1) for _ in range(rng.randint(1, 3))])
+        if roll < 0.22:
+            return "RandomSpellEffect", self.effect_values(
+                m_effectList=[self.effect(depth + 1) for _ in range(rng.randint(2, 4))])
+        if roll < 0.30:
+            return "EffectListSpellEffect", self.effect_values(
+                m_effectList=[self.effect(depth + 1) for _ in range(rng.randint(1, 3))])
+        if roll < 0.36:
+            return "DelaySpellEffect", self.effect_values(
+                m_damage=rng.randrange(0, 1000, 5), m_rounds=rng.randint(1, 3),
+                m_spellDelayedTemplateID=self.SPELL_ID_BASE + rng.randrange(self.spec.spells),
+                m_targetSubcircleList=rng.sample(range(8), rng.randint(0, 3)),
+                m_spellHits=rng.randint(1, 2))
+        return "SpellEffect", self.effect_values()
+
+    def effect_values(self, **extra: Any) -> Dict[str, Any]:
+        rng = self.rng
+        values = {
+            "m_effectType": rng.randrange(0, 150),
+            "m_effectParam": rng.randrange(0, 1200, 5),
+            "m_effectTarget": rng.randrange(0, 12),
+            "m_disposition": rng.randrange(0, 3),
+            "m_damageType": rng.randrange(0, 2 ** 31),
+            "m_sDamageType": rng.choice(SCHOOLS),
+            "m_numRounds": rng.randint(0, 4),
+            "m_paramPerRound": rng.randrange(0, 200, 10),
+            "m_pipNum": rng.randint(0, 3),
+            "m_rank": rng.randint(0, 10),
+            "m_healModifier": 1.0,
+            "m_act": rng.random() < 0.05,
+            "m_protected": rng.random() < 0.02,
+        }
+        values.update(extra)
+        return values
+
+    def conditional_element(self, depth: int) -> SyntheticObject:
+        return "ConditionalSpellElement", {
+            "m_pReqs": self.requirement_list(0),
+            "m_pEffect": self.effect(depth),
+        }
+
+    def requirement_list(self, depth: int) -> SyntheticObject:
+        rng = self.rng
+        requirements = [self.requirement() for _ in range(rng.randint(1, 3))]
+        if depth < 2 and rng.random() < 0.15:
+            requirements.append(self.requirement_list(depth + 1))
+        return "RequirementList", {
+            "m_applyNOT": rng.random() < 0.1,
+            "m_operator": rng.randrange(0, 2),
+            "m_requirements": requirements,
+        }
+
+    def requirement(self) -> SyntheticObject:
+        rng = self.rng
+        kind = rng.randrange(4)
+        values = {"m_applyNOT": rng.random() < 0.2, "m_operator": rng.randrange(0, 2)}
+        if kind == 0:
+            values.update(m_targetType=rng.randrange(0, 2), m_magicSchoolName=rng.choice(SCHOOLS))
+            return "ReqIsSchool", values
+        if kind == 1:
+            values.update(m_numericValue=float(rng.randrange(1, 170)), m_operatorType=rng.randrange(0, 4),
+                          m_magicSchool=rng.choice(SCHOOLS))
+            return "ReqMagicLevel", values
+        if kind == 2:
+            values.update(m_targetType=rng.randrange(0, 2))
+            return "ReqPvPCombat", values
+        values.update(m_targetType=rng.randrange(0, 2), m_minPips=rng.randint(0, 7),
+                      m_maxPips=rng.randint(7, 14))
+        return "ReqPipCount", values
+
+    # ----- mobs -----
+
+    @staticmethod
+    def mob_filename(index: int) -> str:
+        return f"ObjectData/Mobs/Synthetic/Zone{index % 20:02d}/Mob_{index:06d}.xml"
+
+    def mob(self, index: int) -> SyntheticObject:
+        rng = self.rng
+        school = rng.choice(SCHOOLS)
+        level = rng.randint(1, 170)
+        boss = rng.random() < 0.08
+        behaviors = [
+            ("NPCBehaviorTemplate", {
+                "m_behaviorName": "NPCBehavior",
+                "m_nStartingHealth": level * rng.randint(40, 400),
+                "m_nLevel": level,
+                "m_fIntelligence": round(rng.uniform(0.3, 1.0), 2),
+                "m_fSelfishFactor": round(rng.uniform(0.3, 1.0), 2),
+                "m_nAggressiveFactor": rng.randint(1, 10),
+                "m_bossMob": boss,
+                "m_turnTowardsPlayer": True,
+                "m_mobTitle": 3 if boss else rng.randint(0, 2),
+                "m_maxShadowPips": rng.randint(0, 3),
+                "m_cylinderScaleValue": 1.0,
+                "m_nameColor": (rng.randrange(256), rng.randrange(256), rng.randrange(256), 255),
+                "m_schoolOfFocus": school,
+                "m_secondarySchoolOfFocus": rng.choice(SCHOOLS) if rng.random() < 0.3 else "",
+            }),
+            ("DuelistBehaviorTemplate", {"m_behaviorName": "DuelistBehavior", "m_npcProximity": 15.0}),
+        ]
+        if rng.random() < 0.3:
+            behaviors.append(("MobMonsterMagicBehaviorTemplate", {
+                "m_behaviorName": "MobMonsterMagicBehavior",
+                "m_collectedAsTemplateID": self.MOB_ID_BASE + index,
+                "m_collectionResistance": rng.randrange(0, 100),
+                "m_goldPerKillTC": rng.randrange(0, 5000, 100),
+                "m_essencesPerKillTC": rng.randrange(0, 50),
+                "m_isBoss": boss,
+                "m_worldName": f"Zone{index % 20:02d}",
+            }))
+        return "WizGameObjectTemplate", {
+            "m_templateID": self.MOB_ID_BASE + index,
+            "m_objectName": f"Synthetic_Mob_{index:06d}",
+            "m_displayName": f"Mob_Synthetic_{index:06d}_Name",
+            "m_visualID": rng.randrange(1, 100000),
+            "m_nObjectType": 2,
+            "m_primarySchoolName": school,
+            "m_adjectiveList": ["Boss"] if boss else ["Minion"] if rng.random() < 0.1 else [],
+            "m_behaviors": behaviors,
+            "m_lootTable": [f"Loot_Zone{index % 20:02d}"],
+            "m_sIcon": f"GUI/Icons/Mob_{school}.dds",
+            "m_deathSound": "Sound/Death.wav",
+        }
+
+    # ----- items -----
+
+    @staticmethod
+    def item_filename(index: int) -> str:
+        return f"ObjectData/Items/Synthetic/Item_{index:06d}.xml"
+
+    def statistic_effect(self) -> SyntheticObject:
+        rng = self.rng
+        return "StatisticEffectInfo", {
+            "m_effectName": rng.choice(STAT_EFFECTS),
+            "m_lookupIndex": rng.randrange(0, 60),
+            "m_effectValue": float(rng.randint(1, 40)),
+            "m_effectPercent": 0.0,
+            "m_schoolName": rng.choice(SCHOOLS + ["All"]),
+            "m_effectType": rng.randrange(0, 4),
+        }
+
+    def item(self, index: int) -> SyntheticObject:
+        rng = self.rng
+        school = rng.choice(SCHOOLS + ["All"])
+        slot = rng.choice(EQUIP_SLOTS)
+        level = rng.randint(1, 170)
+        return "WizItemTemplate", {
+            "m_templateID": self.ITEM_ID_BASE + index,
+            "m_objectName": f"Synthetic_{slot}_{index:06d}",
+            "m_displayName": f"Item_Synthetic_{index:06d}_Name",
+            "m_description": f"Item_Synthetic_{index:06d}_Desc",
+            "m_visualID": rng.randrange(1, 100000),
+            "m_nObjectType": 1,
+            "m_school": school,
+            "m_rarity": rng.randrange(0, 5),
+            "m_rank": rng.randint(1, 15),
+            "m_baseCost": float(rng.randrange(0, 20000, 50)),
+            "m_creditsCost": float(rng.randrange(0, 2000, 10)) if rng.random() < 0.2 else 0.0,
+            "m_itemLimit": -1,
+            "m_sIcon": f"GUI/Icons/{slot}.dds",
+            "m_adjectiveList": [slot],
+            "m_equipEffects": [self.statistic_effect() for _ in range(rng.randint(0, 4))],
+            "m_behaviors": [("EquipmentBehaviorTemplate", {
+                "m_behaviorName": "EquipmentBehavior",
+                "m_equipSlot": slot,
+                "m_equipSchool": school,
+                "m_levelRequirement": level,
+                "m_statisticEffects": [self.statistic_effect() for _ in range(rng.randint(0, 2))],
+                "m_equipmentFlags": ["NoTrade"] if rng.random() < 0.2 else [],
+            })],
+        }
+
+    # ----- decks -----
+
+    @staticmethod
+    def deck_name(index: int) -> str:
+        return f"Mdeck-Synthetic-{index:06d}"
+
+    def deck_spells(self) -> List[str]:
+        rng = self.rng
+        return [self.spell_name(rng.randrange(self.spec.spells)) for _ in range(rng.randint(4, 40))]
+
+
+def _iter_entries(spec: SyntheticFixtureSpec):
+    """Yield (archive path, root object) of all templates, then the manifest and deck JSON"""
+    content = _ContentGenerator(spec)
+    manifest: List[SyntheticObject] = []
+
+    for index in range(spec.spells):
+        yield content.spell_filename(index), content.spell(index), None
+
+    for index in range(spec.mobs):
+        filename = content.mob_filename(index)
+        manifest.append(("TemplateLocation", {"m_filename": filename, "m_id": content.MOB_ID_BASE + index}))
+        yield filename, content.mob(index), None
+
+    for index in range(spec.items):
+        filename = content.item_filename(index)
+        manifest.append(("TemplateLocation", {"m_filename": filename, "m_id": content.ITEM_ID_BASE + index}))
+        yield filename, content.item(index), None
+
+    for index in range(spec.decks):
+        name = content.deck_name(index)
+        filename = f"ObjectData/Decks/{name}.xml"
+        spell_names = content.deck_spells()
+        manifest.append(("TemplateLocation", {"m_filename": filename, "m_id": content.DECK_ID_BASE + index}))
+        deck_json = {"$__type": 4737210, "m_name": name, "m_spellNameList": spell_names, "m_behaviors": []}
+        yield filename, ("DeckTemplate", {"m_name": name, "m_spellNameList": spell_names}), deck_json
+
+    yield "TemplateManifest.xml", ("TemplateManifest", {"m_serializedTemplates": manifest}), None
+
+
+def generate_fixture(output_dir: Path, spec: Optional[SyntheticFixtureSpec] = None,
+                     progress_interval: int = 0) -> SyntheticFixture:
+    """
+    Generate a synthetic Root.wad, types.json and MobDecks directory
+
+    Args:
+        output_dir: Directory receiving Root.wad, types.json and MobDecks/ (deck XML
+                    files of an earlier fixture there are removed)
+        spec: Fixture size (SyntheticFixtureSpec defaults if None)
+        progress_interval: Print progress every N entries (0 = silent)
+
+    Returns:
+        SyntheticFixture with the generated paths
+    """
+    spec = spec or SyntheticFixtureSpec()
+    output_dir = Path(output_dir)
+    decks_dir = output_dir / "MobDecks"
+    decks_dir.mkdir(parents=True, exist_ok=True)
+
+    # Regenerating into an old fixture must not leave its decks (or its spec) behind
+    (output_dir / FIXTURE_SPEC_FILENAME).unlink(missing_ok=True)
+    for stale_deck in decks_dir.glob("*.xml"):
+        stale_deck.unlink()
+
+    types_path = output_dir / "types.json"
+    with open(types_path, 'w', encoding='utf-8') as f:
+        json.dump(build_types_dump(), f)
+
+    encoder = ObjectEncoder()
+    wad_path = output_dir / "Root.wad"
+    with KIWADWriter(wad_path, compress=spec.compress) as wad:
+        for count, (filename, obj, deck_json) in enumerate(_iter_entries(spec), 1):
+            wad.add(filename, encoder.encode(obj))
+            if deck_json is not None:
+                with open(decks_dir / Path(filename).name, 'w', encoding='utf-8') as f:
+                    json.dump(deck_json, f)
+            if progress_interval and count % progress_interval == 0:
+                print(f"  Generated {count:,}/{spec.entry_count:,} entries")
+
+    # Written last, so only complete fixtures can be loaded
+    with open(output_dir / FIXTURE_SPEC_FILENAME, 'w', encoding='utf-8') as f:
+        json.dump(asdict(spec), f, indent=2)
+
+    return SyntheticFixture(wad_path=wad_path, types_path=types_path, decks_dir=decks_dir, spec=spec)
+
+
+def load_fixture(fixture_dir: Path) -> Optional[SyntheticFixture]:
+    """
+    Load a fixture generated earlier
+
+    Args:
+        fixture_dir: Directory passed to generate_fixture
+
+    Returns:
+        SyntheticFixture, or None if the directory holds no complete fixture
+    """
+    fixture_dir = Path(fixture_dir)
+    spec_path = fixture_dir / FIXTURE_SPEC_FILENAME
+    if not spec_path.exists():
+        return None
+
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = SyntheticFixtureSpec(**json.load(f))
+    return SyntheticFixture(wad_path=fixture_dir / "Root.wad", types_path=fixture_dir / "types.json",
+                            decks_dir=fixture_dir / "MobDecks", spec=spec)
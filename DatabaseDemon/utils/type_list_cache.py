@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Type List Cache
+===============
+Cached compact copies of the types.json type dump.
+
+Every pipeline start parses the full (pretty-printed) types.json. The cache
+keeps two compact artifacts per (types.json content hash, game revision) key:
+
+- a minified copy of the dump for katsuba's TypeList.open. TypeList can
+  only be built by parsing JSON, so this only saves the whitespace: on a
+  62 MB indented dump TypeList.open went from 243 ms to 170 ms (1.43x)
+- a marshal snapshot of the parsed dump, for Python-side readers that
+  would otherwise json.load the whole file (type validation, class
+  lookups): 430 ms to 211 ms (2.04x) on the same dump
+
+Building the cache costs about 2 s once per types.json/revision, so it pays
+off after a dozen or so pipeline starts. Numbers come from
+"Test Scripts/benchmark_type_list_startup.py".
+
+The content hash is only recomputed when the size or mtime of types.json
+changes, so the common case of an unchanged dump costs a stat call and a
+small sidecar read. Any change to types.json (or a new revision) produces a
+new key and the cache is rebuilt automatically.
+"""
+
+import hashlib
+import json
+import marshal
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .revision_detector import RevisionDetector
+
+
+class TypeListCache:
+    """Builds and loads the compact type dump cache for one types.json"""
+
+    # Bump when the cache layout changes to force a rebuild
+    CACHE_FORMAT_VERSION = 1
+
+    SIDECAR_NAME = "source_stat.json"
+    MINIFIED_SUFFIX = ".types.min.json"
+    SNAPSHOT_SUFFIX = ".types.marshal"
+
+    def __init__(self, types_path: Path, cache_dir: Optional[Path] = None,
+                 revision: Optional[str] = None):
+        """
+        Initialize the type list cache
+
+        Args:
+            types_path: Path to the source types.json file
+            cache_dir: Cache directory (defaults to .type_cache next to types.json)
+            revision: Game revision for the cache key (detected with RevisionDetector if None)
+        """
+        self.types_path = Path(types_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.types_path.parent / ".type_cache"
+        self.revision = revision
+        self._source_hash = None
+
+    def _get_revision(self) -> str:
+        """Get the revision part of the cache key"""
+        if self.revision is None:
+            self.revision = RevisionDetector().get_revision_for_database_name()
+        return self.revision
+
+    def _hash_source(self) -> str:
+        """Compute the SHA-1 of types.json in chunks"""
+        digest = hashlib.sha1()
+        with open(self.types_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get_source_hash(self) -> str:
+        """
+        Get the content hash of types.json, reusing the recorded hash while
+        the file size and mtime are unchanged
+
+        Returns:
+            Hex SHA-1 of the types.json content
+        """
+        if self._source_hash:
+            return self._source_hash
+
+        stat = self.types_path.stat()
+        source_key = str(self.types_path.resolve())
+        sidecar_path = self.cache_dir / self.SIDECAR_NAME
+
+        sidecar = {}
+        if sidecar_path.exists():
+            try:
+                with open(sidecar_path, 'r', encoding='utf-8') as f:
+                    sidecar = json.load(f)
+            except (OSError, ValueError):
+                sidecar = {}
+
+        entry = sidecar.get(source_key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            self._source_hash = entry["sha1"]
+            return self._source_hash
+
+        self._source_hash = self._hash_source()
+        sidecar[source_key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": self._source_hash
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, indent=2)
+
+        return self._source_hash
+
+    def get_cache_key(self) -> str:
+        """Get the cache key (revision plus content hash prefix)"""
+        return f"{self._get_revision()}_{self.get_source_hash()[:16]}"
+
+    def get_minified_path(self) -> Path:
+        """Path of the minified type dump for the current key"""
+        return self.cache_dir / f"{self.get_cache_key()}{self.MINIFIED_SUFFIX}"
+
+    def get_snapshot_path(self) -> Path:
+        """Path of the marshal snapshot for the current key"""
+        return self.cache_dir / f"{self.get_cache_key()}{self.SNAPSHOT_SUFFIX}"
+
+    def is_current(self) -> bool:
+        """Check whether cache artifacts exist for the current types.json and revision"""
+        return self.get_minified_path().exists() and self.get_snapshot_path().exists()
+
+    def rebuild(self) -> bool:
+        """
+        Rebuild the cache artifacts from types.json
+
+        Returns:
+            True if the cache was written, False otherwise
+        """
+        try:
+            print(f"[INFO] Building type cache for {self.types_path} (key {self.get_cache_key()})")
+
+            with open(self.types_path, 'r', encoding='utf-8') as f:
+                types_data = json.load(f)
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to temporary names first so an interrupted build is never picked up
+            minified_path = self.get_minified_path()
+            temp_minified = minified_path.with_name(minified_path.name + ".tmp")
+            with open(temp_minified, 'w', encoding='utf-8') as f:
+                json.dump(types_data, f, separators=(',', ':'), ensure_ascii=False)
+
+            snapshot_path = self.get_snapshot_path()
+            temp_snapshot = snapshot_path.with_name(snapshot_path.name + ".tmp")
+            with open(temp_snapshot, 'wb') as f:
+                marshal.dump({
+                    "format_version": self.CACHE_FORMAT_VERSION,
+                    "source_sha1": self.get_source_hash(),
+                    "revision": self._get_revision(),
+                    "types_data": types_data
+                }, f)
+
+            temp_minified.replace(minified_path)
+            temp_snapshot.replace(snapshot_path)
+
+            self._remove_stale_artifacts()
+            print(f"[OK] Type cache written to {self.cache_dir}")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to build type cache: {e}")
+            return False
+
+    def _remove_stale_artifacts(self):
+        """Delete cache artifacts that belong to other keys"""
+        current = {self.get_minified_path().name, self.get_snapshot_path().name}
+        for suffix in (self.MINIFIED_SUFFIX, self.SNAPSHOT_SUFFIX):
+            for path in self.cache_dir.glob(f"*{suffix}"):
+                if path.name not in current:
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    def ensure_current(self) -> bool:
+        """Rebuild the cache if types.json or the revision changed"""
+        if self.is_current():
+            return True
+        return self.rebuild()
+
+    def load_type_list(self):
+        """
+        Load the katsuba TypeList through the cache
+
+        Returns:
+            TypeList built from the minified dump (or from types.json if the cache is unavailable)
+        """
+        # Imported here so pipelines that only need the parsed dump don't require katsuba
+        from katsuba.op import TypeList
+
+        if self.ensure_current():
+            return TypeList.open(str(self.get_minified_path()))
+        return TypeList.open(str(self.types_path))
+
+    def load_types_data(self) -> Dict[str, Any]:
+        """
+        Load the parsed type dump (same structure as json.load of types.json)
+
+        Returns:
+            Parsed type dump dictionary
+        """
+        if self.ensure_current():
+            try:
+                # loads() on the full buffer is much faster than load() on the file object
+                with open(self.get_snapshot_path(), 'rb') as f:
+                    snapshot = marshal.loads(f.read())
+                if snapshot.get("format_version") == self.CACHE_FORMAT_VERSION:
+                    return snapshot["types_data"]
+            except (OSError, ValueError, EOFError, TypeError):
+                pass
+
+        with open(self.types_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+def open_cached_type_list(types_path: Path, revision: Optional[str] = None):
+    """
+    Open a TypeList for types.json using the type dump cache
+
+    Args:
+        types_path: Path to types.json
+        revision: Game revision for the cache key (detected if None)
+
+    Returns:
+        Loaded TypeList
+    """
+    return TypeListCache(types_path, revision=revision).load_type_list()
+
+
+def load_cached_types_data(types_path: Path, revision: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load the parsed types.json dump using the type dump cache
+
+    Args:
+        types_path: Path to types.json
+        revision: Game revision for the cache key (detected if None)
+
+    Returns:
+        Parsed type dump dictionary
+    """
+    return TypeListCache(types_path, revision=revision).load_types_data()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+WAD Manifest
+============
+Per-entry manifest of the Root.wad files a database was built from.
+
+Every build stores, next to its database, the size and CRC32 of each WAD
+entry it scanned together with the database keys (spell filename, item
+filename, mob template_id) each entry produced. On the next patch the new
+archive is compared against that manifest, and only added, changed and
+removed entries are re-processed: the rows of changed/removed entries are
+deleted across all tables and the changed/added entries are inserted again
+into a copy of the previous database. Patch-day rebuild time is therefore
+proportional to the diff instead of the whole archive.
+
+Note: the manifest tracks WAD content only. Code or types.json changes that
+alter how unchanged entries are extracted still require a full rebuild.
+"""
+
+import json
+import shutil
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def get_manifest_path(database_path: Path) -> Path:
+    """Get the manifest path stored alongside a database file"""
+    database_path = Path(database_path)
+    return database_path.with_name(database_path.name + MANIFEST_SUFFIX)
+
+
+@dataclass
+class ManifestDiff:
+    """Entries that differ between two manifests"""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    @property
+    def reprocess_paths(self) -> List[str]:
+        """Entries that must be extracted and inserted again"""
+        return self.added + self.changed
+
+    @property
+    def stale_paths(self) -> List[str]:
+        """Entries whose existing database rows must be deleted"""
+        return self.changed + self.removed
+
+    def is_empty(self) -> bool:
+        """Check whether the archive content is unchanged"""
+        return not (self.added or self.changed or self.removed)
+
+    def summary(self) -> str:
+        """One-line summary of the diff"""
+        return (f"{len(self.added)} added, {len(self.changed)} changed, "
+                f"{len(self.removed)} removed, {self.unchanged_count} unchanged")
+
+
+class WadManifest:
+    """Maps WAD entry paths to their content checksum and produced database keys"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, glob_pattern: str, revision: Optional[str] = None):
+        """
+        Initialize an empty manifest
+
+        Args:
+            glob_pattern: WAD glob the manifest covers (e.g. "Spells/*")
+            revision: Game revision the entries were read from
+        """
+        self.glob_pattern = glob_pattern
+        self.revision = revision
+        self.created_at = None
+
+        # {entry path: (size, crc32)}
+        self.entries: Dict[str, Tuple[int, int]] = {}
+        # {entry path: [database key, ...]}
+        self.row_keys: Dict[str, List[Any]] = {}
+
+    def build(self, archive, file_paths: Optional[Iterable[str]] = None) -> int:
+        """
+        Checksum the archive entries covered by this manifest
+
+        Args:
+            archive: Opened katsuba WAD Archive
+            file_paths: Entries to checksum (globbed from the archive if None)
+
+        Returns:
+            Number of entries recorded
+        """
+        if file_paths is None:
+            file_paths = archive.iter_glob(self.glob_pattern)
+
+        for file_path in file_paths:
+            data = archive[file_path]
+            self.entries[file_path] = (len(data), zlib.crc32(data))
+
+        self.created_at = datetime.now().isoformat()
+        return len(self.entries)
+
+    def get_size(self, file_path: str) -> Optional[int]:
+        """Get the byte size of an entry (None if the manifest does not cover it)"""
+        entry = self.entries.get(file_path)
+        return entry[0] if entry else None
+
+    def copy_entries(self) -> "WadManifest":
+        """Create a manifest with the same entries and no recorded keys"""
+        manifest = WadManifest(self.glob_pattern, self.revision)
+        manifest.entries = dict(self.entries)
+        manifest.created_at = self.created_at
+        return manifest
+
+    def record_key(self, file_path: str, key: Any):
+        """Record a database key produced by an entry"""
+        self.row_keys.setdefault(file_path, []).append(key)
+
+    def forget(self, file_path: str):
+        """
+        Drop an entry that produced no usable rows (failure, duplicate) so the
+        next incremental build sees it as added and processes it again
+        """
+        self.entries.pop(file_path, None)
+        self.row_keys.pop(file_path, None)
+
+    def get_keys(self, file_paths: Iterable[str]) -> List[Any]:
+        """Get all database keys produced by the given entries"""
+        keys = []
+        for file_path in file_paths:
+            keys.extend(self.row_keys.get(file_path, []))
+        return keys
+
+    def carry_keys_from(self, previous: "WadManifest", file_paths: Iterable[str]):
+        """Keep the keys of entries whose rows were carried over unchanged"""
+        for file_path in file_paths:
+            if file_path in previous.row_keys:
+                self.row_keys[file_path] = list(previous.row_keys[file_path])
+
+    def diff(self, previous: "WadManifest") -> ManifestDiff:
+        """
+        Compare this manifest against the one of a previous build
+
+        Args:
+            previous: Manifest of the previous build
+
+        Returns:
+            ManifestDiff with added/changed/removed entries in archive order
+        """
+        result = ManifestDiff()
+
+        for file_path, checksum in self.entries.items():
+            previous_checksum = previous.entries.get(file_path)
+            if previous_checksum is None:
+                result.added.append(file_path)
+            elif previous_checksum != checksum:
+                result.changed.append(file_path)
+            else:
+                result.unchanged_count += 1
+
+        result.removed = [file_path for file_path in previous.entries if file_path not in self.entries]
+        return result
+
+    def save(self, manifest_path: Path) -> bool:
+        """
+        Write the manifest to disk
+
+        Args:
+            manifest_path: Output path (see get_manifest_path)
+
+        Returns:
+            True if written, False otherwise
+        """
+        try:
+            data = {
+                "format_version": self.FORMAT_VERSION,
+                "glob_pattern": self.glob_pattern,
+                "revision": self.revision,
+                "created_at": self.created_at,
+                "entries": {path: list(checksum) for path, checksum in self.entries.items()},
+                "row_keys": self.row_keys
+            }
+            temp_path = Path(str(manifest_path) + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            temp_path.replace(manifest_path)
+            print(f"[OK] Saved WAD manifest ({len(self.entries)} entries): {manifest_path}")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to save WAD manifest: {e}")
+            return False
+
+    @classmethod
+    def load(cls, manifest_path: Path) -> Optional["WadManifest"]:
+        """
+        Load a manifest written by save()
+
+        Args:
+            manifest_path: Manifest file path
+
+        Returns:
+            Loaded manifest, or None if missing or unreadable
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("format_version") != cls.FORMAT_VERSION:
+                print(f"[WARNING] Unsupported manifest format in {manifest_path}")
+                return None
+
+            manifest = cls(data["glob_pattern"], data.get("revision"))
+            manifest.created_at = data.get("created_at")
+            manifest.entries = {path: tuple(checksum) for path, checksum in data["entries"].items()}
+            manifest.row_keys = data.get("row_keys", {})
+            return manifest
+
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"[WARNING] Failed to load WAD manifest {manifest_path}: {e}")
+            return None
+
+
+def delete_rows_for_keys(cursor, key_column: str, keys: List[Any], chunk_size: int = 500) -> int:
+    """
+    Delete every row keyed by the given values from all tables that have the key column
+
+    Args:
+        cursor: SQLite cursor of the database being patched
+        key_column: Column linking rows to their record (e.g. "filename", "template_id")
+        keys: Key values whose rows should be removed
+        chunk_size: Number of keys per DELETE statement
+
+    Returns:
+        Number of rows deleted
+    """
+    if not keys:
+        return 0
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+    tables = [row[0] for row in cursor.fetchall()]
+
+    deleted = 0
+    for table in tables:
+        cursor.execute(f"PRAGMA table_info({table})")
+        if key_column not in [row[1] for row in cursor.fetchall()]:
+            continue
+
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(f"DELETE FROM {table} WHERE {key_column} IN ({placeholders})", chunk)
+            deleted += cursor.rowcount
+
+    return deleted
+
+
+def prepare_base_database(base_database: Path, database_path: Path) -> Optional[WadManifest]:
+    """
+    Copy a previous build's database so it can be patched in place
+
+    Args:
+        base_database: Database of the previous revision
+        database_path: Database path of the new build
+
+    Returns:
+        Manifest of the base database, or None if an incremental update is not possible
+    """
+    base_database = Path(base_database)
+    database_path = Path(database_path)
+
+    if not base_database.exists():
+        print(f"[WARNING] Base database not found: {base_database} - running a full build")
+        return None
+
+    base_manifest = WadManifest.load(get_manifest_path(base_database))
+    if base_manifest is None:
+        print(f"[WARNING] No WAD manifest for {base_database} - running a full build")
+        return None
+
+    if base_database.resolve() != database_path.resolve():
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(base_database, database_path)
+        print(f"[OK] Copied base database {base_database} -> {database_path}")
+
+    return base_manifest
+
+
+def apply_manifest_diff(cursor, key_column: str, manifest: WadManifest,
+                        base_manifest: WadManifest) -> ManifestDiff:
+    """
+    Remove the rows of changed/removed entries and carry over the keys of unchanged ones
+
+    Args:
+        cursor: SQLite cursor of the copied base database
+        key_column: Column linking rows to their record (e.g. "filename", "template_id")
+        manifest: Manifest of the current archive (keys are recorded into it)
+        base_manifest: Manifest of the base database
+
+    Returns:
+        ManifestDiff; its reprocess_paths still have to be extracted and inserted
+    """
+    diff = manifest.diff(base_manifest)
+    deleted = delete_rows_for_keys(cursor, key_column, base_manifest.get_keys(diff.stale_paths))
+
+    reprocess = set(diff.reprocess_paths)
+    manifest.carry_keys_from(base_manifest, [path for path in manifest.entries if path not in reprocess])
+
+    print(f"[INFO] WAD manifest diff: {diff.summary()}")
+    print(f"[INFO] Deleted {deleted} stale rows, re-processing {len(reprocess)} entries")
+    return diff
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+WAD Session
+===========
+Shared owner of the Root.wad resources used by every pipeline.
+
+A WadSession opens the memory-mapped Archive, loads the TypeList and builds
+the configured Serializer exactly once. Processors that are handed a session
+reuse these objects instead of re-opening the archive and re-parsing
+types.json, so several pipelines can run in one process against one mapping.
+"""
+
+import platform
+from pathlib import Path
+from typing import Optional
+
+from katsuba.wad import Archive
+from katsuba.op import Serializer, SerializerOptions
+
+from .type_list_cache import open_cached_type_list
+
+
+class WadSession:
+    """Owns the opened WAD archive, TypeList and Serializer"""
+
+    def __init__(self, wad_path: Optional[Path] = None, types_path: Optional[Path] = None):
+        """
+        Initialize the WAD session
+
+        Args:
+            wad_path: Path to Root.wad file (auto-detected if None)
+            types_path: Path to types.json file (DatabaseDemon/types.json if None)
+        """
+        self.wad_path = Path(wad_path) if wad_path else None
+        self.types_path = Path(types_path) if types_path else None
+        self.archive = None
+        self.type_list = None
+        self.serializer = None
+
+        if not self.wad_path or not self.types_path:
+            self._auto_detect_paths()
+
+    def _auto_detect_paths(self):
+        """Auto-detect platform-specific paths for WAD and types files"""
+        system = platform.system().lower()
+
+        if not self.wad_path:
+            if system == "windows":
+                self.wad_path = Path("C:/ProgramData/KingsIsle Entertainment/Wizard101/Data/GameData/Root.wad")
+            else:  # Linux or other
+                self.wad_path = Path("/mnt/c/ProgramData/KingsIsle Entertainment/Wizard101/Data/GameData/Root.wad")
+        if not self.types_path:
+            self.types_path = Path(__file__).parent.parent / "types.json"
+
+    def open(self) -> bool:
+        """
+        Load the type list, open the archive and create the serializer
+
+        Returns:
+            True if the session is ready, False otherwise
+        """
+        if self.is_open():
+            return True
+
+        if not self._load_type_list():
+            return False
+        if not self._open_wad_archive():
+            return False
+        return self._create_serializer()
+
+    def is_open(self) -> bool:
+        """Check whether archive, type list and serializer are available"""
+        return self.archive is not None and self.type_list is not None and self.serializer is not None
+
+    def _load_type_list(self) -> bool:
+        """Load TypeList from the types JSON file"""
+        try:
+            if not self.types_path.exists():
+                print(f"[ERROR] Types file not found: {self.types_path}")
+                print("Check if the type dump (types.json) is the correct version for this revision")
+                return False
+
+            self.type_list = open_cached_type_list(self.types_path)
+            print(f"[OK] Loaded type definitions from {self.types_path}")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to load type list: {e}")
+            return False
+
+    def _open_wad_archive(self) -> bool:
+        """Open the WAD archive file"""
+        try:
+            if not self.wad_path.exists():
+                print(f"[ERROR] WAD file not found: {self.wad_path}")
+                return False
+
+            # Try memory mapping first, fall back to heap if needed
+            try:
+                self.archive = Archive.mmap(str(self.wad_path))
+                print(f"[OK] Opened WAD archive (mmap): {self.wad_path}")
+            except Exception:
+                self.archive = Archive.heap(str(self.wad_path))
+                print(f"[OK] Opened WAD archive (heap): {self.wad_path}")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to open WAD archive: {e}")
+            return False
+
+    def _create_serializer(self) -> bool:
+        """Create serializer with the options shared by all pipelines"""
+        try:
+            options = SerializerOptions()
+            options.shallow = False  # Allow deep serialization (required for skip_unknown_types)
+            options.skip_unknown_types = True  # Equivalent to CLI --ignore-unknown-types
+            self.serializer = Serializer(options, self.type_list)
+            print("[OK] Created serializer with deep serialization and skip_unknown_types enabled")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to create serializer: {e}")
+            return False
+
+    def close(self):
+        """Release the archive, type list and serializer"""
+        # Archive cleanup is handled by katsuba
+        self.archive = None
+        self.type_list = None
+        self.serializer = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        if not self.open():
+            raise RuntimeError(f"Failed to open WAD session for {self.wad_path}")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()